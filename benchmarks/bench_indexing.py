@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Indexing throughput benchmark.
+
+Measures notes/sec, chunks/sec and peak RSS for each indexing stage against a
+synthetic corpus and the deterministic stub embedding provider, so no model
+server is needed. Each corpus size runs in a fresh interpreter so peak RSS is
+not inflated by the previous size.
+
+    python -m benchmarks.bench_indexing                       # 1k, 10k, 100k notes
+    python -m benchmarks.bench_indexing --notes 1000 --latency-ms 5
+    python -m benchmarks.bench_indexing --save-baseline       # refresh baselines/indexing.json
+"""
+
+import argparse
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Dict, List
+
+from benchmarks.harness import (
+    compare_to_baseline,
+    load_json,
+    machine_info,
+    measure,
+    quiet_minerva_logging,
+    rate,
+    write_json,
+)
+from benchmarks.stub_provider import StubEmbeddingProvider
+from benchmarks.synthetic import NoteGenerator, SIZE_DISTRIBUTIONS, mutate_notes
+
+DEFAULT_SCALES = [1000, 10000, 100000]
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "indexing.json"
+DEFAULT_TOLERANCE = 0.25
+
+STAGES = ["create_chunks_from_notes", "generate_embeddings", "insert_chunks", "run_incremental_update"]
+COMPARED_METRICS = {"notes_per_sec": True, "chunks_per_sec": True, "peak_rss_mb": False}
+PARAMETER_FIELDS = ["seed", "median_chars", "size_distribution", "chunk_size", "dimension",
+                    "latency_ms", "per_item_latency_ms", "provider_type"]
+
+
+def bench_scale(note_count: int, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    from minerva.indexing.chunking import create_chunks_from_notes
+    from minerva.indexing.embeddings import generate_embeddings
+    from minerva.indexing.storage import create_collection, initialize_chromadb_client, insert_chunks
+    from minerva.indexing.updater import run_incremental_update
+
+    quiet_minerva_logging()
+
+    generator = NoteGenerator(
+        seed=params["seed"],
+        median_chars=params["median_chars"],
+        size_distribution=params["size_distribution"]
+    )
+    provider = StubEmbeddingProvider(
+        dimension=params["dimension"],
+        latency_ms=params["latency_ms"],
+        per_item_latency_ms=params["per_item_latency_ms"],
+        provider_type=params["provider_type"]
+    )
+    notes = generator.notes(note_count)
+    chunk_size = params["chunk_size"]
+    rows = []
+
+    def record(stage: str, sample: Dict[str, Any], notes_processed: int, chunks_processed: int) -> None:
+        rows.append({
+            "notes": note_count,
+            "stage": stage,
+            "notes_per_sec": rate(notes_processed, sample["seconds"]),
+            "chunks_per_sec": rate(chunks_processed, sample["seconds"]),
+            "chunks": chunks_processed,
+            **sample
+        })
+
+    chunks, sample = measure(create_chunks_from_notes, notes, target_chars=chunk_size)
+    record("create_chunks_from_notes", sample, len(notes), len(chunks))
+
+    chunks_with_embeddings, sample = measure(generate_embeddings, provider, chunks)
+    record("generate_embeddings", sample, len(notes), len(chunks_with_embeddings))
+    del chunks
+
+    with tempfile.TemporaryDirectory(prefix="minerva-bench-") as chromadb_path:
+        client = initialize_chromadb_client(chromadb_path)
+        collection = create_collection(
+            client,
+            collection_name="bench_indexing",
+            description="Synthetic benchmark corpus",
+            embedding_metadata=provider.get_embedding_metadata(),
+            chunk_size=chunk_size,
+            note_count=len(notes)
+        )
+
+        _, sample = measure(insert_chunks, collection, chunks_with_embeddings)
+        record("insert_chunks", sample, len(notes), len(chunks_with_embeddings))
+        del chunks_with_embeddings
+
+        next_export = mutate_notes(generator, notes, seed=params["seed"])
+        embedded_before = provider.embedded_texts
+        _, sample = measure(
+            run_incremental_update,
+            collection=collection,
+            new_notes=next_export,
+            provider=provider,
+            new_description="Synthetic benchmark corpus",
+            target_chars=chunk_size
+        )
+        # Throughput over the whole export scanned; chunks are the ones re-embedded
+        record("run_incremental_update", sample, len(next_export), provider.embedded_texts - embedded_before)
+
+    return rows
+
+
+def run_isolated(note_count: int, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+        return executor.submit(bench_scale, note_count, params).result()
+
+
+def print_rows(rows: List[Dict[str, Any]]) -> None:
+    print(f"{'notes':>8}  {'stage':<26} {'seconds':>9} {'notes/s':>10} {'chunks/s':>10} {'peak RSS MB':>12}")
+    for row in rows:
+        print(
+            f"{row['notes']:>8}  {row['stage']:<26} {row['seconds']:>9.2f} "
+            f"{row['notes_per_sec']:>10.1f} {row['chunks_per_sec']:>10.1f} {row['peak_rss_mb']:>12.1f}"
+        )
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark the indexing pipeline with synthetic notes")
+    parser.add_argument("--notes", type=int, nargs="+", default=DEFAULT_SCALES, help="Corpus sizes to run")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--median-chars", type=int, default=2500, help="Median note size in characters")
+    parser.add_argument("--size-distribution", choices=SIZE_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--chunk-size", type=int, default=1200)
+    parser.add_argument("--dimension", type=int, default=384, help="Stub embedding dimension")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated latency per embedding request")
+    parser.add_argument("--per-item-latency-ms", type=float, default=0.0, help="Simulated latency per embedded text")
+    parser.add_argument("--provider-type", default="openai",
+                        help="Provider type reported by the stub; selects the batch size (default: openai)")
+    parser.add_argument("--no-isolate", action="store_true", help="Run every size in this process")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Overwrite the baseline with these results")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed relative regression before failing (default: 0.25)")
+    return parser
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = create_parser().parse_args(argv)
+    params = {field: getattr(args, field) for field in PARAMETER_FIELDS}
+
+    rows: List[Dict[str, Any]] = []
+    for note_count in args.notes:
+        print(f"Benchmarking {note_count} notes...", file=sys.stderr)
+        runner = bench_scale if args.no_isolate else run_isolated
+        rows.extend(runner(note_count, params))
+
+    print_rows(rows)
+    payload = {"benchmark": "indexing", "parameters": params, "machine": machine_info(), "results": rows}
+
+    if args.output:
+        write_json(args.output, payload)
+
+    if args.save_baseline:
+        write_json(args.baseline, payload)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = load_json(args.baseline)
+    if baseline is None:
+        return 0
+    if baseline["parameters"] != params:
+        print("Baseline was recorded with different parameters; skipping comparison", file=sys.stderr)
+        return 0
+
+    regressions = compare_to_baseline(rows, baseline["results"], ("notes", "stage"), COMPARED_METRICS, args.tolerance)
+    if regressions:
+        print(f"\nRegressions beyond {args.tolerance:.0%} against {args.baseline}:")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+
+    print(f"\nNo regressions beyond {args.tolerance:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""Search latency and throughput benchmark.
+
+Builds a synthetic collection with the stub embedding provider, then drives
+search_knowledge_base in-process (thread pool) and/or the serve-http MCP
+endpoint (one MCP session per concurrent client). It reports p50/p95/p99
+latency, throughput and the mean time per search stage, taken from the
+minerva_search_stage_seconds metric.
+
+    python -m benchmarks.bench_search                                  # in-process, 2k notes
+    python -m benchmarks.bench_search --mode both --concurrency 1 8 32
+    python -m benchmarks.bench_search --mode http --url http://kb:8000/mcp/ --collection team_docs
+"""
+
+import argparse
+import asyncio
+import random
+import socket
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.corpus import build_synthetic_collection, corpus_parameters
+from benchmarks.harness import (
+    compare_to_baseline,
+    load_json,
+    machine_info,
+    percentile,
+    quiet_minerva_logging,
+    write_json,
+)
+from benchmarks.stub_provider import StubEmbeddingProvider
+from benchmarks.synthetic import NoteGenerator
+
+DEFAULT_COLLECTION = "bench_search"
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "search.json"
+DEFAULT_TOLERANCE = 0.25
+CONTEXT_MODES = ["chunk_only", "enhanced", "full_note"]
+QUERY_KINDS = ("topic", "title", "random")
+STAGE_METRIC = "minerva_search_stage_seconds"
+COMPARED_METRICS = {"throughput_rps": True, "p95_ms": False}
+PARAMETER_FIELDS = ["notes", "seed", "median_chars", "chunk_size", "dimension", "latency_ms",
+                    "requests", "max_results", "query_mix", "search_engine"]
+
+
+def parse_query_mix(text: str) -> Dict[str, float]:
+    # "topic=0.7,title=0.2,random=0.1"
+    mix = {}
+    for part in text.split(","):
+        kind, _, weight = part.partition("=")
+        kind = kind.strip()
+        if kind not in QUERY_KINDS:
+            raise argparse.ArgumentTypeError(f"Unknown query kind '{kind}' (expected {', '.join(QUERY_KINDS)})")
+        mix[kind] = float(weight or 1)
+    return mix
+
+
+def build_queries(generator: NoteGenerator, note_count: int, mix: Dict[str, float], count: int, seed: int) -> List[str]:
+    # topic: words from one topic's vocabulary (typical semantic question)
+    # title: a note's exact title (near-duplicate hit)
+    # random: shared vocabulary only (weak matches everywhere)
+    rng = random.Random(seed)
+    kinds = rng.choices(list(mix), weights=list(mix.values()), k=count)
+    queries = []
+    for kind in kinds:
+        if kind == "title":
+            queries.append(generator.note(rng.randrange(note_count))["title"])
+        elif kind == "random":
+            queries.append(" ".join(rng.sample(generator.shared_words, 6)))
+        else:
+            queries.append(generator.query(rng))
+    return queries
+
+
+def parse_stage_totals(metrics_text: str) -> Dict[str, Tuple[float, int]]:
+    # {stage: (sum_seconds, count)} from Prometheus text exposition
+    totals: Dict[str, List[float]] = {}
+    for line in metrics_text.splitlines():
+        if not line.startswith(STAGE_METRIC + "_sum") and not line.startswith(STAGE_METRIC + "_count"):
+            continue
+        name_and_labels, _, value = line.rpartition(" ")
+        stage = name_and_labels.split('stage="', 1)[1].split('"', 1)[0]
+        entry = totals.setdefault(stage, [0.0, 0])
+        if name_and_labels.startswith(STAGE_METRIC + "_sum"):
+            entry[0] = float(value)
+        else:
+            entry[1] = int(float(value))
+    return {stage: (entry[0], int(entry[1])) for stage, entry in totals.items()}
+
+
+def stage_means_ms(before: Dict[str, Tuple[float, int]], after: Dict[str, Tuple[float, int]]) -> Dict[str, float]:
+    means = {}
+    for stage, (total, count) in after.items():
+        previous_total, previous_count = before.get(stage, (0.0, 0))
+        if count > previous_count:
+            means[stage] = round((total - previous_total) / (count - previous_count) * 1000, 2)
+    return means
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    completed = len(latencies)
+    return {
+        "requests": completed + errors,
+        "errors": errors,
+        "throughput_rps": round(completed / elapsed, 1) if elapsed > 0 else 0.0,
+        "mean_ms": round(sum(latencies) / completed * 1000, 2) if completed else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2)
+    }
+
+
+# -- in-process ----------------------------------------------------------------
+
+def run_inprocess(
+    search: Callable[[str], Any],
+    queries: List[str],
+    concurrency: int
+) -> Dict[str, Any]:
+    from minerva.common.metrics import render_metrics
+
+    def timed(query: str) -> Optional[float]:
+        start = time.perf_counter()
+        try:
+            search(query)
+        except Exception:
+            return None
+        return time.perf_counter() - start
+
+    before = parse_stage_totals(render_metrics())
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        samples = list(executor.map(timed, queries))
+    elapsed = time.perf_counter() - start
+    after = parse_stage_totals(render_metrics())
+
+    latencies = [sample for sample in samples if sample is not None]
+    summary = summarize(latencies, len(samples) - len(latencies), elapsed)
+    summary["stages_ms"] = stage_means_ms(before, after)
+    return summary
+
+
+# -- HTTP ------------------------------------------------------------------------
+
+def serve_synthetic(chromadb_path: str, collection_name: str, dimension: int, latency_ms: float,
+                    host: str, port: int, search_engine: str = "hnsw") -> None:
+    # Entry point of the spawned server process: the real MCP app and tools,
+    # with the stub provider standing in for the embedding service.
+    import uvicorn
+    from mcp.server.fastmcp import FastMCP
+    from minerva.common.server_config import CollectionServerConfig, ServerConfig
+    from minerva.server import mcp_server
+
+    quiet_minerva_logging()
+    provider = StubEmbeddingProvider(dimension=dimension, latency_ms=latency_ms)
+    mcp_server.SERVER_CONFIG = ServerConfig(
+        chromadb_path=chromadb_path,
+        default_max_results=5,
+        host=host,
+        port=port,
+        source_path=Path("benchmark"),
+        collections={collection_name: CollectionServerConfig(search_engine=search_engine)}
+    )
+    mcp_server.PROVIDER_MAP = {collection_name: provider}
+    mcp_server.AVAILABLE_COLLECTIONS = [{"name": collection_name, "description": "Synthetic benchmark corpus"}]
+    mcp_server.EXACT_SEARCH = mcp_server.initialize_exact_search(
+        mcp_server.SERVER_CONFIG, mcp_server.AVAILABLE_COLLECTIONS
+    )
+
+    mcp = FastMCP("minerva-mcp-server", host=host, port=port, log_level="WARNING")
+    mcp_server._register_tools(mcp)
+    mcp_server._register_http_routes(mcp)
+    uvicorn.run(mcp.streamable_http_app(), host=host, port=port, log_level="warning")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_health(base_url: str, timeout: float = 60.0) -> None:
+    import httpx
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=2).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Benchmark server at {base_url} did not become healthy within {timeout:.0f}s")
+
+
+async def _fetch_stage_totals(base_url: str) -> Dict[str, Tuple[float, int]]:
+    import httpx
+
+    async with httpx.AsyncClient(timeout=10) as client:
+        try:
+            response = await client.get(f"{base_url}/metrics")
+            response.raise_for_status()
+        except httpx.HTTPError:
+            return {}
+    return parse_stage_totals(response.text)
+
+
+async def _run_http(mcp_url: str, base_url: str, collection_name: str, context_mode: str, max_results: int,
+                    queries: List[str], concurrency: int) -> Dict[str, Any]:
+    from mcp import ClientSession
+    from mcp.client.streamable_http import streamablehttp_client
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for query in queries:
+        queue.put_nowait(query)
+
+    latencies: List[float] = []
+    errors = 0
+
+    async def client_worker() -> None:
+        nonlocal errors
+        async with streamablehttp_client(mcp_url) as (read, write, _):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                while not queue.empty():
+                    query = queue.get_nowait()
+                    start = time.perf_counter()
+                    try:
+                        result = await session.call_tool("search_knowledge_base", {
+                            "query": query,
+                            "collection_name": collection_name,
+                            "context_mode": context_mode,
+                            "max_results": max_results
+                        })
+                    except Exception:
+                        errors += 1
+                        continue
+                    if result.isError:
+                        errors += 1
+                    else:
+                        latencies.append(time.perf_counter() - start)
+
+    before = await _fetch_stage_totals(base_url)
+    start = time.perf_counter()
+    await asyncio.gather(*(client_worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    after = await _fetch_stage_totals(base_url)
+
+    summary = summarize(latencies, errors, elapsed)
+    summary["stages_ms"] = stage_means_ms(before, after)
+    return summary
+
+
+def run_http(mcp_url: str, collection_name: str, context_mode: str, max_results: int,
+             queries: List[str], concurrency: int) -> Dict[str, Any]:
+    base_url = mcp_url.rstrip("/").rsplit("/mcp", 1)[0]
+    return asyncio.run(_run_http(mcp_url, base_url, collection_name, context_mode, max_results, queries, concurrency))
+
+
+# -- driver ----------------------------------------------------------------------
+
+def print_rows(rows: List[Dict[str, Any]]) -> None:
+    print(f"{'mode':<10} {'context':<11} {'conc':>5} {'req':>6} {'err':>4} {'rps':>8} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}  stages (mean ms)")
+    for row in rows:
+        stages = ", ".join(f"{stage} {value}" for stage, value in sorted(row["stages_ms"].items()))
+        print(
+            f"{row['mode']:<10} {row['context_mode']:<11} {row['concurrency']:>5} {row['requests']:>6} "
+            f"{row['errors']:>4} {row['throughput_rps']:>8.1f} {row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} "
+            f"{row['p99_ms']:>8.1f}  {stages}"
+        )
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark search latency in-process and over serve-http")
+    parser.add_argument("--mode", choices=["inprocess", "http", "both"], default="inprocess")
+    parser.add_argument("--notes", type=int, default=2000, help="Synthetic corpus size")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--median-chars", type=int, default=2500)
+    parser.add_argument("--chunk-size", type=int, default=1200)
+    parser.add_argument("--dimension", type=int, default=384, help="Stub embedding dimension")
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="Simulated embedding latency per query (model round trip)")
+    parser.add_argument("--chromadb", type=Path,
+                        help="Keep the synthetic ChromaDB here and reuse it on later runs (default: temporary)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--context-modes", nargs="+", choices=CONTEXT_MODES, default=CONTEXT_MODES)
+    parser.add_argument("--query-mix", default="topic=0.7,title=0.2,random=0.1",
+                        help="Weighted query kinds: topic, title, random")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per concurrency level and context mode")
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--max-results", type=int, default=5)
+    parser.add_argument("--search-engine", choices=["hnsw", "exact"], default="hnsw",
+                        help="Search engine for the synthetic collection (see server config 'collections')")
+    parser.add_argument("--url", help="MCP endpoint of a running serve-http (e.g. http://host:8000/mcp/); "
+                                      "skips the synthetic corpus, requires --collection")
+    parser.add_argument("--collection", default=DEFAULT_COLLECTION)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    return parser
+
+
+def run_benchmark(args: argparse.Namespace, chromadb_path: str) -> List[Dict[str, Any]]:
+    from minerva.server.exact_search import ExactSearchEngine
+    from minerva.server.search_tools import search_knowledge_base
+
+    quiet_minerva_logging()
+    query_mix = parse_query_mix(args.query_mix)
+    generator = NoteGenerator(seed=args.seed, median_chars=args.median_chars)
+    provider = StubEmbeddingProvider(dimension=args.dimension, latency_ms=args.latency_ms)
+
+    if not args.url:
+        print(f"Preparing synthetic collection ({args.notes} notes)...", file=sys.stderr)
+        build_synthetic_collection(
+            chromadb_path,
+            args.collection,
+            generator,
+            StubEmbeddingProvider(dimension=args.dimension),
+            corpus_parameters(args.notes, args.seed, args.median_chars, args.chunk_size, args.dimension)
+        )
+
+    exact_search = None
+    if args.search_engine == "exact" and not args.url:
+        exact_search = ExactSearchEngine(chromadb_path, [args.collection])
+
+    modes = ["inprocess", "http"] if args.mode == "both" else [args.mode]
+    rows: List[Dict[str, Any]] = []
+    server = None
+    mcp_url = args.url
+
+    try:
+        if "http" in modes and not mcp_url:
+            port = free_port()
+            server = get_context("spawn").Process(
+                target=serve_synthetic,
+                args=(chromadb_path, args.collection, args.dimension, args.latency_ms, "127.0.0.1", port,
+                      args.search_engine),
+                daemon=True
+            )
+            server.start()
+            wait_for_health(f"http://127.0.0.1:{port}")
+            mcp_url = f"http://127.0.0.1:{port}/mcp/"
+
+        for mode in modes:
+            for context_mode in args.context_modes:
+                for concurrency in args.concurrency:
+                    queries = build_queries(generator, args.notes, query_mix, args.warmup + args.requests, args.seed)
+                    warmup, measured = queries[:args.warmup], queries[args.warmup:]
+                    print(f"  {mode} {context_mode} concurrency={concurrency}...", file=sys.stderr)
+
+                    if mode == "http":
+                        if warmup:
+                            run_http(mcp_url, args.collection, context_mode, args.max_results, warmup, 1)
+                        summary = run_http(mcp_url, args.collection, context_mode, args.max_results,
+                                           measured, concurrency)
+                    else:
+                        def search(query: str, context_mode: str = context_mode) -> Any:
+                            return search_knowledge_base(
+                                query=query,
+                                collection_name=args.collection,
+                                chromadb_path=chromadb_path,
+                                provider=provider,
+                                context_mode=context_mode,
+                                max_results=args.max_results,
+                                exact_search=exact_search
+                            )
+
+                        if warmup:
+                            run_inprocess(search, warmup, 1)
+                        summary = run_inprocess(search, measured, concurrency)
+
+                    rows.append({"mode": mode, "context_mode": context_mode, "concurrency": concurrency, **summary})
+    finally:
+        if server is not None:
+            server.terminate()
+            server.join(timeout=10)
+
+    return rows
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = create_parser().parse_args(argv)
+    if args.url and args.mode == "inprocess":
+        args.mode = "http"
+    params = {field: getattr(args, field) for field in PARAMETER_FIELDS}
+
+    if args.chromadb:
+        args.chromadb.mkdir(parents=True, exist_ok=True)
+        rows = run_benchmark(args, str(args.chromadb))
+    else:
+        with tempfile.TemporaryDirectory(prefix="minerva-bench-") as chromadb_path:
+            rows = run_benchmark(args, chromadb_path)
+
+    print_rows(rows)
+    payload = {"benchmark": "search", "parameters": params, "machine": machine_info(), "results": rows}
+
+    if args.output:
+        write_json(args.output, payload)
+
+    if args.url:
+        # Remote servers are not comparable with the synthetic baseline
+        return 0
+
+    if args.save_baseline:
+        write_json(args.baseline, payload)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = load_json(args.baseline)
+    if baseline is None:
+        return 0
+    if baseline["parameters"] != params:
+        print("Baseline was recorded with different parameters; skipping comparison", file=sys.stderr)
+        return 0
+
+    regressions = compare_to_baseline(
+        rows, baseline["results"], ("mode", "context_mode", "concurrency"), COMPARED_METRICS, args.tolerance
+    )
+    if regressions:
+        print(f"\nRegressions beyond {args.tolerance:.0%} against {args.baseline}:")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+
+    print(f"\nNo regressions beyond {args.tolerance:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+from benchmarks.stub_provider import StubEmbeddingProvider
+from benchmarks.synthetic import NoteGenerator
+
+# Builds (or reuses) a ChromaDB collection of synthetic notes embedded with the
+# stub provider. A small marker file records how the collection was built so a
+# --chromadb directory can be reused across runs with the same parameters.
+
+MARKER_FILE = "minerva-bench-corpus.json"
+
+
+def corpus_parameters(note_count: int, seed: int, median_chars: int, chunk_size: int, dimension: int) -> Dict[str, Any]:
+    return {
+        "notes": note_count,
+        "seed": seed,
+        "median_chars": median_chars,
+        "chunk_size": chunk_size,
+        "dimension": dimension
+    }
+
+
+def build_synthetic_collection(
+    chromadb_path: str | Path,
+    collection_name: str,
+    generator: NoteGenerator,
+    provider: StubEmbeddingProvider,
+    parameters: Dict[str, Any]
+) -> int:
+    # Returns the chunk count of the (possibly reused) collection
+    from minerva.indexing.chunking import create_chunks_from_notes
+    from minerva.indexing.embeddings import generate_embeddings
+    from minerva.indexing.storage import initialize_chromadb_client, insert_chunks, recreate_collection
+
+    marker = Path(chromadb_path) / MARKER_FILE
+    client = initialize_chromadb_client(str(chromadb_path))
+
+    if marker.exists():
+        recorded = json.loads(marker.read_text(encoding="utf-8"))
+        if recorded.get(collection_name) == parameters:
+            return client.get_collection(collection_name).count()
+
+    notes = generator.notes(parameters["notes"])
+    chunks = create_chunks_from_notes(notes, target_chars=parameters["chunk_size"])
+    chunks_with_embeddings = generate_embeddings(provider, chunks)
+
+    collection = recreate_collection(
+        client,
+        collection_name=collection_name,
+        description="Synthetic benchmark corpus",
+        embedding_metadata=provider.get_embedding_metadata(),
+        chunk_size=parameters["chunk_size"],
+        note_count=len(notes)
+    )
+    insert_chunks(collection, chunks_with_embeddings)
+
+    recorded = json.loads(marker.read_text(encoding="utf-8")) if marker.exists() else {}
+    recorded[collection_name] = parameters
+    marker.write_text(json.dumps(recorded, indent=2), encoding="utf-8")
+    return collection.count()
@@ -0,0 +1,115 @@
+import json
+import logging
+import os
+import platform
+import resource
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Shared measurement helpers for the benchmark scripts
+
+
+def quiet_minerva_logging(level: int = logging.WARNING) -> None:
+    # Pipeline functions log progress per batch; keep benchmark output readable
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("minerva"):
+            logger = logging.getLogger(name)
+            logger.setLevel(level)
+            for handler in logger.handlers:
+                handler.setLevel(level)
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def current_rss_mb() -> Optional[float]:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            resident_pages = int(handle.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return round(resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 1)
+
+
+def measure(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Tuple[Any, Dict[str, Any]]:
+    # Arguments are passed through rather than closed over, so callers can drop
+    # large inputs as soon as the stage that uses them is done
+    rss_before = current_rss_mb()
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    seconds = time.perf_counter() - start
+    rss_after = current_rss_mb()
+
+    sample = {"seconds": round(seconds, 4), "peak_rss_mb": peak_rss_mb()}
+    if rss_before is not None and rss_after is not None:
+        sample["rss_growth_mb"] = round(rss_after - rss_before, 1)
+    return result, sample
+
+
+def rate(count: int, seconds: float) -> float:
+    return round(count / seconds, 1) if seconds > 0 else 0.0
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def machine_info() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count()
+    }
+
+
+def write_json(path: Path, payload: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def load_json(path: Path) -> Optional[Dict[str, Any]]:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def compare_to_baseline(
+    results: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    key_fields: Tuple[str, ...],
+    higher_is_better: Dict[str, bool],
+    tolerance: float
+) -> List[str]:
+    # Returns one message per metric that moved the wrong way by more than tolerance
+    baseline_by_key = {tuple(entry[field] for field in key_fields): entry for entry in baseline}
+    regressions = []
+
+    for entry in results:
+        key = tuple(entry[field] for field in key_fields)
+        reference = baseline_by_key.get(key)
+        if reference is None:
+            continue
+
+        for metric, higher in higher_is_better.items():
+            current, previous = entry.get(metric), reference.get(metric)
+            if not current or not previous:
+                continue
+            change = (current - previous) / previous
+            if (higher and change < -tolerance) or (not higher and change > tolerance):
+                label = "/".join(str(part) for part in key)
+                regressions.append(f"{label} {metric}: {previous} -> {current} ({change:+.0%})")
+
+    return regressions
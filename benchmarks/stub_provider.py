@@ -0,0 +1,108 @@
+import re
+import threading
+import time
+import zlib
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from minerva.common.ai_provider import AIProviderError
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=200_000)
+def _feature(token: str, dimension: int) -> Tuple[int, float]:
+    digest = zlib.crc32(token.encode("utf-8"))
+    return digest % dimension, 1.0 if (digest >> 31) & 1 else -1.0
+
+
+def hashed_embedding(text: str, dimension: int) -> List[float]:
+    # Signed feature hashing of lowercased word tokens, L2-normalised. Texts that
+    # share vocabulary get high cosine similarity, so search results are stable
+    # and meaningful without a model.
+    vector = np.zeros(dimension, dtype=np.float32)
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        index, sign = _feature(token, dimension)
+        vector[index] += sign
+
+    norm = float(np.linalg.norm(vector))
+    if norm == 0.0:
+        vector[0] = 1.0
+        norm = 1.0
+    return (vector / norm).tolist()
+
+
+class StubEmbeddingProvider:
+    # Stand-in for AIProvider in benchmarks: same attributes and call surface as
+    # the real provider, deterministic embeddings, configurable dimension and
+    # simulated latency. provider_type picks the pipeline's batching strategy
+    # (see BATCH_SIZES in minerva.indexing.embeddings).
+
+    def __init__(
+        self,
+        dimension: int = 384,
+        latency_ms: float = 0.0,
+        per_item_latency_ms: float = 0.0,
+        provider_type: str = "openai",
+        embedding_model: str = "stub-embedding",
+        llm_model: str = "stub-llm",
+        fail_every: Optional[int] = None
+    ):
+        self.dimension = dimension
+        self.latency_ms = latency_ms
+        self.per_item_latency_ms = per_item_latency_ms
+        self.provider_type = provider_type
+        self.embedding_model = embedding_model
+        self.llm_model = llm_model
+        self.base_url = None
+        self.fail_every = fail_every
+        self.calls = 0
+        self.embedded_texts = 0
+        self._lock = threading.Lock()
+
+    def _simulate_request(self, items: int) -> None:
+        with self._lock:
+            self.calls += 1
+            self.embedded_texts += items
+            call_number = self.calls
+
+        if self.fail_every and call_number % self.fail_every == 0:
+            raise AIProviderError(f"Simulated failure on call {call_number}")
+
+        delay = (self.latency_ms + self.per_item_latency_ms * items) / 1000.0
+        if delay > 0:
+            time.sleep(delay)
+
+    def generate_embedding(self, text: str) -> List[float]:
+        self._simulate_request(1)
+        return hashed_embedding(text, self.dimension)
+
+    def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        self._simulate_request(len(texts))
+        return [hashed_embedding(text, self.dimension) for text in texts]
+
+    def check_availability(self) -> Dict[str, Any]:
+        return {
+            'available': True,
+            'provider_type': self.provider_type,
+            'embedding_model': self.embedding_model,
+            'dimension': self.dimension,
+            'error': None
+        }
+
+    def get_embedding_metadata(self) -> Dict[str, Any]:
+        return {
+            'embedding_provider': self.provider_type,
+            'embedding_model': self.embedding_model,
+            'llm_model': self.llm_model,
+            'embedding_dimension': self.dimension
+        }
+
+    def validate_description(self, description: str) -> Dict[str, Any]:
+        return {'score': 10, 'feedback': 'Stub provider accepts every description', 'valid': True, 'error': None}
+
+    def chat_completion(self, messages: List[Dict[str, Any]], **kwargs) -> Dict[str, Any]:
+        self._simulate_request(1)
+        return {'role': 'assistant', 'content': 'stub response'}
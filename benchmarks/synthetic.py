@@ -0,0 +1,167 @@
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+# Deterministic note generator for benchmarks. Notes follow the extractor JSON
+# schema (title, markdown, size, modificationDate, creationDate) so they can be
+# fed straight into the indexing pipeline or written out for `minerva index`.
+
+SIZE_DISTRIBUTIONS = ("lognormal", "uniform", "fixed")
+
+_SYLLABLES = [
+    "ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "ze", "da", "fe", "gu", "ha", "ji",
+    "pe", "qui", "ro", "su", "ta", "um", "ve", "wa", "xi", "yo", "bri", "cla", "dro", "fla"
+]
+_BASE_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def build_vocabulary(size: int, rng: random.Random) -> List[str]:
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+class NoteGenerator:
+    # Each note belongs to one of `topics` clusters and draws most of its words
+    # from that cluster's vocabulary, so searches against the corpus return
+    # meaningful neighbours when embedded with StubEmbeddingProvider.
+
+    def __init__(
+        self,
+        seed: int = 42,
+        median_chars: int = 2500,
+        size_distribution: str = "lognormal",
+        size_sigma: float = 0.8,
+        min_chars: int = 200,
+        max_chars: int = 40000,
+        topics: int = 50,
+        topic_vocabulary: int = 120,
+        shared_vocabulary: int = 800,
+        topic_word_ratio: float = 0.7,
+        headings: bool = True,
+        list_ratio: float = 0.2,
+        code_ratio: float = 0.05
+    ):
+        if size_distribution not in SIZE_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown size distribution '{size_distribution}'\n"
+                f"  Supported: {', '.join(SIZE_DISTRIBUTIONS)}"
+            )
+
+        self.seed = seed
+        self.median_chars = median_chars
+        self.size_distribution = size_distribution
+        self.size_sigma = size_sigma
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        self.headings = headings
+        self.list_ratio = list_ratio
+        self.code_ratio = code_ratio
+        self.topic_word_ratio = topic_word_ratio
+
+        vocab_rng = random.Random(seed)
+        words = build_vocabulary(shared_vocabulary + topics * topic_vocabulary, vocab_rng)
+        vocab_rng.shuffle(words)
+        self.shared_words = words[:shared_vocabulary]
+        self.topic_words = [
+            words[shared_vocabulary + index * topic_vocabulary:shared_vocabulary + (index + 1) * topic_vocabulary]
+            for index in range(topics)
+        ]
+
+    def _target_size(self, rng: random.Random) -> int:
+        if self.size_distribution == "fixed":
+            size = self.median_chars
+        elif self.size_distribution == "uniform":
+            size = rng.randint(self.min_chars, 2 * self.median_chars - self.min_chars)
+        else:
+            size = int(rng.lognormvariate(0, self.size_sigma) * self.median_chars)
+        return max(self.min_chars, min(self.max_chars, size))
+
+    def _words(self, rng: random.Random, topic: int, count: int) -> List[str]:
+        topic_words = self.topic_words[topic]
+        return [
+            rng.choice(topic_words) if rng.random() < self.topic_word_ratio else rng.choice(self.shared_words)
+            for _ in range(count)
+        ]
+
+    def _sentence(self, rng: random.Random, topic: int) -> str:
+        words = self._words(rng, topic, rng.randint(6, 18))
+        return " ".join(words).capitalize() + "."
+
+    def _block(self, rng: random.Random, topic: int) -> str:
+        roll = rng.random()
+        if roll < self.code_ratio:
+            lines = [f"{word} = {rng.randint(0, 999)}" for word in self._words(rng, topic, rng.randint(2, 6))]
+            return "```python\n" + "\n".join(lines) + "\n```"
+        if roll < self.code_ratio + self.list_ratio:
+            return "\n".join(f"- {self._sentence(rng, topic)}" for _ in range(rng.randint(2, 6)))
+        return " ".join(self._sentence(rng, topic) for _ in range(rng.randint(2, 6)))
+
+    def markdown(self, rng: random.Random, topic: int, title: str, target_chars: int) -> str:
+        parts = [f"# {title}"]
+        size = len(parts[0])
+        while size < target_chars:
+            if self.headings and rng.random() < 0.15:
+                heading = " ".join(self._words(rng, topic, rng.randint(2, 4))).title()
+                block = f"## {heading}"
+            else:
+                block = self._block(rng, topic)
+            parts.append(block)
+            size += len(block) + 2
+        return "\n\n".join(parts)
+
+    def note(self, index: int, version: int = 0) -> Dict[str, Any]:
+        # Same (seed, index, version) always yields the same note; bumping the
+        # version rewrites the body and modification date but keeps identity.
+        rng = random.Random(f"{self.seed}:{index}:{version}")
+        identity = random.Random(f"{self.seed}:{index}")
+        topic = identity.randrange(len(self.topic_words))
+        title = f"Note {index:06d} " + " ".join(self._words(identity, topic, 3)).title()
+
+        markdown = self.markdown(rng, topic, title, self._target_size(rng))
+        created = _BASE_DATE + timedelta(minutes=index)
+        modified = created + timedelta(days=version)
+        return {
+            "title": title,
+            "markdown": markdown,
+            "size": len(markdown.encode("utf-8")),
+            "modificationDate": modified.isoformat(),
+            "creationDate": created.isoformat(),
+            "topic": topic
+        }
+
+    def notes(self, count: int, start: int = 0) -> List[Dict[str, Any]]:
+        return [self.note(index) for index in range(start, start + count)]
+
+    def query(self, rng: random.Random, topic: Optional[int] = None, words: int = 6) -> str:
+        if topic is None:
+            topic = rng.randrange(len(self.topic_words))
+        return " ".join(self._words(rng, topic, words))
+
+
+def mutate_notes(
+    generator: NoteGenerator,
+    notes: List[Dict[str, Any]],
+    modified_ratio: float = 0.1,
+    added_ratio: float = 0.05,
+    deleted_ratio: float = 0.05,
+    seed: int = 7
+) -> List[Dict[str, Any]]:
+    # Produces the "next export" of a corpus for incremental-update benchmarks
+    rng = random.Random(seed)
+    count = len(notes)
+    indices = list(range(count))
+    rng.shuffle(indices)
+
+    deleted = set(indices[:int(count * deleted_ratio)])
+    modified = set(indices[len(deleted):len(deleted) + int(count * modified_ratio)])
+
+    updated = []
+    for index, note in enumerate(notes):
+        if index in deleted:
+            continue
+        updated.append(generator.note(index, version=1) if index in modified else note)
+
+    updated.extend(generator.notes(int(count * added_ratio), start=count))
+    return updated
@@ -1,23 +1,36 @@
 #!/usr/bin/env python3
 
 import argparse
+import importlib
 import sys
 from pathlib import Path
 
 from minerva.common.logger import get_logger
 from minerva.common.exceptions import MinervaError, GracefulExit, resolve_exit_code
 
-from minerva.commands.index import run_index
-from minerva.commands.serve import run_serve
-from minerva.commands.serve_http import run_serve_http
-from minerva.commands.peek import run_peek
-from minerva.commands.remove import run_remove
-from minerva.commands.validate import run_validate
-from minerva.commands.query import run_query
-from minerva.commands.keychain import run_keychain
-
 logger = get_logger(__name__, simple=True, mode="cli")
 
+# Command modules are imported only when dispatched: most of them pull in
+# chromadb, litellm or the MCP stack, which would otherwise be paid by every
+# invocation (including `minerva validate` and `minerva keychain`).
+COMMAND_HANDLERS = {
+    'index': ('minerva.commands.index', 'run_index'),
+    'serve': ('minerva.commands.serve', 'run_serve'),
+    'serve-http': ('minerva.commands.serve_http', 'run_serve_http'),
+    'peek': ('minerva.commands.peek', 'run_peek'),
+    'hnsw-eval': ('minerva.commands.hnsw_eval', 'run_hnsw_eval'),
+    'export-vectors': ('minerva.commands.export_vectors', 'run_export_vectors'),
+    'remove': ('minerva.commands.remove', 'run_remove'),
+    'validate': ('minerva.commands.validate', 'run_validate'),
+    'query': ('minerva.commands.query', 'run_query'),
+    'keychain': ('minerva.commands.keychain', 'run_keychain'),
+}
+
+
+def load_command_handler(command: str):
+    module_name, handler_name = COMMAND_HANDLERS[command]
+    return getattr(importlib.import_module(module_name), handler_name)
+
 
 def create_parser():
 
@@ -49,6 +62,47 @@ For more information, visit: https://github.com/yourusername/minerva
         version='%(prog)s 3.0.0'
     )
 
+    parser.add_argument(
+        '--trace',
+        type=Path,
+        metavar='PATH',
+        help='Record tracing spans to PATH (.json = Chrome trace format, otherwise JSON lines). '
+             'Also enabled by the MINERVA_TRACE environment variable'
+    )
+
+    parser.add_argument(
+        '--trace-format',
+        choices=['jsonl', 'chrome'],
+        help='Trace output format (default: inferred from the --trace file extension)'
+    )
+
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Run the command under a CPU profiler and write pstats plus a hotspot summary'
+    )
+
+    parser.add_argument(
+        '--profiler',
+        choices=['cprofile', 'sampling'],
+        default='cprofile',
+        help='CPU profiler for --profile: cprofile (default) or sampling (requires pyinstrument)'
+    )
+
+    parser.add_argument(
+        '--memory-profile',
+        action='store_true',
+        help='Record tracemalloc peaks per pipeline stage (load, chunk, embed, store)'
+    )
+
+    parser.add_argument(
+        '--profile-dir',
+        type=Path,
+        default=Path('minerva-profiles'),
+        metavar='DIR',
+        help='Directory for --profile and --memory-profile output (default: ./minerva-profiles)'
+    )
+
     # Create subparsers for commands
     subparsers = parser.add_subparsers(
         title='commands',
@@ -76,6 +130,9 @@ Examples:
 
   # Dry run to validate configuration
   minerva index --config configs/index/bear-notes-ollama.json --dry-run
+
+  # Continue a full index that was interrupted
+  minerva index --config configs/index/bear-notes-ollama.json --resume
         """
     )
 
@@ -99,6 +156,12 @@ Examples:
         help='Validate configuration and notes without indexing'
     )
 
+    index_parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Continue an interrupted full index from its embedding checkpoint'
+    )
+
     # ========================================
     # SERVE command
     # ========================================
@@ -195,6 +258,169 @@ Examples:
         help='Output format (default: text)'
     )
 
+    # ========================================
+    # HNSW-EVAL command
+    # ========================================
+    hnsw_eval_parser = subparsers.add_parser(
+        'hnsw-eval',
+        help='Measure HNSW recall against exact search',
+        description='Compare ANN results with exact NumPy search on sampled queries. '
+                    'Reports recall@k, query latency and index build time for each HNSW setting.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Sweep search_ef on a copy of the current index
+  minerva hnsw-eval ./chromadb_data bear_notes
+
+  # Compare graph settings (each M × construction_ef pair builds a temporary index)
+  minerva hnsw-eval ./chromadb_data bear_notes --m 8 16 32 --construction-ef 100 200 --search-ef 50 100
+
+  # Large collection: evaluate on a 50k-vector sample, JSON output
+  minerva hnsw-eval ./chromadb_data bear_notes --max-vectors 50000 --format json
+        """
+    )
+
+    hnsw_eval_parser.add_argument(
+        'chromadb',
+        type=Path,
+        metavar='CHROMADB_PATH',
+        help='Path to ChromaDB data directory'
+    )
+
+    hnsw_eval_parser.add_argument(
+        'collection_name',
+        type=str,
+        metavar='COLLECTION_NAME',
+        help='Collection to evaluate'
+    )
+
+    hnsw_eval_parser.add_argument(
+        '--queries',
+        type=int,
+        default=200,
+        metavar='N',
+        help='Number of stored vectors sampled as queries (default: 200)'
+    )
+
+    hnsw_eval_parser.add_argument(
+        '-k',
+        type=int,
+        default=10,
+        help='Neighbours per query used for recall@k (default: 10)'
+    )
+
+    hnsw_eval_parser.add_argument(
+        '--m',
+        type=int,
+        nargs='+',
+        metavar='M',
+        help='HNSW M values to build (default: the current index value)'
+    )
+
+    hnsw_eval_parser.add_argument(
+        '--construction-ef',
+        type=int,
+        nargs='+',
+        metavar='EF',
+        help='construction_ef values to build (default: the current index value)'
+    )
+
+    hnsw_eval_parser.add_argument(
+        '--search-ef',
+        type=int,
+        nargs='+',
+        default=[10, 25, 50, 100, 200],
+        metavar='EF',
+        help='search_ef values to query with (default: 10 25 50 100 200)'
+    )
+
+    hnsw_eval_parser.add_argument(
+        '--max-vectors',
+        type=int,
+        metavar='N',
+        help='Evaluate on a random sample of N vectors (default: the whole collection)'
+    )
+
+    hnsw_eval_parser.add_argument(
+        '--target-recall',
+        type=float,
+        default=0.95,
+        metavar='R',
+        help='Recall@k a recommended setting must reach (default: 0.95)'
+    )
+
+    hnsw_eval_parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='Random seed for query and vector sampling (default: 0)'
+    )
+
+    hnsw_eval_parser.add_argument(
+        '--format',
+        choices=['text', 'json'],
+        default='text',
+        help='Output format (default: text)'
+    )
+
+    # ========================================
+    # EXPORT-VECTORS command
+    # ========================================
+    export_vectors_parser = subparsers.add_parser(
+        'export-vectors',
+        help='Write collection vectors to memory-mappable float32 files',
+        description='Export each collection\'s embeddings as a float32 .npy (or raw) matrix plus a JSON '
+                    'manifest of chunk IDs. Existing exports are updated incrementally: only new or '
+                    're-embedded chunks are read from ChromaDB. Exports in the default location are '
+                    'also refreshed by `minerva index`.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Export every collection to ./chromadb_data/minerva_vectors/
+  minerva export-vectors ./chromadb_data
+
+  # Export one collection as a headerless float32 file
+  minerva export-vectors ./chromadb_data bear_notes --format raw
+
+  # Rewrite an export from scratch
+  minerva export-vectors ./chromadb_data bear_notes --full
+        """
+    )
+
+    export_vectors_parser.add_argument(
+        'chromadb',
+        type=Path,
+        metavar='CHROMADB_PATH',
+        help='Path to ChromaDB data directory'
+    )
+
+    export_vectors_parser.add_argument(
+        'collection_names',
+        nargs='*',
+        metavar='COLLECTION_NAME',
+        help='Collections to export (default: all collections)'
+    )
+
+    export_vectors_parser.add_argument(
+        '--format',
+        choices=['npy', 'raw'],
+        default=None,
+        help='Matrix file format (default: the existing export\'s format, otherwise npy)'
+    )
+
+    export_vectors_parser.add_argument(
+        '--output-dir',
+        type=Path,
+        metavar='DIR',
+        help='Directory for the exported files (default: CHROMADB_PATH/minerva_vectors)'
+    )
+
+    export_vectors_parser.add_argument(
+        '--full',
+        action='store_true',
+        help='Re-read every vector instead of updating the existing export'
+    )
+
     # ========================================
     # REMOVE command
     # ========================================
@@ -267,7 +493,7 @@ Examples:
   # Query a specific collection
   minerva query ~/.minerva/chromadb --collection my_docs "How does authentication work?"
 
-  # Query all collections
+  # Query all collections (one ranked list across collections)
   minerva query ~/.minerva/chromadb "How does authentication work?"
 
   # Limit results
@@ -314,6 +540,13 @@ Examples:
         help='Output format (default: text)'
     )
 
+    query_parser.add_argument(
+        '--search-mode',
+        choices=['semantic', 'hybrid', 'lexical'],
+        default='semantic',
+        help='Ranking: embeddings, embeddings fused with BM25 keyword matches, or BM25 only (default: semantic)'
+    )
+
     query_parser.add_argument(
         '--verbose',
         action='store_true',
@@ -404,27 +637,48 @@ Examples:
     return parser
 
 
+def _configure_tracing(args) -> None:
+    from minerva.common.tracing import configure_tracing, configure_tracing_from_env
+
+    trace_path = getattr(args, 'trace', None)
+    if trace_path:
+        tracer = configure_tracing(trace_path, getattr(args, 'trace_format', None))
+    else:
+        tracer = configure_tracing_from_env()
+
+    if tracer is not None:
+        # stderr: `minerva serve` speaks JSON-RPC on stdout
+        get_logger("minerva.tracing").info(f"Tracing enabled: {tracer.path} ({tracer.trace_format})")
+
+
+def _run_command(args):
+    handler = load_command_handler(args.command)
+    profile_cpu = getattr(args, 'profile', False)
+    profile_memory = getattr(args, 'memory_profile', False)
+    if not (profile_cpu or profile_memory):
+        return handler(args)
+
+    from minerva.common.profiling import run_profiled
+
+    return run_profiled(
+        lambda: handler(args),
+        command=args.command,
+        profile_dir=args.profile_dir,
+        cpu=profile_cpu,
+        memory=profile_memory,
+        profiler=args.profiler
+    )
+
+
 def main():
     parser = create_parser()
     args = parser.parse_args()
 
     try:
-        if args.command == 'index':
-            return run_index(args)
-        elif args.command == 'serve':
-            return run_serve(args)
-        elif args.command == 'serve-http':
-            return run_serve_http(args)
-        elif args.command == 'peek':
-            return run_peek(args)
-        elif args.command == 'remove':
-            return run_remove(args)
-        elif args.command == 'validate':
-            return run_validate(args)
-        elif args.command == 'query':
-            return run_query(args)
-        elif args.command == 'keychain':
-            return run_keychain(args)
+        _configure_tracing(args)
+
+        if args.command in COMMAND_HANDLERS:
+            return _run_command(args)
         else:
             parser.print_help()
             return 1
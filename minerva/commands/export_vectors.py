@@ -0,0 +1,66 @@
+from argparse import Namespace
+from pathlib import Path
+
+from minerva.common.logger import get_logger
+from minerva.indexing.storage import initialize_chromadb_client, ChromaDBConnectionError, StorageError
+from minerva.indexing.vector_export import default_export_dir, sync_vector_export
+
+logger = get_logger(__name__, simple=True, mode="cli")
+
+
+def run_export_vectors(args: Namespace) -> int:
+    try:
+        chromadb_path = str(args.chromadb)
+        db_path = Path(chromadb_path)
+
+        if not db_path.is_dir():
+            logger.error(f"ChromaDB path does not exist or is not a directory: {chromadb_path}")
+            logger.error("   Example: minerva export-vectors ./chromadb_data bear_notes")
+            return 1
+
+        client = initialize_chromadb_client(chromadb_path)
+        existing_names = sorted(collection.name for collection in client.list_collections())
+        if not existing_names:
+            logger.error("No collections found in ChromaDB")
+            logger.error("   Suggestion: Use 'minerva index' to create collections")
+            return 1
+
+        names = args.collection_names or existing_names
+        missing = [name for name in names if name not in existing_names]
+        if missing:
+            for name in missing:
+                logger.error(f"Collection '{name}' not found")
+            logger.error("Available collections:")
+            for name in existing_names:
+                logger.error(f"  • {name}")
+            return 1
+
+        export_dir = Path(args.output_dir) if args.output_dir else default_export_dir(chromadb_path)
+
+        for name in names:
+            collection = client.get_collection(name)
+            export, stats = sync_vector_export(collection, export_dir, export_format=args.format, full=args.full)
+
+            size_mb = export.nbytes / (1024 * 1024)
+            if stats.up_to_date:
+                logger.info(f"✓ {name}: up to date ({len(export.ids):,} vectors, {size_mb:.1f} MB)")
+            else:
+                logger.success(
+                    f"✓ {name}: {len(export.ids):,} vectors × {export.dimension} ({size_mb:.1f} MB) — "
+                    f"{stats.kept:,} kept, {stats.added:,} added, {stats.removed:,} removed"
+                )
+            logger.info(f"   {export.matrix_path}")
+
+        return 0
+
+    except (ChromaDBConnectionError, StorageError) as error:
+        logger.error(f"Vector export failed: {error}")
+        return 1
+
+    except OSError as error:
+        logger.error(f"Could not write vector export: {error}")
+        return 1
+
+    except KeyboardInterrupt:
+        logger.error("Operation cancelled by user")
+        return 130
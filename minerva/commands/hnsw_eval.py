@@ -0,0 +1,67 @@
+import json
+from argparse import Namespace
+from pathlib import Path
+
+from minerva.common.logger import get_logger
+from minerva.indexing.hnsw_eval import evaluate_collection, format_report_text
+from minerva.indexing.storage import initialize_chromadb_client, ChromaDBConnectionError, StorageError
+
+logger = get_logger(__name__, simple=True, mode="cli")
+
+
+def run_hnsw_eval(args: Namespace) -> int:
+    try:
+        chromadb_path = str(args.chromadb)
+        db_path = Path(chromadb_path)
+
+        if not db_path.is_dir():
+            logger.error(f"ChromaDB path does not exist or is not a directory: {chromadb_path}")
+            logger.error("   Example: minerva hnsw-eval ./chromadb_data bear_notes")
+            return 1
+
+        client = initialize_chromadb_client(chromadb_path)
+        existing_names = [collection.name for collection in client.list_collections()]
+        if args.collection_name not in existing_names:
+            logger.error(f"Collection '{args.collection_name}' not found")
+            if existing_names:
+                logger.error("Available collections:")
+                for name in existing_names:
+                    logger.error(f"  • {name}")
+            return 1
+
+        if args.k < 1 or args.queries < 1:
+            logger.error("--queries and -k must be at least 1")
+            return 1
+
+        # Progress lines would break JSON output for scripts
+        progress = logger.info if args.format != "json" else None
+
+        report = evaluate_collection(
+            chromadb_path,
+            args.collection_name,
+            query_count=args.queries,
+            k=args.k,
+            m_values=args.m,
+            construction_ef_values=args.construction_ef,
+            search_ef_values=args.search_ef,
+            max_vectors=args.max_vectors,
+            target_recall=args.target_recall,
+            seed=args.seed,
+            progress=progress
+        )
+
+        if args.format == "json":
+            logger.info(json.dumps(report.to_dict(), indent=2))
+        else:
+            logger.info("")
+            logger.info(format_report_text(report))
+
+        return 0
+
+    except (ChromaDBConnectionError, StorageError) as error:
+        logger.error(f"HNSW evaluation failed: {error}")
+        return 1
+
+    except KeyboardInterrupt:
+        logger.error("Operation cancelled by user")
+        return 130
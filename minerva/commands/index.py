@@ -1,3 +1,4 @@
+import sqlite3
 import time
 from argparse import Namespace
 from typing import Any, Dict, List
@@ -11,15 +12,22 @@ from minerva.common.index_config import (
 from minerva.indexing.json_loader import load_json_notes
 from minerva.indexing.chunking import create_chunks_from_notes
 from minerva.indexing.embeddings import initialize_provider, generate_embeddings, EmbeddingError
+from minerva.indexing.checkpoint import EmbeddingJournal, checkpoint_fingerprint, default_checkpoint_dir
+from minerva.common.models import ChunkWithEmbedding
 from minerva.indexing.storage import (
     initialize_chromadb_client,
     collection_exists,
     create_collection,
     recreate_collection,
     insert_chunks,
+    get_hnsw_settings,
+    set_search_ef,
     StorageError,
     ChromaDBLock,
 )
+from minerva.indexing.lexical_index import sync_lexical_index
+from minerva.indexing.note_summaries import get_note_summary_collection, sync_note_summaries
+from minerva.indexing.vector_export import default_export_dir, export_exists, sync_vector_export
 from minerva.indexing.updater import (
     run_incremental_update,
     is_v1_collection,
@@ -28,6 +36,7 @@ from minerva.indexing.updater import (
     format_config_change_error
 )
 from minerva.common.logger import get_logger
+from minerva.common.profiling import pipeline_stage
 from minerva.common.exceptions import (
     ConfigError,
     IncrementalUpdateError,
@@ -71,6 +80,10 @@ def load_and_print_config(
         logger.info(f"   Chunk size: {collection.chunk_size} characters")
         logger.info(f"   Force recreate: {collection.force_recreate}")
         logger.info(f"   Skip AI validation: {collection.skip_ai_validation}")
+        if collection.hnsw:
+            logger.info(f"   HNSW parameters: {collection.hnsw.to_metadata()}")
+        if collection.note_summaries:
+            logger.info("   Note summaries: enabled")
         logger.info(f"   AI provider: {provider.provider_type}")
         logger.info(f"   Embedding model: {provider.embedding_model}")
         logger.info(f"   LLM model: {provider.llm_model}")
@@ -83,7 +96,8 @@ def load_and_print_notes(collection: CollectionConfig, verbose: bool) -> List[Di
     logger.info("Loading notes from JSON file...")
 
     try:
-        notes = load_json_notes(collection.json_file)
+        with pipeline_stage("load"):
+            notes = load_json_notes(collection.json_file)
 
         if verbose:
             total_chars = sum(len(note['markdown']) for note in notes)
@@ -279,6 +293,91 @@ def run_dry_run(
     logger.info("   Run without --dry-run to perform actual indexing")
 
 
+def apply_hnsw_settings(collection_obj, collection: CollectionConfig) -> None:
+    current = get_hnsw_settings(collection_obj)
+    requested = collection.hnsw
+
+    if requested.search_ef is not None and requested.search_ef != current["search_ef"]:
+        set_search_ef(collection_obj, requested.search_ef)
+        logger.success(f"   ✓ Updated search_ef: {current['search_ef']} → {requested.search_ef}")
+        logger.info("   Running servers use the new value after a restart")
+        logger.info("")
+
+    # M and construction_ef shape the graph itself and only apply to a new index
+    rebuild_needed = [
+        f"{name}={value} (index has {current[name]})"
+        for name, value in (("M", requested.M), ("construction_ef", requested.construction_ef))
+        if value is not None and current[name] is not None and value != current[name]
+    ]
+    if rebuild_needed:
+        logger.warning(f"   HNSW settings differ from the existing index: {', '.join(rebuild_needed)}")
+        logger.warning("   Set force_recreate: true to rebuild the index with the new settings")
+        logger.info("")
+
+
+def refresh_lexical_index(client, chromadb_path: str, collection_name: str, rebuild: bool = False) -> None:
+    # The BM25 index behind hybrid and lexical search; a failure leaves semantic search working
+    logger.info("Updating lexical index...")
+    try:
+        with pipeline_stage("lexical_index"):
+            stats = sync_lexical_index(client.get_collection(collection_name), chromadb_path, rebuild=rebuild)
+    except (StorageError, OSError, sqlite3.Error) as error:
+        logger.warning(f"   Lexical index not updated: {error}")
+        logger.warning("   Hybrid and lexical search use the previous index until the next successful run")
+        logger.info("")
+        return
+
+    logger.success(
+        f"   ✓ Lexical index updated: {stats.kept} kept, {stats.added} added, {stats.removed} removed"
+    )
+    logger.info("")
+
+
+def refresh_note_summaries(client, collection: CollectionConfig, rebuild: bool = False) -> None:
+    # Summaries created once (note_summaries: true) are kept in sync on later runs too
+    if not collection.note_summaries and get_note_summary_collection(client, collection.name) is None:
+        return
+
+    logger.info("Updating note summaries...")
+    try:
+        with pipeline_stage("note_summaries"):
+            stats = sync_note_summaries(client, client.get_collection(collection.name), rebuild=rebuild)
+    except StorageError as error:
+        logger.warning(f"   Note summaries not updated: {error}")
+        logger.warning("   Two-stage search uses the previous summaries until the next successful run")
+        logger.info("")
+        return
+
+    logger.success(
+        f"   ✓ Note summaries updated: {stats.kept} kept, {stats.added} added, {stats.removed} removed"
+    )
+    logger.info("")
+
+
+def refresh_vector_export(client, chromadb_path: str, collection_name: str) -> None:
+    # Only exports created with `minerva export-vectors` in the default location are kept in sync
+    export_dir = default_export_dir(chromadb_path)
+    if not export_exists(export_dir, collection_name):
+        return
+
+    logger.info("Updating vector export...")
+    try:
+        export, stats = sync_vector_export(client.get_collection(collection_name), export_dir)
+    except (StorageError, OSError) as error:
+        logger.warning(f"   Vector export not updated: {error}")
+        logger.warning(f"   Run 'minerva export-vectors {chromadb_path} {collection_name} --full' to rebuild it")
+        logger.info("")
+        return
+
+    if stats.up_to_date:
+        logger.success(f"   ✓ Vector export already up to date ({len(export.ids)} vectors)")
+    else:
+        logger.success(
+            f"   ✓ Vector export updated: {stats.kept} kept, {stats.added} added, {stats.removed} removed"
+        )
+    logger.info("")
+
+
 def run_incremental_indexing(
     index_config: IndexConfig,
     notes: List[Dict[str, Any]],
@@ -303,6 +402,9 @@ def run_incremental_indexing(
         logger.error(message)
         raise StorageError(message) from error
 
+    if collection.hnsw:
+        apply_hnsw_settings(collection_obj, collection)
+
     try:
         stats = run_incremental_update(
             collection=collection_obj,
@@ -324,30 +426,51 @@ def run_incremental_indexing(
             traceback.print_exc()
         raise IndexingError(f"Incremental update error: {error}") from error
 
+    refresh_lexical_index(client, chromadb_path, collection.name)
+    refresh_note_summaries(client, collection)
+    refresh_vector_export(client, chromadb_path, collection.name)
+
 
 def run_full_indexing(
     index_config: IndexConfig,
     notes: List[Dict[str, Any]],
     verbose: bool,
     start_time: float,
-    provider: AIProvider
+    provider: AIProvider,
+    resume: bool = False
 ) -> None:
     collection = index_config.collection
     embedding_metadata = provider.get_embedding_metadata()
 
     logger.info("Creating semantic chunks...")
-    chunks = create_chunks_from_notes(notes, target_chars=collection.chunk_size)
+    with pipeline_stage("chunk"):
+        chunks = create_chunks_from_notes(notes, target_chars=collection.chunk_size)
     logger.success(f"   ✓ Created {len(chunks)} chunks from {len(notes)} notes")
     logger.info("")
 
+    journal = EmbeddingJournal(
+        default_checkpoint_dir(index_config.chromadb_path),
+        collection.name,
+        checkpoint_fingerprint(index_config, embedding_metadata.get('embedding_dimension'))
+    ).open(resume)
+
     logger.info("Generating embeddings...")
     try:
-        chunks_with_embeddings = generate_embeddings(provider, chunks)
+        with pipeline_stage("embed"):
+            chunks_with_embeddings = embed_with_checkpoint(provider, chunks, journal)
         logger.success(f"   ✓ Generated {len(chunks_with_embeddings)} embeddings")
         logger.info("")
-    except EmbeddingError as error:
-        logger.error(f"Embedding generation error: {error}")
+    except (EmbeddingError, KeyboardInterrupt) as error:
+        if isinstance(error, EmbeddingError):
+            logger.error(f"Embedding generation error: {error}")
+        journal.close()
+        if journal.durable_count:
+            logger.info(f"   {journal.durable_count} embeddings are saved in {journal.journal_path}")
+            logger.info("   Run again with --resume to continue from there")
         raise
+    finally:
+        # Flushes the embeddings still pending, however the stage ended
+        journal.close()
 
     chromadb_path = index_config.chromadb_path
     logger.info(f"Initializing ChromaDB at: {chromadb_path}")
@@ -364,7 +487,8 @@ def run_full_indexing(
                 description=collection.description,
                 embedding_metadata=embedding_metadata,
                 chunk_size=collection.chunk_size,
-                note_count=len(notes)
+                note_count=len(notes),
+                hnsw_params=collection.hnsw.to_metadata() if collection.hnsw else None
             )
             logger.success("   ✓ Collection recreated")
         else:
@@ -374,7 +498,8 @@ def run_full_indexing(
                 description=collection.description,
                 embedding_metadata=embedding_metadata,
                 chunk_size=collection.chunk_size,
-                note_count=len(notes)
+                note_count=len(notes),
+                hnsw_params=collection.hnsw.to_metadata() if collection.hnsw else None
             )
             logger.success("   ✓ Collection ready")
         logger.info("")
@@ -390,7 +515,8 @@ def run_full_indexing(
             logger.info(f"   Progress: {current}/{total} chunks ({percentage:.1f}%)")
 
     try:
-        stats = insert_chunks(collection_obj, chunks_with_embeddings, progress_callback=progress_callback)
+        with pipeline_stage("store"):
+            stats = insert_chunks(collection_obj, chunks_with_embeddings, progress_callback=progress_callback)
         logger.success(f"   ✓ Stored {stats['successful']} chunks")
         if stats['failed'] > 0:
             logger.warning(f"   ⚠ Failed to store {stats['failed']} chunks")
@@ -399,6 +525,11 @@ def run_full_indexing(
         logger.error(f"Storage error: {error}")
         raise
 
+    refresh_lexical_index(client, chromadb_path, collection.name, rebuild=True)
+    refresh_note_summaries(client, collection, rebuild=True)
+    refresh_vector_export(client, chromadb_path, collection.name)
+    journal.discard()
+
     processing_time = time.time() - start_time
     print_final_summary(
         index_config,
@@ -410,6 +541,35 @@ def run_full_indexing(
     )
 
 
+def embed_with_checkpoint(provider: AIProvider, chunks: List[Any], journal: EmbeddingJournal) -> List[Any]:
+    # Chunks journaled with the same text reuse their vectors; new embeddings are journaled as they arrive
+    if not journal.completed:
+        return generate_embeddings(provider, chunks, embedded_callback=journal.record)
+
+    reused = {}
+    for chunk in chunks:
+        embedding = journal.embedding_for(chunk)
+        if embedding is not None:
+            reused[chunk.id] = embedding
+
+    pending = [chunk for chunk in chunks if chunk.id not in reused]
+    logger.info(f"   Resuming: {len(reused)} of {len(chunks)} chunks already embedded")
+    generated = {}
+    if pending:
+        generated = {
+            item.chunk.id: item
+            for item in generate_embeddings(provider, pending, embedded_callback=journal.record)
+        }
+
+    chunks_with_embeddings = []
+    for chunk in chunks:
+        if chunk.id in generated:
+            chunks_with_embeddings.append(generated[chunk.id])
+        elif chunk.id in reused:
+            chunks_with_embeddings.append(ChunkWithEmbedding(chunk=chunk, embedding=reused[chunk.id].tolist()))
+    return chunks_with_embeddings
+
+
 def print_final_summary(
     index_config: IndexConfig,
     notes: List[Dict[str, Any]],
@@ -441,6 +601,7 @@ def print_final_summary(
 
 def run_index(args: Namespace) -> int:
     start_time = time.time()
+    resume = getattr(args, 'resume', False)
 
     try:
         print_banner(args.dry_run)
@@ -465,6 +626,8 @@ def run_index(args: Namespace) -> int:
                 )
 
                 if mode == "incremental":
+                    if resume:
+                        logger.warning("--resume only applies to full indexing; running an incremental update")
                     run_incremental_indexing(
                         index_config,
                         notes,
@@ -478,7 +641,8 @@ def run_index(args: Namespace) -> int:
                         notes,
                         args.verbose,
                         start_time,
-                        provider
+                        provider,
+                        resume=resume
                     )
 
         return 0
@@ -5,6 +5,7 @@ from typing import Dict, Any, List
 
 from minerva.common.logger import get_logger
 from minerva.indexing.storage import initialize_chromadb_client, ChromaDBConnectionError
+from minerva.indexing.note_summaries import is_note_summary_collection
 
 logger = get_logger(__name__, simple=True, mode="cli")
 
@@ -301,7 +302,10 @@ def run_peek(args: Namespace) -> int:
 
         client = initialize_chromadb_client(chromadb_path)
 
-        collections = client.list_collections()
+        collections = [
+            collection for collection in client.list_collections()
+            if not is_note_summary_collection(collection)
+        ]
         existing_collections_names = [c.name for c in collections]
 
         # If no collection name provided, list all collections
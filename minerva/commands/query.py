@@ -5,6 +5,7 @@ import json
 from minerva.common.logger import get_logger
 from minerva.indexing.storage import initialize_chromadb_client, ChromaDBConnectionError
 from minerva.server.search_tools import search_knowledge_base, CollectionNotFoundError
+from minerva.server.federated_search import federated_search
 from minerva.server.collection_discovery import discover_collections_with_providers
 
 logger = get_logger(__name__, simple=True, mode="cli")
@@ -17,18 +18,19 @@ def run_query(args: Namespace) -> int:
     max_results = args.max_results if hasattr(args, 'max_results') and args.max_results else 5
     output_format = args.format if hasattr(args, 'format') and args.format else 'text'
     verbose = args.verbose if hasattr(args, 'verbose') and args.verbose else False
+    search_mode = args.search_mode if hasattr(args, 'search_mode') and args.search_mode else 'semantic'
 
     try:
         client = initialize_chromadb_client(str(chromadb_path))
 
         if collection_name:
             results = _query_single_collection(
-                client, chromadb_path, collection_name, query_text, max_results, verbose
+                client, chromadb_path, collection_name, query_text, max_results, verbose, search_mode
             )
             _print_results(results, collection_name, output_format)
         else:
             all_results = _query_all_collections(
-                client, chromadb_path, query_text, max_results, verbose
+                client, chromadb_path, query_text, max_results, verbose, search_mode
             )
             _print_all_results(all_results, output_format)
 
@@ -48,7 +50,9 @@ def run_query(args: Namespace) -> int:
         return 1
 
 
-def _query_single_collection(client, chromadb_path, collection_name, query_text, max_results, verbose):
+def _query_single_collection(
+    client, chromadb_path, collection_name, query_text, max_results, verbose, search_mode='semantic'
+):
     provider_map, all_collections = discover_collections_with_providers(str(chromadb_path))
 
     available_collections = [c for c in all_collections if c['available']]
@@ -76,47 +80,39 @@ def _query_single_collection(client, chromadb_path, collection_name, query_text,
         provider=provider,
         context_mode="chunk_only",
         max_results=max_results,
-        verbose=verbose
+        verbose=verbose,
+        search_mode=search_mode
     )
 
     return results
 
 
-def _query_all_collections(client, chromadb_path, query_text, max_results, verbose):
+def _query_all_collections(client, chromadb_path, query_text, max_results, verbose, search_mode='semantic'):
     provider_map, all_collections = discover_collections_with_providers(str(chromadb_path))
 
     available_collections = [c for c in all_collections if c['available']]
 
     if not available_collections:
         logger.error("No available collections found")
-        return {}
+        return []
 
     logger.info(f"Querying {len(available_collections)} collection(s)...\n")
 
-    all_results = {}
-    for collection_info in available_collections:
-        collection_name = collection_info['name']
-
-        try:
-            provider = provider_map[collection_name]
-
-            results = search_knowledge_base(
-                query=query_text,
-                collection_name=collection_name,
-                chromadb_path=str(chromadb_path),
-                provider=provider,
-                context_mode="chunk_only",
-                max_results=max_results,
-                verbose=verbose
-            )
-
-            all_results[collection_name] = results
+    results, errors = federated_search(
+        query=query_text,
+        chromadb_path=str(chromadb_path),
+        provider_map=provider_map,
+        collection_names=[c['name'] for c in available_collections],
+        context_mode="chunk_only",
+        max_results=max_results,
+        verbose=verbose,
+        search_mode=search_mode
+    )
 
-        except Exception as e:
-            logger.warning(f"Error querying {collection_name}: {e}")
-            continue
+    for collection_name, message in errors.items():
+        logger.warning(f"Error querying {collection_name}: {message}")
 
-    return all_results
+    return results
 
 
 def _print_results(results, collection_name, output_format):
@@ -137,22 +133,21 @@ def _print_results(results, collection_name, output_format):
             logger.info(f"{'-'*60}")
 
 
-def _print_all_results(all_results, output_format):
+def _print_all_results(results, output_format):
     if output_format == 'json':
-        print(json.dumps(all_results, indent=2))
+        print(json.dumps(results, indent=2))
     else:
-        for collection_name, results in all_results.items():
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Collection: {collection_name}")
-            logger.info(f"{'='*60}")
-
-            if not results:
-                logger.info("No results found\n")
-                continue
-
-            for i, result in enumerate(results, 1):
-                logger.info(f"\n[{i}] {result['noteTitle']}")
-                logger.info(f"Score: {result.get('relevanceScore', result.get('similarityScore', 0)):.4f}")
-                logger.info(f"\n{result.get('text', result.get('content', ''))}\n")
-                if i < len(results):
-                    logger.info(f"{'-'*60}")
+        logger.info("\nResults from all collections (merged by rank within each collection):\n")
+        logger.info(f"{'='*60}")
+
+        if not results:
+            logger.info("No results found")
+            return
+
+        for i, result in enumerate(results, 1):
+            logger.info(f"\n[{i}] {result['noteTitle']}")
+            logger.info(f"Collection: {result['collectionName']}")
+            logger.info(f"Score: {result.get('relevanceScore', result.get('similarityScore', 0)):.4f}")
+            logger.info(f"\n{result.get('text', result.get('content', ''))}\n")
+            if i < len(results):
+                logger.info(f"{'-'*60}")
@@ -12,6 +12,9 @@ from minerva.indexing.storage import (
     remove_collection,
     ChromaDBLock,
 )
+from minerva.indexing.lexical_index import remove_lexical_index
+from minerva.indexing.note_summaries import is_note_summary_collection, remove_note_summaries
+from minerva.indexing.vector_export import default_export_dir, remove_vector_export
 from minerva.commands.peek import (
     format_collection_info_text,
     get_collection_info,
@@ -78,7 +81,10 @@ def run_remove(args: Namespace) -> int:
         resolved_path = _validate_chromadb_path(chromadb_path)
         client = initialize_chromadb_client(str(resolved_path))
 
-        collections = {collection.name: collection for collection in client.list_collections()}
+        collections = {
+            collection.name: collection for collection in client.list_collections()
+            if not is_note_summary_collection(collection)
+        }
 
         if not collections:
             logger.error("No collections found in ChromaDB")
@@ -102,8 +108,13 @@ def run_remove(args: Namespace) -> int:
         # Acquire lock for the deletion operation
         with ChromaDBLock(str(resolved_path)):
             remove_collection(client, collection_name)
+            remove_lexical_index(str(resolved_path), collection_name)
+            remove_note_summaries(client, collection_name)
+            exported = remove_vector_export(default_export_dir(str(resolved_path)), collection_name)
 
         logger.success(f"✓ Collection '{collection_name}' deleted")
+        if exported:
+            logger.info("  Its vector export was removed as well.")
         logger.info("You can recreate it with 'minerva index --config <config-file>'.")
         return 0
 
@@ -2,7 +2,7 @@ import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Mapping, Optional
+from typing import Any, Mapping, Optional, Tuple
 
 from minerva.common.exceptions import APIKeyMissingError, ConfigError
 from minerva.common.credential_helper import get_credential
@@ -53,6 +53,9 @@ class AIProviderConfig:
     base_url: Optional[str] = None
     api_key: Optional[str] = None
     rate_limit: Optional[RateLimitConfig] = None
+    # Every endpoint serving the same models, for load-balanced embedding;
+    # base_url is the first one
+    base_urls: Tuple[str, ...] = ()
 
     def __post_init__(self):
         valid_providers = ['ollama', 'openai', 'gemini', 'lmstudio']
@@ -75,6 +78,21 @@ class AIProviderConfig:
         if self.llm_model is not None and not self.llm_model:
             raise ValueError("llm_model cannot be empty string")
 
+        if self.base_urls:
+            if not all(self.base_urls):
+                raise ValueError("base_urls cannot contain empty strings")
+            if len(set(self.base_urls)) != len(self.base_urls):
+                raise ValueError("base_urls cannot contain duplicates")
+            if self.base_url is None:
+                object.__setattr__(self, 'base_url', self.base_urls[0])
+            elif self.base_url != self.base_urls[0]:
+                raise ValueError("base_url must be the first of base_urls")
+
+    @property
+    def endpoints(self) -> Tuple[Optional[str], ...]:
+        # One entry per endpoint; (None,) when the provider's default is used
+        return self.base_urls or (self.base_url,)
+
     def resolve_api_key(self) -> Optional[str]:
         return resolve_env_variable(self.api_key)
 
@@ -92,7 +110,13 @@ AI_PROVIDER_JSON_SCHEMA: dict[str, Any] = {
         },
         "embedding_model": {"type": "string", "minLength": 1},
         "llm_model": {"type": "string", "minLength": 1},
-        "base_url": {"type": ["string", "null"], "minLength": 1},
+        "base_url": {
+            "type": ["string", "array", "null"],
+            "minLength": 1,
+            "items": {"type": "string", "minLength": 1},
+            "minItems": 1,
+            "uniqueItems": True
+        },
         "api_key": {
             "type": ["string", "null"],
             "minLength": 1,
@@ -103,7 +127,13 @@ AI_PROVIDER_JSON_SCHEMA: dict[str, Any] = {
             "required": ["model"],
             "properties": {
                 "model": {"type": "string", "minLength": 1},
-                "base_url": {"type": ["string", "null"], "minLength": 1},
+                "base_url": {
+                    "type": ["string", "array", "null"],
+                    "minLength": 1,
+                    "items": {"type": "string", "minLength": 1},
+                    "minItems": 1,
+                    "uniqueItems": True
+                },
                 "api_key": {
                     "type": ["string", "null"],
                     "minLength": 1,
@@ -117,7 +147,13 @@ AI_PROVIDER_JSON_SCHEMA: dict[str, Any] = {
             "required": ["model"],
             "properties": {
                 "model": {"type": "string", "minLength": 1},
-                "base_url": {"type": ["string", "null"], "minLength": 1},
+                "base_url": {
+                    "type": ["string", "array", "null"],
+                    "minLength": 1,
+                    "items": {"type": "string", "minLength": 1},
+                    "minItems": 1,
+                    "uniqueItems": True
+                },
                 "api_key": {
                     "type": ["string", "null"],
                     "minLength": 1,
@@ -163,7 +199,7 @@ def build_ai_provider_config(
     embedding_model = _resolve_model(provider_data, "embedding", context, source_path)
     llm_model = _resolve_model(provider_data, "llm", context, source_path)
 
-    base_url = _resolve_endpoint(provider_data)
+    base_urls = _resolve_endpoints(provider_data)
     api_key = _resolve_api_key(provider_data, context, source_path)
     rate_limit = _resolve_rate_limit(provider_data, context, source_path)
 
@@ -171,9 +207,10 @@ def build_ai_provider_config(
         provider_type=provider_type,
         embedding_model=embedding_model,
         llm_model=llm_model,
-        base_url=base_url,
+        base_url=base_urls[0] if base_urls else None,
         api_key=api_key,
         rate_limit=rate_limit,
+        base_urls=base_urls if len(base_urls) > 1 else (),
     )
 
 
@@ -225,22 +262,25 @@ def _resolve_model(
     return None
 
 
-def _resolve_endpoint(provider_data: Mapping[str, Any]) -> Optional[str]:
-    base_url = provider_data.get("base_url")
-    if base_url:
-        value = str(base_url).strip()
-        if value:
-            return value
+def _resolve_endpoints(provider_data: Mapping[str, Any]) -> Tuple[str, ...]:
+    # base_url may be a single URL or a list of equivalent endpoints
+    base_urls = _endpoint_list(provider_data.get("base_url"))
+    if base_urls:
+        return base_urls
 
     for nested_key in ("embedding", "llm"):
         nested = provider_data.get(nested_key)
         if isinstance(nested, Mapping):
-            nested_url = nested.get("base_url")
-            if nested_url:
-                candidate = str(nested_url).strip()
-                if candidate:
-                    return candidate
-    return None
+            nested_urls = _endpoint_list(nested.get("base_url"))
+            if nested_urls:
+                return nested_urls
+    return ()
+
+
+def _endpoint_list(value: Any) -> Tuple[str, ...]:
+    values = value if isinstance(value, (list, tuple)) else [value]
+    urls = [str(url).strip() for url in values if url]
+    return tuple(dict.fromkeys(url for url in urls if url))
 
 
 def _resolve_api_key(
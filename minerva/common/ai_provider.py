@@ -2,18 +2,30 @@ import json
 import os
 import re
 import logging
+import sys
 import threading
 import time
 from collections import deque
 from contextlib import contextmanager
-from typing import List, Dict, Any, Optional, Iterable
+from typing import Callable, List, Dict, Any, Optional, Iterable, Tuple
 
 import httpx
-import litellm
 import numpy as np
 
 from minerva.common.ai_config import AIProviderConfig, APIKeyMissingError, RateLimitConfig
-from minerva.common.exceptions import AIProviderError, ProviderUnavailableError
+from minerva.common.circuit_breaker import CLOSED, OPEN, CircuitBreaker
+from minerva.common.exceptions import AIProviderError, ProviderCircuitOpenError, ProviderUnavailableError
+from minerva.common.logger import get_logger
+from minerva.common.metrics import PROVIDER_ERRORS
+
+console_logger = get_logger(__name__)
+
+# Consecutive connection failures before calls to an endpoint fail fast
+PROVIDER_FAILURE_THRESHOLD = 3
+# Seconds between background probes of an endpoint whose circuit is open
+PROVIDER_PROBE_INTERVAL = 15.0
+# check_availability() is a real embedding call; its result is reused this long
+AVAILABILITY_TTL_SECONDS = 60.0
 
 
 def l2_normalize(vectors: np.ndarray) -> np.ndarray:
@@ -22,8 +34,30 @@ def l2_normalize(vectors: np.ndarray) -> np.ndarray:
     return vectors / norms
 
 
+def classify_provider_error(error: Exception) -> str:
+    error_str = str(error).lower()
+    if isinstance(error, ProviderUnavailableError) or any(
+        keyword in error_str for keyword in ['connection', 'refused', 'unavailable', 'timeout']
+    ):
+        return "unavailable"
+    if 'rate limit' in error_str or 'quota' in error_str or '429' in error_str:
+        return "rate_limited"
+    return "error"
+
+
+def _load_litellm():
+    # litellm takes seconds to import; only providers that route through it pay for it
+    import litellm
+    return litellm
+
+
 @contextmanager
 def _suppress_litellm_debug():
+    litellm = sys.modules.get('litellm')
+    if litellm is None:
+        yield
+        return
+
     old_value = litellm.suppress_debug_info
     litellm.suppress_debug_info = True
     try:
@@ -83,6 +117,159 @@ class RateLimiter:
             time.sleep(duration)
 
 
+class ProviderHealthMonitor:
+    """Health of one provider endpoint, shared by every AIProvider that calls it.
+
+    Connection failures (refused, timeout, unavailable) count towards a
+    circuit breaker; other errors show the endpoint is reachable. Once the
+    circuit opens, calls fail fast with ProviderCircuitOpenError instead of
+    waiting out the client timeout, and a background thread probes the
+    endpoint every `probe_interval` seconds until a probe succeeds.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = PROVIDER_FAILURE_THRESHOLD,
+        probe_interval: float = PROVIDER_PROBE_INTERVAL,
+        availability_ttl: float = AVAILABILITY_TTL_SECONDS
+    ):
+        self.name = name
+        self.breaker = CircuitBreaker(failure_threshold, probe_interval)
+        self.availability_ttl = availability_ttl
+        self.last_error: Optional[str] = None
+        self._probe: Optional[Callable[[], None]] = None
+        self._probe_thread: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+        self._availability: Dict[Any, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def set_probe(self, probe: Callable[[], None]) -> None:
+        # A cheap request that raises when the endpoint is down; the first provider's wins
+        with self._lock:
+            if self._probe is None:
+                self._probe = probe
+
+    def before_call(self) -> None:
+        if self.breaker.allow_request():
+            return
+        raise ProviderCircuitOpenError(self.unavailable_reason())
+
+    def unavailable_reason(self) -> str:
+        return (
+            f"{self.name} is unavailable after {self.breaker.consecutive_failures} consecutive failures "
+            f"(next probe in {self.breaker.retry_after():.0f}s): {self.last_error}"
+        )
+
+    def record_success(self) -> None:
+        if self.breaker.state == CLOSED and self.breaker.consecutive_failures == 0:
+            return
+        recovered = self.breaker.state != CLOSED
+        self.breaker.record_success()
+        if recovered:
+            with self._lock:
+                self._availability.clear()
+            console_logger.info(f"Provider {self.name} recovered; circuit closed")
+
+    def record_failure(self, error: Exception) -> None:
+        if classify_provider_error(error) != "unavailable":
+            # The endpoint answered, so it is up even though the call failed
+            self.record_success()
+            return
+
+        was_closed = self.breaker.state == CLOSED
+        self.last_error = str(error).splitlines()[0] if str(error) else type(error).__name__
+        self.breaker.record_failure()
+        if self.breaker.state == OPEN and was_closed:
+            with self._lock:
+                self._availability.clear()
+            console_logger.warning(
+                f"Provider {self.name} marked unavailable after {self.breaker.consecutive_failures} "
+                f"consecutive failures; failing fast and probing every {self.breaker.cooldown_seconds:.0f}s "
+                f"({self.last_error})"
+            )
+            self._start_probe()
+
+    def cached_availability(self, key: Any, check: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        # An open circuit bypasses the cache: check() then fails fast
+        if self.breaker.state == CLOSED:
+            with self._lock:
+                cached = self._availability.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self.availability_ttl:
+                return dict(cached[1])
+
+        result = check()
+        with self._lock:
+            self._availability[key] = (time.monotonic(), dict(result))
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        state = self.breaker.state
+        return {
+            "provider": self.name,
+            "state": state,
+            "consecutive_failures": self.breaker.consecutive_failures,
+            "retry_after_seconds": round(self.breaker.retry_after(), 1),
+            "last_error": self.last_error if state != CLOSED else None,
+        }
+
+    def close(self) -> None:
+        # Stops the background probe
+        self._closed.set()
+
+    def _start_probe(self) -> None:
+        with self._lock:
+            if self._closed.is_set() or self._probe is None or (self._probe_thread is not None and self._probe_thread.is_alive()):
+                return
+            self._probe_thread = threading.Thread(
+                target=self._run_probe, name=f"minerva-probe-{self.name}", daemon=True
+            )
+            self._probe_thread.start()
+
+    def _run_probe(self) -> None:
+        while self.breaker.state != CLOSED:
+            if self._closed.wait(max(self.breaker.retry_after(), 0.05)):
+                return
+            # Half-open: only one trial at a time, which may also be a real call
+            if not self.breaker.allow_request():
+                continue
+            try:
+                self._probe()
+            except Exception as error:
+                self.record_failure(error)
+                continue
+            self.record_success()
+
+
+_HEALTH_MONITORS: Dict[Tuple[Any, Any], ProviderHealthMonitor] = {}
+_HEALTH_MONITORS_LOCK = threading.Lock()
+
+
+def provider_health_monitor(provider_type: str, base_url: Optional[str]) -> ProviderHealthMonitor:
+    # One monitor per endpoint: every model served by a down Ollama is down too
+    key = (provider_type, base_url)
+    with _HEALTH_MONITORS_LOCK:
+        monitor = _HEALTH_MONITORS.get(key)
+        if monitor is None:
+            name = f"{provider_type}@{base_url}" if base_url else provider_type
+            monitor = _HEALTH_MONITORS[key] = ProviderHealthMonitor(name)
+        return monitor
+
+
+def provider_health_snapshot() -> List[Dict[str, Any]]:
+    with _HEALTH_MONITORS_LOCK:
+        monitors = list(_HEALTH_MONITORS.values())
+    return [monitor.snapshot() for monitor in sorted(monitors, key=lambda monitor: monitor.name)]
+
+
+def reset_provider_health() -> None:
+    with _HEALTH_MONITORS_LOCK:
+        monitors = list(_HEALTH_MONITORS.values())
+        _HEALTH_MONITORS.clear()
+    for monitor in monitors:
+        monitor.close()
+
+
 class LMStudioClient:
     def __init__(self, base_url: str):
         base_url = base_url.rstrip('/')
@@ -186,6 +373,17 @@ class LMStudioClient:
                         continue
 
         return stream_generator()
+
+
+class ProviderEndpoint:
+    # One base URL of a provider: its health, its LM Studio client and its in-flight requests
+    def __init__(self, provider_type: str, base_url: Optional[str]):
+        self.base_url = base_url
+        self.health = provider_health_monitor(provider_type, base_url)
+        self.client = LMStudioClient(base_url) if provider_type == 'lmstudio' else None
+        self.outstanding = 0
+
+
 class AIProvider:
     def __init__(self, config: AIProviderConfig):
         self.config = config
@@ -196,14 +394,105 @@ class AIProvider:
         self.base_url = config.base_url
         self.rate_limiter = RateLimiter.from_config(config.rate_limit)
         self.using_lmstudio = self.provider_type == 'lmstudio'
-        self.lmstudio_client = None
+        self.litellm = None
 
-        if self.using_lmstudio:
-            self.lmstudio_client = LMStudioClient(self.base_url)
-        else:
-            self.litellm = litellm
+        # Embeddings are spread over every endpoint; chat and the availability
+        # check use the first one
+        self.endpoints = [ProviderEndpoint(self.provider_type, base_url) for base_url in config.endpoints]
+        self._endpoint_lock = threading.Lock()
+        self._next_endpoint = 0
+        self.health = self.endpoints[0].health
+
+        if not self.using_lmstudio:
+            self.litellm = _load_litellm()
             self._configure_litellm()
 
+        for endpoint in self.endpoints:
+            endpoint.health.set_probe(lambda endpoint=endpoint: self._probe_endpoint(endpoint))
+
+    @property
+    def endpoint_count(self) -> int:
+        return len(self.endpoints)
+
+    @property
+    def lmstudio_client(self) -> Optional['LMStudioClient']:
+        return self.endpoints[0].client
+
+    @lmstudio_client.setter
+    def lmstudio_client(self, client: Optional['LMStudioClient']) -> None:
+        self.endpoints[0].client = client
+
+    def _record_error(self, operation: str, error: Exception) -> None:
+        PROVIDER_ERRORS.inc(provider=self.provider_type, operation=operation, kind=classify_provider_error(error))
+
+    def _probe_endpoint(self, endpoint: ProviderEndpoint) -> None:
+        # Used by the health monitor; bypasses its circuit and raises when the endpoint is down
+        with _suppress_litellm_debug():
+            if self.embedding_model:
+                self._send_embedding_request(endpoint, ["Connection test"])
+            else:
+                self._chat_completion_request(
+                    messages=[{"role": "user", "content": "test"}],
+                    temperature=0.0,
+                    max_tokens=1,
+                    tools=None,
+                    stream=False
+                )
+
+    def _embedding_request(self, texts: List[str]):
+        # Sent to the healthy endpoint with the fewest requests in flight. A
+        # connection failure moves on to the next endpoint; other errors are raised.
+        tried: List[ProviderEndpoint] = []
+        while True:
+            endpoint = self._acquire_endpoint(tried)
+            try:
+                response = self._send_embedding_request(endpoint, texts)
+            except Exception as error:
+                endpoint.health.record_failure(error)
+                tried.append(endpoint)
+                if classify_provider_error(error) != "unavailable" or len(tried) == len(self.endpoints):
+                    raise
+                console_logger.warning(f"Embedding request to {endpoint.health.name} failed, trying another endpoint: {error}")
+                continue
+            finally:
+                self._release_endpoint(endpoint)
+            endpoint.health.record_success()
+            return response
+
+    def _acquire_endpoint(self, exclude: List[ProviderEndpoint]) -> ProviderEndpoint:
+        with self._endpoint_lock:
+            count = len(self.endpoints)
+            # Rotating the start makes ties go round-robin; sorted() is stable
+            rotation = [self.endpoints[(self._next_endpoint + offset) % count] for offset in range(count)]
+            candidates = sorted(
+                (endpoint for endpoint in rotation if endpoint not in exclude),
+                key=lambda endpoint: endpoint.outstanding
+            )
+            for endpoint in candidates:
+                if endpoint.health.breaker.allow_request():
+                    endpoint.outstanding += 1
+                    self._next_endpoint = (self.endpoints.index(endpoint) + 1) % count
+                    return endpoint
+
+        if count == 1:
+            raise ProviderCircuitOpenError(self.health.unavailable_reason())
+        reasons = "; ".join(endpoint.health.unavailable_reason() for endpoint in candidates)
+        raise ProviderCircuitOpenError(f"All {count} {self.provider_type} endpoints are unavailable: {reasons}")
+
+    def _release_endpoint(self, endpoint: ProviderEndpoint) -> None:
+        with self._endpoint_lock:
+            endpoint.outstanding -= 1
+
+    def _send_embedding_request(self, endpoint: ProviderEndpoint, texts: List[str]):
+        with self._rate_limit_guard():
+            if self.using_lmstudio and endpoint.client:
+                return endpoint.client.embeddings(self.embedding_model, texts)
+            model_name = self._get_model_name_for_litellm(self.embedding_model, for_embedding=True)
+            if len(self.endpoints) > 1:
+                # OLLAMA_API_BASE / OPENAI_API_BASE only name the first endpoint
+                return self.litellm.embedding(model=model_name, input=texts, api_base=endpoint.base_url)
+            return self.litellm.embedding(model=model_name, input=texts)
+
     @contextmanager
     def _rate_limit_guard(self):
         if not self.rate_limiter:
@@ -254,15 +543,7 @@ class AIProvider:
             )
 
         try:
-            with self._rate_limit_guard():
-                if self.using_lmstudio and self.lmstudio_client:
-                    response = self.lmstudio_client.embeddings(self.embedding_model, [text])
-                else:
-                    model_name = self._get_model_name_for_litellm(self.embedding_model, for_embedding=True)
-                    response = self.litellm.embedding(
-                        model=model_name,
-                        input=[text]
-                    )
+            response = self._embedding_request([text])
 
             if not response:
                 raise AIProviderError("Invalid response from provider: empty response")
@@ -295,10 +576,14 @@ class AIProvider:
             normalized = l2_normalize(vector.reshape(1, -1))
             return normalized.flatten().tolist()
 
-        except (AIProviderError, ProviderUnavailableError):
+        except ProviderCircuitOpenError:
+            raise
+        except (AIProviderError, ProviderUnavailableError) as error:
             # Re-raise our own exceptions unchanged
+            self._record_error("embedding", error)
             raise
         except Exception as error:
+            self._record_error("embedding", error)
             # Check for connection/availability errors
             error_str = str(error).lower()
             if any(keyword in error_str for keyword in ['connection', 'refused', 'unavailable', 'timeout']):
@@ -322,15 +607,7 @@ class AIProvider:
                 )
 
         try:
-            with self._rate_limit_guard():
-                if self.using_lmstudio and self.lmstudio_client:
-                    response = self.lmstudio_client.embeddings(self.embedding_model, texts)
-                else:
-                    model_name = self._get_model_name_for_litellm(self.embedding_model, for_embedding=True)
-                    response = self.litellm.embedding(
-                        model=model_name,
-                        input=texts
-                    )
+            response = self._embedding_request(texts)
 
             if not response:
                 raise AIProviderError("Invalid response from provider: empty response")
@@ -372,10 +649,14 @@ class AIProvider:
             # Convert to list of lists and return
             return normalized.tolist()
 
-        except (AIProviderError, ProviderUnavailableError):
+        except ProviderCircuitOpenError:
+            raise
+        except (AIProviderError, ProviderUnavailableError) as error:
             # Re-raise our own exceptions unchanged
+            self._record_error("embedding_batch", error)
             raise
         except Exception as error:
+            self._record_error("embedding_batch", error)
             # Check for connection/availability errors
             error_str = str(error).lower()
             if any(keyword in error_str for keyword in ['connection', 'refused', 'unavailable', 'timeout']):
@@ -465,6 +746,10 @@ class AIProvider:
         return metadata
 
     def check_availability(self) -> Dict[str, Any]:
+        # Cached per model for AVAILABILITY_TTL_SECONDS; fails fast while the endpoint's circuit is open
+        return self.health.cached_availability((self.embedding_model, self.llm_model), self._check_availability)
+
+    def _check_availability(self) -> Dict[str, Any]:
         result = {
             'available': False,
             'provider_type': self.provider_type,
@@ -613,6 +898,7 @@ Be concise and direct."""
         if not messages:
             raise ValueError("Messages list cannot be empty")
 
+        self.health.before_call()
         try:
             response = self._chat_completion_request(
                 messages=messages,
@@ -621,6 +907,7 @@ Be concise and direct."""
                 tools=tools,
                 stream=stream
             )
+            self.health.record_success()
 
             if stream:
                 if isinstance(response, dict) and 'stream' in response:
@@ -696,9 +983,13 @@ Be concise and direct."""
 
             return result
 
-        except (AIProviderError, ProviderUnavailableError):
+        except (AIProviderError, ProviderUnavailableError) as error:
+            self._record_error("chat", error)
+            self.health.record_failure(error)
             raise
         except Exception as error:
+            self._record_error("chat", error)
+            self.health.record_failure(error)
             error_str = str(error).lower()
             if any(keyword in error_str for keyword in ['connection', 'refused', 'unavailable', 'timeout']):
                 raise ProviderUnavailableError(
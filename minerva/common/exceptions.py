@@ -65,6 +65,10 @@ class ProviderUnavailableError(ProviderError):
     pass
 
 
+class ProviderCircuitOpenError(ProviderUnavailableError):
+    pass
+
+
 class ServerError(MinervaError):
     pass
 
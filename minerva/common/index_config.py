@@ -4,7 +4,7 @@ import json
 import copy
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from jsonschema import Draft7Validator
 from jsonschema import ValidationError as JsonSchemaValidationError
@@ -55,6 +55,18 @@ INDEX_CONFIG_SCHEMA: Dict[str, Any] = {
                 },
                 "skip_ai_validation": {
                     "type": "boolean"
+                },
+                "note_summaries": {
+                    "type": "boolean"
+                },
+                "hnsw": {
+                    "type": "object",
+                    "properties": {
+                        "M": {"type": "integer", "minimum": 2, "maximum": 256},
+                        "construction_ef": {"type": "integer", "minimum": 1, "maximum": 4096},
+                        "search_ef": {"type": "integer", "minimum": 1, "maximum": 4096}
+                    },
+                    "additionalProperties": False
                 }
             },
             "additionalProperties": False
@@ -65,6 +77,22 @@ INDEX_CONFIG_SCHEMA: Dict[str, Any] = {
 }
 
 
+@dataclass(frozen=True)
+class HnswConfig:
+    # Unset values keep ChromaDB's defaults (M=16, construction_ef=100, search_ef=100)
+    M: Optional[int] = None
+    construction_ef: Optional[int] = None
+    search_ef: Optional[int] = None
+
+    def to_metadata(self) -> Dict[str, int]:
+        values = {
+            "hnsw:M": self.M,
+            "hnsw:construction_ef": self.construction_ef,
+            "hnsw:search_ef": self.search_ef
+        }
+        return {key: value for key, value in values.items() if value is not None}
+
+
 @dataclass(frozen=True)
 class CollectionConfig:
     name: str
@@ -73,6 +101,9 @@ class CollectionConfig:
     chunk_size: int
     force_recreate: bool
     skip_ai_validation: bool
+    hnsw: Optional[HnswConfig] = None
+    # Keep a companion collection of per-note mean vectors for two-stage search
+    note_summaries: bool = False
 
 
 @dataclass(frozen=True)
@@ -201,6 +232,10 @@ def _build_collection(block: Dict[str, Any], base_dir: Path, source_path: Path)
 
     force_recreate = bool(block.get("force_recreate", False))
     skip_validation = bool(block.get("skip_ai_validation", False))
+    note_summaries = bool(block.get("note_summaries", False))
+
+    hnsw_block = block.get("hnsw")
+    hnsw = HnswConfig(**hnsw_block) if hnsw_block else None
 
     return CollectionConfig(
         name=name,
@@ -208,7 +243,9 @@ def _build_collection(block: Dict[str, Any], base_dir: Path, source_path: Path)
         json_file=json_file,
         chunk_size=chunk_size,
         force_recreate=force_recreate,
-        skip_ai_validation=skip_validation
+        skip_ai_validation=skip_validation,
+        hnsw=hnsw,
+        note_summaries=note_summaries
     )
 
 
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 
 @dataclass(frozen=True)
@@ -20,6 +20,12 @@ class Chunk:
     # Content hash (SHA256 of title + markdown), only set for first chunk
     content_hash: Optional[str] = None
 
+    # Token count of content (cl100k_base), computed once at index time
+    token_count: Optional[int] = None
+
+    # Normalized extractor fields for metadata-filtered search (see indexing.filter_fields)
+    filter_fields: Optional[Dict[str, Any]] = None
+
     def __post_init__(self):
         if not self.id:
             raise ValueError("Chunk ID cannot be empty")
@@ -80,6 +86,14 @@ class ChunkWithEmbedding:
     def content_hash(self) -> Optional[str]:
         return self.chunk.content_hash
 
+    @property
+    def token_count(self) -> Optional[int]:
+        return self.chunk.token_count
+
+    @property
+    def filter_fields(self) -> Optional[Dict[str, Any]]:
+        return self.chunk.filter_fields
+
 
 # Type aliases for better readability in function signatures
 ChunkList = List[Chunk]
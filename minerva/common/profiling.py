@@ -0,0 +1,214 @@
+import cProfile
+import io
+import json
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from minerva.common.logger import get_logger
+from minerva.common.tracing import span
+
+# stderr: profiling can wrap `minerva serve`, which speaks JSON-RPC on stdout
+logger = get_logger(__name__)
+
+DEFAULT_PROFILE_DIR = "minerva-profiles"
+PROFILERS = ("cprofile", "sampling")
+TOP_HOTSPOTS = 40
+TOP_ALLOCATION_SITES = 15
+
+
+@dataclass
+class StageMemory:
+    name: str
+    calls: int = 0
+    seconds: float = 0.0
+    peak_bytes: int = 0
+    net_bytes: int = 0
+
+
+class MemoryProfiler:
+    # Peaks are tracked per pipeline stage with tracemalloc.reset_peak(), so each
+    # stage reports its own high-water mark rather than the process-wide one.
+    # Stages may nest and repeat (incremental updates embed once per change set);
+    # repeated stages keep the highest peak and accumulate time and net growth.
+
+    def __init__(self, frames: int = 1):
+        self.frames = frames
+        self.stages: Dict[str, StageMemory] = {}
+        self._active: List[Dict[str, Any]] = []
+        self._overall_peak = 0
+
+    def start(self) -> None:
+        tracemalloc.start(self.frames)
+
+    def _fold_peak(self) -> int:
+        _, peak = tracemalloc.get_traced_memory()
+        for frame in self._active:
+            frame['peak'] = max(frame['peak'], peak)
+        self._overall_peak = max(self._overall_peak, peak)
+        return peak
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        self._fold_peak()
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        frame = {'name': name, 'start_bytes': current, 'peak': current, 'start_time': time.perf_counter()}
+        self._active.append(frame)
+        try:
+            yield
+        finally:
+            self._fold_peak()
+            self._active.remove(frame)
+            end_bytes, _ = tracemalloc.get_traced_memory()
+
+            stats = self.stages.setdefault(name, StageMemory(name))
+            stats.calls += 1
+            stats.seconds += time.perf_counter() - frame['start_time']
+            stats.peak_bytes = max(stats.peak_bytes, frame['peak'])
+            stats.net_bytes += end_bytes - frame['start_bytes']
+
+    def stop(self) -> Dict[str, Any]:
+        self._fold_peak()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        top_sites = [
+            {'location': str(stat.traceback), 'size_bytes': stat.size, 'count': stat.count}
+            for stat in snapshot.statistics('lineno')[:TOP_ALLOCATION_SITES]
+        ]
+        return {
+            'overall_peak_bytes': self._overall_peak,
+            'stages': [asdict(stage) for stage in self.stages.values()],
+            'top_allocation_sites': top_sites
+        }
+
+
+_memory_profiler: Optional[MemoryProfiler] = None
+
+
+@contextmanager
+def pipeline_stage(name: str) -> Iterator[None]:
+    # Marks a coarse pipeline stage (load, chunk, embed, store) for --memory-profile
+    # and for traces. Costs a global lookup when neither is enabled.
+    profiler = _memory_profiler
+    with span(f"stage.{name}"):
+        if profiler is None:
+            yield
+        else:
+            with profiler.stage(name):
+                yield
+
+
+def _format_bytes(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(value) < 1024 or unit == "GiB":
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+def format_memory_report(report: Dict[str, Any]) -> str:
+    lines = [
+        f"Overall peak traced memory: {_format_bytes(report['overall_peak_bytes'])}",
+        "",
+        f"{'Stage':<12} {'Calls':>6} {'Time (s)':>10} {'Peak':>12} {'Net':>12}"
+    ]
+    for stage in report['stages']:
+        lines.append(
+            f"{stage['name']:<12} {stage['calls']:>6} {stage['seconds']:>10.2f} "
+            f"{_format_bytes(stage['peak_bytes']):>12} {_format_bytes(stage['net_bytes']):>12}"
+        )
+    lines.extend(["", "Top allocation sites still live at exit:"])
+    for site in report['top_allocation_sites']:
+        lines.append(f"  {_format_bytes(site['size_bytes']):>12}  {site['count']:>8} blocks  {site['location']}")
+    return "\n".join(lines) + "\n"
+
+
+def profile_output_base(profile_dir: str | Path, command: str) -> Path:
+    directory = Path(profile_dir).expanduser()
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / f"{command}-{time.strftime('%Y%m%d-%H%M%S')}"
+
+
+def _run_cprofile(func: Callable[[], Any], base: Path) -> Any:
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func)
+    finally:
+        pstats_path = base.with_suffix(".pstats")
+        profiler.dump_stats(str(pstats_path))
+
+        summary = io.StringIO()
+        stats = pstats.Stats(profiler, stream=summary)
+        stats.sort_stats("cumulative").print_stats(TOP_HOTSPOTS)
+        summary_path = base.with_suffix(".txt")
+        summary_path.write_text(summary.getvalue(), encoding="utf-8")
+
+        logger.info(f"Profile written: {pstats_path} (pstats), {summary_path} (top {TOP_HOTSPOTS} by cumulative time)")
+
+
+def _run_sampling(func: Callable[[], Any], base: Path) -> Any:
+    from pyinstrument import Profiler
+
+    profiler = Profiler()
+    profiler.start()
+    try:
+        return func()
+    finally:
+        profiler.stop()
+        summary_path = base.with_suffix(".txt")
+        html_path = base.with_suffix(".html")
+        summary_path.write_text(profiler.output_text(unicode=True, color=False), encoding="utf-8")
+        html_path.write_text(profiler.output_html(), encoding="utf-8")
+        logger.info(f"Profile written: {summary_path} (call tree), {html_path} (interactive)")
+
+
+def run_profiled(
+    func: Callable[[], Any],
+    command: str,
+    profile_dir: str | Path = DEFAULT_PROFILE_DIR,
+    cpu: bool = True,
+    memory: bool = False,
+    profiler: str = "cprofile"
+) -> Any:
+    global _memory_profiler
+
+    base = profile_output_base(profile_dir, command)
+    profiled: Callable[[], Any] = func
+
+    if cpu:
+        runner = _run_cprofile
+        if profiler == "sampling":
+            try:
+                import pyinstrument  # noqa: F401
+                runner = _run_sampling
+            except ImportError:
+                logger.warning("Sampling profiler unavailable (pip install pyinstrument); using cProfile")
+
+        def profiled_cpu() -> Any:
+            return runner(func, base)
+
+        profiled = profiled_cpu
+
+    if not memory:
+        return profiled()
+
+    _memory_profiler = MemoryProfiler()
+    _memory_profiler.start()
+    try:
+        return profiled()
+    finally:
+        report = _memory_profiler.stop()
+        _memory_profiler = None
+
+        json_path = Path(f"{base}-memory.json")
+        text_path = Path(f"{base}-memory.txt")
+        json_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        text_path.write_text(format_memory_report(report), encoding="utf-8")
+        logger.info(f"Memory profile written: {text_path}, {json_path}")
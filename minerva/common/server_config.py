@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict
 
@@ -10,6 +10,16 @@ from jsonschema import ValidationError as JsonSchemaValidationError
 
 from minerva.common.exceptions import ConfigError
 
+# Leaves headroom below the common 25,000-token MCP response limit
+DEFAULT_RESPONSE_TOKEN_BUDGET = 20000
+
+# Neighbor chunks kept in memory for enhanced context; 0 disables the cache
+DEFAULT_CHUNK_CACHE_SIZE = 10000
+
+# How often the server looks for collections created or deleted while it runs; 0 disables it
+DEFAULT_COLLECTION_POLL_SECONDS = 30
+
+SEARCH_ENGINES = ("hnsw", "exact")
 
 SERVER_CONFIG_SCHEMA: Dict[str, Any] = {
     "$schema": "http://json-schema.org/draft-07/schema#",
@@ -33,12 +43,58 @@ SERVER_CONFIG_SCHEMA: Dict[str, Any] = {
             "type": ["integer", "null"],
             "minimum": 1,
             "maximum": 65535
+        },
+        "response_token_budget": {
+            "type": ["integer", "null"],
+            "minimum": 500
+        },
+        "chunk_cache_size": {
+            "type": "integer",
+            "minimum": 0
+        },
+        "collection_poll_seconds": {
+            "type": "number",
+            "minimum": 0
+        },
+        "lazy_providers": {
+            "type": "boolean"
+        },
+        "collections": {
+            "type": "object",
+            "additionalProperties": {
+                "type": "object",
+                "properties": {
+                    "search_engine": {
+                        "type": "string",
+                        "enum": list(SEARCH_ENGINES)
+                    },
+                    "memory_map": {
+                        "type": "boolean"
+                    },
+                    "two_stage_notes": {
+                        "type": ["integer", "null"],
+                        "minimum": 1,
+                        "maximum": 1000
+                    }
+                },
+                "additionalProperties": False
+            }
         }
     },
     "additionalProperties": False
 }
 
 
+@dataclass(frozen=True)
+class CollectionServerConfig:
+    # "hnsw" queries ChromaDB's ANN index; "exact" scans an in-memory float32 matrix
+    search_engine: str = "hnsw"
+    memory_map: bool = False
+    # When set, search ranks this many notes by their summary vector first and
+    # then only their chunks (needs note_summaries in the index config)
+    two_stage_notes: int | None = None
+
+
 @dataclass(frozen=True)
 class ServerConfig:
     chromadb_path: str
@@ -46,6 +102,15 @@ class ServerConfig:
     host: str | None
     port: int | None
     source_path: Path
+    response_token_budget: int | None = DEFAULT_RESPONSE_TOKEN_BUDGET
+    chunk_cache_size: int = DEFAULT_CHUNK_CACHE_SIZE
+    collection_poll_seconds: float = DEFAULT_COLLECTION_POLL_SECONDS
+    # Build and probe each collection's provider on first use instead of at startup
+    lazy_providers: bool = False
+    collections: Dict[str, CollectionServerConfig] = field(default_factory=dict)
+
+    def collection_settings(self, collection_name: str) -> CollectionServerConfig:
+        return self.collections.get(collection_name, CollectionServerConfig())
 
 
 def load_server_config(config_path: str) -> ServerConfig:
@@ -123,12 +188,25 @@ def _build_server_config(payload: Dict[str, Any], path: Path) -> ServerConfig:
     port_field = payload.get("port")
     port_value = _clean_port(port_field, path)
 
+    # An explicit null disables packing; a missing key uses the default budget
+    response_token_budget = payload.get("response_token_budget", DEFAULT_RESPONSE_TOKEN_BUDGET)
+
+    collections = {
+        name: CollectionServerConfig(**settings)
+        for name, settings in (payload.get("collections") or {}).items()
+    }
+
     return ServerConfig(
         chromadb_path=chromadb_path,
         default_max_results=default_max_results,
         host=host_value,
         port=port_value,
-        source_path=path
+        source_path=path,
+        response_token_budget=response_token_budget,
+        chunk_cache_size=payload.get("chunk_cache_size", DEFAULT_CHUNK_CACHE_SIZE),
+        collection_poll_seconds=payload.get("collection_poll_seconds", DEFAULT_COLLECTION_POLL_SECONDS),
+        lazy_providers=payload.get("lazy_providers", False),
+        collections=collections
     )
 
 
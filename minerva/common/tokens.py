@@ -0,0 +1,49 @@
+import threading
+from typing import Any, Optional
+
+from minerva.common.logger import get_logger
+
+logger = get_logger(__name__, mode="cli")
+
+# cl100k_base (GPT-4/ChatGPT tokenizer) is the standard reference for MCP token limits
+TOKEN_ENCODING_NAME = "cl100k_base"
+
+# Rough chars-per-token ratio for English prose, used when no stored count exists
+CHARS_PER_TOKEN = 4
+
+_encoder: Any = None
+_encoder_loaded = False
+_encoder_lock = threading.Lock()
+
+
+def _get_encoder() -> Optional[Any]:
+    global _encoder, _encoder_loaded
+
+    if _encoder_loaded:
+        return _encoder
+
+    with _encoder_lock:
+        if not _encoder_loaded:
+            try:
+                import tiktoken
+                _encoder = tiktoken.get_encoding(TOKEN_ENCODING_NAME)
+            except Exception as error:
+                # tiktoken downloads the encoding on first use; offline hosts fall back to estimates
+                logger.warning(f"Token encoder unavailable ({error}); using character-based estimates")
+                _encoder = None
+            _encoder_loaded = True
+
+    return _encoder
+
+
+def approximate_token_count(text: str) -> int:
+    if not text:
+        return 0
+    return max(1, (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN)
+
+
+def count_tokens(text: str) -> int:
+    encoder = _get_encoder()
+    if encoder is None:
+        return approximate_token_count(text)
+    return len(encoder.encode(text, disallowed_special=()))
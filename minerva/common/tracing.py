@@ -0,0 +1,192 @@
+import atexit
+import contextvars
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from minerva.common.exceptions import ConfigError
+
+TRACE_ENV_VAR = "MINERVA_TRACE"
+TRACE_FORMAT_ENV_VAR = "MINERVA_TRACE_FORMAT"
+
+TRACE_FORMATS = ("jsonl", "chrome")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_current_span: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar("minerva_current_span", default=None)
+_span_ids = itertools.count(1)
+
+
+class Tracer:
+    # Spans are written as they finish for "jsonl" (one object per line, safe to
+    # tail while a long index runs); "chrome" buffers complete ("ph": "X") events
+    # and writes a trace file loadable in chrome://tracing or Perfetto on flush().
+
+    def __init__(self, path: Path, trace_format: str = "jsonl"):
+        if trace_format not in TRACE_FORMATS:
+            raise ConfigError(
+                f"Unknown trace format '{trace_format}'\n"
+                f"  Supported formats: {', '.join(TRACE_FORMATS)}"
+            )
+
+        self.path = Path(path)
+        self.trace_format = trace_format
+        self.pid = os.getpid()
+        self.listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        # Wall clock anchor so span timestamps are comparable across processes
+        self._epoch_offset_us = time.time() * 1_000_000 - time.perf_counter() * 1_000_000
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.trace_format == "jsonl":
+            self._handle = self.path.open("a", encoding="utf-8")
+        else:
+            self._handle = None
+
+    def record(self, event: Dict[str, Any]) -> None:
+        for listener in self.listeners:
+            listener(event)
+
+        with self._lock:
+            if self._handle is not None:
+                self._handle.write(json.dumps(event, default=str) + "\n")
+                self._handle.flush()
+            else:
+                self._events.append(event)
+
+    def timestamp_us(self, perf_counter: float) -> float:
+        return perf_counter * 1_000_000 + self._epoch_offset_us
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.flush()
+                return
+
+            trace_events = [
+                {
+                    "name": event["name"],
+                    "cat": event["name"].split(".", 1)[0],
+                    "ph": "X",
+                    "ts": event["ts_us"],
+                    "dur": event["duration_us"],
+                    "pid": event["pid"],
+                    "tid": event["tid"],
+                    "args": {**event["attributes"], "span_id": event["span_id"], "parent_id": event["parent_id"]}
+                }
+                for event in self._events
+            ]
+            with self.path.open("w", encoding="utf-8") as handle:
+                json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, handle, default=str)
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+
+_tracer: Optional[Tracer] = None
+
+
+def is_tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+def _infer_format(path: Path) -> str:
+    return "chrome" if path.suffix == ".json" else "jsonl"
+
+
+def configure_tracing(path: str | Path, trace_format: Optional[str] = None) -> Tracer:
+    global _tracer
+
+    shutdown_tracing()
+    trace_path = Path(path).expanduser()
+    _tracer = Tracer(trace_path, trace_format or _infer_format(trace_path))
+    return _tracer
+
+
+def configure_tracing_from_env() -> Optional[Tracer]:
+    path = os.environ.get(TRACE_ENV_VAR, "").strip()
+    if not path:
+        return None
+    return configure_tracing(path, os.environ.get(TRACE_FORMAT_ENV_VAR) or None)
+
+
+def shutdown_tracing() -> None:
+    global _tracer
+
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.close()
+
+
+atexit.register(shutdown_tracing)
+
+
+@contextmanager
+def _active_span(tracer: Tracer, name: str, attributes: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    span_id = next(_span_ids)
+    parent_id = _current_span.get()
+    token = _current_span.set(span_id)
+    start = time.perf_counter()
+    error: Optional[BaseException] = None
+    try:
+        yield attributes
+    except BaseException as exc:
+        error = exc
+        raise
+    finally:
+        end = time.perf_counter()
+        _current_span.reset(token)
+        if error is not None:
+            attributes["error"] = f"{type(error).__name__}: {error}"
+        tracer.record({
+            "name": name,
+            "span_id": span_id,
+            "parent_id": parent_id,
+            "ts_us": round(tracer.timestamp_us(start), 1),
+            "duration_us": round((end - start) * 1_000_000, 1),
+            "pid": tracer.pid,
+            "tid": threading.get_ident(),
+            "attributes": attributes
+        })
+
+
+@contextmanager
+def _noop_span() -> Iterator[Dict[str, Any]]:
+    yield {}
+
+
+def span(name: str, **attributes: Any):
+    # Yields a dict callers may add attributes to (e.g. result counts).
+    # When tracing is disabled this costs one global lookup.
+    tracer = _tracer
+    if tracer is None:
+        return _noop_span()
+    return _active_span(tracer, name, attributes)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            with _active_span(tracer, name, {}):
+                return func(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+    return decorator
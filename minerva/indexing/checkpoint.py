@@ -0,0 +1,235 @@
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from minerva.common.exceptions import IndexingError
+from minerva.common.index_config import IndexConfig
+from minerva.common.logger import get_logger
+from minerva.common.models import Chunk, ChunkWithEmbedding
+
+logger = get_logger(__name__)
+
+CHECKPOINT_DIRNAME = "minerva_checkpoints"
+JOURNAL_VERSION = 2
+# Embeddings per journal record; a crash loses at most the record being filled
+JOURNAL_BATCH_SIZE = 64
+
+_RECORD_MAGIC = b"MVJ2"
+# chunk count, dimension, byte length of the newline-joined chunk IDs
+_RECORD_HEADER = struct.Struct("<III")
+_DIGEST_SIZE = hashlib.sha256().digest_size
+_RECORD_CRC = struct.Struct("<I")
+
+
+def default_checkpoint_dir(chromadb_path: str) -> Path:
+    return Path(chromadb_path) / CHECKPOINT_DIRNAME
+
+
+def chunk_digest(chunk: Chunk) -> bytes:
+    # The text that was embedded; a chunk ID survives an edit that keeps the note's modification date
+    return hashlib.sha256(chunk.content.encode("utf-8")).digest()
+
+
+def checkpoint_fingerprint(index_config: IndexConfig, embedding_dimension: Optional[int]) -> Dict[str, Any]:
+    # Everything besides the chunk text that changes a chunk's vector
+    provider = index_config.provider
+    return {
+        "version": JOURNAL_VERSION,
+        "collection": index_config.collection.name,
+        "chunk_size": index_config.collection.chunk_size,
+        "provider_type": provider.provider_type,
+        "embedding_model": provider.embedding_model,
+        "embedding_dimension": embedding_dimension,
+    }
+
+
+class EmbeddingJournal:
+    """Write-ahead journal of the embeddings made by a full `minerva index` run.
+
+    Embeddings are appended as records of up to `batch_size` chunks: the
+    chunk IDs, a SHA-256 digest of each chunk's text, the float32 vectors
+    and a CRC32, fsynced before the next record is started. A run killed mid-write leaves a torn last record,
+    which is dropped when the journal is loaded. `<collection>.json` records
+    the configuration the vectors were made with; a journal is only resumed
+    when it matches.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        collection_name: str,
+        fingerprint: Dict[str, Any],
+        batch_size: int = JOURNAL_BATCH_SIZE
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.directory = directory
+        self.manifest_path = directory / f"{collection_name}.json"
+        self.journal_path = directory / f"{collection_name}.journal"
+        self.fingerprint = fingerprint
+        self.batch_size = batch_size
+        # Vectors loaded from an earlier run and the digest of the text they embed, by chunk ID
+        self.completed: Dict[str, np.ndarray] = {}
+        self.digests: Dict[str, bytes] = {}
+        self.durable_count = 0
+        self._pending_ids: List[str] = []
+        self._pending_digests: List[bytes] = []
+        self._pending_vectors: List[List[float]] = []
+        self._handle: Optional[BinaryIO] = None
+
+    def open(self, resume: bool) -> "EmbeddingJournal":
+        if resume:
+            self._load()
+        else:
+            self.discard()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if not self.manifest_path.exists():
+            self._write_manifest()
+        self._handle = open(self.journal_path, "ab")
+        return self
+
+    def record(self, item: ChunkWithEmbedding) -> None:
+        self._pending_ids.append(item.chunk.id)
+        self._pending_digests.append(chunk_digest(item.chunk))
+        self._pending_vectors.append(item.embedding)
+        if len(self._pending_ids) >= self.batch_size:
+            self.flush()
+
+    def embedding_for(self, chunk: Chunk) -> Optional[np.ndarray]:
+        # The journaled vector, unless the chunk's text changed since it was made
+        if self.digests.get(chunk.id) != chunk_digest(chunk):
+            return None
+        return self.completed[chunk.id]
+
+    def flush(self) -> None:
+        if not self._pending_ids or self._handle is None:
+            return
+
+        ids = "\n".join(self._pending_ids).encode("utf-8")
+        vectors = np.asarray(self._pending_vectors, dtype="<f4")
+        digests = b"".join(self._pending_digests)
+        payload = (
+            _RECORD_HEADER.pack(len(self._pending_ids), vectors.shape[1], len(ids))
+            + ids + digests + vectors.tobytes()
+        )
+        self._handle.write(_RECORD_MAGIC + payload + _RECORD_CRC.pack(zlib.crc32(payload)))
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+
+        self.durable_count += len(self._pending_ids)
+        self._pending_ids = []
+        self._pending_digests = []
+        self._pending_vectors = []
+
+    def close(self) -> None:
+        if self._handle is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self._handle.close()
+            self._handle = None
+
+    def discard(self) -> None:
+        # Drops the journal once its embeddings are stored (or are not wanted)
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        self.journal_path.unlink(missing_ok=True)
+        self.manifest_path.unlink(missing_ok=True)
+        self.completed = {}
+        self.digests = {}
+        self.durable_count = 0
+
+    def _load(self) -> None:
+        manifest = self._read_manifest()
+        if manifest is None:
+            logger.warning(f"No embedding checkpoint at {self.manifest_path}; starting from the beginning")
+            self.discard()
+            return
+
+        if manifest.get("fingerprint") != self.fingerprint:
+            raise IndexingError(
+                f"Embedding checkpoint was written with a different configuration\n"
+                f"  Checkpoint: {manifest.get('fingerprint')}\n"
+                f"  Current: {self.fingerprint}\n"
+                f"  Suggestion: Run without --resume to start over"
+            )
+
+        completed, digests, valid_length = _read_records(self.journal_path)
+        if self.journal_path.exists() and self.journal_path.stat().st_size > valid_length:
+            # Torn or corrupt tail from the interrupted run; later records are appended after the good ones
+            logger.warning(f"Dropping incomplete record at the end of {self.journal_path}")
+            with open(self.journal_path, "r+b") as handle:
+                handle.truncate(valid_length)
+
+        self.completed = completed
+        self.digests = digests
+        self.durable_count = len(completed)
+
+    def _read_manifest(self) -> Optional[Dict[str, Any]]:
+        if not self.manifest_path.exists():
+            return None
+        try:
+            return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as error:
+            logger.warning(f"Ignoring unreadable checkpoint manifest {self.manifest_path}: {error}")
+            return None
+
+    def _write_manifest(self) -> None:
+        handle, temp_name = tempfile.mkstemp(prefix=f".{self.manifest_path.name}.", dir=self.directory)
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as temp_file:
+                json.dump({"fingerprint": self.fingerprint}, temp_file, indent=2)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            os.replace(temp_name, self.manifest_path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+
+def _read_records(path: Path) -> Tuple[Dict[str, np.ndarray], Dict[str, bytes], int]:
+    # Vectors and text digests of every intact record, and the byte length those records span
+    completed: Dict[str, np.ndarray] = {}
+    digests: Dict[str, bytes] = {}
+    if not path.exists():
+        return completed, digests, 0
+
+    valid_length = 0
+    with open(path, "rb") as handle:
+        while True:
+            if handle.read(len(_RECORD_MAGIC)) != _RECORD_MAGIC:
+                break
+            header = handle.read(_RECORD_HEADER.size)
+            if len(header) < _RECORD_HEADER.size:
+                break
+            count, dimension, ids_length = _RECORD_HEADER.unpack(header)
+            body_length = ids_length + count * (_DIGEST_SIZE + dimension * 4)
+            body = handle.read(body_length)
+            crc = handle.read(_RECORD_CRC.size)
+            if len(body) < body_length or len(crc) < _RECORD_CRC.size:
+                break
+            if zlib.crc32(header + body) != _RECORD_CRC.unpack(crc)[0]:
+                break
+
+            ids = body[:ids_length].decode("utf-8").split("\n")
+            vectors_offset = ids_length + count * _DIGEST_SIZE
+            chunk_digests = body[ids_length:vectors_offset]
+            vectors = np.frombuffer(body, dtype="<f4", offset=vectors_offset).reshape(count, dimension)
+            completed.update(zip(ids, vectors))
+            digests.update(
+                (chunk_id, chunk_digests[index * _DIGEST_SIZE:(index + 1) * _DIGEST_SIZE])
+                for index, chunk_id in enumerate(ids)
+            )
+            valid_length = handle.tell()
+
+    return completed, digests, valid_length
@@ -3,6 +3,9 @@ from typing import List, Dict, Any
 
 from minerva.common.exceptions import ChunkingError
 from minerva.common.logger import get_logger
+from minerva.common.tokens import count_tokens
+from minerva.common.tracing import traced
+from minerva.indexing.filter_fields import build_filter_fields
 
 logger = get_logger(__name__, mode="cli")
 
@@ -158,6 +161,8 @@ def build_chunks_from_note(note: Dict[str, Any], target_chars: int, overlap_char
         overlap_chars=overlap_chars
     )
 
+    filter_fields = build_filter_fields(note)
+
     chunks = []
     for chunk_index, chunk_data in enumerate(markdown_chunks):
         chunk_id = generate_chunk_id(note_id, note['modificationDate'], chunk_index)
@@ -171,7 +176,9 @@ def build_chunks_from_note(note: Dict[str, Any], target_chars: int, overlap_char
             creationDate=note.get('creationDate', ''),
             size=chunk_data['size'],
             chunkIndex=chunk_index,
-            content_hash=content_hash if chunk_index == 0 else None
+            content_hash=content_hash if chunk_index == 0 else None,
+            token_count=count_tokens(chunk_data['content']),
+            filter_fields=filter_fields or None
         )
         chunks.append(chunk)
 
@@ -182,6 +189,7 @@ def should_report_progress(current_index: int, total_count: int) -> bool:
     return (current_index + 1) % 50 == 0 or current_index == total_count - 1
 
 
+@traced("index.chunk_notes")
 def create_chunks_from_notes(notes: List[Dict[str, Any]], target_chars: int = 1200, overlap_chars: int = 200) -> ChunkList:
     chunks = []
     failed_notes = []
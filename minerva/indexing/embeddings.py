@@ -1,14 +1,17 @@
 import time
-from typing import List, Dict, Any, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Callable, Tuple
 import sys
 
 import numpy as np
 
-from minerva.common.exceptions import EmbeddingError
+from minerva.common.exceptions import EmbeddingError, ProviderCircuitOpenError
 from minerva.common.logger import get_logger
 from minerva.common.models import Chunk, ChunkWithEmbedding, ChunkList, ChunkWithEmbeddingList
 from minerva.common.ai_provider import AIProvider, AIProviderError, ProviderUnavailableError
 from minerva.common.ai_config import AIProviderConfig
+from minerva.common.metrics import PROVIDER_RETRIES
+from minerva.common.tracing import span, traced
 
 logger = get_logger(__name__, mode="cli")
 
@@ -32,6 +35,7 @@ def initialize_provider(provider_config: AIProviderConfig) -> AIProvider:
         raise EmbeddingError(f"Failed to initialize AI provider: {error}")
 
 
+@traced("embeddings.single")
 def generate_embedding(
     provider: AIProvider,
     text: str,
@@ -50,10 +54,14 @@ def generate_embedding(
         try:
             return provider.generate_embedding(text)
 
+        except ProviderCircuitOpenError:
+            # The endpoint is known to be down; retrying would only wait out the backoff
+            raise
         except AIProviderError as error:
             if attempt < max_retries:
                 logger.warning(f"Embedding attempt {attempt + 1} failed: {error}")
                 logger.warning(f"         Retrying in {retry_delay} seconds...")
+                PROVIDER_RETRIES.inc(provider=provider.provider_type, operation="embedding")
                 time.sleep(retry_delay)
                 retry_delay *= 1.5
             else:
@@ -62,6 +70,7 @@ def generate_embedding(
             if attempt < max_retries:
                 logger.warning(f"Embedding attempt {attempt + 1} failed: {error}")
                 logger.warning(f"         Retrying in {retry_delay} seconds...")
+                PROVIDER_RETRIES.inc(provider=provider.provider_type, operation="embedding")
                 time.sleep(retry_delay)
                 retry_delay *= 1.5
             else:
@@ -92,10 +101,13 @@ def generate_embeddings_batch(
         try:
             return provider.generate_embeddings_batch(texts)
 
+        except ProviderCircuitOpenError:
+            raise
         except AIProviderError as error:
             if attempt < max_retries:
                 logger.warning(f"Batch embedding attempt {attempt + 1} failed: {error}")
                 logger.warning(f"         Retrying in {retry_delay} seconds...")
+                PROVIDER_RETRIES.inc(provider=provider.provider_type, operation="embedding_batch")
                 time.sleep(retry_delay)
                 retry_delay *= 1.5
             else:
@@ -106,6 +118,7 @@ def generate_embeddings_batch(
             if attempt < max_retries:
                 logger.warning(f"Batch embedding attempt {attempt + 1} failed: {error}")
                 logger.warning(f"         Retrying in {retry_delay} seconds...")
+                PROVIDER_RETRIES.inc(provider=provider.provider_type, operation="embedding_batch")
                 time.sleep(retry_delay)
                 retry_delay *= 1.5
             else:
@@ -117,6 +130,39 @@ def generate_embeddings_batch(
     raise EmbeddingError("Failed to generate batch embeddings: unexpected loop exit")
 
 
+def _embed_each(
+    provider: AIProvider,
+    chunks: ChunkList,
+    max_retries: int,
+    retry_delay: float,
+    workers: int
+) -> Iterator[Tuple[Chunk, Optional[List[float]], Optional[Exception]]]:
+    # (chunk, embedding, error) for each chunk, in chunk order
+    def embed(chunk: Chunk):
+        try:
+            return chunk, generate_embedding(provider, chunk.content, max_retries, retry_delay), None
+        except Exception as error:
+            return chunk, None, error
+
+    if workers == 1:
+        for chunk in chunks:
+            yield embed(chunk)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="minerva-embed") as executor:
+        try:
+            yield from executor.map(embed, chunks)
+        finally:
+            # Stopping early (provider down) must not embed the rest
+            executor.shutdown(cancel_futures=True)
+
+
+def _abort_on_open_circuit(error: ProviderCircuitOpenError, processed: int, total: int) -> None:
+    # Every remaining chunk would fail the same way; stop instead of recording each one
+    logger.error(f"   Provider unavailable after {processed}/{total} chunks, stopping: {error}")
+    raise EmbeddingError(f"Provider unavailable, indexing stopped after {processed}/{total} chunks: {error}")
+
+
 def validate_embedding_consistency(embeddings: List[List[float]]) -> bool:
     if not embeddings:
         return True
@@ -136,13 +182,16 @@ def validate_embedding_consistency(embeddings: List[List[float]]) -> bool:
     return True
 
 
+@traced("index.embed")
 def generate_embeddings(
     provider: AIProvider,
     chunks: ChunkList,
     max_retries: int = DEFAULT_MAX_RETRIES,
     retry_delay: float = DEFAULT_RETRY_DELAY,
-    progress_callback: Optional[Callable[[int, int], None]] = None
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    embedded_callback: Optional[Callable[[ChunkWithEmbedding], None]] = None
 ) -> ChunkWithEmbeddingList:
+    # embedded_callback receives each embedding as soon as it is made, e.g. to checkpoint it
     if not chunks:
         return []
 
@@ -186,12 +235,13 @@ def generate_embeddings(
 
             try:
                 # Generate embeddings for entire batch
-                embeddings = generate_embeddings_batch(
-                    provider=provider,
-                    texts=batch_texts,
-                    max_retries=max_retries,
-                    retry_delay=retry_delay
-                )
+                with span("embeddings.batch", batch=current_batch_num, size=len(batch_texts)):
+                    embeddings = generate_embeddings_batch(
+                        provider=provider,
+                        texts=batch_texts,
+                        max_retries=max_retries,
+                        retry_delay=retry_delay
+                    )
 
                 # Pair chunks with their embeddings
                 for chunk, embedding in zip(batch_chunks, embeddings):
@@ -200,6 +250,8 @@ def generate_embeddings(
                         embedding=embedding
                     )
                     chunks_with_embeddings.append(chunk_with_embedding)
+                    if embedded_callback:
+                        embedded_callback(chunk_with_embedding)
 
                 processed_count += len(batch_chunks)
 
@@ -212,6 +264,8 @@ def generate_embeddings(
                     f"{processed_count}/{len(chunks)} chunks ({processed_count / len(chunks) * 100:.1f}%)"
                 )
 
+            except ProviderCircuitOpenError as error:
+                _abort_on_open_circuit(error, processed_count, len(chunks))
             except Exception as error:
                 # If batch fails, fall back to processing chunks individually
                 logger.warning(f"   Batch {current_batch_num} failed: {error}")
@@ -231,7 +285,11 @@ def generate_embeddings(
                             embedding=embedding
                         )
                         chunks_with_embeddings.append(chunk_with_embedding)
+                        if embedded_callback:
+                            embedded_callback(chunk_with_embedding)
 
+                    except ProviderCircuitOpenError as individual_error:
+                        _abort_on_open_circuit(individual_error, processed_count, len(chunks))
                     except Exception as individual_error:
                         failed_chunks.append({
                             'chunk_id': chunk.id,
@@ -245,27 +303,20 @@ def generate_embeddings(
                     progress_callback(processed_count, len(chunks))
 
     else:
-        # Sequential processing mode (for local providers)
-        for i, chunk in enumerate(chunks):
+        # One chunk per request (for local providers); with several endpoints,
+        # one request is kept in flight on each
+        workers = provider.endpoint_count
+        if workers > 1:
+            logger.info(f"   Spreading requests over {workers} endpoints...")
+
+        outcomes = _embed_each(provider, chunks, max_retries, retry_delay, workers)
+        for i, (chunk, embedding, error) in enumerate(outcomes):
             if progress_callback:
                 progress_callback(i, len(chunks))
 
-            try:
-                embedding = generate_embedding(
-                    provider=provider,
-                    text=chunk.content,
-                    max_retries=max_retries,
-                    retry_delay=retry_delay
-                )
-
-                chunk_with_embedding = ChunkWithEmbedding(
-                    chunk=chunk,
-                    embedding=embedding
-                )
-
-                chunks_with_embeddings.append(chunk_with_embedding)
-
-            except Exception as error:
+            if isinstance(error, ProviderCircuitOpenError):
+                _abort_on_open_circuit(error, i, len(chunks))
+            if error is not None:
                 failed_chunks.append({
                     'chunk_id': chunk.id,
                     'title': chunk.title,
@@ -274,6 +325,15 @@ def generate_embeddings(
                 logger.error(f"   Failed to generate embedding for chunk {chunk.id}: {error}")
                 continue
 
+            chunk_with_embedding = ChunkWithEmbedding(
+                chunk=chunk,
+                embedding=embedding
+            )
+
+            chunks_with_embeddings.append(chunk_with_embedding)
+            if embedded_callback:
+                embedded_callback(chunk_with_embedding)
+
             if (i + 1) % 25 == 0 or i == len(chunks) - 1:
                 logger.info(f"   Progress: {i + 1}/{len(chunks)} chunks ({(i + 1) / len(chunks) * 100:.1f}%)")
 
@@ -0,0 +1,88 @@
+from datetime import datetime, timezone
+from pathlib import PurePosixPath
+from typing import Any, Dict, Optional
+
+# Extractor fields copied into every chunk's metadata in a form ChromaDB `where`
+# clauses can match directly: dates as epoch seconds, paths as one key per
+# directory depth (pathPrefix1="docs", pathPrefix2="docs/api", ...) and authors
+# casefolded. Fields a note does not have are simply left out.
+MAX_PATH_PREFIX_DEPTH = 8
+
+FILTER_FIELD_NAMES = (
+    "modifiedAt",
+    "createdAt",
+    "sourcePath",
+    "author",
+    "authorKey",
+    "year",
+) + tuple(f"pathPrefix{depth}" for depth in range(1, MAX_PATH_PREFIX_DEPTH + 1))
+
+
+def date_to_epoch(value: Any) -> Optional[int]:
+    # ISO 8601 date or datetime; a value without an offset is taken as UTC
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def normalize_source_path(value: str) -> str:
+    # Forward slashes, no leading "./" or "/" and no trailing slash
+    parts = [part for part in value.replace("\\", "/").split("/") if part and part != "."]
+    return str(PurePosixPath(*parts)) if parts else ""
+
+
+def path_prefix_key(depth: int) -> str:
+    return f"pathPrefix{depth}"
+
+
+def path_prefix_fields(source_path: str) -> Dict[str, str]:
+    # One entry per parent directory; the file name itself is matched through sourcePath
+    directories = normalize_source_path(source_path).split("/")[:-1]
+    return {
+        path_prefix_key(depth): "/".join(directories[:depth])
+        for depth in range(1, min(len(directories), MAX_PATH_PREFIX_DEPTH) + 1)
+    }
+
+
+def normalize_author(value: str) -> str:
+    return " ".join(value.split()).casefold()
+
+
+def build_filter_fields(note: Dict[str, Any]) -> Dict[str, Any]:
+    fields: Dict[str, Any] = {}
+
+    modified_at = date_to_epoch(note.get("modificationDate"))
+    if modified_at is not None:
+        fields["modifiedAt"] = modified_at
+
+    created_at = date_to_epoch(note.get("creationDate"))
+    if created_at is not None:
+        fields["createdAt"] = created_at
+
+    source_path = note.get("sourcePath")
+    if isinstance(source_path, str) and normalize_source_path(source_path):
+        fields["sourcePath"] = normalize_source_path(source_path)
+        fields.update(path_prefix_fields(source_path))
+
+    author = note.get("author")
+    if isinstance(author, str) and author.strip():
+        fields["author"] = " ".join(author.split())
+        fields["authorKey"] = normalize_author(author)
+
+    year = note.get("year")
+    if isinstance(year, int) and not isinstance(year, bool):
+        fields["year"] = year
+
+    return fields
+
+
+def filter_fields_stale(metadata: Optional[Dict[str, Any]], fields: Dict[str, Any]) -> bool:
+    # True when stored chunk metadata predates these filter fields or disagrees with them
+    metadata = metadata or {}
+    return any(metadata.get(key) != value for key, value in fields.items())
@@ -0,0 +1,353 @@
+import math
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from minerva.common.exceptions import StorageError
+from minerva.common.logger import get_logger
+from minerva.indexing.storage import HNSW_SPACE, get_hnsw_settings, initialize_chromadb_client
+
+logger = get_logger(__name__)
+
+DEFAULT_QUERY_COUNT = 200
+DEFAULT_TOP_K = 10
+DEFAULT_SEARCH_EF_VALUES = (10, 25, 50, 100, 200)
+DEFAULT_TARGET_RECALL = 0.95
+FETCH_PAGE_SIZE = 5000
+ADD_BATCH_SIZE = 5000
+WARMUP_QUERIES = 5
+EVAL_COLLECTION_NAME = "minerva_hnsw_eval"
+
+
+@dataclass(frozen=True)
+class EvalResult:
+    # source: "exact" (NumPy brute force), "current" (the live index) or "candidate" (rebuilt copy)
+    source: str
+    M: Optional[int]
+    construction_ef: Optional[int]
+    search_ef: Optional[int]
+    recall: float
+    p50_ms: float
+    p95_ms: float
+    mean_ms: float
+    build_seconds: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class EvalReport:
+    collection_name: str
+    vector_count: int
+    dimension: int
+    query_count: int
+    k: int
+    current_settings: Dict[str, Any]
+    results: List[EvalResult]
+    target_recall: float
+
+    def recommended(self) -> Optional[EvalResult]:
+        # Fastest ANN configuration that reaches the target recall
+        candidates = [
+            result for result in self.results
+            if result.source != "exact" and result.recall >= self.target_recall
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda result: (result.p95_ms, result.build_seconds or 0.0))
+
+    def to_dict(self) -> Dict[str, Any]:
+        recommended = self.recommended()
+        return {
+            "collection": self.collection_name,
+            "vector_count": self.vector_count,
+            "dimension": self.dimension,
+            "query_count": self.query_count,
+            "k": self.k,
+            "current_settings": self.current_settings,
+            "target_recall": self.target_recall,
+            "results": [result.to_dict() for result in self.results],
+            "recommended": recommended.to_dict() if recommended else None,
+        }
+
+
+def load_vectors(
+    collection,
+    max_vectors: Optional[int] = None,
+    seed: int = 0
+) -> Tuple[List[str], np.ndarray]:
+    total_count = collection.count()
+    ids: List[str] = []
+    pages: List[np.ndarray] = []
+
+    # Paged: a single unbounded get() exceeds SQLite's variable limit on large collections
+    for offset in range(0, total_count, FETCH_PAGE_SIZE):
+        page = collection.get(limit=FETCH_PAGE_SIZE, offset=offset, include=["embeddings"])
+        if not page["ids"]:
+            break
+        ids.extend(page["ids"])
+        pages.append(np.asarray(page["embeddings"], dtype=np.float32))
+
+    if not ids:
+        raise StorageError(f"Collection '{collection.name}' has no vectors to evaluate")
+
+    vectors = np.vstack(pages)
+
+    if max_vectors is not None and len(ids) > max_vectors:
+        rng = np.random.default_rng(seed)
+        keep = np.sort(rng.choice(len(ids), size=max_vectors, replace=False))
+        ids = [ids[index] for index in keep]
+        vectors = vectors[keep]
+
+    return ids, vectors
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def sample_query_indices(vector_count: int, query_count: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.choice(vector_count, size=min(query_count, vector_count), replace=False)
+
+
+def exact_neighbors(
+    normalized: np.ndarray,
+    query_indices: Sequence[int],
+    k: int
+) -> Tuple[List[List[int]], List[float]]:
+    # Cosine brute force; the query vector itself is excluded from its own neighbours
+    neighbors: List[List[int]] = []
+    latencies: List[float] = []
+    top = min(k, len(normalized) - 1)
+
+    for query_index in query_indices:
+        started = time.perf_counter()
+        scores = normalized @ normalized[query_index]
+        scores[query_index] = -np.inf
+        candidates = np.argpartition(-scores, top - 1)[:top] if top > 0 else np.array([], dtype=int)
+        ordered = candidates[np.argsort(-scores[candidates])]
+        latencies.append((time.perf_counter() - started) * 1000)
+        neighbors.append(ordered.tolist())
+
+    return neighbors, latencies
+
+
+def recall_at_k(found: Sequence[Sequence[str]], expected: Sequence[Sequence[str]]) -> float:
+    hits = 0
+    total = 0
+    for found_ids, expected_ids in zip(found, expected):
+        hits += len(set(found_ids) & set(expected_ids))
+        total += len(expected_ids)
+    return hits / total if total else 1.0
+
+
+def latency_percentile(latencies: Sequence[float], percentile: float) -> float:
+    if not latencies:
+        return 0.0
+    ordered = sorted(latencies)
+    rank = max(0, math.ceil(percentile / 100 * len(ordered)) - 1)
+    return ordered[rank]
+
+
+def query_collection(
+    collection,
+    ids: Sequence[str],
+    vectors: np.ndarray,
+    query_indices: Sequence[int],
+    k: int
+) -> Tuple[List[List[str]], List[float]]:
+    # One query per request, as the MCP server issues them
+    warmup = query_indices[:WARMUP_QUERIES]
+    for query_index in warmup:
+        collection.query(query_embeddings=[vectors[query_index].tolist()], n_results=k + 1, include=[])
+
+    found: List[List[str]] = []
+    latencies: List[float] = []
+    for query_index in query_indices:
+        started = time.perf_counter()
+        result = collection.query(
+            query_embeddings=[vectors[query_index].tolist()],
+            n_results=k + 1,
+            include=[]
+        )
+        latencies.append((time.perf_counter() - started) * 1000)
+        query_id = ids[query_index]
+        found.append([chunk_id for chunk_id in result["ids"][0] if chunk_id != query_id][:k])
+
+    return found, latencies
+
+
+def build_result(
+    source: str,
+    settings: Dict[str, Any],
+    found: Sequence[Sequence[str]],
+    expected: Sequence[Sequence[str]],
+    latencies: Sequence[float],
+    build_seconds: Optional[float] = None
+) -> EvalResult:
+    return EvalResult(
+        source=source,
+        M=settings.get("M"),
+        construction_ef=settings.get("construction_ef"),
+        search_ef=settings.get("search_ef"),
+        recall=round(recall_at_k(found, expected), 4),
+        p50_ms=round(latency_percentile(latencies, 50), 3),
+        p95_ms=round(latency_percentile(latencies, 95), 3),
+        mean_ms=round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        build_seconds=round(build_seconds, 3) if build_seconds is not None else None,
+    )
+
+
+def open_collection(chromadb_path: str, collection_name: str):
+    # ChromaDB reads ef_search when it loads the index segment, so a fresh
+    # system is needed for a changed search_ef to take effect in this process
+    from chromadb.api.client import SharedSystemClient
+
+    SharedSystemClient.clear_system_cache()
+    client = initialize_chromadb_client(chromadb_path)
+    return client.get_collection(collection_name)
+
+
+def build_candidate_index(
+    chromadb_path: str,
+    ids: Sequence[str],
+    vectors: np.ndarray,
+    M: Optional[int],
+    construction_ef: Optional[int]
+) -> float:
+    metadata: Dict[str, Any] = {"hnsw:space": HNSW_SPACE}
+    if M is not None:
+        metadata["hnsw:M"] = M
+    if construction_ef is not None:
+        metadata["hnsw:construction_ef"] = construction_ef
+
+    client = initialize_chromadb_client(chromadb_path)
+    collection = client.create_collection(name=EVAL_COLLECTION_NAME, metadata=metadata)
+
+    started = time.perf_counter()
+    for start in range(0, len(ids), ADD_BATCH_SIZE):
+        collection.add(
+            ids=list(ids[start:start + ADD_BATCH_SIZE]),
+            embeddings=vectors[start:start + ADD_BATCH_SIZE]
+        )
+    return time.perf_counter() - started
+
+
+def evaluate_collection(
+    chromadb_path: str,
+    collection_name: str,
+    query_count: int = DEFAULT_QUERY_COUNT,
+    k: int = DEFAULT_TOP_K,
+    m_values: Optional[Sequence[int]] = None,
+    construction_ef_values: Optional[Sequence[int]] = None,
+    search_ef_values: Sequence[int] = DEFAULT_SEARCH_EF_VALUES,
+    max_vectors: Optional[int] = None,
+    target_recall: float = DEFAULT_TARGET_RECALL,
+    seed: int = 0,
+    progress: Optional[Callable[[str], None]] = None
+) -> EvalReport:
+    def report_progress(message: str) -> None:
+        if progress:
+            progress(message)
+
+    live_collection = open_collection(chromadb_path, collection_name)
+    current_settings = get_hnsw_settings(live_collection)
+
+    report_progress(f"Loading vectors from '{collection_name}'...")
+    ids, vectors = load_vectors(live_collection, max_vectors=max_vectors, seed=seed)
+    normalized = normalize_rows(vectors)
+    query_indices = sample_query_indices(len(ids), query_count, seed=seed)
+
+    report_progress(f"Computing exact top-{k} for {len(query_indices)} queries over {len(ids)} vectors...")
+    exact_indices, exact_latencies = exact_neighbors(normalized, query_indices, k)
+    expected = [[ids[index] for index in row] for row in exact_indices]
+
+    results = [build_result("exact", {}, expected, expected, exact_latencies)]
+
+    # The live index answers over the full collection, so it is only comparable
+    # with the exact results when no subsample was taken
+    if len(ids) == live_collection.count():
+        report_progress("Querying the current index...")
+        found, latencies = query_collection(live_collection, ids, vectors, query_indices, k)
+        results.append(build_result("current", current_settings, found, expected, latencies))
+
+    m_values = list(m_values or [current_settings["M"]])
+    construction_ef_values = list(construction_ef_values or [current_settings["construction_ef"]])
+
+    for M in m_values:
+        for construction_ef in construction_ef_values:
+            workdir = tempfile.mkdtemp(prefix="minerva-hnsw-eval-")
+            try:
+                report_progress(f"Building index M={M} construction_ef={construction_ef}...")
+                build_seconds = build_candidate_index(workdir, ids, vectors, M, construction_ef)
+
+                for search_ef in search_ef_values:
+                    candidate = open_collection(workdir, EVAL_COLLECTION_NAME)
+                    candidate.modify(configuration={"hnsw": {"ef_search": search_ef}})
+                    candidate = open_collection(workdir, EVAL_COLLECTION_NAME)
+
+                    found, latencies = query_collection(candidate, ids, vectors, query_indices, k)
+                    settings = {"M": M, "construction_ef": construction_ef, "search_ef": search_ef}
+                    results.append(build_result("candidate", settings, found, expected, latencies, build_seconds))
+            finally:
+                from chromadb.api.client import SharedSystemClient
+
+                SharedSystemClient.clear_system_cache()
+                shutil.rmtree(workdir, ignore_errors=True)
+
+    return EvalReport(
+        collection_name=collection_name,
+        vector_count=len(ids),
+        dimension=int(vectors.shape[1]),
+        query_count=len(query_indices),
+        k=k,
+        current_settings=current_settings,
+        results=results,
+        target_recall=target_recall,
+    )
+
+
+def format_report_text(report: EvalReport) -> str:
+    current = report.current_settings
+    lines = [
+        "=" * 78,
+        f"HNSW evaluation: {report.collection_name}",
+        "=" * 78,
+        f"Vectors: {report.vector_count} × {report.dimension}   Queries: {report.query_count}   k: {report.k}",
+        f"Current index: M={current.get('M')} construction_ef={current.get('construction_ef')} "
+        f"search_ef={current.get('search_ef')}",
+        "",
+        f"{'source':<10} {'M':>4} {'constr_ef':>9} {'search_ef':>9} {'recall@k':>9} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'build s':>8}",
+        "-" * 78,
+    ]
+
+    def show(value: Any) -> str:
+        return "-" if value is None else str(value)
+
+    for result in report.results:
+        lines.append(
+            f"{result.source:<10} {show(result.M):>4} {show(result.construction_ef):>9} "
+            f"{show(result.search_ef):>9} {result.recall:>9.4f} {result.p50_ms:>8.3f} "
+            f"{result.p95_ms:>8.3f} {show(result.build_seconds):>8}"
+        )
+
+    lines.append("")
+    recommended = report.recommended()
+    if recommended:
+        lines.append(
+            f"Recommended (fastest with recall@{report.k} ≥ {report.target_recall}): "
+            f"M={recommended.M} construction_ef={recommended.construction_ef} search_ef={recommended.search_ef}"
+        )
+    else:
+        lines.append(f"No configuration reached recall@{report.k} ≥ {report.target_recall}")
+    lines.append("=" * 78)
+    return "\n".join(lines)
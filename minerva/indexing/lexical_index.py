@@ -0,0 +1,248 @@
+import math
+import re
+import sqlite3
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from minerva.common.exceptions import StorageError
+from minerva.indexing.storage import note_hashes_by_chunk
+
+LEXICAL_DIRNAME = "minerva_lexical"
+SCHEMA_VERSION = 1
+# ChromaDB's SQLite backend caps bound variables per statement
+FETCH_PAGE_SIZE = 5000
+# Standard BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Identifiers such as ERR_CONN_RESET, os.path.join or E-1234 are kept whole
+# (the rarest, most specific term) and also split into their parts.
+_TOKEN_PATTERN = re.compile(r"\w+(?:[.\-:/]\w+)*")
+_PART_PATTERN = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by can do does for from has have how i if in is it its not of "
+    "on or so that the their there these this to was we what when where which who why will "
+    "with you your".split()
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS chunks (
+    chunk_id TEXT PRIMARY KEY,
+    content_hash TEXT,
+    length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    chunk_id TEXT NOT NULL,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, chunk_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_by_chunk ON postings (chunk_id);
+"""
+
+
+def tokenize(text: str) -> List[str]:
+    tokens: List[str] = []
+    for match in _TOKEN_PATTERN.finditer(text or ""):
+        word = match.group(0)
+        lowered = word.lower()
+        parts = [part.lower() for part in _PART_PATTERN.findall(word)]
+
+        if lowered not in STOPWORDS:
+            tokens.append(lowered)
+        if len(parts) > 1:
+            tokens.extend(part for part in parts if part != lowered and part not in STOPWORDS)
+    return tokens
+
+
+def default_lexical_dir(chromadb_path: str) -> Path:
+    return Path(chromadb_path) / LEXICAL_DIRNAME
+
+
+def lexical_index_path(chromadb_path: str, collection_name: str) -> Path:
+    return default_lexical_dir(chromadb_path) / f"{collection_name}.sqlite3"
+
+
+def lexical_index_exists(chromadb_path: str, collection_name: str) -> bool:
+    return lexical_index_path(chromadb_path, collection_name).exists()
+
+
+def remove_lexical_index(chromadb_path: str, collection_name: str) -> bool:
+    removed = False
+    path = lexical_index_path(chromadb_path, collection_name)
+    for candidate in (path, Path(f"{path}-wal"), Path(f"{path}-shm")):
+        if candidate.exists():
+            candidate.unlink()
+            removed = True
+    return removed
+
+
+@dataclass(frozen=True)
+class LexicalSyncStats:
+    kept: int = 0
+    added: int = 0
+    removed: int = 0
+
+
+class LexicalIndex:
+    """BM25 inverted index over a collection's chunk documents, stored in SQLite.
+
+    Written by `minerva index` next to the ChromaDB data and opened read-only by
+    the server. WAL mode lets searches run while an indexing run is writing.
+    """
+
+    def __init__(self, path: Path, readonly: bool = False):
+        self.path = Path(path)
+        self.readonly = readonly
+        try:
+            if readonly:
+                self._conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            else:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.executescript(_SCHEMA)
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),)
+                )
+                self._conn.commit()
+        except sqlite3.Error as error:
+            raise StorageError(f"Cannot open lexical index {self.path}: {error}") from error
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "LexicalIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def count(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0])
+
+    def chunk_hashes(self) -> Dict[str, Optional[str]]:
+        return dict(self._conn.execute("SELECT chunk_id, content_hash FROM chunks"))
+
+    def add_chunks(
+        self,
+        ids: Sequence[str],
+        documents: Sequence[Optional[str]],
+        content_hashes: Optional[Sequence[Optional[str]]] = None
+    ) -> None:
+        hashes = content_hashes if content_hashes is not None else [None] * len(ids)
+        with self._conn:
+            # Re-adding a chunk replaces its postings
+            self._delete(ids)
+            for chunk_id, document, content_hash in zip(ids, documents, hashes):
+                terms = Counter(tokenize(document or ""))
+                self._conn.execute(
+                    "INSERT INTO chunks (chunk_id, content_hash, length) VALUES (?, ?, ?)",
+                    (chunk_id, content_hash, sum(terms.values()))
+                )
+                self._conn.executemany(
+                    "INSERT INTO postings (term, chunk_id, tf) VALUES (?, ?, ?)",
+                    [(term, chunk_id, tf) for term, tf in terms.items()]
+                )
+
+    def delete_chunks(self, ids: Sequence[str]) -> None:
+        with self._conn:
+            self._delete(ids)
+
+    def _delete(self, ids: Sequence[str]) -> None:
+        self._conn.executemany("DELETE FROM postings WHERE chunk_id = ?", [(chunk_id,) for chunk_id in ids])
+        self._conn.executemany("DELETE FROM chunks WHERE chunk_id = ?", [(chunk_id,) for chunk_id in ids])
+
+    def search(self, query: str, n_results: int) -> List[Tuple[str, float]]:
+        """Return up to n_results (chunk_id, BM25 score) pairs, best first."""
+        terms = sorted(set(tokenize(query)))
+        if not terms or n_results < 1:
+            return []
+
+        total, total_length = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(length), 0) FROM chunks").fetchone()
+        if not total:
+            return []
+        average_length = total_length / total or 1.0
+
+        placeholders = ",".join("?" * len(terms))
+        document_frequency = dict(self._conn.execute(
+            f"SELECT term, COUNT(*) FROM postings WHERE term IN ({placeholders}) GROUP BY term", terms
+        ))
+        if not document_frequency:
+            return []
+
+        # BM25 idf with the +1 inside the log so very common terms never score negative
+        idf = {
+            term: math.log(1 + (total - df + 0.5) / (df + 0.5))
+            for term, df in document_frequency.items()
+        }
+
+        scores: Dict[str, float] = {}
+        rows = self._conn.execute(
+            f"SELECT p.term, p.chunk_id, p.tf, c.length FROM postings p "
+            f"JOIN chunks c ON c.chunk_id = p.chunk_id WHERE p.term IN ({placeholders})",
+            terms
+        )
+        for term, chunk_id, tf, length in rows:
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+            scores[chunk_id] = scores.get(chunk_id, 0.0) + idf[term] * tf * (BM25_K1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:n_results]
+
+
+def open_lexical_index(chromadb_path: str, collection_name: str) -> Optional[LexicalIndex]:
+    # Read-only handle for searching; None when the collection has no lexical index yet
+    path = lexical_index_path(chromadb_path, collection_name)
+    if not path.exists():
+        return None
+    return LexicalIndex(path, readonly=True)
+
+
+def _iter_collection_pages(collection, include: List[str], ids: Optional[List[str]] = None) -> Iterable[dict]:
+    if ids is not None:
+        for start in range(0, len(ids), FETCH_PAGE_SIZE):
+            yield collection.get(ids=ids[start:start + FETCH_PAGE_SIZE], include=include)
+        return
+
+    total_count = collection.count()
+    for offset in range(0, total_count, FETCH_PAGE_SIZE):
+        page = collection.get(limit=FETCH_PAGE_SIZE, offset=offset, include=include)
+        if not page["ids"]:
+            break
+        yield page
+
+
+def sync_lexical_index(collection, chromadb_path: str, rebuild: bool = False) -> LexicalSyncStats:
+    """Bring a collection's lexical index in line with its ChromaDB chunks.
+
+    Chunks whose id and note content_hash are unchanged keep their postings;
+    only new or re-chunked documents are read from ChromaDB and tokenized.
+    """
+    if rebuild:
+        remove_lexical_index(chromadb_path, collection.name)
+
+    with LexicalIndex(lexical_index_path(chromadb_path, collection.name)) as index:
+        indexed = index.chunk_hashes()
+
+        entries: List[Tuple[str, Optional[Dict[str, Any]]]] = []
+        for page in _iter_collection_pages(collection, include=["metadatas"]):
+            entries.extend(zip(page["ids"], page["metadatas"]))
+        current = note_hashes_by_chunk(entries)
+
+        removed = [chunk_id for chunk_id in indexed if chunk_id not in current]
+        changed = [
+            chunk_id for chunk_id, content_hash in indexed.items()
+            if chunk_id in current and current[chunk_id] != content_hash
+        ]
+        missing = [chunk_id for chunk_id in current if chunk_id not in indexed] + changed
+
+        index.delete_chunks(removed + changed)
+        for page in _iter_collection_pages(collection, include=["documents"], ids=missing):
+            index.add_chunks(page["ids"], page["documents"], [current[chunk_id] for chunk_id in page["ids"]])
+
+    return LexicalSyncStats(kept=len(indexed) - len(removed) - len(changed), added=len(missing), removed=len(removed))
@@ -0,0 +1,172 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from minerva.common.exceptions import StorageError
+from minerva.indexing.filter_fields import FILTER_FIELD_NAMES
+
+# Companion collection holding one vector per note: the mean of the note's
+# unit-normalized chunk embeddings, so no extra embedding calls are needed.
+# Two-stage search ranks these first and then only the chunks of the top notes.
+NOTE_SUMMARY_SUFFIX = "__notes"
+NOTE_SUMMARY_ROLE = "note_summaries"
+# ChromaDB's SQLite backend caps bound variables per statement
+FETCH_PAGE_SIZE = 5000
+WRITE_BATCH_SIZE = 1000
+
+_COPIED_METADATA = ("embedding_model", "embedding_provider", "embedding_dimension", "embedding_base_url")
+
+
+@dataclass(frozen=True)
+class NoteSummarySyncStats:
+    kept: int = 0
+    added: int = 0
+    removed: int = 0
+
+
+def note_summary_collection_name(collection_name: str) -> str:
+    return f"{collection_name}{NOTE_SUMMARY_SUFFIX}"
+
+
+def is_note_summary_collection(collection) -> bool:
+    return (collection.metadata or {}).get("minerva_role") == NOTE_SUMMARY_ROLE
+
+
+def get_note_summary_collection(client, collection_name: str):
+    # None when the collection has no note summaries
+    try:
+        summaries = client.get_collection(note_summary_collection_name(collection_name))
+    except Exception:
+        return None
+    return summaries if is_note_summary_collection(summaries) else None
+
+
+def remove_note_summaries(client, collection_name: str) -> bool:
+    if get_note_summary_collection(client, collection_name) is None:
+        return False
+    client.delete_collection(note_summary_collection_name(collection_name))
+    return True
+
+
+def _summary_metadata(parent_metadata: Dict[str, Any], collection_name: str) -> Dict[str, Any]:
+    metadata = {
+        "hnsw:space": "cosine",
+        "minerva_role": NOTE_SUMMARY_ROLE,
+        "parent_collection": collection_name,
+        "description": f"Note summary vectors for '{collection_name}'",
+    }
+    metadata.update({key: parent_metadata[key] for key in _COPIED_METADATA if parent_metadata.get(key) is not None})
+    return metadata
+
+
+def _iter_pages(collection, include: List[str], ids: Optional[List[str]] = None) -> Iterable[dict]:
+    if ids is not None:
+        for start in range(0, len(ids), FETCH_PAGE_SIZE):
+            yield collection.get(ids=ids[start:start + FETCH_PAGE_SIZE], include=include)
+        return
+
+    total_count = collection.count()
+    for offset in range(0, total_count, FETCH_PAGE_SIZE):
+        page = collection.get(limit=FETCH_PAGE_SIZE, offset=offset, include=include)
+        if not page["ids"]:
+            break
+        yield page
+
+
+def _note_metadata(first_chunk_metadata: Dict[str, Any], chunk_count: int) -> Dict[str, Any]:
+    metadata = {
+        "noteId": first_chunk_metadata.get("noteId"),
+        "title": first_chunk_metadata.get("title", ""),
+        "chunkCount": chunk_count,
+    }
+    # Filter fields are copied so metadata filters also apply to the note stage
+    for key in ("content_hash",) + FILTER_FIELD_NAMES:
+        if first_chunk_metadata.get(key) is not None:
+            metadata[key] = first_chunk_metadata[key]
+    return metadata
+
+
+def unit_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def sync_note_summaries(client, collection, rebuild: bool = False) -> NoteSummarySyncStats:
+    """Bring a collection's note summary vectors in line with its chunks.
+
+    Notes whose content_hash, chunk count and filter fields are unchanged keep
+    their summary; only new or changed notes have their chunk embeddings read
+    back from ChromaDB and averaged.
+    """
+    name = note_summary_collection_name(collection.name)
+    try:
+        if rebuild:
+            remove_note_summaries(client, collection.name)
+        summaries = get_note_summary_collection(client, collection.name)
+        if summaries is None:
+            summaries = client.create_collection(
+                name=name, metadata=_summary_metadata(collection.metadata or {}, collection.name)
+            )
+    except Exception as error:
+        raise StorageError(f"Failed to open note summary collection '{name}': {error}") from error
+
+    existing: Dict[str, Dict[str, Any]] = {}
+    for page in _iter_pages(summaries, include=["metadatas"]):
+        for note_id, metadata in zip(page["ids"], page["metadatas"]):
+            existing[note_id] = metadata or {}
+
+    chunk_ids: Dict[str, List[str]] = {}
+    first_chunks: Dict[str, Dict[str, Any]] = {}
+    for page in _iter_pages(collection, include=["metadatas"]):
+        for chunk_id, metadata in zip(page["ids"], page["metadatas"]):
+            metadata = metadata or {}
+            note_id = metadata.get("noteId")
+            if not note_id:
+                continue
+            chunk_ids.setdefault(note_id, []).append(chunk_id)
+            if metadata.get("chunkIndex") == 0 or note_id not in first_chunks:
+                first_chunks[note_id] = metadata
+
+    current = {
+        note_id: _note_metadata(first_chunks[note_id], len(ids)) for note_id, ids in chunk_ids.items()
+    }
+    removed = [note_id for note_id in existing if note_id not in current]
+    changed = [note_id for note_id, metadata in current.items() if existing.get(note_id) != metadata]
+
+    for start in range(0, len(removed), WRITE_BATCH_SIZE):
+        summaries.delete(ids=removed[start:start + WRITE_BATCH_SIZE])
+
+    # Running sums of unit vectors per note, so memory is bounded by the number
+    # of changed notes rather than their chunks
+    wanted = [chunk_id for note_id in changed for chunk_id in chunk_ids[note_id]]
+    note_of = {chunk_id: note_id for note_id in changed for chunk_id in chunk_ids[note_id]}
+    sums: Dict[str, np.ndarray] = {}
+    counts: Dict[str, int] = {}
+    for page in _iter_pages(collection, include=["embeddings"], ids=wanted):
+        if not len(page["ids"]):
+            continue
+        unit = unit_rows(np.asarray(page["embeddings"], dtype=np.float32))
+        for chunk_id, vector in zip(page["ids"], unit):
+            note_id = note_of[chunk_id]
+            if note_id in sums:
+                sums[note_id] += vector
+            else:
+                sums[note_id] = vector.copy()
+            counts[note_id] = counts.get(note_id, 0) + 1
+
+    ready = [note_id for note_id in changed if note_id in sums]
+    for start in range(0, len(ready), WRITE_BATCH_SIZE):
+        batch = ready[start:start + WRITE_BATCH_SIZE]
+        summaries.upsert(
+            ids=batch,
+            embeddings=[(sums[note_id] / counts[note_id]).tolist() for note_id in batch],
+            metadatas=[current[note_id] for note_id in batch]
+        )
+
+    return NoteSummarySyncStats(
+        kept=len(existing) - len(removed) - len([note_id for note_id in changed if note_id in existing]),
+        added=len(ready),
+        removed=len(removed)
+    )
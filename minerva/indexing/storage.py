@@ -2,11 +2,12 @@ import os
 import re
 import fcntl
 import time
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Iterable, Optional, Callable, Tuple
 from pathlib import Path
 
 from minerva.common.exceptions import StorageError, ChromaDBConnectionError
 from minerva.common.logger import get_logger
+from minerva.common.tracing import traced
 
 logger = get_logger(__name__, mode="cli")
 
@@ -148,7 +149,13 @@ def _validate_no_actual_api_keys(value: Any, field_name: str) -> None:
             )
 
 
-def build_collection_metadata(description: str, embedding_metadata: Dict[str, Any], chunk_size: int = 1200, note_count: Optional[int] = None) -> Dict[str, Any]:
+def build_collection_metadata(
+    description: str,
+    embedding_metadata: Dict[str, Any],
+    chunk_size: int = 1200,
+    note_count: Optional[int] = None,
+    hnsw_params: Optional[Dict[str, int]] = None,
+) -> Dict[str, Any]:
     from datetime import datetime, timezone
 
     if not embedding_metadata:
@@ -175,6 +182,14 @@ def build_collection_metadata(description: str, embedding_metadata: Dict[str, An
     if note_count is not None:
         metadata["note_count"] = note_count
 
+    # HNSW build/search parameters (hnsw:M, hnsw:construction_ef, hnsw:search_ef);
+    # ChromaDB only reads them at creation time
+    if hnsw_params:
+        for key, value in hnsw_params.items():
+            if not key.startswith("hnsw:") or key == "hnsw:space":
+                raise StorageError(f"Invalid HNSW parameter '{key}'")
+            metadata[key] = value
+
     allowed_fields = [
         'embedding_model',
         'embedding_provider',
@@ -223,6 +238,28 @@ def create_new_collection(client: chromadb.PersistentClient, collection_name: st
         raise StorageError(f"Failed to create collection '{collection_name}': {error}")
 
 
+def get_hnsw_settings(collection: chromadb.Collection) -> Dict[str, Any]:
+    # Effective index settings live in the collection configuration; metadata loses
+    # the hnsw:* keys after the first metadata update
+    configuration = getattr(collection, "configuration", None) or {}
+    hnsw = configuration.get("hnsw") or {}
+    return {
+        "space": hnsw.get("space"),
+        "M": hnsw.get("max_neighbors"),
+        "construction_ef": hnsw.get("ef_construction"),
+        "search_ef": hnsw.get("ef_search"),
+    }
+
+
+def set_search_ef(collection: chromadb.Collection, search_ef: int) -> None:
+    # search_ef is the only HNSW parameter ChromaDB can change without rebuilding the index.
+    # It is read when the index is loaded, so running servers pick it up on restart
+    try:
+        collection.modify(configuration={"hnsw": {"ef_search": search_ef}})
+    except Exception as error:
+        raise StorageError(f"Failed to set search_ef on collection '{collection.name}': {error}")
+
+
 def print_collection_creation_summary(collection_name: str, description: str, created_at: str) -> None:
     logger.success(f"   Created new collection '{collection_name}'")
     if description:
@@ -237,6 +274,7 @@ def create_collection(
     embedding_metadata: Dict[str, Any],
     chunk_size: int = 1200,
     note_count: Optional[int] = None,
+    hnsw_params: Optional[Dict[str, int]] = None,
 ) -> chromadb.Collection:
     try:
         if collection_exists(client, collection_name):
@@ -248,7 +286,7 @@ def create_collection(
                 f"       (WARNING: This will permanently delete all existing data!)\n"
             )
 
-        metadata = build_collection_metadata(description, embedding_metadata, chunk_size, note_count)
+        metadata = build_collection_metadata(description, embedding_metadata, chunk_size, note_count, hnsw_params)
 
         collection = create_new_collection(client, collection_name, metadata)
 
@@ -270,11 +308,12 @@ def recreate_collection(
     embedding_metadata: Dict[str, Any],
     chunk_size: int = 1200,
     note_count: Optional[int] = None,
+    hnsw_params: Optional[Dict[str, int]] = None,
 ) -> chromadb.Collection:
     try:
         delete_existing_collection(client, collection_name)
 
-        metadata = build_collection_metadata(description, embedding_metadata, chunk_size, note_count)
+        metadata = build_collection_metadata(description, embedding_metadata, chunk_size, note_count, hnsw_params)
 
         collection = create_new_collection(client, collection_name, metadata)
 
@@ -298,6 +337,7 @@ def get_or_create_collection(
     embedding_metadata: Optional[Dict[str, Any]] = None,
     chunk_size: int = 1200,
     note_count: Optional[int] = None,
+    hnsw_params: Optional[Dict[str, int]] = None,
 ) -> chromadb.Collection:
     if not embedding_metadata:
         raise StorageError(
@@ -307,9 +347,9 @@ def get_or_create_collection(
         )
 
     if force_recreate:
-        return recreate_collection(client, collection_name, description, embedding_metadata, chunk_size, note_count)
+        return recreate_collection(client, collection_name, description, embedding_metadata, chunk_size, note_count, hnsw_params)
     else:
-        return create_collection(client, collection_name, description, embedding_metadata, chunk_size, note_count)
+        return create_collection(client, collection_name, description, embedding_metadata, chunk_size, note_count, hnsw_params)
 
 
 def compute_adjacent_chunk_ids(chunks_with_embeddings: ChunkWithEmbeddingList) -> Dict[str, Dict[str, Optional[str]]]:
@@ -360,6 +400,14 @@ def prepare_chunk_batch_data(batch, adjacent_ids_map: Optional[Dict[str, Dict[st
         if chunk.content_hash is not None:
             metadata['content_hash'] = chunk.content_hash
 
+        # Stored token count lets the server budget responses without re-tokenizing
+        if chunk.token_count is not None:
+            metadata['tokenCount'] = chunk.token_count
+
+        # Normalized extractor fields (dates, path prefixes, author, year) for where-filters
+        if chunk.filter_fields:
+            metadata.update(chunk.filter_fields)
+
         # Add adjacent chunk IDs as a delimited string (schema-flexible for future extensions)
         # Format: "prev2:prev1:next1:next2" where None becomes empty string
         if adjacent_ids_map and chunk.id in adjacent_ids_map:
@@ -377,6 +425,31 @@ def prepare_chunk_batch_data(batch, adjacent_ids_map: Optional[Dict[str, Dict[st
     return ids, documents, embeddings, metadatas
 
 
+def note_hashes_by_chunk(entries: Iterable[Tuple[str, Optional[Dict[str, Any]]]]) -> Dict[str, Optional[str]]:
+    # The note content_hash of each (chunk id, metadata) pair. Only chunk 0 stores
+    # the hash, and a note edited without a new modificationDate keeps its chunk
+    # ids, so later chunks are only comparable through their note.
+    note_ids: Dict[str, str] = {}
+    note_hashes: Dict[str, str] = {}
+    hashes: Dict[str, Optional[str]] = {}
+
+    for chunk_id, metadata in entries:
+        metadata = metadata or {}
+        note_id = metadata.get('noteId')
+        content_hash = metadata.get('content_hash')
+        if note_id is None:
+            hashes[chunk_id] = content_hash
+            continue
+        note_ids[chunk_id] = note_id
+        if content_hash is not None:
+            note_hashes[note_id] = content_hash
+
+    for chunk_id, note_id in note_ids.items():
+        hashes[chunk_id] = note_hashes.get(note_id)
+    return hashes
+
+
+@traced("index.insert_batch")
 def insert_batch_to_collection(collection, batch, batch_num, stats, adjacent_ids_map=None):
     try:
         ids, documents, embeddings, metadatas = prepare_chunk_batch_data(batch, adjacent_ids_map)
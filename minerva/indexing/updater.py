@@ -3,10 +3,13 @@ from typing import Dict, List, Set, Tuple, Optional, Any
 from dataclasses import dataclass, field
 from minerva.common.exceptions import IncrementalUpdateError
 from minerva.common.logger import get_logger
+from minerva.common.profiling import pipeline_stage
+from minerva.common.tracing import traced
 from minerva.common.models import Chunk, ChunkList
 from minerva.common.ai_provider import AIProvider
 from minerva.indexing.chunking import generate_note_id, compute_content_hash, build_chunks_from_note
 from minerva.indexing.embeddings import generate_embeddings
+from minerva.indexing.filter_fields import build_filter_fields, filter_fields_stale
 from minerva.indexing.storage import insert_chunks
 
 logger = get_logger(__name__, mode="cli")
@@ -18,6 +21,11 @@ except ImportError as error:
     logger.error(f"{message}. Run: pip install chromadb")
     raise IncrementalUpdateError(message) from error
 
+# ChromaDB's SQLite backend caps bound variables per statement
+FETCH_PAGE_SIZE = 5000
+DELETE_BATCH_SIZE = 5000
+UPDATE_BATCH_SIZE = 5000
+
 
 @dataclass
 class UpdateStats:
@@ -188,6 +196,7 @@ def format_config_change_error(collection_name: str, config_change: ConfigChange
     )
 
 
+@traced("index.fetch_existing_state")
 def fetch_existing_state(collection: chromadb.Collection) -> ExistingState:
     logger.info("   Fetching existing chunks from ChromaDB...")
 
@@ -197,9 +206,18 @@ def fetch_existing_state(collection: chromadb.Collection) -> ExistingState:
         logger.info("   Collection is empty (no existing chunks)")
         return ExistingState(noteId_to_chunks={}, noteId_to_hash={})
 
-    results = collection.get(
-        include=["metadatas"]
-    )
+    # Paged: a single unbounded get() exceeds SQLite's variable limit on large collections
+    results: Dict[str, List[Any]] = {"ids": [], "metadatas": []}
+    for offset in range(0, total_count, FETCH_PAGE_SIZE):
+        page = collection.get(
+            include=["metadatas"],
+            limit=FETCH_PAGE_SIZE,
+            offset=offset
+        )
+        if not page or not page.get("ids"):
+            break
+        results["ids"].extend(page["ids"])
+        results["metadatas"].extend(page.get("metadatas") or [{}] * len(page["ids"]))
 
     noteId_to_chunks: Dict[str, List[Dict[str, Any]]] = {}
     noteId_to_hash: Dict[str, str] = {}
@@ -318,7 +336,8 @@ def delete_note_chunks(
         return 0
 
     try:
-        collection.delete(ids=chunk_ids_to_delete)
+        for start in range(0, len(chunk_ids_to_delete), DELETE_BATCH_SIZE):
+            collection.delete(ids=chunk_ids_to_delete[start:start + DELETE_BATCH_SIZE])
         logger.success(f"   ✓ Deleted {len(chunk_ids_to_delete)} chunks")
         return len(chunk_ids_to_delete)
     except Exception as error:
@@ -347,17 +366,20 @@ def update_note_chunks(
     delete_note_chunks(collection, note_ids_to_delete, existing_state)
 
     all_new_chunks = []
-    for note in notes_to_update:
-        chunks = build_chunks_from_note(note, target_chars, overlap_chars)
-        all_new_chunks.extend(chunks)
+    with pipeline_stage("chunk"):
+        for note in notes_to_update:
+            chunks = build_chunks_from_note(note, target_chars, overlap_chars)
+            all_new_chunks.extend(chunks)
 
     if not all_new_chunks:
         logger.warning("   No new chunks created during update")
         return 0
 
-    chunks_with_embeddings = generate_embeddings(provider, all_new_chunks)
+    with pipeline_stage("embed"):
+        chunks_with_embeddings = generate_embeddings(provider, all_new_chunks)
 
-    insert_chunks(collection, chunks_with_embeddings)
+    with pipeline_stage("store"):
+        insert_chunks(collection, chunks_with_embeddings)
 
     logger.success(f"   ✓ Updated {len(all_new_chunks)} chunks for {len(notes_to_update)} notes")
     return len(all_new_chunks)
@@ -376,22 +398,70 @@ def add_note_chunks(
     logger.info(f"   Adding chunks for {len(notes_to_add)} new notes...")
 
     all_new_chunks = []
-    for note in notes_to_add:
-        chunks = build_chunks_from_note(note, target_chars, overlap_chars)
-        all_new_chunks.extend(chunks)
+    with pipeline_stage("chunk"):
+        for note in notes_to_add:
+            chunks = build_chunks_from_note(note, target_chars, overlap_chars)
+            all_new_chunks.extend(chunks)
 
     if not all_new_chunks:
         logger.warning("   No chunks created for new notes")
         return 0
 
-    chunks_with_embeddings = generate_embeddings(provider, all_new_chunks)
+    with pipeline_stage("embed"):
+        chunks_with_embeddings = generate_embeddings(provider, all_new_chunks)
 
-    insert_chunks(collection, chunks_with_embeddings)
+    with pipeline_stage("store"):
+        insert_chunks(collection, chunks_with_embeddings)
 
     logger.success(f"   ✓ Added {len(all_new_chunks)} chunks for {len(notes_to_add)} notes")
     return len(all_new_chunks)
 
 
+def backfill_filter_fields(
+    collection: chromadb.Collection,
+    new_notes: List[Dict[str, Any]],
+    unchanged_note_ids: List[str],
+    existing_state: ExistingState
+) -> int:
+    # Unchanged notes indexed before filter fields existed (or whose extractor
+    # fields changed without touching the markdown) get them as a metadata-only
+    # update; nothing is re-embedded.
+    if not unchanged_note_ids:
+        return 0
+
+    unchanged = set(unchanged_note_ids)
+    ids: List[str] = []
+    metadatas: List[Dict[str, Any]] = []
+    for note in new_notes:
+        note_id = generate_note_id(note['title'], note.get('creationDate'))
+        if note_id not in unchanged:
+            continue
+        fields = build_filter_fields(note)
+        if not fields:
+            continue
+        for chunk in existing_state.noteId_to_chunks.get(note_id, []):
+            if filter_fields_stale(chunk["metadata"], fields):
+                ids.append(chunk["id"])
+                metadatas.append({**(chunk["metadata"] or {}), **fields})
+
+    if not ids:
+        return 0
+
+    logger.info(f"   Backfilling search filter fields on {len(ids)} unchanged chunks...")
+    try:
+        for start in range(0, len(ids), UPDATE_BATCH_SIZE):
+            collection.update(
+                ids=ids[start:start + UPDATE_BATCH_SIZE],
+                metadatas=metadatas[start:start + UPDATE_BATCH_SIZE]
+            )
+        logger.success(f"   ✓ Backfilled filter fields on {len(ids)} chunks")
+    except Exception as error:
+        # Filtered searches miss these chunks until the next run; plain searches are unaffected
+        logger.warning(f"   Failed to backfill filter fields: {error}")
+        return 0
+    return len(ids)
+
+
 def log_content_changes(changes: ChangeDetectionResult) -> None:
     """Log summary of content changes."""
     total_changes = len(changes.added_notes) + len(changes.updated_notes) + len(changes.deleted_note_ids)
@@ -421,6 +491,12 @@ def log_metadata_changes(changes: MetadataChanges) -> None:
         logger.info(f"      • Note count: {changes.old_note_count} → {changes.new_note_count}")
 
 
+def strip_hnsw_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    # hnsw:* keys are read only at collection creation; ChromaDB rejects them in modify()
+    # and keeps the index settings in the collection configuration instead
+    return {key: value for key, value in metadata.items() if not key.startswith('hnsw:')}
+
+
 def update_collection_metadata(
     collection: chromadb.Collection,
     metadata_changes: MetadataChanges
@@ -431,12 +507,7 @@ def update_collection_metadata(
     current_timestamp = datetime.now(timezone.utc).isoformat()
 
     try:
-        current_metadata = collection.metadata or {}
-        updated_metadata = dict(current_metadata)
-
-        # Remove immutable ChromaDB fields that cannot be modified
-        # hnsw:space is set at collection creation and cannot be changed
-        updated_metadata.pop('hnsw:space', None)
+        updated_metadata = strip_hnsw_metadata(collection.metadata or {})
 
         updated_metadata['last_updated'] = current_timestamp
 
@@ -464,12 +535,7 @@ def update_collection_timestamp(collection: chromadb.Collection, note_count: Opt
     current_timestamp = datetime.now(timezone.utc).isoformat()
 
     try:
-        current_metadata = collection.metadata or {}
-        updated_metadata = dict(current_metadata)
-
-        # Remove immutable ChromaDB fields that cannot be modified
-        # hnsw:space is set at collection creation and cannot be changed
-        updated_metadata.pop('hnsw:space', None)
+        updated_metadata = strip_hnsw_metadata(collection.metadata or {})
 
         updated_metadata['last_updated'] = current_timestamp
 
@@ -496,12 +562,7 @@ def update_collection_description(
     current_timestamp = datetime.now(timezone.utc).isoformat()
 
     try:
-        current_metadata = collection.metadata or {}
-        updated_metadata = dict(current_metadata)
-
-        # Remove immutable ChromaDB fields that cannot be modified
-        # hnsw:space is set at collection creation and cannot be changed
-        updated_metadata.pop('hnsw:space', None)
+        updated_metadata = strip_hnsw_metadata(collection.metadata or {})
 
         updated_metadata['description'] = new_description
         updated_metadata['last_updated'] = current_timestamp
@@ -610,6 +671,7 @@ def run_incremental_update(
         stats.added = len(content_changes.added_notes)
 
     stats.unchanged = len(content_changes.unchanged_note_ids)
+    backfill_filter_fields(collection, new_notes, content_changes.unchanged_note_ids, existing_state)
 
     # 5. Update metadata if changed
     logger.info("")
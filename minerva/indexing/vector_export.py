@@ -0,0 +1,308 @@
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from minerva.common.exceptions import StorageError
+from minerva.common.logger import get_logger
+from minerva.indexing.storage import note_hashes_by_chunk
+
+logger = get_logger(__name__)
+
+EXPORT_DIRNAME = "minerva_vectors"
+EXPORT_FORMATS = ("npy", "raw")
+MANIFEST_VERSION = 1
+# ChromaDB's SQLite backend caps bound variables per statement
+FETCH_PAGE_SIZE = 5000
+# Rows copied per step when rewriting the matrix file
+COPY_BLOCK_ROWS = 8192
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class VectorExport:
+    # `matrix` is a read-only memory map; row i holds the embedding of ids[i]
+    collection_name: str
+    ids: List[str]
+    content_hashes: List[Optional[str]]
+    matrix: np.ndarray
+    last_updated: Optional[str]
+    format: str
+    matrix_path: Path
+
+    @property
+    def dimension(self) -> int:
+        return int(self.matrix.shape[1])
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.matrix.nbytes)
+
+
+@dataclass(frozen=True)
+class ExportSyncStats:
+    kept: int = 0
+    added: int = 0
+    removed: int = 0
+    up_to_date: bool = False
+
+
+def default_export_dir(chromadb_path: str) -> Path:
+    return Path(chromadb_path) / EXPORT_DIRNAME
+
+
+def manifest_path(export_dir: Path, collection_name: str) -> Path:
+    return export_dir / f"{collection_name}.json"
+
+
+def matrix_path(export_dir: Path, collection_name: str, export_format: str) -> Path:
+    suffix = ".npy" if export_format == "npy" else ".f32"
+    return export_dir / f"{collection_name}{suffix}"
+
+
+def export_exists(export_dir: Path, collection_name: str) -> bool:
+    return manifest_path(export_dir, collection_name).exists()
+
+
+def read_manifest(export_dir: Path, collection_name: str) -> Optional[Dict[str, Any]]:
+    path = manifest_path(export_dir, collection_name)
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as error:
+        logger.warning(f"Ignoring unreadable vector export manifest {path}: {error}")
+        return None
+
+
+def load_vector_export(export_dir: Path, collection_name: str) -> Optional[VectorExport]:
+    manifest = read_manifest(export_dir, collection_name)
+    if manifest is None:
+        return None
+
+    export_format = manifest.get("format", "npy")
+    path = matrix_path(export_dir, collection_name, export_format)
+    ids = manifest.get("ids", [])
+    count = len(ids)
+    dimension = int(manifest.get("dimension", 0))
+
+    try:
+        if count == 0:
+            matrix = np.zeros((0, dimension), dtype=np.float32)
+        elif export_format == "npy":
+            matrix = np.load(path, mmap_mode="r")
+        else:
+            matrix = np.memmap(path, dtype=np.float32, mode="r", shape=(count, dimension))
+    except (OSError, ValueError) as error:
+        logger.warning(f"Ignoring unreadable vector export {path}: {error}")
+        return None
+
+    # A manifest and matrix from different writes (e.g. a reader racing a sync) are unusable
+    if matrix.ndim != 2 or matrix.shape[0] != count or matrix.dtype != np.float32:
+        return None
+
+    return VectorExport(
+        collection_name=collection_name,
+        ids=ids,
+        content_hashes=manifest.get("content_hashes", [None] * count),
+        matrix=matrix,
+        last_updated=manifest.get("last_updated"),
+        format=export_format,
+        matrix_path=path,
+    )
+
+
+def remove_vector_export(export_dir: Path, collection_name: str) -> bool:
+    removed = False
+    for path in (
+        manifest_path(export_dir, collection_name),
+        matrix_path(export_dir, collection_name, "npy"),
+        matrix_path(export_dir, collection_name, "raw"),
+    ):
+        if path.exists():
+            path.unlink()
+            removed = True
+    return removed
+
+
+def read_chunk_hashes(collection) -> Tuple[List[str], Dict[str, Optional[str]]]:
+    # Chunk ids in collection order with their note's content_hash; metadata only, no vectors
+    total_count = collection.count()
+    entries: List[Tuple[str, Optional[Dict[str, Any]]]] = []
+
+    for offset in range(0, total_count, FETCH_PAGE_SIZE):
+        page = collection.get(limit=FETCH_PAGE_SIZE, offset=offset, include=["metadatas"])
+        if not page["ids"]:
+            break
+        entries.extend(zip(page["ids"], page["metadatas"]))
+
+    return [chunk_id for chunk_id, _ in entries], note_hashes_by_chunk(entries)
+
+
+def fetch_embeddings(collection, ids: List[str]) -> np.ndarray:
+    if not ids:
+        return np.zeros((0, 0), dtype=np.float32)
+
+    vectors: Dict[str, Any] = {}
+    for start in range(0, len(ids), FETCH_PAGE_SIZE):
+        page = collection.get(ids=ids[start:start + FETCH_PAGE_SIZE], include=["embeddings"])
+        vectors.update(zip(page["ids"], page["embeddings"]))
+
+    missing = [chunk_id for chunk_id in ids if chunk_id not in vectors]
+    if missing:
+        raise StorageError(
+            f"{len(missing)} chunk(s) disappeared from '{collection.name}' during vector export; "
+            f"rerun the export once indexing has finished"
+        )
+
+    return np.asarray([vectors[chunk_id] for chunk_id in ids], dtype=np.float32).reshape(len(ids), -1)
+
+
+def sync_vector_export(
+    collection,
+    export_dir: Path,
+    export_format: Optional[str] = None,
+    full: bool = False
+) -> Tuple[VectorExport, ExportSyncStats]:
+    """Bring a collection's vector export up to date with ChromaDB.
+
+    Rows whose chunk id and note content_hash are unchanged are copied from the
+    existing export; only new or re-embedded chunks are read from ChromaDB.
+    """
+    name = collection.name
+    metadata = collection.metadata or {}
+    last_updated = metadata.get("last_updated")
+
+    existing = None if full else load_vector_export(export_dir, name)
+    if existing is not None and read_manifest(export_dir, name).get("embedding_model") != metadata.get("embedding_model"):
+        # Re-embedded with another model: same ids and hashes, different vectors
+        existing = None
+    if export_format is None:
+        export_format = existing.format if existing else "npy"
+    if export_format not in EXPORT_FORMATS:
+        raise StorageError(f"Unknown vector export format '{export_format}' (expected one of {', '.join(EXPORT_FORMATS)})")
+
+    if (
+        existing is not None
+        and existing.format == export_format
+        and last_updated is not None
+        and existing.last_updated == last_updated
+    ):
+        return existing, ExportSyncStats(kept=len(existing.ids), up_to_date=True)
+
+    current_ids, current_hashes = read_chunk_hashes(collection)
+
+    keep_rows: List[int] = []
+    if existing is not None:
+        for row, chunk_id in enumerate(existing.ids):
+            if current_hashes.get(chunk_id, _MISSING) == existing.content_hashes[row]:
+                keep_rows.append(row)
+
+    kept_ids = {existing.ids[row] for row in keep_rows} if existing is not None else set()
+    new_ids = [chunk_id for chunk_id in current_ids if chunk_id not in kept_ids]
+    new_vectors = fetch_embeddings(collection, new_ids)
+
+    if existing is not None and keep_rows:
+        dimension = existing.dimension
+        if len(new_ids) and new_vectors.shape[1] != dimension:
+            # Embedding model changed: nothing in the old export is reusable
+            return sync_vector_export(collection, export_dir, export_format, full=True)
+    elif len(new_ids):
+        dimension = int(new_vectors.shape[1])
+    else:
+        dimension = int(metadata.get("embedding_dimension") or 0)
+
+    ids = [existing.ids[row] for row in keep_rows] + new_ids if existing is not None else new_ids
+    hashes = [current_hashes.get(chunk_id) for chunk_id in ids]
+
+    export_dir.mkdir(parents=True, exist_ok=True)
+    path = matrix_path(export_dir, name, export_format)
+    _write_matrix(path, export_format, existing.matrix if existing is not None else None, keep_rows, new_vectors, dimension)
+    _write_manifest(export_dir, name, {
+        "version": MANIFEST_VERSION,
+        "collection": name,
+        "format": export_format,
+        "dtype": "float32",
+        "count": len(ids),
+        "dimension": dimension,
+        "last_updated": last_updated,
+        "embedding_model": metadata.get("embedding_model"),
+        "ids": ids,
+        "content_hashes": hashes,
+    })
+
+    # A format switch leaves the previous matrix file behind
+    if existing is not None and existing.format != export_format and existing.matrix_path.exists():
+        existing.matrix_path.unlink()
+
+    stats = ExportSyncStats(
+        kept=len(keep_rows),
+        added=len(new_ids),
+        removed=(len(existing.ids) - len(keep_rows)) if existing is not None else 0,
+    )
+    export = load_vector_export(export_dir, name)
+    if export is None:
+        raise StorageError(f"Vector export for '{name}' could not be read back from {export_dir}")
+    return export, stats
+
+
+def _atomic_temp_path(path: Path) -> Path:
+    handle, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    os.close(handle)
+    # mkstemp creates 0600 files; exports are meant to be mapped by other processes
+    os.chmod(temp_name, 0o644)
+    return Path(temp_name)
+
+
+def _write_matrix(
+    path: Path,
+    export_format: str,
+    previous: Optional[np.ndarray],
+    keep_rows: List[int],
+    new_vectors: np.ndarray,
+    dimension: int
+) -> None:
+    count = len(keep_rows) + len(new_vectors)
+    temp_path = _atomic_temp_path(path)
+
+    try:
+        if count == 0:
+            # An empty raw export is an empty file, which mkstemp already created
+            if export_format == "npy":
+                with open(temp_path, "wb") as handle:
+                    np.save(handle, np.zeros((0, dimension), dtype=np.float32))
+        else:
+            if export_format == "npy":
+                output = np.lib.format.open_memmap(temp_path, mode="w+", dtype=np.float32, shape=(count, dimension))
+            else:
+                output = np.memmap(temp_path, dtype=np.float32, mode="w+", shape=(count, dimension))
+
+            # Copy kept rows block by block so a large export never sits in memory twice
+            for start in range(0, len(keep_rows), COPY_BLOCK_ROWS):
+                block = keep_rows[start:start + COPY_BLOCK_ROWS]
+                output[start:start + len(block)] = previous[block]
+            if len(new_vectors):
+                output[len(keep_rows):] = new_vectors
+            output.flush()
+            del output
+
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_manifest(export_dir: Path, collection_name: str, manifest: Dict[str, Any]) -> None:
+    path = manifest_path(export_dir, collection_name)
+    temp_path = _atomic_temp_path(path)
+    try:
+        temp_path.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
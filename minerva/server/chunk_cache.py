@@ -0,0 +1,94 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from minerva.common.metrics import record_cache_lookup
+from minerva.common.server_config import DEFAULT_CHUNK_CACHE_SIZE
+
+CACHE_NAME = "context_chunks"
+
+# (document, metadata) as returned by collection.get()
+CachedChunk = Tuple[Optional[str], Optional[Dict[str, Any]]]
+
+
+class ChunkCache:
+    """Bounded LRU of chunk documents and metadata for context retrieval.
+
+    Enhanced context mode reads every matched chunk and its neighbours by ID,
+    and popular notes are expanded over and over. Entries are keyed by
+    (collection, chunk ID) and tagged with the collection's `last_updated`;
+    when a re-index changes it, that collection's entries are dropped on the
+    next lookup. Other collections keep theirs.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CHUNK_CACHE_SIZE):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], CachedChunk]" = OrderedDict()
+        self._versions: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def invalidate(self, collection_name: str) -> None:
+        with self._lock:
+            self._drop_collection(collection_name)
+            self._versions.pop(collection_name, None)
+
+    def _drop_collection(self, collection_name: str) -> None:
+        stale = [key for key in self._entries if key[0] == collection_name]
+        for key in stale:
+            del self._entries[key]
+
+    def get(self, collection, ids: List[str]) -> Dict[str, List[Any]]:
+        # collection.get(ids=..., include=["documents", "metadatas"])-shaped
+        # result; only the IDs not cached are read from ChromaDB
+        name = collection.name
+        version = (collection.metadata or {}).get("last_updated")
+
+        found: Dict[str, CachedChunk] = {}
+        with self._lock:
+            if name in self._versions and self._versions[name] != version:
+                self._drop_collection(name)
+            self._versions[name] = version
+            for chunk_id in ids:
+                entry = self._entries.get((name, chunk_id))
+                if entry is not None:
+                    self._entries.move_to_end((name, chunk_id))
+                    found[chunk_id] = entry
+
+        missing = [chunk_id for chunk_id in dict.fromkeys(ids) if chunk_id not in found]
+        record_cache_lookup(CACHE_NAME, hit=True, count=len(found))
+        record_cache_lookup(CACHE_NAME, hit=False, count=len(missing))
+
+        if missing:
+            fetched = collection.get(ids=missing, include=["documents", "metadatas"])
+            documents = fetched.get("documents") or [None] * len(fetched["ids"])
+            metadatas = fetched.get("metadatas") or [None] * len(fetched["ids"])
+            loaded = {
+                chunk_id: (document, metadata)
+                for chunk_id, document, metadata in zip(fetched["ids"], documents, metadatas)
+            }
+            found.update(loaded)
+            self._store(name, version, loaded)
+
+        ordered = [chunk_id for chunk_id in dict.fromkeys(ids) if chunk_id in found]
+        return {
+            "ids": ordered,
+            "documents": [found[chunk_id][0] for chunk_id in ordered],
+            "metadatas": [found[chunk_id][1] for chunk_id in ordered],
+        }
+
+    def _store(self, collection_name: str, version: Optional[str], chunks: Dict[str, CachedChunk]) -> None:
+        with self._lock:
+            # A re-index seen by a concurrent lookup makes these reads stale
+            if self._versions.get(collection_name) != version:
+                return
+            for chunk_id, entry in chunks.items():
+                self._entries[(collection_name, chunk_id)] = entry
+                self._entries.move_to_end((collection_name, chunk_id))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
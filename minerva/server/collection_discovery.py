@@ -1,5 +1,8 @@
 import sys
-from typing import List, Dict, Any, Optional, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Set, Tuple, TYPE_CHECKING
 
 from minerva.common.exceptions import CollectionDiscoveryError
 from minerva.common.logger import get_logger
@@ -15,20 +18,49 @@ except ImportError as error:
     raise CollectionDiscoveryError(message) from error
 
 from minerva.indexing.storage import initialize_chromadb_client, ChromaDBConnectionError
+from minerva.indexing.note_summaries import is_note_summary_collection
 from minerva.common.ai_config import AIProviderConfig, APIKeyMissingError
 from minerva.common.ai_provider import AIProvider, AIProviderError, ProviderUnavailableError
 
+if TYPE_CHECKING:
+    from minerva.server.provider_registry import LazyProviderRegistry
 
-def reconstruct_provider_from_metadata(metadata: Dict[str, Any]) -> Tuple[Optional[AIProvider], Optional[str]]:
+# Each availability probe is a real embedding call; a hung provider must not block startup
+DEFAULT_PROBE_TIMEOUT = 30.0
+DEFAULT_PROBE_WORKERS = 8
+
+ProviderKey = Tuple[Any, Any, Any, Any, Any]
+
+
+def list_searchable_collections(client: chromadb.PersistentClient) -> List[Any]:
+    # Note summary companions are internal to two-stage search, not knowledge bases
+    return [collection for collection in client.list_collections() if not is_note_summary_collection(collection)]
+
+
+def provider_key_from_metadata(metadata: Dict[str, Any]) -> ProviderKey:
+    return (
+        metadata.get('embedding_provider'),
+        metadata.get('embedding_model'),
+        metadata.get('llm_model'),
+        metadata.get('embedding_base_url'),
+        metadata.get('embedding_api_key_ref')
+    )
+
+
+def missing_provider_metadata(metadata: Dict[str, Any]) -> Optional[str]:
+    provider_type, embedding_model, llm_model, _, _ = provider_key_from_metadata(metadata)
+    if not provider_type or not embedding_model or not llm_model:
+        return "Missing AI provider metadata (created with old pipeline)"
+    return None
+
+
+def build_provider_from_metadata(metadata: Dict[str, Any]) -> Tuple[Optional[AIProvider], Optional[str]]:
     try:
-        provider_type = metadata.get('embedding_provider')
-        embedding_model = metadata.get('embedding_model')
-        llm_model = metadata.get('llm_model')
-        base_url = metadata.get('embedding_base_url')
-        api_key_ref = metadata.get('embedding_api_key_ref')
+        reason = missing_provider_metadata(metadata)
+        if reason is not None:
+            return None, reason
 
-        if not provider_type or not embedding_model or not llm_model:
-            return None, "Missing AI provider metadata (created with old pipeline)"
+        provider_type, embedding_model, llm_model, base_url, api_key_ref = provider_key_from_metadata(metadata)
 
         config = AIProviderConfig(
             provider_type=provider_type,
@@ -39,15 +71,7 @@ def reconstruct_provider_from_metadata(metadata: Dict[str, Any]) -> Tuple[Option
             rate_limit=None
         )
 
-        provider = AIProvider(config)
-
-        availability = provider.check_availability()
-
-        if not availability['available']:
-            reason = availability.get('error', 'Unknown error')
-            return None, reason
-
-        return provider, None
+        return AIProvider(config), None
 
     except APIKeyMissingError as error:
         return None, str(error)
@@ -57,35 +81,208 @@ def reconstruct_provider_from_metadata(metadata: Dict[str, Any]) -> Tuple[Option
         return None, f"Unexpected error during provider reconstruction: {error}"
 
 
-def discover_collections_with_providers(chromadb_path: str) -> Tuple[Dict[str, AIProvider], List[Dict[str, Any]]]:
+def probe_provider(provider: AIProvider) -> Optional[str]:
+    # Returns None when the provider is available, otherwise the reason it is not
+    try:
+        availability = provider.check_availability()
+    except Exception as error:
+        endpoint = f" at {provider.base_url}" if provider.base_url else ""
+        return (
+            f"Availability check failed for provider "
+            f"'{provider.provider_type}/{provider.embedding_model}'{endpoint}: {error}"
+        )
+
+    if not availability['available']:
+        return availability.get('error', 'Unknown error')
+    return None
+
+
+def reconstruct_provider_from_metadata(metadata: Dict[str, Any]) -> Tuple[Optional[AIProvider], Optional[str]]:
+    provider, reason = build_provider_from_metadata(metadata)
+    if provider is None:
+        return None, reason
+
+    reason = probe_provider(provider)
+    if reason is not None:
+        return None, reason
+
+    return provider, None
+
+
+def resolve_shared_providers(
+    metadatas: List[Dict[str, Any]],
+    probe_timeout: float = DEFAULT_PROBE_TIMEOUT,
+    max_workers: int = DEFAULT_PROBE_WORKERS,
+    known_providers: Optional[Dict[ProviderKey, AIProvider]] = None
+) -> Dict[ProviderKey, Tuple[Optional[AIProvider], Optional[str]]]:
+    # One provider instance and one availability probe per distinct configuration,
+    # with probes running concurrently. Collections built with the same provider
+    # settings share the resulting instance. Configurations in known_providers
+    # reuse that instance without another probe.
+    resolved: Dict[ProviderKey, Tuple[Optional[AIProvider], Optional[str]]] = {
+        key: (provider, None) for key, provider in (known_providers or {}).items()
+    }
+    pending: Dict[ProviderKey, AIProvider] = {}
+
+    for metadata in metadatas:
+        key = provider_key_from_metadata(metadata)
+        if key in resolved or key in pending:
+            continue
+
+        provider, reason = build_provider_from_metadata(metadata)
+        if provider is None:
+            resolved[key] = (None, reason)
+        else:
+            pending[key] = provider
+
+    if not pending:
+        return resolved
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(pending))),
+        thread_name_prefix="minerva-probe"
+    )
+    try:
+        futures = {executor.submit(probe_provider, provider): key for key, provider in pending.items()}
+        done, not_done = wait(futures, timeout=probe_timeout)
+
+        for future in done:
+            key = futures[future]
+            reason = future.result()
+            resolved[key] = (pending[key], None) if reason is None else (None, reason)
+
+        for future in not_done:
+            resolved[futures[future]] = (None, f"Availability check timed out after {probe_timeout:.0f}s")
+    finally:
+        # Don't wait on probes that are still hanging past the timeout
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return resolved
+
+
+def _collection_details(collection, unavailable_reason: Optional[str]) -> Dict[str, Any]:
+    metadata = collection.metadata or {}
+    return {
+        "name": collection.name,
+        "description": metadata.get("description", "No description available"),
+        "chunk_count": collection.count(),
+        "created_at": metadata.get("created_at", "Unknown"),
+        "available": unavailable_reason is None,
+        "provider_type": metadata.get("embedding_provider"),
+        "embedding_model": metadata.get("embedding_model"),
+        "llm_model": metadata.get("llm_model"),
+        "embedding_dimension": metadata.get("embedding_dimension"),
+        "unavailable_reason": unavailable_reason
+    }
+
+
+@dataclass(frozen=True)
+class CollectionChanges:
+    # Collections created or deleted since the known set was discovered
+    providers: Dict[str, AIProvider] = field(default_factory=dict)
+    added: List[Dict[str, Any]] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not self.added and not self.removed
+
+
+def discover_collection_changes(
+    chromadb_path: str,
+    known_names: Set[str],
+    provider_map: Dict[str, AIProvider],
+    probe_timeout: float = DEFAULT_PROBE_TIMEOUT,
+    registry: Optional["LazyProviderRegistry"] = None
+) -> CollectionChanges:
+    """Find collections created or deleted since `known_names` was discovered.
+
+    Only new collections get a provider. One whose configuration matches a
+    collection in `provider_map` shares that provider without a new probe.
+    With a registry, new collections are only registered there (see
+    discover_collections_with_providers).
+    """
+    try:
+        client = initialize_chromadb_client(chromadb_path)
+        collections = list_searchable_collections(client)
+    except Exception as error:
+        raise CollectionDiscoveryError(f"Failed to list collections at '{chromadb_path}': {error}") from error
+
+    current_names = {collection.name for collection in collections}
+    removed = sorted(known_names - current_names)
+    new_collections = [collection for collection in collections if collection.name not in known_names]
+    if not new_collections:
+        return CollectionChanges(removed=removed)
+
+    if registry is not None:
+        return CollectionChanges(added=_register_lazily(registry, new_collections), removed=removed)
+
+    known_providers = {
+        provider_key_from_metadata(collection.metadata or {}): provider_map[collection.name]
+        for collection in collections if collection.name in provider_map
+    }
+    shared_providers = resolve_shared_providers(
+        [collection.metadata or {} for collection in new_collections],
+        probe_timeout=probe_timeout,
+        known_providers=known_providers
+    )
+
+    providers: Dict[str, AIProvider] = {}
+    added: List[Dict[str, Any]] = []
+    for collection in new_collections:
+        provider, unavailable_reason = shared_providers[provider_key_from_metadata(collection.metadata or {})]
+        if provider is not None:
+            providers[collection.name] = provider
+        added.append(_collection_details(collection, unavailable_reason))
+
+    return CollectionChanges(providers=providers, added=added, removed=removed)
+
+
+def _register_lazily(registry: "LazyProviderRegistry", collections: List[Any]) -> List[Dict[str, Any]]:
+    # Collections whose provider can be built are recorded for first-use
+    # initialization and reported available; nothing is probed
+    details = []
+    for collection in collections:
+        metadata = collection.metadata or {}
+        unavailable_reason = missing_provider_metadata(metadata)
+        if unavailable_reason is None:
+            registry.register(collection.name, metadata)
+        details.append(_collection_details(collection, unavailable_reason))
+    return details
+
+
+def discover_collections_with_providers(
+    chromadb_path: str,
+    probe_timeout: float = DEFAULT_PROBE_TIMEOUT,
+    registry: Optional["LazyProviderRegistry"] = None
+) -> Tuple[Dict[str, AIProvider], List[Dict[str, Any]]]:
+    # With a registry, collections are only recorded there and the returned
+    # provider map is empty: providers are built on first use instead
     try:
         client = initialize_chromadb_client(chromadb_path)
-        collections = client.list_collections()
+        collections = list_searchable_collections(client)
+
+        if registry is not None:
+            return {}, _register_lazily(registry, collections)
 
         provider_map: Dict[str, AIProvider] = {}
         collection_details: List[Dict[str, Any]] = []
 
-        for collection in collections:
-            metadata = collection.metadata or {}
-            provider, unavailable_reason = reconstruct_provider_from_metadata(metadata)
-
-            collection_info = {
-                "name": collection.name,
-                "description": metadata.get("description", "No description available"),
-                "chunk_count": collection.count(),
-                "created_at": metadata.get("created_at", "Unknown"),
-                "available": provider is not None,
-                "provider_type": metadata.get("embedding_provider"),
-                "embedding_model": metadata.get("embedding_model"),
-                "llm_model": metadata.get("llm_model"),
-                "embedding_dimension": metadata.get("embedding_dimension"),
-                "unavailable_reason": unavailable_reason
-            }
+        start_time = time.time()
+        shared_providers = resolve_shared_providers(
+            [collection.metadata or {} for collection in collections],
+            probe_timeout=probe_timeout
+        )
+        console_logger.info(
+            f"Checked {len(shared_providers)} distinct provider configuration(s) for "
+            f"{len(collections)} collection(s) in {time.time() - start_time:.2f}s"
+        )
 
+        for collection in collections:
+            provider, unavailable_reason = shared_providers[provider_key_from_metadata(collection.metadata or {})]
             if provider is not None:
                 provider_map[collection.name] = provider
-
-            collection_details.append(collection_info)
+            collection_details.append(_collection_details(collection, unavailable_reason))
 
         return provider_map, collection_details
 
@@ -118,14 +315,16 @@ def list_collections(chromadb_path: str) -> List[Dict[str, Any]]:
         client = initialize_chromadb_client(chromadb_path)
 
         # Step 2: Query all collections
-        collections = client.list_collections()
+        collections = list_searchable_collections(client)
 
         # Step 3: Extract metadata, chunk count, and provider availability for each collection
+        shared_providers = resolve_shared_providers([collection.metadata or {} for collection in collections])
+
         result: List[Dict[str, Any]] = []
         for collection in collections:
             metadata = collection.metadata or {}
 
-            provider, unavailable_reason = reconstruct_provider_from_metadata(metadata)
+            provider, unavailable_reason = shared_providers[provider_key_from_metadata(metadata)]
 
             collection_info = {
                 "name": collection.name,
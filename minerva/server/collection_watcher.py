@@ -0,0 +1,75 @@
+import threading
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from minerva.common.logger import get_logger
+
+console_logger = get_logger(__name__)
+
+# ChromaDB's system database; creating or deleting a collection always writes to it
+# (or to its write-ahead log first)
+SYSDB_FILES = ("chroma.sqlite3", "chroma.sqlite3-wal")
+
+Fingerprint = Tuple[Optional[Tuple[int, int]], ...]
+
+
+def chromadb_fingerprint(chromadb_path: str) -> Fingerprint:
+    # (mtime_ns, size) of each system database file; None for a missing file
+    fingerprint = []
+    for name in SYSDB_FILES:
+        try:
+            stat = (Path(chromadb_path) / name).stat()
+        except OSError:
+            fingerprint.append(None)
+            continue
+        fingerprint.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(fingerprint)
+
+
+class CollectionWatcher:
+    """Background poller that notices collections added or removed on disk.
+
+    Every `interval` seconds it stats ChromaDB's system database files. Only
+    when they changed does it call `on_change`, which lists the collections
+    and initializes the new ones. Most polls therefore cost two stat() calls.
+    Indexing also touches these files, so `on_change` must be cheap when
+    nothing was added or removed.
+    """
+
+    def __init__(self, chromadb_path: str, interval: float, on_change: Callable[[], None]):
+        self.chromadb_path = chromadb_path
+        self.interval = interval
+        self.on_change = on_change
+        self._fingerprint = chromadb_fingerprint(chromadb_path)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="minerva-collection-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def check(self) -> bool:
+        # True when the files changed and on_change ran
+        fingerprint = chromadb_fingerprint(self.chromadb_path)
+        if fingerprint == self._fingerprint:
+            return False
+
+        self.on_change()
+        # Only advance after a successful refresh, so a failed one is retried next poll
+        self._fingerprint = fingerprint
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as error:
+                console_logger.warning(f"Collection rediscovery failed: {error}")
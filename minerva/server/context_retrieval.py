@@ -1,11 +1,191 @@
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Set, Optional, TYPE_CHECKING
 import chromadb
 import time
 from minerva.common.exceptions import ContextRetrievalError
 from minerva.common.logger import get_logger
+from minerva.common.metrics import SEARCH_STAGE_SECONDS
+from minerva.server.response_packer import pack_windows
+
+if TYPE_CHECKING:
+    from minerva.server.chunk_cache import ChunkCache
 
 console_logger = get_logger(__name__)
 
+# Chunks are split with a 200-char overlap (see build_text_splitters). The splitter
+# trims whitespace at chunk edges, so search a slightly wider tail for the overlap.
+STITCH_MAX_OVERLAP = 400
+# Shorter common prefixes/suffixes are too likely to be coincidental (e.g. "the ").
+STITCH_MIN_OVERLAP = 20
+
+
+def find_chunk_overlap(
+    previous: str,
+    current: str,
+    max_overlap: int = STITCH_MAX_OVERLAP,
+    min_overlap: int = STITCH_MIN_OVERLAP
+) -> int:
+    # Length of the longest suffix of `previous` that is also a prefix of `current`
+    limit = min(max_overlap, len(previous), len(current))
+    if limit < min_overlap:
+        return 0
+
+    tail = previous[-limit:]
+    probe = current[:min_overlap]
+
+    # The first candidate position gives the longest overlap
+    start = tail.find(probe)
+    while start != -1:
+        if current.startswith(tail[start:]):
+            return limit - start
+        start = tail.find(probe, start + 1)
+
+    return 0
+
+
+def stitch_chunks(
+    chunks: List[Dict[str, Any]],
+    matched_indices: Set[int],
+    style: str = "window"
+) -> str:
+    # chunks: [{'index': int, 'content': str}, ...] sorted by index.
+    # style "window" wraps matches in [MATCH START]/[MATCH END] (enhanced mode),
+    # style "full_note" prefixes them with [MATCH AT CHUNK n].
+    texts = [chunk['content'] for chunk in chunks]
+    seamless = [False] * len(chunks)
+
+    for i in range(1, len(chunks)):
+        if chunks[i]['index'] != chunks[i - 1]['index'] + 1:
+            continue
+
+        overlap = find_chunk_overlap(chunks[i - 1]['content'], chunks[i]['content'])
+        if overlap == 0:
+            continue
+
+        current_is_match = chunks[i]['index'] in matched_indices
+        previous_is_match = chunks[i - 1]['index'] in matched_indices
+
+        if current_is_match and not previous_is_match:
+            # Keep the matched chunk intact; drop the duplicated tail of its predecessor
+            texts[i - 1] = texts[i - 1][:-overlap] if len(texts[i - 1]) > overlap else ""
+        else:
+            texts[i] = chunks[i]['content'][overlap:]
+        seamless[i] = True
+
+    pieces: List[str] = []
+    for i, chunk in enumerate(chunks):
+        is_match = chunk['index'] in matched_indices
+        previous_is_match = i > 0 and chunks[i - 1]['index'] in matched_indices
+
+        if style == "window":
+            marker_boundary = is_match or previous_is_match
+        else:
+            marker_boundary = is_match
+
+        text = texts[i]
+        if i > 0:
+            if seamless[i] and not marker_boundary:
+                pass  # continuation of the previous chunk, joined without separator
+            else:
+                pieces.append("\n\n")
+                text = text.lstrip()
+
+        if is_match and style == "window":
+            pieces.append(f"[MATCH START]\n\n{text}\n\n[MATCH END]")
+        elif is_match:
+            pieces.append(f"[MATCH AT CHUNK {chunk['index']}]\n\n{text}")
+        else:
+            pieces.append(text)
+
+    return "".join(pieces)
+
+
+def merge_note_windows(windows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # windows: [{'result': ..., 'chunks': [...]}, ...] in rank order.
+    # Windows from the same note that overlap or touch are folded into the
+    # highest-ranked one, so shared chunks are only sent to the client once.
+    merged: List[Dict[str, Any]] = []
+    by_note: Dict[Any, List[Dict[str, Any]]] = {}
+
+    for window in windows:
+        result = window['result']
+        indices = [chunk['index'] for chunk in window['chunks']]
+        current = {
+            'result': result,
+            'chunks': {chunk['index']: chunk for chunk in window['chunks']},
+            'matched': {result['chunkIndex']},
+            'start': min(indices),
+            'end': max(indices),
+            'merged_results': [result]
+        }
+
+        note_entries = by_note.setdefault(result['noteId'], [])
+        placed = False
+        changed = True
+        while changed:
+            changed = False
+            for candidate in note_entries:
+                if candidate is current or not _windows_touch(current, candidate):
+                    continue
+                if not placed:
+                    _absorb_window(candidate, current)
+                    current = candidate
+                    placed = True
+                else:
+                    # The grown window now bridges two earlier ones; keep the higher-ranked
+                    first, second = sorted((current, candidate), key=merged.index)
+                    _absorb_window(first, second)
+                    note_entries.remove(second)
+                    merged.remove(second)
+                    current = first
+                changed = True
+                break
+
+        if not placed:
+            note_entries.append(current)
+            merged.append(current)
+
+    return [
+        {
+            'result': entry['result'],
+            'chunks': [entry['chunks'][index] for index in sorted(entry['chunks'])],
+            'matched': entry['matched'],
+            'merged_results': entry['merged_results']
+        }
+        for entry in merged
+    ]
+
+
+def _windows_touch(first: Dict[str, Any], second: Dict[str, Any]) -> bool:
+    return first['start'] <= second['end'] + 1 and first['end'] >= second['start'] - 1
+
+
+def _absorb_window(target: Dict[str, Any], other: Dict[str, Any]) -> None:
+    for index, chunk in other['chunks'].items():
+        target['chunks'].setdefault(index, chunk)
+    target['matched'] |= other['matched']
+    target['start'] = min(target['start'], other['start'])
+    target['end'] = max(target['end'], other['end'])
+    target['merged_results'].extend(other['merged_results'])
+
+
+def render_windows(
+    windows: List[Dict[str, Any]],
+    style: str = "window",
+    token_budget: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    if token_budget is not None:
+        windows, _ = pack_windows(windows, token_budget)
+
+    rendered = []
+    for window in merge_note_windows(windows):
+        result = window['result']
+        result['content'] = stitch_chunks(window['chunks'], window['matched'], style)
+        result['totalChunks'] = len(window['chunks'])
+        if len(window['matched']) > 1:
+            result['matchedChunkIndices'] = sorted(window['matched'])
+        rendered.append(result)
+    return rendered
+
 
 def get_chunk_only_content(
     collection: chromadb.Collection,
@@ -17,6 +197,39 @@ def get_chunk_only_content(
     return result
 
 
+def _matched_chunk_window(result: Dict[str, Any]) -> Dict[str, Any]:
+    # Window holding only the matched chunk (used when neighbors cannot be fetched)
+    return {
+        'result': result,
+        'chunks': [{'index': result['chunkIndex'], 'content': result['content']}]
+    }
+
+
+def _chunks_from_get_results(get_results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    chunks = []
+    for i in range(len(get_results['ids'])):
+        if get_results['metadatas'] and get_results['documents']:
+            metadata = get_results['metadatas'][i]
+            chunks.append({
+                'id': get_results['ids'][i],
+                'noteId': metadata.get('noteId') if metadata else None,
+                'index': metadata.get('chunkIndex', 0) if metadata else 0,
+                'content': get_results['documents'][i],
+                'tokenCount': metadata.get('tokenCount') if metadata else None
+            })
+    return chunks
+
+
+def _get_chunks_by_id(
+    collection: chromadb.Collection,
+    ids: List[str],
+    chunk_cache: Optional["ChunkCache"]
+) -> Dict[str, Any]:
+    if chunk_cache is not None:
+        return chunk_cache.get(collection, ids)
+    return collection.get(ids=ids, include=["documents", "metadatas"])
+
+
 def get_enhanced_content(
     collection: chromadb.Collection,
     result: Dict[str, Any]
@@ -44,28 +257,10 @@ def get_enhanced_content(
             # Fallback to chunk_only if we can't get surrounding chunks
             return get_chunk_only_content(collection, result)
 
-        # Sort chunks by index
-        chunks = []
-        for i in range(len(surrounding_results['ids'])):
-            if surrounding_results['metadatas'] and surrounding_results['documents']:
-                metadata = surrounding_results['metadatas'][i]
-                chunks.append({
-                    'index': metadata['chunkIndex'] if metadata else 0,
-                    'content': surrounding_results['documents'][i]
-                })
-
+        chunks = _chunks_from_get_results(surrounding_results)
         chunks.sort(key=lambda x: x['index'])
 
-        content_parts = []
-        for chunk in chunks:
-            if chunk['index'] == matched_chunk_index:
-                content_parts.append("[MATCH START]")
-                content_parts.append(chunk['content'])
-                content_parts.append("[MATCH END]")
-            else:
-                content_parts.append(chunk['content'])
-
-        result['content'] = "\n\n".join(content_parts)
+        result['content'] = stitch_chunks(chunks, {matched_chunk_index}, style="window")
         result['totalChunks'] = len(chunks)
 
         return result
@@ -79,8 +274,12 @@ def get_enhanced_content(
 def batch_get_enhanced_content_with_ids(
     collection: chromadb.Collection,
     results: List[Dict[str, Any]],
-    verbose: bool = False
+    verbose: bool = False,
+    token_budget: Optional[int] = None,
+    chunk_cache: Optional["ChunkCache"] = None
 ) -> List[Dict[str, Any]]:
+    # chunk_cache serves matched and neighboring chunks already read by
+    # earlier searches; only the rest are fetched from ChromaDB
     if not results:
         return results
 
@@ -95,17 +294,14 @@ def batch_get_enhanced_content_with_ids(
             if not matched_chunk_id:
                 # If we don't have chunk ID in result, we'll need to fall back
                 console_logger.warning("Result missing chunkId field. Falling back to metadata query.")
-                return batch_get_enhanced_content(collection, results, verbose)
+                return batch_get_enhanced_content(collection, results, verbose, token_budget)
 
             ids_to_fetch.add(matched_chunk_id)
             result_map[matched_chunk_id] = result
 
         if verbose:
             console_logger.info(f"  → Fetching {len(ids_to_fetch)} matched chunks...")
-        matched_chunks = collection.get(
-            ids=list(ids_to_fetch),
-            include=["documents", "metadatas"]
-        )
+        matched_chunks = _get_chunks_by_id(collection, list(ids_to_fetch), chunk_cache)
 
         if not matched_chunks or not matched_chunks['ids']:
             console_logger.warning("No matched chunks found. Falling back to chunk_only mode.")
@@ -132,33 +328,24 @@ def batch_get_enhanced_content_with_ids(
         if len(all_ids_to_fetch) == len(ids_to_fetch):
             if verbose:
                 console_logger.info("  → No adjacent_chunk_ids found in metadata. Falling back to metadata query.")
-            return batch_get_enhanced_content(collection, results, verbose)
+            return batch_get_enhanced_content(collection, results, verbose, token_budget)
 
+        # Matched chunks are already in hand; only their neighbors are left to read
+        neighbor_ids = [chunk_id for chunk_id in all_ids_to_fetch if chunk_id not in chunk_metadata_map]
         if verbose:
-            console_logger.info(f"  → Fetching {len(all_ids_to_fetch)} chunks (matched + adjacent)...")
-        all_chunks = collection.get(
-            ids=list(all_ids_to_fetch),
-            include=["documents", "metadatas"]
-        )
+            console_logger.info(f"  → Fetching {len(neighbor_ids)} adjacent chunks...")
+        neighbor_chunks = _get_chunks_by_id(collection, neighbor_ids, chunk_cache) if neighbor_ids else None
 
         query_time = time.time() - start_time
+        SEARCH_STAGE_SECONDS.observe(query_time, stage="context_fetch")
         if verbose:
             console_logger.info(f"  → ID-based query completed in {query_time*1000:.1f}ms ({len(results)} results)")
 
-        if not all_chunks or not all_chunks['ids']:
-            console_logger.warning("Failed to fetch chunks by ID. Falling back to chunk_only mode.")
-            return [get_chunk_only_content(collection, r) for r in results]
-
-        chunks_by_id = {}
-        for i, chunk_id in enumerate(all_chunks['ids']):
-            if all_chunks['documents'] and all_chunks['metadatas']:
-                metadata = all_chunks['metadatas'][i]
-                chunks_by_id[chunk_id] = {
-                    'content': all_chunks['documents'][i],
-                    'chunkIndex': metadata.get('chunkIndex', 0) if metadata else 0
-                }
+        chunks_by_id = {chunk['id']: chunk for chunk in _chunks_from_get_results(matched_chunks)}
+        if neighbor_chunks:
+            chunks_by_id.update((chunk['id'], chunk) for chunk in _chunks_from_get_results(neighbor_chunks))
 
-        enhanced_results = []
+        windows = []
 
         for result in results:
             matched_chunk_id = result.get('chunkId')
@@ -166,7 +353,7 @@ def batch_get_enhanced_content_with_ids(
 
             if not matched_metadata or 'adjacent_chunk_ids' not in matched_metadata:
                 # Fall back to chunk_only for this specific result
-                enhanced_results.append(get_chunk_only_content(collection, result))
+                windows.append(_matched_chunk_window(result))
                 continue
 
             adjacent_ids_str = matched_metadata['adjacent_chunk_ids']
@@ -174,7 +361,7 @@ def batch_get_enhanced_content_with_ids(
 
             if len(parts) != 4:
                 # Invalid format, fall back to chunk_only
-                enhanced_results.append(get_chunk_only_content(collection, result))
+                windows.append(_matched_chunk_window(result))
                 continue
 
             # Collect chunks in order: prev2, prev1, matched, next1, next2
@@ -186,38 +373,27 @@ def batch_get_enhanced_content_with_ids(
                 parts[3] if parts[3] else None   # next2
             ]
 
-            # Filter out None values and fetch chunk data
-            chunks_in_order = []
-            for chunk_id in ordered_chunk_ids:
-                if chunk_id and chunk_id in chunks_by_id:
-                    chunk_data = chunks_by_id[chunk_id]
-                    chunks_in_order.append({
-                        'id': chunk_id,
-                        'content': chunk_data['content'],
-                        'index': chunk_data['chunkIndex']
-                    })
+            chunks_in_order = [
+                chunks_by_id[chunk_id]
+                for chunk_id in ordered_chunk_ids
+                if chunk_id and chunk_id in chunks_by_id
+            ]
 
             if not chunks_in_order:
-                enhanced_results.append(get_chunk_only_content(collection, result))
+                windows.append(_matched_chunk_window(result))
                 continue
 
-            content_parts = []
+            windows.append({'result': result, 'chunks': chunks_in_order})
 
-            for chunk in chunks_in_order:
-                if chunk['id'] == matched_chunk_id:
-                    content_parts.append("[MATCH START]")
-                    content_parts.append(chunk['content'])
-                    content_parts.append("[MATCH END]")
-                else:
-                    content_parts.append(chunk['content'])
-
-            result['content'] = "\n\n".join(content_parts)
-            result['totalChunks'] = len(chunks_in_order)
-            enhanced_results.append(result)
+        enhanced_results = render_windows(windows, style="window", token_budget=token_budget)
 
         total_time = time.time() - start_time
         if verbose:
             console_logger.info(f"  → Total ID-based processing: {total_time*1000:.1f}ms")
+            if len(enhanced_results) < len(results):
+                console_logger.info(
+                    f"  → Stitched {len(results)} results into {len(enhanced_results)} (overlapping windows merged)"
+                )
 
         if total_time > 2.0:
             console_logger.warning(f"ID-based context retrieval took {total_time:.2f}s - performance may need optimization")
@@ -227,13 +403,14 @@ def batch_get_enhanced_content_with_ids(
     except Exception as error:
         # Fallback to metadata-based batch processing
         console_logger.warning(f"ID-based enhanced context retrieval failed: {error}. Falling back to metadata query.")
-        return batch_get_enhanced_content(collection, results, verbose)
+        return batch_get_enhanced_content(collection, results, verbose, token_budget)
 
 
 def batch_get_enhanced_content(
     collection: chromadb.Collection,
     results: List[Dict[str, Any]],
-    verbose: bool = False
+    verbose: bool = False,
+    token_budget: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     if not results:
         return results
@@ -273,6 +450,7 @@ def batch_get_enhanced_content(
         )
 
         query_time = time.time() - start_time
+        SEARCH_STAGE_SECONDS.observe(query_time, stage="context_fetch")
         if verbose:
             console_logger.info(f"  → Batch query completed in {query_time*1000:.1f}ms ({len(results)} results)")
 
@@ -284,60 +462,36 @@ def batch_get_enhanced_content(
         group_start = time.time()
         chunks_map = {}  # {(noteId, chunkIndex): {'index': ..., 'content': ...}}
 
-        for i in range(len(all_chunks_results['ids'])):
-            if all_chunks_results['metadatas'] and i < len(all_chunks_results['metadatas']):
-                metadata = all_chunks_results['metadatas'][i]
-                note_id = metadata.get('noteId') if metadata else None
-                chunk_index = metadata.get('chunkIndex') if metadata else None
-
-                if note_id is not None and chunk_index is not None and all_chunks_results['documents']:
-                    key = (note_id, chunk_index)
-                    chunks_map[key] = {
-                        'index': chunk_index,
-                        'content': all_chunks_results['documents'][i]
-                    }
+        for chunk in _chunks_from_get_results(all_chunks_results):
+            if chunk['noteId'] is not None:
+                chunks_map[(chunk['noteId'], chunk['index'])] = chunk
 
         group_time = time.time() - group_start
         if verbose:
             console_logger.info(f"  → Grouped {len(chunks_map)} chunks in {group_time*1000:.1f}ms")
 
         distribute_start = time.time()
-        enhanced_results = []
+        windows = []
 
         for req in result_requirements:
             result = req['result']
             note_id = req['noteId']
-            matched_chunk_index = req['matchedChunkIndex']
-            start_index = req['startIndex']
-            end_index = req['endIndex']
 
-            # Collect chunks for this result
+            # Collect chunks for this result (already in index order)
             relevant_chunks = []
-            for chunk_index in range(start_index, end_index + 1):
+            for chunk_index in range(req['startIndex'], req['endIndex'] + 1):
                 key = (note_id, chunk_index)
                 if key in chunks_map:
                     relevant_chunks.append(chunks_map[key])
 
             if not relevant_chunks:
                 # Fallback to chunk_only for this result
-                enhanced_results.append(get_chunk_only_content(collection, result))
+                windows.append(_matched_chunk_window(result))
                 continue
 
-            # Sort chunks by index
-            relevant_chunks.sort(key=lambda x: x['index'])
-
-            content_parts = []
-            for chunk in relevant_chunks:
-                if chunk['index'] == matched_chunk_index:
-                    content_parts.append("[MATCH START]")
-                    content_parts.append(chunk['content'])
-                    content_parts.append("[MATCH END]")
-                else:
-                    content_parts.append(chunk['content'])
+            windows.append({'result': result, 'chunks': relevant_chunks})
 
-            result['content'] = "\n\n".join(content_parts)
-            result['totalChunks'] = len(relevant_chunks)
-            enhanced_results.append(result)
+        enhanced_results = render_windows(windows, style="window", token_budget=token_budget)
 
         distribute_time = time.time() - distribute_start
         if verbose:
@@ -376,25 +530,10 @@ def get_full_note_content(
             # Fallback to chunk_only if we can't get the full note
             return get_chunk_only_content(collection, result)
 
-        # Sort chunks by index
-        chunks = []
-        for i in range(len(note_results['ids'])):
-            if note_results['metadatas'] and note_results['documents']:
-                metadata = note_results['metadatas'][i]
-                chunks.append({
-                    'index': metadata['chunkIndex'] if metadata else 0,
-                    'content': note_results['documents'][i]
-                })
-
+        chunks = _chunks_from_get_results(note_results)
         chunks.sort(key=lambda x: x['index'])
 
-        content_parts = []
-        for chunk in chunks:
-            if chunk['index'] == matched_chunk_index:
-                content_parts.append(f"[MATCH AT CHUNK {matched_chunk_index}]")
-            content_parts.append(chunk['content'])
-
-        result['content'] = "\n\n".join(content_parts)
+        result['content'] = stitch_chunks(chunks, {matched_chunk_index}, style="full_note")
         result['totalChunks'] = len(chunks)
 
         return result
@@ -405,12 +544,57 @@ def get_full_note_content(
         return get_chunk_only_content(collection, result)
 
 
+def batch_get_full_note_content(
+    collection: chromadb.Collection,
+    results: List[Dict[str, Any]],
+    verbose: bool = False,
+    token_budget: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    if not results:
+        return results
+
+    try:
+        note_ids = list(dict.fromkeys(result['noteId'] for result in results))
+        where = {"noteId": {"$in": note_ids}} if len(note_ids) > 1 else {"noteId": {"$eq": note_ids[0]}}
+
+        note_results = collection.get(where=where, include=["documents", "metadatas"])
+
+        if not note_results or not note_results['ids']:
+            console_logger.warning("Full note query returned no results. Falling back to chunk_only mode.")
+            return [get_chunk_only_content(collection, r) for r in results]
+
+        chunks_by_note: Dict[Any, List[Dict[str, Any]]] = {}
+        for chunk in _chunks_from_get_results(note_results):
+            chunks_by_note.setdefault(chunk['noteId'], []).append(chunk)
+        for chunks in chunks_by_note.values():
+            chunks.sort(key=lambda x: x['index'])
+
+        windows = []
+        for result in results:
+            chunks = chunks_by_note.get(result['noteId'])
+            windows.append({'result': result, 'chunks': chunks} if chunks else _matched_chunk_window(result))
+
+        full_results = render_windows(windows, style="full_note", token_budget=token_budget)
+        if verbose and len(full_results) < len(results):
+            console_logger.info(f"  → Merged {len(results)} results into {len(full_results)} notes")
+
+        return full_results
+
+    except Exception as error:
+        console_logger.warning(f"Batch full note retrieval failed: {error}. Falling back to individual processing.")
+        return [get_full_note_content(collection, result) for result in results]
+
+
 def apply_context_mode(
     collection: chromadb.Collection,
     results: List[Dict[str, Any]],
     context_mode: str,
-    verbose: bool = False
+    verbose: bool = False,
+    token_budget: Optional[int] = None,
+    chunk_cache: Optional["ChunkCache"] = None
 ) -> List[Dict[str, Any]]:
+    # token_budget caps the response size: results and neighboring chunks are
+    # admitted by rank until the budget (in tokens) is spent.
 
     if not results:
         return results
@@ -418,17 +602,14 @@ def apply_context_mode(
     # Use optimized ID-based batch processing for enhanced mode
     if context_mode == "enhanced":
         # Try Strategy 4 (ID-based) first - it will auto-fallback to Strategy 1 if needed
-        return batch_get_enhanced_content_with_ids(collection, results, verbose)
-
-    # For other modes, process individually
-    enhanced_results = []
-    for result in results:
-        if context_mode == "chunk_only":
-            enhanced_results.append(get_chunk_only_content(collection, result))
-        elif context_mode == "full_note":
-            enhanced_results.append(get_full_note_content(collection, result))
-        else:
-            # Default to chunk_only for unknown modes
-            enhanced_results.append(get_chunk_only_content(collection, result))
+        return batch_get_enhanced_content_with_ids(collection, results, verbose, token_budget, chunk_cache)
+
+    if context_mode == "full_note":
+        # One query for all notes; several hits in one note become a single result
+        return batch_get_full_note_content(collection, results, verbose, token_budget)
 
-    return enhanced_results
+    # Default to chunk_only for chunk_only and unknown modes
+    if token_budget is not None:
+        packed, _ = pack_windows([_matched_chunk_window(result) for result in results], token_budget)
+        results = [window['result'] for window in packed]
+    return [get_chunk_only_content(collection, result) for result in results]
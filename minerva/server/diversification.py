@@ -0,0 +1,142 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from minerva.common.logger import get_logger
+from minerva.common.metrics import SEARCH_STAGE_SECONDS
+from minerva.common.tracing import span
+
+console_logger = get_logger(__name__)
+
+# Weight of relevance against novelty in the MMR score; 1.0 is plain ranking
+MMR_LAMBDA = 0.7
+# Candidates fetched per requested result when diversifying, so there is
+# something left to choose from once near-duplicates are skipped
+DIVERSITY_CANDIDATE_FACTOR = 3
+MIN_DIVERSITY_CANDIDATES = 15
+
+
+def diversity_candidate_count(max_results: int) -> int:
+    return max(max_results * DIVERSITY_CANDIDATE_FACTOR, MIN_DIVERSITY_CANDIDATES)
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def mmr_select(
+    relevance: Sequence[float],
+    vectors: Optional[np.ndarray],
+    note_ids: Sequence[str],
+    k: int,
+    lambda_: float = MMR_LAMBDA,
+    max_per_note: Optional[int] = None
+) -> List[int]:
+    """Pick up to k candidate positions by maximal marginal relevance.
+
+    Each step takes the candidate with the best
+    lambda * relevance - (1 - lambda) * max cosine similarity to the picks so far.
+    Without vectors the order is plain relevance. Candidates whose note already
+    has max_per_note picks are skipped.
+    """
+    count = len(relevance)
+    if count == 0 or k < 1:
+        return []
+
+    scores = np.asarray(relevance, dtype=np.float32)
+    use_vectors = vectors is not None and len(vectors) == count and lambda_ < 1.0
+    if use_vectors:
+        unit = _normalize_rows(np.asarray(vectors, dtype=np.float32))
+        # Highest similarity of each candidate to anything already selected
+        redundancy = np.full(count, -np.inf, dtype=np.float32)
+
+    per_note: Dict[str, int] = {}
+    available = np.ones(count, dtype=bool)
+    selected: List[int] = []
+
+    while len(selected) < k and available.any():
+        if use_vectors and selected:
+            mmr = lambda_ * scores - (1.0 - lambda_) * redundancy
+        else:
+            mmr = scores.copy()
+        mmr[~available] = -np.inf
+        best = int(np.argmax(mmr))
+        available[best] = False
+
+        note_id = note_ids[best]
+        if max_per_note is not None and per_note.get(note_id, 0) >= max_per_note:
+            continue
+
+        per_note[note_id] = per_note.get(note_id, 0) + 1
+        selected.append(best)
+        if use_vectors:
+            redundancy = np.maximum(redundancy, unit @ unit[best])
+
+    return selected
+
+
+def _fetch_embeddings(collection, chunk_ids: List[str]) -> Dict[str, np.ndarray]:
+    if not chunk_ids:
+        return {}
+    fetched = collection.get(ids=chunk_ids, include=["embeddings"])
+    return {
+        chunk_id: np.asarray(embedding, dtype=np.float32)
+        for chunk_id, embedding in zip(fetched["ids"], fetched["embeddings"])
+    }
+
+
+def diversify_results(
+    collection,
+    results_per_query: List[List[Dict[str, Any]]],
+    max_results: int,
+    diversify: bool = False,
+    max_per_note: Optional[int] = None
+) -> List[List[Dict[str, Any]]]:
+    # Narrows each query's over-fetched candidates down to max_results. The
+    # candidates' vectors are read from ChromaDB in one get() for all queries;
+    # with only max_per_note set no vectors are needed.
+    if not diversify and max_per_note is None:
+        return [results[:max_results] for results in results_per_query]
+
+    with SEARCH_STAGE_SECONDS.time(stage="diversification"), span(
+        "search.diversification", collection=collection.name, max_per_note=max_per_note or 0
+    ):
+        embeddings: Dict[str, np.ndarray] = {}
+        if diversify:
+            chunk_ids = list(dict.fromkeys(
+                result["chunkId"] for results in results_per_query for result in results
+            ))
+            embeddings = _fetch_embeddings(collection, chunk_ids)
+
+        diversified = []
+        for results in results_per_query:
+            vectors = None
+            if diversify and results and all(result["chunkId"] in embeddings for result in results):
+                vectors = np.stack([embeddings[result["chunkId"]] for result in results])
+            picks = mmr_select(
+                [result["similarityScore"] for result in results],
+                vectors,
+                [result["noteId"] for result in results],
+                max_results,
+                lambda_=MMR_LAMBDA if diversify else 1.0,
+                max_per_note=max_per_note
+            )
+            diversified.append([results[position] for position in picks])
+
+    return diversified
+
+
+def cap_results_per_note(results: List[Dict[str, Any]], max_per_note: Optional[int]) -> List[Dict[str, Any]]:
+    # Keeps the first max_per_note results of each note in an already ranked list
+    if max_per_note is None:
+        return results
+    per_note: Dict[Any, int] = {}
+    capped = []
+    for result in results:
+        key = (result.get("collectionName"), result["noteId"])
+        if per_note.get(key, 0) < max_per_note:
+            per_note[key] = per_note.get(key, 0) + 1
+            capped.append(result)
+    return capped
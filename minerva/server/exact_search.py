@@ -0,0 +1,223 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from minerva.common.logger import get_logger
+from minerva.indexing.vector_export import default_export_dir, sync_vector_export
+
+console_logger = get_logger(__name__)
+
+# Paged reads: a single unbounded get() exceeds SQLite's variable limit on large collections
+FETCH_PAGE_SIZE = 5000
+# Above this, one matrix-vector product per query starts to cost more than an HNSW lookup
+LARGE_COLLECTION_WARNING = 100_000
+
+
+@dataclass(frozen=True)
+class ExactIndex:
+    # Rows of `matrix` are float32 vectors in the order of `ids`; scores are
+    # scaled by `inverse_norms` so a memory-mapped matrix never has to be copied
+    collection_name: str
+    ids: List[str]
+    matrix: np.ndarray
+    inverse_norms: np.ndarray
+    last_updated: Optional[str]
+    memory_mapped: bool = False
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.matrix.nbytes)
+
+    def top_k(
+        self,
+        query_embedding: List[float],
+        n_results: int,
+        rows: Optional[np.ndarray] = None
+    ) -> Dict[str, List[List[Any]]]:
+        # Returns ids and cosine distances in the shape of collection.query().
+        # `rows` restricts the search to those matrix rows (a metadata filter).
+        if rows is None:
+            rows = np.arange(len(self.ids))
+        count = len(rows)
+        n = min(n_results, count)
+        if n == 0:
+            return {"ids": [[]], "distances": [[]]}
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm > 0:
+            query = query / norm
+
+        if count == len(self.ids):
+            scores = (self.matrix @ query) * self.inverse_norms
+        else:
+            scores = np.full(len(self.ids), -np.inf, dtype=np.float32)
+            scores[rows] = (self.matrix[rows] @ query) * self.inverse_norms[rows]
+        if n < count:
+            candidates = rows[np.argpartition(-scores[rows], n - 1)[:n]]
+        else:
+            candidates = rows
+        ordered = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        return {
+            "ids": [[self.ids[index] for index in ordered]],
+            "distances": [[float(1.0 - scores[index]) for index in ordered]],
+        }
+
+
+def inverse_row_norms(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1) if len(matrix) else np.zeros(0, dtype=np.float32)
+    norms[norms == 0] = 1.0
+    return (1.0 / norms).astype(np.float32)
+
+
+def build_index(
+    collection_name: str,
+    ids: List[str],
+    matrix: np.ndarray,
+    last_updated: Optional[str],
+    memory_mapped: bool = False
+) -> ExactIndex:
+    if not memory_mapped:
+        matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    return ExactIndex(collection_name, ids, matrix, inverse_row_norms(matrix), last_updated, memory_mapped)
+
+
+def read_collection_vectors(collection) -> tuple[List[str], np.ndarray]:
+    total_count = collection.count()
+    ids: List[str] = []
+    pages: List[np.ndarray] = []
+
+    for offset in range(0, total_count, FETCH_PAGE_SIZE):
+        page = collection.get(limit=FETCH_PAGE_SIZE, offset=offset, include=["embeddings"])
+        if not page["ids"]:
+            break
+        ids.extend(page["ids"])
+        pages.append(np.asarray(page["embeddings"], dtype=np.float32))
+
+    if not pages:
+        dimension = (collection.metadata or {}).get("embedding_dimension") or 0
+        return [], np.zeros((0, dimension), dtype=np.float32)
+
+    return ids, np.vstack(pages)
+
+
+class ExactSearchEngine:
+    """Brute-force cosine search over collections held in memory as float32 matrices.
+
+    An index is rebuilt from ChromaDB whenever the collection's `last_updated`
+    metadata differs from the one it was loaded with. Collections listed in
+    `memory_mapped` are served from their vector export (`minerva export-vectors`),
+    which is synced incrementally and mapped instead of held on the heap.
+    """
+
+    def __init__(self, chromadb_path: str, collection_names: List[str], memory_mapped: Optional[List[str]] = None):
+        self.chromadb_path = chromadb_path
+        self.collection_names = set(collection_names)
+        self.memory_mapped = set(memory_mapped or [])
+        self.export_dir = default_export_dir(chromadb_path)
+        self._indexes: Dict[str, ExactIndex] = {}
+        self._locks: Dict[str, threading.Lock] = {name: threading.Lock() for name in self.collection_names}
+
+    def handles(self, collection_name: str) -> bool:
+        return collection_name in self.collection_names
+
+    def get_index(self, collection) -> ExactIndex:
+        name = collection.name
+        last_updated = (collection.metadata or {}).get("last_updated")
+
+        index = self._indexes.get(name)
+        if index is not None and index.last_updated == last_updated:
+            return index
+
+        with self._locks[name]:
+            # Another thread may have refreshed it while we waited
+            index = self._indexes.get(name)
+            if index is not None and index.last_updated == last_updated:
+                return index
+
+            index = self._build_index(collection, last_updated)
+            self._indexes[name] = index
+            return index
+
+    def query(
+        self,
+        collection,
+        query_embedding: List[float],
+        n_results: int,
+        where: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, List[List[Any]]]:
+        # Same result shape as collection.query(include=["documents", "metadatas", "distances"])
+        return self.query_batch(collection, [query_embedding], n_results, where)
+
+    def query_batch(
+        self,
+        collection,
+        query_embeddings: List[List[float]],
+        n_results: int,
+        where: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, List[List[Any]]]:
+        # One row per query embedding; documents for all queries come from a single get().
+        # A `where` filter is resolved to chunk ids once and restricts the scored rows.
+        index = self.get_index(collection)
+        rows = None
+        if where is not None:
+            allowed = set(collection.get(where=where, include=[])["ids"])
+            rows = np.fromiter(
+                (position for position, chunk_id in enumerate(index.ids) if chunk_id in allowed), dtype=np.int64
+            )
+        ranked = [index.top_k(embedding, n_results, rows) for embedding in query_embeddings]
+
+        ids = list(dict.fromkeys(chunk_id for result in ranked for chunk_id in result["ids"][0]))
+        by_id = {}
+        if ids:
+            fetched = collection.get(ids=ids, include=["documents", "metadatas"])
+            by_id = {
+                chunk_id: (document, metadata)
+                for chunk_id, document, metadata in zip(fetched["ids"], fetched["documents"], fetched["metadatas"])
+            }
+
+        results: Dict[str, List[List[Any]]] = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        for result in ranked:
+            # A chunk deleted since the last refresh is skipped rather than failing the search
+            hits = [
+                (chunk_id, distance) for chunk_id, distance in zip(result["ids"][0], result["distances"][0])
+                if chunk_id in by_id
+            ]
+            results["ids"].append([chunk_id for chunk_id, _ in hits])
+            results["documents"].append([by_id[chunk_id][0] for chunk_id, _ in hits])
+            results["metadatas"].append([by_id[chunk_id][1] or {} for chunk_id, _ in hits])
+            results["distances"].append([distance for _, distance in hits])
+        return results
+
+    def _build_index(self, collection, last_updated: Optional[str]) -> ExactIndex:
+        name = collection.name
+        started = time.perf_counter()
+
+        if name in self.memory_mapped:
+            export, stats = sync_vector_export(collection, self.export_dir)
+            index = build_index(name, export.ids, export.matrix, last_updated, memory_mapped=True)
+            source = "from vector export" if stats.up_to_date else f"from vector export ({stats.added:,} new)"
+        else:
+            ids, vectors = read_collection_vectors(collection)
+            index = build_index(name, ids, vectors, last_updated)
+            source = "from ChromaDB"
+
+        self._log_loaded(index, started, source)
+        if len(index.ids) > LARGE_COLLECTION_WARNING:
+            console_logger.warning(
+                f"  Exact search over {len(index.ids):,} chunks in '{name}' may be slower than HNSW; "
+                f"consider search_engine 'hnsw' for this collection"
+            )
+        return index
+
+    def _log_loaded(self, index: ExactIndex, started: float, source: str) -> None:
+        elapsed = time.perf_counter() - started
+        mapped = ", memory-mapped" if index.memory_mapped else ""
+        console_logger.info(
+            f"  Exact search index for '{index.collection_name}': {len(index.ids):,} vectors "
+            f"({index.nbytes / (1024 * 1024):.1f} MB{mapped}) loaded {source} in {elapsed:.2f}s"
+        )
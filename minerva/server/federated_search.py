@@ -0,0 +1,222 @@
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
+
+from minerva.common.ai_provider import AIProvider
+from minerva.common.logger import get_logger
+from minerva.common.tracing import traced
+from minerva.indexing.storage import initialize_chromadb_client, ChromaDBConnectionError
+from minerva.server.hybrid_search import RRF_K
+from minerva.server.response_packer import estimate_results_tokens
+from minerva.server.search_tools import (
+    search_knowledge_base,
+    retrieve_collection_context,
+    embed_query,
+    validate_search_arguments,
+    SearchError,
+)
+
+if TYPE_CHECKING:
+    from minerva.server.exact_search import ExactSearchEngine
+    from minerva.server.two_stage_search import TwoStageSearchEngine
+    from minerva.server.chunk_cache import ChunkCache
+
+console_logger = get_logger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def provider_group_key(provider: AIProvider) -> Tuple[Any, Any, Any]:
+    # Collections whose embeddings come from the same endpoint and model share a query vector
+    return (provider.provider_type, provider.embedding_model, provider.base_url)
+
+
+def group_collections_by_provider(
+    provider_map: Dict[str, AIProvider],
+    collection_names: List[str]
+) -> Dict[Tuple[Any, Any, Any], List[str]]:
+    groups: Dict[Tuple[Any, Any, Any], List[str]] = {}
+    for name in collection_names:
+        groups.setdefault(provider_group_key(provider_map[name]), []).append(name)
+    return groups
+
+
+def merge_ranked_results(
+    results_by_collection: Dict[str, List[Dict[str, Any]]],
+    max_results: int
+) -> List[Dict[str, Any]]:
+    # Rank-based fusion. similarityScore is not comparable across collections:
+    # their embedding models differ, and hybrid collections report fused RRF
+    # scores rather than cosine similarity. Each result is therefore placed by
+    # its rank within its own collection; federatedScore is its reciprocal-rank
+    # score, 1.0 for a collection's top hit. Equal ranks keep collection order.
+    merged = [
+        {**result, 'federatedScore': (RRF_K + 1) / (RRF_K + rank)}
+        for results in results_by_collection.values()
+        for rank, result in enumerate(results, start=1)
+    ]
+    merged.sort(key=lambda result: result['federatedScore'], reverse=True)
+    return merged[:max_results]
+
+
+def trim_to_token_budget(results: List[Dict[str, Any]], token_budget: Optional[int]) -> List[Dict[str, Any]]:
+    if token_budget is None:
+        return results
+
+    kept = []
+    used = 0
+    for result in results:
+        cost = estimate_results_tokens([result])
+        if kept and used + cost > token_budget:
+            break
+        kept.append(result)
+        used += cost
+    return kept
+
+
+@traced("search.federated")
+def federated_search(
+    query: str,
+    chromadb_path: str,
+    provider_map: Dict[str, AIProvider],
+    collection_names: Optional[List[str]] = None,
+    context_mode: str = "enhanced",
+    max_results: int = 5,
+    token_budget: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    verbose: bool = False,
+    exact_search: Optional["ExactSearchEngine"] = None,
+    search_mode: str = "semantic",
+    two_stage: Optional["TwoStageSearchEngine"] = None,
+    chunk_cache: Optional["ChunkCache"] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+    # Searches several collections at once and returns (ranked results, errors by collection).
+    # Results keep their 'collectionName' for attribution. A failing collection is
+    # reported in errors instead of failing the whole search.
+    # Collections are first ranked on their matched chunks alone; context
+    # (neighbors or full notes) is only fetched for the merged top results,
+    # within token_budget.
+    if not query or not query.strip():
+        raise SearchError("Query cannot be empty")
+
+    validate_search_arguments(max_results, token_budget, context_mode, search_mode)
+
+    if collection_names is None:
+        collection_names = list(provider_map.keys())
+
+    unknown = [name for name in collection_names if name not in provider_map]
+    if unknown:
+        raise SearchError(
+            f"Collection(s) not available: {', '.join(unknown)}\n"
+            f"Available collections: {', '.join(provider_map) if provider_map else 'none'}"
+        )
+
+    if not collection_names:
+        return [], {}
+
+    start_time = time.time()
+
+    try:
+        client = initialize_chromadb_client(chromadb_path)
+    except ChromaDBConnectionError as error:
+        raise SearchError(f"ChromaDB connection failed: {error}")
+
+    groups = group_collections_by_provider(provider_map, collection_names)
+    workers = max(1, min(max_workers, len(collection_names)))
+    errors: Dict[str, str] = {}
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="minerva-search") as executor:
+        # One query embedding per distinct provider/model, computed concurrently.
+        # Tasks run in a copy of the caller's context so trace spans nest correctly.
+        # Lexical search needs no embedding at all.
+        embedding_futures = {
+            key: executor.submit(contextvars.copy_context().run, embed_query, query, provider_map[names[0]])
+            for key, names in groups.items()
+        } if search_mode != "lexical" else {}
+
+        search_futures = {}
+        for key, names in groups.items():
+            try:
+                query_embedding = embedding_futures[key].result() if key in embedding_futures else None
+            except Exception as error:
+                for name in names:
+                    errors[name] = str(error)
+                continue
+
+            for name in names:
+                search_futures[name] = executor.submit(
+                    contextvars.copy_context().run,
+                    search_knowledge_base,
+                    query=query,
+                    collection_name=name,
+                    chromadb_path=chromadb_path,
+                    provider=provider_map[name],
+                    context_mode="chunk_only",
+                    max_results=max_results,
+                    query_embedding=query_embedding,
+                    client=client,
+                    exact_search=exact_search,
+                    search_mode=search_mode,
+                    two_stage=two_stage,
+                    chunk_cache=chunk_cache
+                )
+
+        results_by_collection: Dict[str, List[Dict[str, Any]]] = {}
+        for name in collection_names:
+            future = search_futures.get(name)
+            if future is None:
+                continue
+            try:
+                results_by_collection[name] = future.result()
+            except Exception as error:
+                errors[name] = str(error)
+
+        top_results = merge_ranked_results(results_by_collection, max_results)
+        top_by_collection: Dict[str, List[Dict[str, Any]]] = {}
+        for result in top_results:
+            top_by_collection.setdefault(result['collectionName'], []).append(result)
+
+        context_futures = {
+            name: executor.submit(
+                contextvars.copy_context().run,
+                retrieve_collection_context,
+                collection_name=name,
+                chromadb_path=chromadb_path,
+                results=results,
+                context_mode=context_mode,
+                token_budget=token_budget,
+                client=client,
+                chunk_cache=chunk_cache
+            )
+            for name, results in top_by_collection.items()
+        }
+        contextual: List[Dict[str, Any]] = []
+        for name, future in context_futures.items():
+            try:
+                contextual.extend(future.result())
+            except Exception as error:
+                errors[name] = str(error)
+
+    for name, message in errors.items():
+        console_logger.warning(f"Search failed for collection '{name}': {message}")
+
+    if errors and all(name in errors for name in collection_names):
+        raise SearchError(
+            "Search failed for every collection:\n" +
+            "\n".join(f"  {name}: {message}" for name, message in errors.items())
+        )
+
+    # Back into merged rank order; full_note mode may have folded several hits of a note into one
+    rank_of = {(result['collectionName'], result['chunkId']): rank for rank, result in enumerate(top_results)}
+    contextual.sort(key=lambda result: rank_of.get((result['collectionName'], result['chunkId']), len(rank_of)))
+    merged = trim_to_token_budget(contextual, token_budget)
+
+    if verbose:
+        elapsed = time.time() - start_time
+        console_logger.info(
+            f"  → Federated search over {len(collection_names)} collection(s) "
+            f"({len(embedding_futures)} query embedding(s)) in {elapsed*1000:.1f}ms"
+        )
+
+    return merged, errors
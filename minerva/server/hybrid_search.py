@@ -0,0 +1,56 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from minerva.common.logger import get_logger
+from minerva.common.metrics import SEARCH_STAGE_SECONDS
+from minerva.common.tracing import span
+from minerva.indexing.lexical_index import open_lexical_index
+
+console_logger = get_logger(__name__)
+
+SEARCH_MODES = ("semantic", "lexical", "hybrid")
+
+# Rank constant from the original RRF paper; dampens the weight of the very top ranks
+RRF_K = 60
+# Each ranking contributes this many candidates per requested result before fusion
+FUSION_CANDIDATE_FACTOR = 4
+MIN_FUSION_CANDIDATES = 20
+
+
+def fusion_candidate_count(max_results: int) -> int:
+    return max(max_results * FUSION_CANDIDATE_FACTOR, MIN_FUSION_CANDIDATES)
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[str]], k: int = RRF_K) -> List[Tuple[str, float]]:
+    # Returns (chunk_id, score) best first. The score is normalized so that an
+    # id ranked first in every list scores 1.0. It is a rank score, not a
+    # similarity, so federated search merges collections by rank instead.
+    if not rankings:
+        return []
+
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, chunk_id in enumerate(ranking, start=1):
+            scores[chunk_id] = scores.get(chunk_id, 0.0) + 1.0 / (k + rank)
+
+    best_possible = len(rankings) / (k + 1)
+    # Ties keep first-seen order, so the vector ranking wins over the lexical one
+    ordered = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    return [(chunk_id, score / best_possible) for chunk_id, score in ordered]
+
+
+def lexical_query(
+    chromadb_path: str,
+    collection_name: str,
+    queries: List[str],
+    n_results: int
+) -> Optional[List[List[Tuple[str, float]]]]:
+    # One BM25 ranking per query; None when the collection has no lexical
+    # index (indexed before it existed)
+    index = open_lexical_index(chromadb_path, collection_name)
+    if index is None:
+        return None
+
+    with index, SEARCH_STAGE_SECONDS.time(stage="lexical_query"), span(
+        "search.lexical_query", collection=collection_name, n_results=n_results
+    ):
+        return [index.search(query, n_results) for query in queries]
@@ -1,13 +1,17 @@
 #!/usr/bin/env python3
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from typing import List, Dict, Any, Optional, Set
 
 from minerva.common.exceptions import (
     GracefulExit,
     ServerError,
     StartupValidationError,
     CollectionDiscoveryError,
+    ProviderUnavailableError,
 )
 from minerva.common.logger import get_logger
+from minerva.common.metrics import SEARCH_SECONDS, PROMETHEUS_CONTENT_TYPE, render_metrics
 
 console_logger = get_logger(__name__)
 
@@ -21,18 +25,37 @@ except ImportError as error:
 # Import configuration and validation modules
 from minerva.common.server_config import ServerConfig, load_server_config
 from minerva.server.startup_validation import validate_server_prerequisites
-from minerva.server.collection_discovery import discover_collections_with_providers
+from minerva.server.collection_discovery import discover_collections_with_providers, discover_collection_changes
+from minerva.server.collection_watcher import CollectionWatcher
+from minerva.server.provider_registry import LazyProviderRegistry
 from minerva.server.search_tools import (
     search_knowledge_base as search_kb,
+    search_knowledge_base_batch as search_kb_batch,
     SearchError,
-    CollectionNotFoundError
+    CollectionNotFoundError,
+    MAX_BATCH_QUERIES,
 )
-from minerva.common.ai_provider import AIProvider
+from minerva.server.federated_search import federated_search
+from minerva.server.exact_search import ExactSearchEngine
+from minerva.server.two_stage_search import TwoStageSearchEngine
+from minerva.server.chunk_cache import ChunkCache
+from minerva.indexing.note_summaries import get_note_summary_collection
+from minerva.indexing.storage import initialize_chromadb_client
+from minerva.common.ai_provider import AIProvider, provider_health_snapshot
 
 # Global configuration (loaded at startup)
 SERVER_CONFIG: Optional[ServerConfig] = None
 PROVIDER_MAP: Dict[str, AIProvider] = {}
+# Set with lazy_providers: providers are built on first use instead of filling PROVIDER_MAP
+PROVIDER_REGISTRY: Optional[LazyProviderRegistry] = None
 AVAILABLE_COLLECTIONS: List[Dict[str, Any]] = []
+EXACT_SEARCH: Optional[ExactSearchEngine] = None
+TWO_STAGE_SEARCH: Optional[TwoStageSearchEngine] = None
+CHUNK_CACHE: Optional[ChunkCache] = None
+# Every collection seen by discovery, available or not; rediscovery only initializes others
+KNOWN_COLLECTIONS: Set[str] = set()
+COLLECTION_WATCHER: Optional[CollectionWatcher] = None
+_REFRESH_LOCK = threading.Lock()
 
 
 def _ensure_server_config(config: ServerConfig | str) -> ServerConfig:
@@ -41,18 +64,88 @@ def _ensure_server_config(config: ServerConfig | str) -> ServerConfig:
     return load_server_config(config)
 
 
+def initialize_exact_search(server_config: ServerConfig, available_collections: List[Dict[str, Any]]) -> Optional[ExactSearchEngine]:
+    available_names = {collection['name'] for collection in available_collections}
+    exact_names = [
+        name for name, settings in server_config.collections.items()
+        if settings.search_engine == "exact"
+    ]
+
+    for name in server_config.collections:
+        if name not in available_names:
+            console_logger.warning(f"Collection settings for '{name}' ignored: collection is not available")
+
+    exact_names = [name for name in exact_names if name in available_names]
+    if not exact_names:
+        return None
+
+    memory_mapped = [name for name in exact_names if server_config.collections[name].memory_map]
+    engine = ExactSearchEngine(server_config.chromadb_path, exact_names, memory_mapped=memory_mapped)
+
+    # Load at startup so the first query does not pay for reading every vector
+    console_logger.info("Loading exact search indexes...")
+    client = initialize_chromadb_client(server_config.chromadb_path)
+    for name in exact_names:
+        engine.get_index(client.get_collection(name))
+    console_logger.info("")
+
+    return engine
+
+
+def initialize_two_stage_search(
+    server_config: ServerConfig,
+    available_collections: List[Dict[str, Any]]
+) -> Optional[TwoStageSearchEngine]:
+    available_names = {collection['name'] for collection in available_collections}
+    note_candidates = {
+        name: settings.two_stage_notes for name, settings in server_config.collections.items()
+        if settings.two_stage_notes is not None and name in available_names
+    }
+
+    for name in list(note_candidates):
+        if server_config.collections[name].search_engine == "exact":
+            console_logger.warning(f"two_stage_notes for '{name}' ignored: the collection uses exact search")
+            del note_candidates[name]
+    if not note_candidates:
+        return None
+
+    client = initialize_chromadb_client(server_config.chromadb_path)
+    for name, notes in note_candidates.items():
+        if get_note_summary_collection(client, name) is None:
+            console_logger.warning(
+                f"Two-stage search for '{name}' needs note summaries; "
+                f"set note_summaries: true in its index config and run 'minerva index'"
+            )
+        else:
+            console_logger.info(f"Two-stage search enabled for '{name}' (top {notes} notes)")
+
+    return TwoStageSearchEngine(server_config.chromadb_path, note_candidates)
+
+
 def initialize_server(server_config: ServerConfig) -> None:
-    global SERVER_CONFIG, PROVIDER_MAP, AVAILABLE_COLLECTIONS
+    global SERVER_CONFIG, PROVIDER_MAP, AVAILABLE_COLLECTIONS, EXACT_SEARCH, TWO_STAGE_SEARCH, CHUNK_CACHE
+    global KNOWN_COLLECTIONS, PROVIDER_REGISTRY
 
     SERVER_CONFIG = server_config
     PROVIDER_MAP = {}
+    PROVIDER_REGISTRY = None
     AVAILABLE_COLLECTIONS = []
+    KNOWN_COLLECTIONS = set()
+    EXACT_SEARCH = None
+    TWO_STAGE_SEARCH = None
+    CHUNK_CACHE = None
+
+    cold_start = time.perf_counter()
 
     console_logger.info("Loading configuration...")
     source_display = server_config.source_path if server_config.source_path else "provided object"
     console_logger.success(f"✓ Configuration loaded from {source_display}")
     console_logger.info(f"  ChromaDB path: {server_config.chromadb_path}")
     console_logger.info(f"  Default max results: {server_config.default_max_results}")
+    if server_config.response_token_budget:
+        console_logger.info(f"  Response token budget: {server_config.response_token_budget:,}")
+    if server_config.chunk_cache_size:
+        console_logger.info(f"  Chunk cache size: {server_config.chunk_cache_size:,}")
     if server_config.host:
         console_logger.info(f"  Host override: {server_config.host}")
     if server_config.port:
@@ -71,10 +164,23 @@ def initialize_server(server_config: ServerConfig) -> None:
         console_logger.error(f"Validation Error:\n{error}")
         raise StartupValidationError(str(error)) from error
 
-    console_logger.info("\nDiscovering collections and initializing AI providers...")
+    validation_time = time.perf_counter() - cold_start
+
+    if server_config.lazy_providers:
+        console_logger.info("\nDiscovering collections (AI providers are initialized on first use)...")
+    else:
+        console_logger.info("\nDiscovering collections and initializing AI providers...")
 
     try:
-        provider_map, all_collections = discover_collections_with_providers(server_config.chromadb_path)
+        discovery_start = time.perf_counter()
+        registry = LazyProviderRegistry() if server_config.lazy_providers else None
+        if registry is not None:
+            provider_map, all_collections = discover_collections_with_providers(
+                server_config.chromadb_path, registry=registry
+            )
+        else:
+            provider_map, all_collections = discover_collections_with_providers(server_config.chromadb_path)
+        discovery_time = time.perf_counter() - discovery_start
 
         total_count = len(all_collections)
         available_count = sum(1 for c in all_collections if c['available'])
@@ -123,7 +229,22 @@ def initialize_server(server_config: ServerConfig) -> None:
             raise CollectionDiscoveryError(error_msg)
 
         PROVIDER_MAP = provider_map
+        PROVIDER_REGISTRY = registry
         AVAILABLE_COLLECTIONS = available_collections
+        KNOWN_COLLECTIONS = {collection['name'] for collection in all_collections}
+        EXACT_SEARCH = initialize_exact_search(server_config, available_collections)
+        TWO_STAGE_SEARCH = initialize_two_stage_search(server_config, available_collections)
+        CHUNK_CACHE = ChunkCache(server_config.chunk_cache_size) if server_config.chunk_cache_size else None
+
+        if registry is not None:
+            provider_summary = f"providers for {available_count} collection(s) deferred to first use"
+        else:
+            distinct_providers = len({id(provider) for provider in provider_map.values()})
+            provider_summary = f"{distinct_providers} shared provider(s) for {available_count} collection(s)"
+        console_logger.info(
+            f"Cold start: {time.perf_counter() - cold_start:.2f}s "
+            f"(validation {validation_time:.2f}s, discovery {discovery_time:.2f}s, {provider_summary})"
+        )
         console_logger.info("Server is ready to accept requests\n")
 
     except CollectionDiscoveryError as error:
@@ -134,6 +255,123 @@ def initialize_server(server_config: ServerConfig) -> None:
         raise ServerError(f"Failed to discover collections: {error}") from error
 
 
+def refresh_collections() -> bool:
+    # Picks up collections created or deleted since the last discovery. New maps
+    # are built on the side and swapped in by assignment, so requests already
+    # holding the old ones finish undisturbed. Returns True when anything changed.
+    global PROVIDER_MAP, AVAILABLE_COLLECTIONS, KNOWN_COLLECTIONS
+
+    if SERVER_CONFIG is None:
+        raise ServerError("Server configuration not initialized")
+
+    with _REFRESH_LOCK:
+        changes = discover_collection_changes(
+            SERVER_CONFIG.chromadb_path, KNOWN_COLLECTIONS, PROVIDER_MAP, registry=PROVIDER_REGISTRY
+        )
+        if changes.empty:
+            return False
+
+        if PROVIDER_REGISTRY is not None:
+            for name in changes.removed:
+                PROVIDER_REGISTRY.unregister(name)
+
+        removed = set(changes.removed)
+        provider_map = {name: provider for name, provider in PROVIDER_MAP.items() if name not in removed}
+        provider_map.update(changes.providers)
+        available_collections = [c for c in AVAILABLE_COLLECTIONS if c['name'] not in removed]
+        available_collections.extend(c for c in changes.added if c['available'])
+
+        PROVIDER_MAP = provider_map
+        AVAILABLE_COLLECTIONS = available_collections
+        KNOWN_COLLECTIONS = (KNOWN_COLLECTIONS - removed) | {c['name'] for c in changes.added}
+
+    for collection in changes.added:
+        if collection['available']:
+            console_logger.success(f"✓ New collection available: {collection['name']} ({collection['chunk_count']} chunks)")
+        else:
+            console_logger.warning(
+                f"New collection '{collection['name']}' is unavailable: {collection['unavailable_reason']}"
+            )
+        if collection['name'] in SERVER_CONFIG.collections:
+            console_logger.warning(
+                f"Collection settings for '{collection['name']}' apply after a server restart"
+            )
+    for name in changes.removed:
+        console_logger.info(f"Collection removed: {name}")
+        if CHUNK_CACHE is not None:
+            CHUNK_CACHE.invalidate(name)
+
+    return True
+
+
+def _unavailable_collection_error(collection_name: str) -> SearchError:
+    available_collections = [col['name'] for col in AVAILABLE_COLLECTIONS]
+    return SearchError(
+        f"Collection '{collection_name}' is not available. "
+        f"Use list_knowledge_bases() to see available collections.\n"
+        f"Available collections: {', '.join(available_collections) if available_collections else 'none'}"
+    )
+
+
+def resolve_provider(collection_name: str) -> AIProvider:
+    # Read each map once: rediscovery may swap them while a request runs
+    registry = PROVIDER_REGISTRY
+    if registry is None:
+        provider = PROVIDER_MAP.get(collection_name)
+        if provider is None:
+            raise _unavailable_collection_error(collection_name)
+        return provider
+
+    try:
+        return registry.get(collection_name)
+    except KeyError:
+        raise _unavailable_collection_error(collection_name)
+    except ProviderUnavailableError as error:
+        raise SearchError(str(error)) from error
+
+
+def resolve_providers(collection_names: Optional[List[str]]) -> Dict[str, AIProvider]:
+    # Providers of the collections a federated search should cover. With lazy
+    # providers, collections whose provider cannot be initialized are left out
+    # (and logged) rather than failing the whole search.
+    registry = PROVIDER_REGISTRY
+    if registry is None:
+        provider_map = PROVIDER_MAP
+        if collection_names is None:
+            return provider_map
+        for name in collection_names:
+            if name not in provider_map:
+                raise _unavailable_collection_error(name)
+        return {name: provider_map[name] for name in collection_names}
+
+    names = collection_names if collection_names is not None else registry.names()
+    providers: Dict[str, AIProvider] = {}
+    for name in names:
+        if not registry.knows(name):
+            raise _unavailable_collection_error(name)
+        try:
+            providers[name] = registry.get(name)
+        except ProviderUnavailableError as error:
+            console_logger.warning(f"  Skipping collection '{name}': {error}")
+    if not providers:
+        raise SearchError("No provider could be initialized for the requested collection(s)")
+    return providers
+
+
+def start_collection_watcher(server_config: ServerConfig) -> Optional[CollectionWatcher]:
+    global COLLECTION_WATCHER
+
+    if not server_config.collection_poll_seconds:
+        return None
+
+    COLLECTION_WATCHER = CollectionWatcher(
+        server_config.chromadb_path, server_config.collection_poll_seconds, refresh_collections
+    )
+    COLLECTION_WATCHER.start()
+    console_logger.info(f"Watching for new collections every {server_config.collection_poll_seconds:g}s")
+    return COLLECTION_WATCHER
+
+
 def _register_tools(mcp_instance: FastMCP) -> None:
     """Register all MCP tools with their descriptions."""
 
@@ -159,11 +397,59 @@ def _register_tools(mcp_instance: FastMCP) -> None:
                     "Format: 'According to [noteTitle], ...' or 'From [noteTitle]: ...' or '[noteTitle] states that ...' "
                     "Do NOT present information without citing its source. The noteTitle indicates where the information came from. "
                     "\n\n"
-                    "TOKEN LIMITS: Each result includes surrounding context (~1,500 tokens). "
-                    "Start with max_results=3-5 (default: 5). If you get a token limit error, retry with fewer results. "
-                    "The system will self-regulate through error responses. Max allowed: 15 results."
+                    "Nearby hits from the same note are merged into a single result; 'matchedChunkIndices' then lists every matched chunk. "
+                    "\n\n"
+                    "SEARCH MODE: 'semantic' (default) ranks by embedding similarity. "
+                    "Use 'hybrid' when the query contains exact identifiers, error codes, API or function names: "
+                    "it fuses keyword (BM25) and semantic rankings. 'lexical' is keyword-only and skips the embedding call. "
+                    "In hybrid and lexical modes similarityScore is the fused rank score; "
+                    "vectorScore and lexicalScore show the individual scores. "
+                    "\n\n"
+                    "FILTERS: narrow the search before ranking with source_path_prefix (whole path segments, "
+                    "e.g. 'docs/api' for repository docs), modified_after / modified_before (ISO dates, "
+                    "after is inclusive, before exclusive), author (case-insensitive) and year (e.g. for books). "
+                    "Only notes whose extractor provided the field can match it. "
+                    "\n\n"
+                    "DIVERSITY: when one long note dominates the results, set max_per_note (e.g. 1 or 2) to cap "
+                    "results per note, and/or diversify=true to skip chunks that repeat what a higher-ranked "
+                    "result already says. More candidates are searched so max_results can still be filled. "
+                    "\n\n"
+                    "TOKEN LIMITS: Responses are packed to a token budget (server default, override with token_budget). "
+                    "The top results are always returned; lower-ranked results and outer context chunks are dropped "
+                    "when the budget is spent, so fewer results than max_results may come back. "
+                    "Start with max_results=3-5 (default: 5). Max allowed: 15 results."
     )(search_knowledge_base)
 
+    # Register search_knowledge_base_batch tool
+    mcp_instance.tool(
+        description="Run several related searches against one knowledge base in a single call. "
+                    "Prefer this over calling search_knowledge_base repeatedly when you have 2 or more queries "
+                    f"for the same collection (max {MAX_BATCH_QUERIES}): the queries are embedded and searched together. "
+                    "max_results applies to each query. A chunk found by several queries is returned once, "
+                    "and 'matchedQueries' lists the queries that found it. "
+                    "Results are ranked by score across all queries and packed to one token budget. "
+                    "context_mode, search_mode, diversify, max_per_note and the filters work as in search_knowledge_base; "
+                    "max_per_note applies to the combined results. "
+                    "\n\n"
+                    "⚠️ CITATION REQUIREMENT: ALWAYS cite the 'noteTitle' field when presenting information from these results."
+    )(search_knowledge_base_batch)
+
+    # Register search_all_knowledge_bases tool
+    mcp_instance.tool(
+        description="Search several knowledge bases at once and return one ranked list. "
+                    "Use this when you don't know which collection holds the answer. "
+                    "Searches every available collection unless 'collection_names' narrows the set. "
+                    "Each result carries 'collectionName' so you can tell where it came from. "
+                    "\n\n"
+                    "⚠️ CITATION REQUIREMENT: ALWAYS cite the 'noteTitle' field (and collection when useful) "
+                    "when presenting information from these results. "
+                    "\n\n"
+                    "search_mode works as in search_knowledge_base ('semantic', 'hybrid' or 'lexical'). "
+                    "Scores from different collections are not comparable, so results are merged by their rank "
+                    "within their own collection (federatedScore; 1.0 for a collection's top hit) and capped at "
+                    "max_results (default: server setting, max 15) and the response token budget."
+    )(search_all_knowledge_bases)
+
 
 def list_knowledge_bases() -> List[Dict[str, Any]]:
     try:
@@ -180,11 +466,56 @@ def list_knowledge_bases() -> List[Dict[str, Any]]:
         raise CollectionDiscoveryError(f"Failed to list knowledge bases: {e}")
 
 
+def _search_filters(
+    source_path_prefix: Optional[str],
+    modified_after: Optional[str],
+    modified_before: Optional[str],
+    author: Optional[str],
+    year: Optional[int]
+) -> Optional[Dict[str, Any]]:
+    filters = {
+        "source_path_prefix": source_path_prefix,
+        "modified_after": modified_after,
+        "modified_before": modified_before,
+        "author": author,
+        "year": year,
+    }
+    return {name: value for name, value in filters.items() if value is not None} or None
+
+
 def search_knowledge_base(
     query: str,
     collection_name: str,
     context_mode: str = "enhanced",
-    max_results: Optional[int] = None
+    max_results: Optional[int] = None,
+    token_budget: Optional[int] = None,
+    search_mode: str = "semantic",
+    diversify: bool = False,
+    max_per_note: Optional[int] = None,
+    source_path_prefix: Optional[str] = None,
+    modified_after: Optional[str] = None,
+    modified_before: Optional[str] = None,
+    author: Optional[str] = None,
+    year: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    filters = _search_filters(source_path_prefix, modified_after, modified_before, author, year)
+    with SEARCH_SECONDS.time(tool="search_knowledge_base"):
+        return _search_knowledge_base(
+            query, collection_name, context_mode, max_results, token_budget, search_mode, diversify, max_per_note,
+            filters
+        )
+
+
+def _search_knowledge_base(
+    query: str,
+    collection_name: str,
+    context_mode: str,
+    max_results: Optional[int],
+    token_budget: Optional[int],
+    search_mode: str = "semantic",
+    diversify: bool = False,
+    max_per_note: Optional[int] = None,
+    filters: Optional[Dict[str, Any]] = None
 ) -> List[Dict[str, Any]]:
     try:
         # Use default max_results from config if not provided
@@ -192,23 +523,23 @@ def search_knowledge_base(
             raise ServerError("Server configuration not initialized")
 
         effective_max_results: int = max_results if max_results is not None else SERVER_CONFIG.default_max_results
+        effective_token_budget = token_budget if token_budget is not None else SERVER_CONFIG.response_token_budget
 
         console_logger.info(f"Tool invoked: search_knowledge_base")
         console_logger.info(f"  Query: {query[:80]}{'...' if len(query) > 80 else ''}")
         console_logger.info(f"  Collection: {collection_name}")
         console_logger.info(f"  Context mode: {context_mode}")
+        console_logger.info(f"  Search mode: {search_mode}")
         console_logger.info(f"  Max results: {effective_max_results}")
+        if diversify or max_per_note is not None:
+            console_logger.info(f"  Diversify: {diversify}, max per note: {max_per_note or 'unlimited'}")
+        if effective_token_budget:
+            console_logger.info(f"  Token budget: {effective_token_budget:,}")
+        if filters:
+            console_logger.info(f"  Filters: {filters}")
 
         # Look up provider for target collection
-        if collection_name not in PROVIDER_MAP:
-            available_collections = [col['name'] for col in AVAILABLE_COLLECTIONS]
-            raise SearchError(
-                f"Collection '{collection_name}' is not available. "
-                f"Use list_knowledge_bases() to see available collections.\n"
-                f"Available collections: {', '.join(available_collections) if available_collections else 'none'}"
-            )
-
-        provider = PROVIDER_MAP[collection_name]
+        provider = resolve_provider(collection_name)
 
         # Perform search with collection-specific provider
         results = search_kb(
@@ -217,7 +548,15 @@ def search_knowledge_base(
             chromadb_path=SERVER_CONFIG.chromadb_path,
             provider=provider,
             context_mode=context_mode,
-            max_results=effective_max_results
+            max_results=effective_max_results,
+            token_budget=effective_token_budget,
+            exact_search=EXACT_SEARCH,
+            search_mode=search_mode,
+            diversify=diversify,
+            max_per_note=max_per_note,
+            filters=filters,
+            two_stage=TWO_STAGE_SEARCH,
+            chunk_cache=CHUNK_CACHE
         )
 
         console_logger.success(f"✓ Search completed: {len(results)} result(s)")
@@ -237,6 +576,165 @@ def search_knowledge_base(
         raise SearchError(f"Search failed: {e}")
 
 
+def search_knowledge_base_batch(
+    queries: List[str],
+    collection_name: str,
+    context_mode: str = "enhanced",
+    max_results: Optional[int] = None,
+    token_budget: Optional[int] = None,
+    search_mode: str = "semantic",
+    diversify: bool = False,
+    max_per_note: Optional[int] = None,
+    source_path_prefix: Optional[str] = None,
+    modified_after: Optional[str] = None,
+    modified_before: Optional[str] = None,
+    author: Optional[str] = None,
+    year: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    filters = _search_filters(source_path_prefix, modified_after, modified_before, author, year)
+    with SEARCH_SECONDS.time(tool="search_knowledge_base_batch"):
+        return _search_knowledge_base_batch(
+            queries, collection_name, context_mode, max_results, token_budget, search_mode, diversify, max_per_note,
+            filters
+        )
+
+
+def _search_knowledge_base_batch(
+    queries: List[str],
+    collection_name: str,
+    context_mode: str,
+    max_results: Optional[int],
+    token_budget: Optional[int],
+    search_mode: str = "semantic",
+    diversify: bool = False,
+    max_per_note: Optional[int] = None,
+    filters: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    try:
+        if SERVER_CONFIG is None:
+            raise ServerError("Server configuration not initialized")
+
+        effective_max_results: int = max_results if max_results is not None else SERVER_CONFIG.default_max_results
+        effective_token_budget = token_budget if token_budget is not None else SERVER_CONFIG.response_token_budget
+
+        console_logger.info("Tool invoked: search_knowledge_base_batch")
+        for query in queries or []:
+            console_logger.info(f"  Query: {query[:80]}{'...' if len(query) > 80 else ''}")
+        console_logger.info(f"  Collection: {collection_name}")
+        console_logger.info(f"  Context mode: {context_mode}")
+        console_logger.info(f"  Search mode: {search_mode}")
+        console_logger.info(f"  Max results per query: {effective_max_results}")
+        if filters:
+            console_logger.info(f"  Filters: {filters}")
+
+        provider = resolve_provider(collection_name)
+
+        results = search_kb_batch(
+            queries=queries,
+            collection_name=collection_name,
+            chromadb_path=SERVER_CONFIG.chromadb_path,
+            provider=provider,
+            context_mode=context_mode,
+            max_results=effective_max_results,
+            token_budget=effective_token_budget,
+            exact_search=EXACT_SEARCH,
+            search_mode=search_mode,
+            diversify=diversify,
+            max_per_note=max_per_note,
+            filters=filters,
+            two_stage=TWO_STAGE_SEARCH,
+            chunk_cache=CHUNK_CACHE
+        )
+
+        console_logger.success(f"✓ Batch search completed: {len(results)} unique result(s)")
+        for i, result in enumerate(results):
+            console_logger.info(
+                f"  {i+1}. {result['noteTitle']} (score: {result['similarityScore']:.3f}, "
+                f"queries: {len(result['matchedQueries'])})"
+            )
+
+        return results
+
+    except CollectionNotFoundError as e:
+        console_logger.error(f"Collection not found: {e}")
+        raise
+    except SearchError as e:
+        console_logger.error(f"Search error: {e}")
+        raise
+    except Exception as e:
+        console_logger.error(f"Unexpected error in search_knowledge_base_batch: {e}")
+        raise SearchError(f"Search failed: {e}")
+
+
+def search_all_knowledge_bases(
+    query: str,
+    collection_names: Optional[List[str]] = None,
+    context_mode: str = "enhanced",
+    max_results: Optional[int] = None,
+    token_budget: Optional[int] = None,
+    search_mode: str = "semantic"
+) -> List[Dict[str, Any]]:
+    with SEARCH_SECONDS.time(tool="search_all_knowledge_bases"):
+        return _search_all_knowledge_bases(
+            query, collection_names, context_mode, max_results, token_budget, search_mode
+        )
+
+
+def _search_all_knowledge_bases(
+    query: str,
+    collection_names: Optional[List[str]],
+    context_mode: str,
+    max_results: Optional[int],
+    token_budget: Optional[int],
+    search_mode: str = "semantic"
+) -> List[Dict[str, Any]]:
+    try:
+        if SERVER_CONFIG is None:
+            raise ServerError("Server configuration not initialized")
+
+        effective_max_results: int = max_results if max_results is not None else SERVER_CONFIG.default_max_results
+        effective_token_budget = token_budget if token_budget is not None else SERVER_CONFIG.response_token_budget
+
+        console_logger.info("Tool invoked: search_all_knowledge_bases")
+        console_logger.info(f"  Query: {query[:80]}{'...' if len(query) > 80 else ''}")
+        console_logger.info(f"  Collections: {', '.join(collection_names) if collection_names else 'all'}")
+        console_logger.info(f"  Context mode: {context_mode}")
+        console_logger.info(f"  Search mode: {search_mode}")
+        console_logger.info(f"  Max results: {effective_max_results}")
+
+        providers = resolve_providers(collection_names)
+        results, errors = federated_search(
+            query=query,
+            chromadb_path=SERVER_CONFIG.chromadb_path,
+            provider_map=providers,
+            collection_names=list(providers),
+            context_mode=context_mode,
+            max_results=effective_max_results,
+            token_budget=effective_token_budget,
+            exact_search=EXACT_SEARCH,
+            search_mode=search_mode,
+            two_stage=TWO_STAGE_SEARCH,
+            chunk_cache=CHUNK_CACHE
+        )
+
+        console_logger.success(f"✓ Federated search completed: {len(results)} result(s)")
+        for i, result in enumerate(results):
+            console_logger.info(
+                f"  {i+1}. [{result['collectionName']}] {result['noteTitle']} (rank score: {result['federatedScore']:.3f})"
+            )
+        if errors:
+            console_logger.warning(f"  Skipped {len(errors)} collection(s): {', '.join(errors)}")
+
+        return results
+
+    except SearchError as e:
+        console_logger.error(f"Search error: {e}")
+        raise
+    except Exception as e:
+        console_logger.error(f"Unexpected error in search_all_knowledge_bases: {e}")
+        raise SearchError(f"Search failed: {e}")
+
+
 def main(config: ServerConfig | str):
     console_logger.info("=" * 60)
     console_logger.info("Multi-Collection MCP Server for Markdown Notes")
@@ -244,6 +742,7 @@ def main(config: ServerConfig | str):
 
     server_config = _ensure_server_config(config)
     initialize_server(server_config)
+    start_collection_watcher(server_config)
 
     # Create FastMCP instance (stdio mode doesn't need host/port)
     mcp = FastMCP("minerva-mcp-server")
@@ -264,16 +763,39 @@ def main(config: ServerConfig | str):
         raise ServerError(f"Server encountered an error: {error}") from error
 
 
-def main_http(config: ServerConfig | str):
-    from starlette.responses import JSONResponse
+def _register_http_routes(mcp_instance: FastMCP) -> None:
+    from starlette.responses import JSONResponse, Response
     from starlette.requests import Request
 
+    # Add health check endpoint using FastMCP's custom_route method
+    async def health_check(request: Request):
+        """Health check endpoint for Docker and monitoring systems."""
+        providers = provider_health_snapshot()
+        degraded = any(provider["state"] != "closed" for provider in providers)
+        return JSONResponse({
+            "status": "degraded" if degraded else "healthy",
+            "collections": len(AVAILABLE_COLLECTIONS),
+            "providers": providers,
+            "service": "minerva-mcp-server"
+        })
+
+    async def metrics(request: Request):
+        """Prometheus scrape endpoint (text exposition format)."""
+        return Response(render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+    # Register the routes (manually call the decorator as a function)
+    mcp_instance.custom_route("/health", methods=["GET"], name="health_check")(health_check)
+    mcp_instance.custom_route("/metrics", methods=["GET"], name="metrics")(metrics)
+
+
+def main_http(config: ServerConfig | str):
     console_logger.info("=" * 60)
     console_logger.info("Multi-Collection MCP Server for Markdown Notes")
     console_logger.info("=" * 60)
 
     server_config = _ensure_server_config(config)
     initialize_server(server_config)
+    start_collection_watcher(server_config)
 
     host = server_config.host or "localhost"
     port = server_config.port or 8000
@@ -284,21 +806,13 @@ def main_http(config: ServerConfig | str):
     # Register all tools
     _register_tools(mcp)
 
-    # Add health check endpoint using FastMCP's custom_route method
-    async def health_check(request: Request):
-        """Health check endpoint for Docker and monitoring systems."""
-        return JSONResponse({
-            "status": "healthy",
-            "collections": len(AVAILABLE_COLLECTIONS),
-            "service": "minerva-mcp-server"
-        })
-
-    # Register the health check route (manually call the decorator as a function)
-    mcp.custom_route("/health", methods=["GET"], name="health_check")(health_check)
+    # Add /health and /metrics endpoints
+    _register_http_routes(mcp)
 
     console_logger.info(f"Starting FastMCP server in HTTP mode on http://{host}:{port}...")
     console_logger.info(f"MCP endpoint will be available at: http://{host}:{port}/mcp/")
     console_logger.info(f"Health check endpoint: http://{host}:{port}/health")
+    console_logger.info(f"Metrics endpoint: http://{host}:{port}/metrics")
     console_logger.info("Waiting for HTTP requests...\n")
 
     try:
@@ -0,0 +1,90 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from minerva.common.metrics import SEARCH_STAGE_SECONDS
+from minerva.common.tracing import span
+from minerva.indexing.filter_fields import (
+    MAX_PATH_PREFIX_DEPTH,
+    date_to_epoch,
+    normalize_author,
+    normalize_source_path,
+    path_prefix_key,
+)
+
+FILTER_NAMES = ("source_path_prefix", "modified_after", "modified_before", "author", "year")
+
+# Lexical hits are filtered after BM25 ranking, so more of them are ranked
+# when a filter is set to leave enough once non-matching chunks are dropped
+FILTERED_LEXICAL_FACTOR = 5
+
+
+def build_where_clause(filters: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Translate search filters into a ChromaDB `where` clause over the fields
+    written at index time (see minerva.indexing.filter_fields).
+
+    Raises ValueError for unknown filters or values that cannot be normalized.
+    Returns None when no filter is set.
+    """
+    filters = {key: value for key, value in (filters or {}).items() if value is not None}
+    unknown = sorted(set(filters) - set(FILTER_NAMES))
+    if unknown:
+        raise ValueError(f"Unknown filter(s): {', '.join(unknown)}. Supported: {', '.join(FILTER_NAMES)}")
+
+    clauses: List[Dict[str, Any]] = []
+
+    prefix = filters.get("source_path_prefix")
+    if prefix is not None:
+        clauses.append(_source_path_clause(prefix))
+
+    for name, operator in (("modified_after", "$gte"), ("modified_before", "$lt")):
+        if name in filters:
+            epoch = date_to_epoch(filters[name])
+            if epoch is None:
+                raise ValueError(f"{name} must be an ISO 8601 date or datetime (e.g. 2024-06-30), got {filters[name]!r}")
+            clauses.append({"modifiedAt": {operator: epoch}})
+
+    author = filters.get("author")
+    if author is not None:
+        if not isinstance(author, str) or not author.strip():
+            raise ValueError("author must be a non-empty string")
+        clauses.append({"authorKey": normalize_author(author)})
+
+    year = filters.get("year")
+    if year is not None:
+        if not isinstance(year, int) or isinstance(year, bool):
+            raise ValueError("year must be an integer")
+        clauses.append({"year": year})
+
+    if not clauses:
+        return None
+    if len(clauses) == 1:
+        return clauses[0]
+    return {"$and": clauses}
+
+
+def _source_path_clause(prefix: Any) -> Dict[str, Any]:
+    # A prefix matches whole path segments: "docs/api" matches "docs/api/auth.md"
+    # and the file "docs/api" itself, but not "docs/api-v2/auth.md"
+    if not isinstance(prefix, str) or not normalize_source_path(prefix):
+        raise ValueError("source_path_prefix must be a non-empty relative path")
+
+    normalized = normalize_source_path(prefix)
+    depth = len(normalized.split("/"))
+    if depth > MAX_PATH_PREFIX_DEPTH:
+        raise ValueError(f"source_path_prefix can have at most {MAX_PATH_PREFIX_DEPTH} directory levels")
+    return {"$or": [{"sourcePath": normalized}, {path_prefix_key(depth): normalized}]}
+
+
+def filter_lexical_hits(
+    collection,
+    lexical_hits: List[List[Tuple[str, float]]],
+    where: Dict[str, Any],
+    n_results: int
+) -> List[List[Tuple[str, float]]]:
+    # Keeps the hits whose chunks match `where`; one get() covers every query
+    chunk_ids = list(dict.fromkeys(chunk_id for hits in lexical_hits for chunk_id, _ in hits))
+    if not chunk_ids:
+        return lexical_hits
+
+    with SEARCH_STAGE_SECONDS.time(stage="lexical_filter"), span("search.lexical_filter", candidates=len(chunk_ids)):
+        allowed = set(collection.get(ids=chunk_ids, where=where, include=[])["ids"])
+    return [[hit for hit in hits if hit[0] in allowed][:n_results] for hits in lexical_hits]
@@ -0,0 +1,110 @@
+import threading
+from typing import Any, Dict, List, Optional
+
+from minerva.common.ai_provider import AIProvider
+from minerva.common.circuit_breaker import (
+    CircuitBreaker,
+    DEFAULT_COOLDOWN_SECONDS,
+    DEFAULT_FAILURE_THRESHOLD,
+)
+from minerva.common.exceptions import ProviderUnavailableError
+from minerva.common.logger import get_logger
+from minerva.server.collection_discovery import (
+    ProviderKey,
+    provider_key_from_metadata,
+    reconstruct_provider_from_metadata,
+)
+
+console_logger = get_logger(__name__)
+
+
+class LazyProviderRegistry:
+    """Builds and health-checks each collection's AIProvider on first use.
+
+    Discovery only records collection metadata here, so startup does not wait
+    on any provider. Collections with the same provider settings share one
+    instance, as in eager discovery. A configuration that fails to build or
+    probe `failure_threshold` times in a row is refused for `cooldown_seconds`
+    instead of being retried on every search; other configurations (and their
+    collections) are unaffected.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown_seconds: float = DEFAULT_COOLDOWN_SECONDS
+    ):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._metadata: Dict[str, Dict[str, Any]] = {}
+        self._providers: Dict[ProviderKey, AIProvider] = {}
+        self._breakers: Dict[ProviderKey, CircuitBreaker] = {}
+        self._last_errors: Dict[ProviderKey, str] = {}
+        self._key_locks: Dict[ProviderKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def register(self, collection_name: str, metadata: Dict[str, Any]) -> None:
+        with self._lock:
+            self._metadata[collection_name] = dict(metadata)
+
+    def unregister(self, collection_name: str) -> None:
+        with self._lock:
+            self._metadata.pop(collection_name, None)
+
+    def knows(self, collection_name: str) -> bool:
+        with self._lock:
+            return collection_name in self._metadata
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return list(self._metadata)
+
+    def cached(self, collection_name: str) -> Optional[AIProvider]:
+        # The provider if it was already built, without initializing it
+        with self._lock:
+            metadata = self._metadata.get(collection_name)
+            if metadata is None:
+                return None
+            return self._providers.get(provider_key_from_metadata(metadata))
+
+    def get(self, collection_name: str) -> AIProvider:
+        # Raises KeyError for unknown collections and ProviderUnavailableError
+        # when the provider cannot be built or its circuit is open
+        with self._lock:
+            metadata = self._metadata[collection_name]
+            key = provider_key_from_metadata(metadata)
+            provider = self._providers.get(key)
+            if provider is not None:
+                return provider
+            breaker = self._breakers.setdefault(
+                key, CircuitBreaker(self.failure_threshold, self.cooldown_seconds)
+            )
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # One initialization per configuration; concurrent callers wait for it
+        with key_lock:
+            with self._lock:
+                provider = self._providers.get(key)
+            if provider is not None:
+                return provider
+
+            if not breaker.allow_request():
+                raise ProviderUnavailableError(
+                    f"Provider for collection '{collection_name}' is unavailable "
+                    f"(retrying in {breaker.retry_after():.0f}s): {self._last_errors.get(key, 'unknown error')}"
+                )
+
+            provider, reason = reconstruct_provider_from_metadata(metadata)
+            if provider is None:
+                breaker.record_failure()
+                with self._lock:
+                    self._last_errors[key] = reason or "unknown error"
+                console_logger.warning(f"Provider for collection '{collection_name}' unavailable: {reason}")
+                raise ProviderUnavailableError(f"Provider for collection '{collection_name}' is unavailable: {reason}")
+
+            breaker.record_success()
+            with self._lock:
+                self._providers[key] = provider
+                self._last_errors.pop(key, None)
+            console_logger.info(f"Initialized {provider.provider_type} provider for collection '{collection_name}'")
+            return provider
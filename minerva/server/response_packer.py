@@ -0,0 +1,109 @@
+from typing import List, Dict, Any, Set, Tuple
+
+from minerva.common.tokens import approximate_token_count
+from minerva.common.logger import get_logger
+
+console_logger = get_logger(__name__)
+
+# Per-result JSON envelope (field names, title, ids, score) on top of the content itself
+RESULT_OVERHEAD_TOKENS = 60
+
+# Common MCP client limit on a single tool response
+MCP_RESPONSE_TOKEN_LIMIT = 25000
+
+
+def chunk_token_count(chunk: Dict[str, Any]) -> int:
+    # Prefer the count stored at index time; collections indexed before token
+    # counts existed fall back to a character-based estimate.
+    stored = chunk.get('tokenCount')
+    if isinstance(stored, int) and stored >= 0:
+        return stored
+    return approximate_token_count(chunk.get('content', ''))
+
+
+def result_overhead_tokens(result: Dict[str, Any]) -> int:
+    return RESULT_OVERHEAD_TOKENS + approximate_token_count(result.get('noteTitle', ''))
+
+
+def pack_windows(
+    windows: List[Dict[str, Any]],
+    token_budget: int
+) -> Tuple[List[Dict[str, Any]], int]:
+    # windows: [{'result': ..., 'chunks': [...]}, ...] in rank order, chunks sorted by index.
+    # Phase 1 admits matched chunks by rank until the budget is spent (the top
+    # result is always kept). Phase 2 grows the admitted windows one ring of
+    # neighbors at a time, so context is spread evenly across results instead
+    # of the first result eating the whole budget. Chunks shared by windows of
+    # the same note are only charged once.
+    used = 0
+    included: Set[Tuple[Any, int]] = set()
+    admitted: List[Dict[str, Any]] = []
+
+    for window in windows:
+        result = window['result']
+        matched = next((c for c in window['chunks'] if c['index'] == result['chunkIndex']), None)
+        if matched is None:
+            matched = {'index': result['chunkIndex'], 'content': result.get('content', '')}
+
+        key = (result['noteId'], matched['index'])
+        cost = result_overhead_tokens(result) + (0 if key in included else chunk_token_count(matched))
+
+        if admitted and used + cost > token_budget:
+            break
+
+        used += cost
+        included.add(key)
+        admitted.append({
+            'window': window,
+            'kept': {matched['index']: matched},
+            'by_index': {chunk['index']: chunk for chunk in window['chunks']},
+            'blocked': {'left': False, 'right': False},
+            'center': matched['index']
+        })
+
+    max_radius = max((len(entry['by_index']) for entry in admitted), default=0)
+
+    for radius in range(1, max_radius + 1):
+        for entry in admitted:
+            note_id = entry['window']['result']['noteId']
+            for side, index in (('left', entry['center'] - radius), ('right', entry['center'] + radius)):
+                if entry['blocked'][side]:
+                    continue
+
+                chunk = entry['by_index'].get(index)
+                if chunk is None:
+                    entry['blocked'][side] = True
+                    continue
+
+                key = (note_id, index)
+                cost = 0 if key in included else chunk_token_count(chunk)
+                if used + cost > token_budget:
+                    # Keep the window contiguous: stop growing this side
+                    entry['blocked'][side] = True
+                    continue
+
+                used += cost
+                included.add(key)
+                entry['kept'][index] = chunk
+
+    packed = [
+        {
+            'result': entry['window']['result'],
+            'chunks': [entry['kept'][index] for index in sorted(entry['kept'])]
+        }
+        for entry in admitted
+    ]
+
+    dropped = len(windows) - len(packed)
+    if dropped:
+        console_logger.info(f"  → Token budget {token_budget:,}: dropped {dropped} lower-ranked result(s)")
+
+    return packed, used
+
+
+def estimate_results_tokens(results: List[Dict[str, Any]]) -> int:
+    return sum(
+        result_overhead_tokens(result) + approximate_token_count(result.get('content', ''))
+        for result in results
+    )
+
@@ -1,18 +1,35 @@
 import sys
-import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from pathlib import Path
 
 import chromadb
-import tiktoken
 from minerva.indexing.storage import initialize_chromadb_client, ChromaDBConnectionError
 from minerva.common.ai_provider import AIProvider, AIProviderError, ProviderUnavailableError
 
 from minerva.server.context_retrieval import apply_context_mode
+from minerva.server.diversification import cap_results_per_note, diversify_results, diversity_candidate_count
+from minerva.server.metadata_filters import FILTERED_LEXICAL_FACTOR, build_where_clause, filter_lexical_hits
+from minerva.server.hybrid_search import (
+    SEARCH_MODES,
+    fusion_candidate_count,
+    lexical_query,
+    reciprocal_rank_fusion,
+)
+from minerva.server.response_packer import estimate_results_tokens, MCP_RESPONSE_TOKEN_LIMIT
 from minerva.common.logger import get_logger
+from minerva.common.metrics import SEARCH_STAGE_SECONDS, SEARCH_REQUESTS
+from minerva.common.tracing import span, traced
+
+if TYPE_CHECKING:
+    from minerva.server.exact_search import ExactSearchEngine
+    from minerva.server.two_stage_search import TwoStageSearchEngine
+    from minerva.server.chunk_cache import ChunkCache
 
 console_logger = get_logger(__name__)
 
+# search_knowledge_base_batch: agents typically send 3-6 related queries
+MAX_BATCH_QUERIES = 10
+
 
 class SearchError(Exception):
     pass
@@ -24,22 +41,33 @@ class CollectionNotFoundError(Exception):
 
 def estimate_token_count(results: List[Dict[str, Any]]) -> int:
     try:
-        # Use cl100k_base (GPT-4/ChatGPT tokenizer) as standard reference
-        encoding = tiktoken.get_encoding("cl100k_base")
-
-        # Serialize results to JSON (similar to what MCP will send)
-        json_str = json.dumps(results)
-
-        # Count tokens
-        token_count = len(encoding.encode(json_str))
-
-        return token_count
+        # Chunk token counts are computed at index time; re-tokenizing the whole
+        # response here would cost more than the search itself.
+        return estimate_results_tokens(results)
     except Exception as e:
         # If token estimation fails, log but don't break the search
         console_logger.warning(f"Token estimation failed: {e}")
         return -1
 
 
+def embed_query(query: str, provider: AIProvider, verbose: bool = False) -> List[float]:
+    if verbose:
+        console_logger.info("  → Generating query embedding...")
+    try:
+        with SEARCH_STAGE_SECONDS.time(stage="query_embedding"), span("search.query_embedding"):
+            query_embedding = provider.generate_embedding(query)
+        if verbose:
+            console_logger.info(f"  ✓ Embedding generated (dimension: {len(query_embedding)})")
+        return query_embedding
+    except ProviderUnavailableError as error:
+        raise SearchError(
+            f"AI provider unavailable: {error}\n"
+            f"Suggestion: Ensure the provider service is running and accessible."
+        )
+    except AIProviderError as error:
+        raise SearchError(f"Failed to generate query embedding: {error}")
+
+
 def validate_collection_exists(
     client: chromadb.PersistentClient,
     collection_name: str
@@ -62,114 +90,522 @@ def validate_collection_exists(
         raise SearchError(f"Failed to validate collection '{collection_name}': {error}")
 
 
-def search_knowledge_base(
-    query: str,
-    collection_name: str,
-    chromadb_path: str,
-    provider: AIProvider,
-    context_mode: str = "enhanced",
-    max_results: int = 5,
-    verbose: bool = False
-) -> List[Dict[str, Any]]:
-    if not query or not query.strip():
-        raise SearchError("Query cannot be empty")
+def embed_queries(queries: List[str], provider: AIProvider, verbose: bool = False) -> List[List[float]]:
+    # A single query keeps using generate_embedding; several go out in one request
+    if len(queries) == 1:
+        return [embed_query(queries[0], provider, verbose)]
 
+    if verbose:
+        console_logger.info(f"  → Generating {len(queries)} query embeddings in one request...")
+    try:
+        with SEARCH_STAGE_SECONDS.time(stage="query_embedding"), span(
+            "search.query_embedding", queries=len(queries)
+        ):
+            return provider.generate_embeddings_batch(queries)
+    except ProviderUnavailableError as error:
+        raise SearchError(
+            f"AI provider unavailable: {error}\n"
+            f"Suggestion: Ensure the provider service is running and accessible."
+        )
+    except AIProviderError as error:
+        raise SearchError(f"Failed to generate query embeddings: {error}")
+
+
+def resolve_where_clause(filters: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    try:
+        return build_where_clause(filters)
+    except ValueError as error:
+        raise SearchError(f"Invalid filter: {error}")
+
+
+def validate_search_arguments(
+    max_results: int,
+    token_budget: Optional[int],
+    context_mode: str,
+    search_mode: str,
+    max_per_note: Optional[int] = None
+) -> None:
     if max_results < 1 or max_results > 15:
         raise SearchError("max_results must be between 1 and 15")
 
+    if max_per_note is not None and (not isinstance(max_per_note, int) or max_per_note < 1):
+        raise SearchError("max_per_note must be a positive integer")
+
+    if token_budget is not None and (not isinstance(token_budget, int) or token_budget < 500):
+        raise SearchError("token_budget must be an integer of at least 500")
+
     if context_mode not in ["chunk_only", "enhanced", "full_note"]:
         raise SearchError(
             f"Invalid context_mode '{context_mode}'. "
             f"Must be one of: chunk_only, enhanced, full_note"
         )
 
-    try:
-        client = initialize_chromadb_client(chromadb_path)
+    if search_mode not in SEARCH_MODES:
+        raise SearchError(
+            f"Invalid search_mode '{search_mode}'. "
+            f"Must be one of: {', '.join(SEARCH_MODES)}"
+        )
 
-        collection = validate_collection_exists(client, collection_name)
 
-        collection_metadata = collection.metadata
-        if not collection_metadata:
-            raise SearchError(
-                f"Collection '{collection_name}' has no metadata. "
-                f"This collection was created with an old pipeline version and is not compatible. "
-                f"Please recreate the collection using the updated pipeline with AI provider metadata."
+def format_result(
+    collection_name: str,
+    chunk_id: str,
+    document: str,
+    metadata: Optional[Dict[str, Any]],
+    score: float
+) -> Dict[str, Any]:
+    metadata = metadata or {}
+    return {
+        'chunkId': chunk_id,  # Include chunk ID for Strategy 4
+        'noteTitle': metadata.get('title', 'Unknown'),
+        'noteId': metadata.get('noteId', 'unknown'),
+        'chunkIndex': metadata.get('chunkIndex', 0),
+        'modificationDate': metadata.get('modificationDate', ''),
+        'collectionName': collection_name,
+        'similarityScore': score,
+        'content': document,
+        'totalChunks': 1
+    }
+
+
+def format_vector_results(collection_name: str, vector_results: Dict[str, Any]) -> List[List[Dict[str, Any]]]:
+    # One list of formatted results per query in a collection.query()-shaped response
+    formatted = []
+    for q, ids in enumerate(vector_results.get('ids') or []):
+        formatted.append([
+            format_result(
+                collection_name,
+                chunk_id,
+                vector_results['documents'][q][i],
+                vector_results['metadatas'][q][i],
+                1.0 - vector_results['distances'][q][i]
             )
+            for i, chunk_id in enumerate(ids)
+        ])
+    return formatted
 
-        expected_dimension = collection_metadata.get('embedding_dimension')
 
-        if verbose:
-            console_logger.info("  → Generating query embedding...")
-        try:
-            query_embedding = provider.generate_embedding(query)
-            if verbose:
-                console_logger.info(f"  ✓ Embedding generated (dimension: {len(query_embedding)})")
-        except ProviderUnavailableError as error:
-            raise SearchError(
-                f"AI provider unavailable: {error}\n"
-                f"Suggestion: Ensure the provider service is running and accessible."
-            )
-        except AIProviderError as error:
-            raise SearchError(f"Failed to generate query embedding: {error}")
-
-        actual_dimension = len(query_embedding)
-        if expected_dimension is not None and actual_dimension != expected_dimension:
-            raise SearchError(
-                f"Embedding dimension mismatch! Query: {actual_dimension}, Collection: {expected_dimension}\n"
-                f"The collection was created with a different embedding model.\n"
-                f"Collection provider: {collection_metadata.get('embedding_provider')}\n"
-                f"Collection model: {collection_metadata.get('embedding_model')}"
-            )
+def fuse_results(
+    collection: chromadb.Collection,
+    collection_name: str,
+    vector_results: Optional[Dict[str, Any]],
+    lexical_hits: List[List[Any]],
+    max_results: int
+) -> List[List[Dict[str, Any]]]:
+    # Reciprocal-rank fusion of the vector and BM25 rankings of each query.
+    # similarityScore becomes the normalized fused score; the per-ranking scores
+    # are kept as vectorScore and lexicalScore for the hits that had them.
+    # Documents of keyword-only hits are fetched for all queries in one get().
+    rows: Dict[str, Any] = {}
+    fused_per_query = []
+    vector_scores_per_query = []
+
+    for q, hits in enumerate(lexical_hits):
+        rankings = []
+        vector_scores: Dict[str, float] = {}
+        if vector_results is not None:
+            vector_ids = vector_results['ids'][q]
+            for i, chunk_id in enumerate(vector_ids):
+                rows[chunk_id] = (vector_results['documents'][q][i], vector_results['metadatas'][q][i])
+                vector_scores[chunk_id] = 1.0 - vector_results['distances'][q][i]
+            rankings.append(vector_ids)
+        rankings.append([chunk_id for chunk_id, _ in hits])
+
+        fused_per_query.append(reciprocal_rank_fusion(rankings)[:max_results])
+        vector_scores_per_query.append(vector_scores)
+
+    missing = list(dict.fromkeys(
+        chunk_id for fused in fused_per_query for chunk_id, _ in fused if chunk_id not in rows
+    ))
+    if missing:
+        fetched = collection.get(ids=missing, include=["documents", "metadatas"])
+        for chunk_id, document, metadata in zip(fetched['ids'], fetched['documents'], fetched['metadatas']):
+            rows[chunk_id] = (document, metadata)
+
+    formatted = []
+    for fused, vector_scores, hits in zip(fused_per_query, vector_scores_per_query, lexical_hits):
+        lexical_scores = dict(hits)
+        results = []
+        for chunk_id, score in fused:
+            # A chunk deleted after the lexical index was written is skipped
+            if chunk_id not in rows:
+                continue
+            document, metadata = rows[chunk_id]
+            result = format_result(collection_name, chunk_id, document, metadata, score)
+            if chunk_id in vector_scores:
+                result['vectorScore'] = vector_scores[chunk_id]
+            if chunk_id in lexical_scores:
+                result['lexicalScore'] = round(lexical_scores[chunk_id], 4)
+            results.append(result)
+        formatted.append(results)
+
+    return formatted
+
+
+def _vector_query(
+    collection: chromadb.Collection,
+    collection_name: str,
+    queries: List[str],
+    provider: AIProvider,
+    n_results: int,
+    query_embeddings: Optional[List[List[float]]],
+    exact_search: Optional["ExactSearchEngine"],
+    verbose: bool,
+    where: Optional[Dict[str, Any]] = None,
+    two_stage: Optional["TwoStageSearchEngine"] = None
+) -> Dict[str, Any]:
+    # Returns collection.query()-shaped results with one row per query.
+    # A where clause is pushed down to ChromaDB (or the exact engine).
+    filter_kwargs = {"where": where} if where is not None else {}
+    collection_metadata = collection.metadata or {}
+    expected_dimension = collection_metadata.get('embedding_dimension')
+
+    if query_embeddings is None:
+        query_embeddings = embed_queries(queries, provider, verbose)
+
+    actual_dimension = len(query_embeddings[0])
+    if expected_dimension is not None and actual_dimension != expected_dimension:
+        raise SearchError(
+            f"Embedding dimension mismatch! Query: {actual_dimension}, Collection: {expected_dimension}\n"
+            f"The collection was created with a different embedding model.\n"
+            f"Collection provider: {collection_metadata.get('embedding_provider')}\n"
+            f"Collection model: {collection_metadata.get('embedding_model')}"
+        )
 
+    if exact_search is not None and exact_search.handles(collection_name):
+        if verbose:
+            console_logger.info(f"  → Exact search (max_results: {n_results})...")
+        with SEARCH_STAGE_SECONDS.time(stage="exact_query"), span(
+            "search.exact_query", collection=collection_name, n_results=n_results
+        ):
+            if len(query_embeddings) == 1:
+                return exact_search.query(collection, query_embeddings[0], n_results, **filter_kwargs)
+            return exact_search.query_batch(collection, query_embeddings, n_results, **filter_kwargs)
+
+    if two_stage is not None and two_stage.handles(collection_name):
         if verbose:
-            console_logger.info(f"  → Querying ChromaDB (max_results: {max_results})...")
-        results = collection.query(
-            query_embeddings=[query_embedding],
-            n_results=max_results,
-            include=["documents", "metadatas", "distances"]
+            console_logger.info(f"  → Two-stage search: top notes, then their chunks (max_results: {n_results})...")
+        results = two_stage.query_batch(collection, query_embeddings, n_results, where)
+        if results is not None:
+            return results
+
+    if verbose:
+        console_logger.info(f"  → Querying ChromaDB (max_results: {n_results})...")
+    with SEARCH_STAGE_SECONDS.time(stage="ann_query"), span(
+        "search.ann_query", collection=collection_name, n_results=n_results
+    ):
+        return collection.query(
+            query_embeddings=query_embeddings,
+            n_results=n_results,
+            include=["documents", "metadatas", "distances"],
+            **filter_kwargs
         )
 
-        # Log how many results were found
-        num_results = len(results['ids'][0]) if results and results['ids'] else 0
-        if verbose:
-            console_logger.info(f"  ✓ ChromaDB query completed ({num_results} results found)")
-
-        formatted_results = []
-
-        if results and results['ids'] and len(results['ids']) > 0:
-            for i in range(len(results['ids'][0])):
-                result = {
-                    'chunkId': results['ids'][0][i],  # Include chunk ID for Strategy 4
-                    'noteTitle': results['metadatas'][0][i].get('title', 'Unknown'),
-                    'noteId': results['metadatas'][0][i].get('noteId', 'unknown'),
-                    'chunkIndex': results['metadatas'][0][i].get('chunkIndex', 0),
-                    'modificationDate': results['metadatas'][0][i].get('modificationDate', ''),
-                    'collectionName': collection_name,
-                    'similarityScore': 1.0 - results['distances'][0][i],
-                    'content': results['documents'][0][i],
-                    'totalChunks': 1
-                }
-                formatted_results.append(result)
 
+def retrieve_results(
+    collection: chromadb.Collection,
+    collection_name: str,
+    chromadb_path: str,
+    queries: List[str],
+    provider: AIProvider,
+    max_results: int,
+    search_mode: str,
+    query_embeddings: Optional[List[List[float]]] = None,
+    exact_search: Optional["ExactSearchEngine"] = None,
+    verbose: bool = False,
+    diversify: bool = False,
+    max_per_note: Optional[int] = None,
+    where: Optional[Dict[str, Any]] = None,
+    two_stage: Optional["TwoStageSearchEngine"] = None
+) -> List[List[Dict[str, Any]]]:
+    # Ranked, formatted results for each query (before context retrieval).
+    # All queries share one embedding request and one ChromaDB query.
+    # Diversification over-fetches candidates and then picks max_results of
+    # them, so context retrieval only ever expands the final picks.
+    # `where` restricts every ranking to chunks whose metadata matches it.
+    diversifying = diversify or max_per_note is not None
+    n_ranked = diversity_candidate_count(max_results) if diversifying else max_results
+    fused = search_mode != "semantic"
+    n_candidates = fusion_candidate_count(n_ranked) if fused else n_ranked
+
+    lexical_hits = None
+    if fused:
         if verbose:
-            console_logger.info(f"  → Applying context mode: {context_mode}...")
-        enhanced_results = apply_context_mode(collection, formatted_results, context_mode, verbose)
-        if verbose:
-            console_logger.info(f"  ✓ Context retrieval completed")
+            console_logger.info(f"  → Querying lexical index (max_results: {n_candidates})...")
+        n_lexical = n_candidates * FILTERED_LEXICAL_FACTOR if where is not None else n_candidates
+        lexical_hits = lexical_query(chromadb_path, collection_name, queries, n_lexical)
+        if lexical_hits is not None and where is not None:
+            lexical_hits = filter_lexical_hits(collection, lexical_hits, where, n_candidates)
+        if lexical_hits is None:
+            if search_mode == "lexical":
+                raise SearchError(
+                    f"Collection '{collection_name}' has no lexical index.\n"
+                    f"Suggestion: Run 'minerva index' for this collection to build it, "
+                    f"or use search_mode 'semantic'."
+                )
+            console_logger.warning(
+                f"  Collection '{collection_name}' has no lexical index; using semantic search. "
+                f"Run 'minerva index' to build it."
+            )
+            fused = False
+            n_candidates = n_ranked
+
+    vector_results = None
+    if search_mode != "lexical":
+        vector_results = _vector_query(
+            collection, collection_name, queries, provider, n_candidates,
+            query_embeddings, exact_search, verbose, where, two_stage
+        )
+
+    if fused:
+        ranked = fuse_results(collection, collection_name, vector_results, lexical_hits, n_ranked)
+    else:
+        ranked = format_vector_results(collection_name, vector_results)
+
+    if not diversifying:
+        return ranked
+    if verbose:
+        console_logger.info(f"  → Diversifying {sum(len(results) for results in ranked)} candidate(s)...")
+    return diversify_results(collection, ranked, max_results, diversify, max_per_note)
+
+
+def _get_collection(
+    client: Optional[chromadb.PersistentClient],
+    chromadb_path: str,
+    collection_name: str
+) -> chromadb.Collection:
+    if client is None:
+        client = initialize_chromadb_client(chromadb_path)
+
+    collection = validate_collection_exists(client, collection_name)
+
+    if not collection.metadata:
+        raise SearchError(
+            f"Collection '{collection_name}' has no metadata. "
+            f"This collection was created with an old pipeline version and is not compatible. "
+            f"Please recreate the collection using the updated pipeline with AI provider metadata."
+        )
+    return collection
+
 
-        # Estimate token count for monitoring/debugging
+def _finish_results(
+    collection: chromadb.Collection,
+    collection_name: str,
+    formatted_results: List[Dict[str, Any]],
+    context_mode: str,
+    token_budget: Optional[int],
+    verbose: bool,
+    chunk_cache: Optional["ChunkCache"] = None
+) -> List[Dict[str, Any]]:
+    if verbose:
+        console_logger.info(f"  ✓ Search completed ({len(formatted_results)} results found)")
+        console_logger.info(f"  → Applying context mode: {context_mode}...")
+    with SEARCH_STAGE_SECONDS.time(stage="context_retrieval"), span(
+        "search.apply_context_mode", collection=collection_name, context_mode=context_mode
+    ):
+        enhanced_results = apply_context_mode(
+            collection, formatted_results, context_mode, verbose, token_budget, chunk_cache
+        )
+    if verbose:
+        console_logger.info("  ✓ Context retrieval completed")
+
+    # Estimate token count for monitoring/debugging
+    with SEARCH_STAGE_SECONDS.time(stage="token_estimation"):
         estimated_tokens = estimate_token_count(enhanced_results)
-        if verbose and estimated_tokens > 0:
-            console_logger.info(f"  ℹ Estimated response size: ~{estimated_tokens:,} tokens")
-            if estimated_tokens > 25000:
-                console_logger.warning(
-                    f"  ⚠ Response may exceed common MCP token limit (25,000 tokens). "
-                    f"The MCP client may reject this response and the AI will likely retry with fewer results."
-                )
+    if verbose and estimated_tokens > 0:
+        console_logger.info(f"  ℹ Estimated response size: ~{estimated_tokens:,} tokens")
+        if estimated_tokens > MCP_RESPONSE_TOKEN_LIMIT:
+            console_logger.warning(
+                f"  ⚠ Response may exceed common MCP token limit ({MCP_RESPONSE_TOKEN_LIMIT:,} tokens). "
+                f"The MCP client may reject this response and the AI will likely retry with fewer results."
+            )
+
+    return enhanced_results
+
+
+@traced("search.collection")
+def search_knowledge_base(
+    query: str,
+    collection_name: str,
+    chromadb_path: str,
+    provider: AIProvider,
+    context_mode: str = "enhanced",
+    max_results: int = 5,
+    verbose: bool = False,
+    token_budget: Optional[int] = None,
+    query_embedding: Optional[List[float]] = None,
+    client: Optional[chromadb.PersistentClient] = None,
+    exact_search: Optional["ExactSearchEngine"] = None,
+    search_mode: str = "semantic",
+    diversify: bool = False,
+    max_per_note: Optional[int] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    two_stage: Optional["TwoStageSearchEngine"] = None,
+    chunk_cache: Optional["ChunkCache"] = None
+) -> List[Dict[str, Any]]:
+    # query_embedding and client let federated search embed once per provider
+    # and share one ChromaDB client across concurrent collection queries.
+    # exact_search replaces the HNSW query for the collections it handles;
+    # two_stage ranks note summaries first for the collections it handles;
+    # chunk_cache serves neighboring chunks for enhanced context.
+    # search_mode "lexical" ranks by BM25 alone (no embedding call); "hybrid"
+    # fuses the BM25 and vector rankings. diversify re-ranks the candidates by
+    # maximal marginal relevance; max_per_note caps results from one note.
+    # filters (source_path_prefix, modified_after, modified_before, author,
+    # year) are pushed down to ChromaDB as a where clause.
+    if not query or not query.strip():
+        raise SearchError("Query cannot be empty")
+
+    validate_search_arguments(max_results, token_budget, context_mode, search_mode, max_per_note)
+    where = resolve_where_clause(filters)
+
+    status = "error"
+    try:
+        collection = _get_collection(client, chromadb_path, collection_name)
+
+        formatted_results = retrieve_results(
+            collection,
+            collection_name,
+            chromadb_path,
+            [query],
+            provider,
+            max_results,
+            search_mode,
+            query_embeddings=[query_embedding] if query_embedding is not None else None,
+            exact_search=exact_search,
+            verbose=verbose,
+            diversify=diversify,
+            max_per_note=max_per_note,
+            where=where,
+            two_stage=two_stage
+        )[0]
+
+        enhanced_results = _finish_results(
+            collection, collection_name, formatted_results, context_mode, token_budget, verbose, chunk_cache
+        )
+
+        status = "ok"
+        return enhanced_results
+
+    except CollectionNotFoundError:
+        status = "not_found"
+        raise
+    except SearchError:
+        raise
+    except ChromaDBConnectionError as error:
+        raise SearchError(f"ChromaDB connection failed: {error}")
+    except Exception as error:
+        raise SearchError(f"Search failed: {error}")
+    finally:
+        SEARCH_REQUESTS.inc(collection=collection_name, context_mode=context_mode, status=status)
+
+
+@traced("search.collection_context")
+def retrieve_collection_context(
+    collection_name: str,
+    chromadb_path: str,
+    results: List[Dict[str, Any]],
+    context_mode: str,
+    token_budget: Optional[int] = None,
+    client: Optional[chromadb.PersistentClient] = None,
+    verbose: bool = False,
+    chunk_cache: Optional["ChunkCache"] = None
+) -> List[Dict[str, Any]]:
+    # Context for results already ranked by a chunk_only search of the
+    # collection; federated search fetches it only for the merged top results.
+    try:
+        collection = _get_collection(client, chromadb_path, collection_name)
+        return _finish_results(collection, collection_name, results, context_mode, token_budget, verbose, chunk_cache)
+    except (CollectionNotFoundError, SearchError):
+        raise
+    except ChromaDBConnectionError as error:
+        raise SearchError(f"ChromaDB connection failed: {error}")
+    except Exception as error:
+        raise SearchError(f"Context retrieval failed: {error}")
+
+
+def merge_query_results(queries: List[str], results_per_query: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    # Union of several queries' results: a chunk found by more than one query
+    # appears once, with its best score and every query that matched it.
+    merged: Dict[str, Dict[str, Any]] = {}
+    for query, results in zip(queries, results_per_query):
+        for result in results:
+            existing = merged.get(result['chunkId'])
+            if existing is None:
+                merged[result['chunkId']] = {**result, 'matchedQueries': [query]}
+                continue
+            existing['matchedQueries'].append(query)
+            if result['similarityScore'] > existing['similarityScore']:
+                existing.update({**result, 'matchedQueries': existing['matchedQueries']})
+
+    ordered = list(merged.values())
+    ordered.sort(key=lambda result: result['similarityScore'], reverse=True)
+    return ordered
+
+
+@traced("search.collection_batch")
+def search_knowledge_base_batch(
+    queries: List[str],
+    collection_name: str,
+    chromadb_path: str,
+    provider: AIProvider,
+    context_mode: str = "enhanced",
+    max_results: int = 5,
+    verbose: bool = False,
+    token_budget: Optional[int] = None,
+    client: Optional[chromadb.PersistentClient] = None,
+    exact_search: Optional["ExactSearchEngine"] = None,
+    search_mode: str = "semantic",
+    diversify: bool = False,
+    max_per_note: Optional[int] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    two_stage: Optional["TwoStageSearchEngine"] = None,
+    chunk_cache: Optional["ChunkCache"] = None
+) -> List[Dict[str, Any]]:
+    # Several related queries against one collection: one embedding request,
+    # one ChromaDB query and one context-retrieval pass over the deduplicated
+    # union. max_results applies per query; token_budget and max_per_note to
+    # the whole response.
+    queries = list(dict.fromkeys(query.strip() for query in queries or [] if query and query.strip()))
+    if not queries:
+        raise SearchError("At least one non-empty query is required")
+    if len(queries) > MAX_BATCH_QUERIES:
+        raise SearchError(f"At most {MAX_BATCH_QUERIES} queries can be searched in one batch")
+
+    validate_search_arguments(max_results, token_budget, context_mode, search_mode, max_per_note)
+    where = resolve_where_clause(filters)
+
+    status = "error"
+    try:
+        collection = _get_collection(client, chromadb_path, collection_name)
+
+        results_per_query = retrieve_results(
+            collection,
+            collection_name,
+            chromadb_path,
+            queries,
+            provider,
+            max_results,
+            search_mode,
+            exact_search=exact_search,
+            verbose=verbose,
+            diversify=diversify,
+            max_per_note=max_per_note,
+            where=where,
+            two_stage=two_stage
+        )
+        # Different queries can still pick chunks of the same note
+        merged = cap_results_per_note(merge_query_results(queries, results_per_query), max_per_note)
+
+        enhanced_results = _finish_results(
+            collection, collection_name, merged, context_mode, token_budget, verbose, chunk_cache
+        )
 
+        status = "ok"
         return enhanced_results
 
     except CollectionNotFoundError:
+        status = "not_found"
         raise
     except SearchError:
         raise
@@ -177,3 +613,5 @@ def search_knowledge_base(
         raise SearchError(f"ChromaDB connection failed: {error}")
     except Exception as error:
         raise SearchError(f"Search failed: {error}")
+    finally:
+        SEARCH_REQUESTS.inc(collection=collection_name, context_mode=context_mode, status=status)
@@ -0,0 +1,111 @@
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from minerva.common.logger import get_logger
+from minerva.common.metrics import SEARCH_STAGE_SECONDS
+from minerva.common.tracing import span
+from minerva.indexing.note_summaries import get_note_summary_collection
+from minerva.indexing.storage import initialize_chromadb_client
+from minerva.server.exact_search import build_index
+
+console_logger = get_logger(__name__)
+
+DEFAULT_NOTE_CANDIDATES = 50
+
+
+class TwoStageSearchEngine:
+    """Note-first search for collections too large for a fast chunk-level ANN query.
+
+    Stage one queries the collection's note summary companion (one mean vector
+    per note, built by `minerva index` with note_summaries enabled) for the top
+    notes. Stage two reads the chunks of those notes in one get() and ranks
+    them exactly. Chunks of notes outside the top set are never considered, so
+    recall drops slightly in exchange for scanning a few hundred vectors.
+    """
+
+    def __init__(self, chromadb_path: str, note_candidates: Dict[str, int]):
+        self.chromadb_path = chromadb_path
+        self.note_candidates = dict(note_candidates)
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._missing_warned: set = set()
+
+    def handles(self, collection_name: str) -> bool:
+        return collection_name in self.note_candidates
+
+    def _summaries(self, collection_name: str):
+        with self._client_lock:
+            if self._client is None:
+                self._client = initialize_chromadb_client(self.chromadb_path)
+        summaries = get_note_summary_collection(self._client, collection_name)
+        if summaries is None and collection_name not in self._missing_warned:
+            self._missing_warned.add(collection_name)
+            console_logger.warning(
+                f"  Collection '{collection_name}' has no note summaries; using chunk-level search. "
+                f"Set note_summaries: true in its index config and run 'minerva index'."
+            )
+        return summaries
+
+    def query_batch(
+        self,
+        collection,
+        query_embeddings: List[List[float]],
+        n_results: int,
+        where: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, List[List[Any]]]]:
+        # collection.query()-shaped results with one row per query embedding, or
+        # None when the collection has no note summaries (the caller falls back)
+        summaries = self._summaries(collection.name)
+        if summaries is None:
+            return None
+
+        n_notes = self.note_candidates[collection.name]
+        filter_kwargs = {"where": where} if where is not None else {}
+        with SEARCH_STAGE_SECONDS.time(stage="note_query"), span(
+            "search.note_query", collection=collection.name, n_notes=n_notes
+        ):
+            note_results = summaries.query(
+                query_embeddings=query_embeddings, n_results=n_notes, include=["distances"], **filter_kwargs
+            )
+
+        notes_per_query = note_results["ids"]
+        note_ids = list(dict.fromkeys(note_id for note_ids in notes_per_query for note_id in note_ids))
+        results: Dict[str, List[List[Any]]] = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        if not note_ids:
+            for _ in query_embeddings:
+                for key in results:
+                    results[key].append([])
+            return results
+
+        with SEARCH_STAGE_SECONDS.time(stage="note_chunk_rank"), span(
+            "search.note_chunk_rank", collection=collection.name, notes=len(note_ids)
+        ):
+            fetched = collection.get(
+                where={"noteId": {"$in": note_ids}}, include=["embeddings", "documents", "metadatas"]
+            )
+            chunk_ids = fetched["ids"]
+            index = build_index(
+                collection.name,
+                chunk_ids,
+                np.asarray(fetched["embeddings"], dtype=np.float32).reshape(len(chunk_ids), -1),
+                None
+            )
+            chunk_notes = [(metadata or {}).get("noteId") for metadata in fetched["metadatas"]]
+            position_of = {chunk_id: position for position, chunk_id in enumerate(chunk_ids)}
+
+            for embedding, query_notes in zip(query_embeddings, notes_per_query):
+                # Each query only ranks chunks of its own top notes
+                allowed = set(query_notes)
+                rows = np.fromiter(
+                    (position for position, note_id in enumerate(chunk_notes) if note_id in allowed), dtype=np.int64
+                )
+                ranked = index.top_k(embedding, n_results, rows)
+                ids = ranked["ids"][0]
+                results["ids"].append(ids)
+                results["documents"].append([fetched["documents"][position_of[chunk_id]] for chunk_id in ids])
+                results["metadatas"].append([fetched["metadatas"][position_of[chunk_id]] or {} for chunk_id in ids])
+                results["distances"].append(ranked["distances"][0])
+
+        return results
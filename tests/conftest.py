@@ -175,6 +175,15 @@ def env_vars_backup():
     os.environ.update(original_env)
 
 
+@pytest.fixture(autouse=True)
+def provider_health_reset():
+    # Provider health is shared per endpoint; keep one test's open circuit out of the next
+    from minerva.common.ai_provider import reset_provider_health
+
+    yield
+    reset_provider_health()
+
+
 @pytest.fixture
 def mock_ollama_config() -> dict[str, Any]:
     return {
@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""Local OpenAI-compatible stub server for offline testing.
+
+Serves /v1/embeddings, /v1/chat/completions (plain and streaming) and
+/v1/models with deterministic output, so LMStudioClient and litellm's OpenAI
+path can be exercised without a model server. Faults are injectable:
+
+- latency_ms / jitter_ms     delay before every /v1 response
+- error_rate                 fraction of requests answered with HTTP 500
+- rate_limit_rate            fraction of requests answered with HTTP 429
+- requests_per_minute        real sliding-window limit; excess requests get 429
+- max_batch_size             embedding requests with more inputs get HTTP 400
+- fail_next                  answer the next N requests with a given status
+
+Faults can be changed while running (POST /_stub/config) and counters read
+back (GET /_stub/stats), including connections opened and peak in-flight
+requests for checking retry, batching, rate limiting and connection reuse.
+
+    python tests/helpers/openai_stub_server.py --port 1234 --latency-ms 20 --rate-limit-rate 0.1
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from benchmarks.stub_provider import hashed_embedding  # noqa: E402
+
+DEFAULT_DIMENSION = 384
+DEFAULT_COMPLETION = "This is a canned response from the stub server."
+FAULT_FIELDS = ("latency_ms", "jitter_ms", "error_rate", "rate_limit_rate", "requests_per_minute",
+                "max_batch_size", "retry_after_seconds", "completion_text", "dimension")
+
+
+class StubState:
+    def __init__(
+        self,
+        dimension: int = DEFAULT_DIMENSION,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        requests_per_minute: Optional[int] = None,
+        max_batch_size: Optional[int] = None,
+        retry_after_seconds: float = 1.0,
+        completion_text: str = DEFAULT_COMPLETION,
+        seed: int = 0
+    ):
+        self.dimension = dimension
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.requests_per_minute = requests_per_minute
+        self.max_batch_size = max_batch_size
+        self.retry_after_seconds = retry_after_seconds
+        self.completion_text = completion_text
+
+        self.lock = threading.Lock()
+        self.random = random.Random(seed)
+        self.forced_failures: Deque[int] = deque()
+        self.window: Deque[float] = deque()
+        self.requests: Counter = Counter()
+        self.statuses: Counter = Counter()
+        self.batch_sizes: List[int] = []
+        self.connections = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def configure(self, **changes: Any) -> None:
+        with self.lock:
+            for name, value in changes.items():
+                if name == "fail_next":
+                    count, status = value if isinstance(value, (list, tuple)) else (value, 500)
+                    self.forced_failures.extend([int(status)] * int(count))
+                elif name in FAULT_FIELDS:
+                    setattr(self, name, value)
+                else:
+                    raise ValueError(f"Unknown stub setting '{name}'")
+
+    def reset_stats(self) -> None:
+        with self.lock:
+            self.requests.clear()
+            self.statuses.clear()
+            self.batch_sizes.clear()
+            self.connections = 0
+            self.peak_in_flight = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "requests": dict(self.requests),
+                "statuses": {str(status): count for status, count in self.statuses.items()},
+                "batch_sizes": list(self.batch_sizes),
+                "connections": self.connections,
+                "peak_in_flight": self.peak_in_flight
+            }
+
+    def injected_status(self) -> Optional[int]:
+        # Decides, under the lock, whether this request fails before doing work
+        with self.lock:
+            if self.forced_failures:
+                return self.forced_failures.popleft()
+
+            if self.requests_per_minute:
+                now = time.monotonic()
+                while self.window and now - self.window[0] >= 60.0:
+                    self.window.popleft()
+                if len(self.window) >= self.requests_per_minute:
+                    return 429
+                self.window.append(now)
+
+            roll = self.random.random()
+            if roll < self.rate_limit_rate:
+                return 429
+            if roll < self.rate_limit_rate + self.error_rate:
+                return 500
+        return None
+
+    def delay(self) -> float:
+        with self.lock:
+            jitter = self.random.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0
+        return (self.latency_ms + jitter) / 1000.0
+
+
+def _error_body(message: str, error_type: str, code: Optional[str] = None) -> Dict[str, Any]:
+    return {"error": {"message": message, "type": error_type, "param": None, "code": code}}
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "StubHTTPServer"
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.state.lock:
+            self.server.state.connections += 1
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        # Counted before replying, so a client reading stats() afterwards sees it
+        if self.path.startswith("/v1/"):
+            with self.server.state.lock:
+                self.server.state.statuses[status] += 1
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        return json.loads(raw or b"{}")
+
+    def do_GET(self) -> None:
+        state = self.server.state
+        if self.path == "/_stub/stats":
+            self._send_json(200, state.stats())
+        elif self.path.rstrip("/") == "/v1/models":
+            self._send_json(200, {"object": "list", "data": [
+                {"id": "stub-embedding", "object": "model", "owned_by": "minerva-stub"},
+                {"id": "stub-chat", "object": "model", "owned_by": "minerva-stub"}
+            ]})
+        else:
+            self._send_json(404, _error_body(f"Unknown path {self.path}", "invalid_request_error"))
+
+    def do_POST(self) -> None:
+        state = self.server.state
+        try:
+            payload = self._read_json()
+        except json.JSONDecodeError as error:
+            self._send_json(400, _error_body(f"Invalid JSON body: {error}", "invalid_request_error"))
+            return
+
+        if self.path == "/_stub/config":
+            try:
+                state.configure(**payload)
+            except ValueError as error:
+                self._send_json(400, _error_body(str(error), "invalid_request_error"))
+                return
+            self._send_json(200, {"ok": True})
+            return
+        if self.path == "/_stub/reset":
+            state.reset_stats()
+            self._send_json(200, {"ok": True})
+            return
+
+        path = self.path.rstrip("/")
+        if path not in ("/v1/embeddings", "/v1/chat/completions"):
+            self._send_json(404, _error_body(f"Unknown path {self.path}", "invalid_request_error"))
+            return
+
+        with state.lock:
+            state.requests[path] += 1
+            state.in_flight += 1
+            state.peak_in_flight = max(state.peak_in_flight, state.in_flight)
+        try:
+            delay = state.delay()
+            if delay > 0:
+                time.sleep(delay)
+
+            status = state.injected_status()
+            if status == 429:
+                self._send_json(
+                    429,
+                    _error_body("Rate limit reached for requests", "requests", "rate_limit_exceeded"),
+                    {"Retry-After": f"{state.retry_after_seconds:g}"}
+                )
+            elif status is not None:
+                self._send_json(status, _error_body("Injected server error", "server_error"))
+            elif path == "/v1/embeddings":
+                self._embeddings(payload)
+            else:
+                self._chat_completion(payload)
+        finally:
+            with state.lock:
+                state.in_flight -= 1
+
+    def _embeddings(self, payload: Dict[str, Any]) -> None:
+        state = self.server.state
+        inputs = payload.get("input")
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        if not isinstance(inputs, list) or not inputs:
+            self._send_json(400, _error_body("'input' must be a non-empty string or array", "invalid_request_error"))
+            return
+        if state.max_batch_size and len(inputs) > state.max_batch_size:
+            self._send_json(400, _error_body(
+                f"Too many inputs: {len(inputs)} (max {state.max_batch_size})", "invalid_request_error"
+            ))
+            return
+
+        with state.lock:
+            state.batch_sizes.append(len(inputs))
+
+        data = [
+            {"object": "embedding", "index": index, "embedding": hashed_embedding(str(text), state.dimension)}
+            for index, text in enumerate(inputs)
+        ]
+        tokens = sum(len(str(text).split()) for text in inputs)
+        self._send_json(200, {
+            "object": "list",
+            "data": data,
+            "model": payload.get("model", "stub-embedding"),
+            "usage": {"prompt_tokens": tokens, "total_tokens": tokens}
+        })
+
+    def _chat_completion(self, payload: Dict[str, Any]) -> None:
+        state = self.server.state
+        if not payload.get("messages"):
+            self._send_json(400, _error_body("'messages' is required", "invalid_request_error"))
+            return
+
+        model = payload.get("model", "stub-chat")
+        created = int(time.time())
+        text = state.completion_text
+
+        if payload.get("stream"):
+            with state.lock:
+                state.statuses[200] += 1
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+            words = text.split(" ")
+            for index, word in enumerate(words):
+                delta = {"content": word if index == 0 else " " + word}
+                if index == 0:
+                    delta["role"] = "assistant"
+                chunk = {"id": "chatcmpl-stub", "object": "chat.completion.chunk", "created": created,
+                         "model": model, "choices": [{"index": 0, "delta": delta, "finish_reason": None}]}
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            final = {"id": "chatcmpl-stub", "object": "chat.completion.chunk", "created": created,
+                     "model": model, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+            self.wfile.write(f"data: {json.dumps(final)}\n\ndata: [DONE]\n\n".encode("utf-8"))
+            return
+
+        self._send_json(200, {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop"
+            }],
+            "usage": {"prompt_tokens": 1, "completion_tokens": len(text.split()), "total_tokens": 1 + len(text.split())}
+        })
+
+
+class StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], state: StubState, verbose: bool = False):
+        super().__init__(address, StubRequestHandler)
+        self.state = state
+        self.verbose = verbose
+
+
+class OpenAIStubServer:
+    # Runs the stub in a background thread; use as a context manager in tests:
+    #
+    #     with OpenAIStubServer(max_batch_size=8) as stub:
+    #         AIProviderConfig(provider_type="lmstudio", base_url=stub.base_url, ...)
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, verbose: bool = False, **settings: Any):
+        self.state = StubState(**settings)
+        self.httpd = StubHTTPServer((host, port), self.state, verbose=verbose)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def base_url(self) -> str:
+        return f"{self.url}/v1"
+
+    def configure(self, **changes: Any) -> None:
+        self.state.configure(**changes)
+
+    def stats(self) -> Dict[str, Any]:
+        return self.state.stats()
+
+    def start(self) -> "OpenAIStubServer":
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="openai-stub",
+            daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "OpenAIStubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="OpenAI-compatible stub server for offline testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1234)
+    parser.add_argument("--dimension", type=int, default=DEFAULT_DIMENSION)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--requests-per-minute", type=int, help="Enforce a sliding-window request limit")
+    parser.add_argument("--max-batch-size", type=int, help="Reject embedding requests with more inputs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args(argv)
+
+    server = OpenAIStubServer(
+        host=args.host,
+        port=args.port,
+        verbose=args.verbose,
+        dimension=args.dimension,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        requests_per_minute=args.requests_per_minute,
+        max_batch_size=args.max_batch_size,
+        seed=args.seed
+    )
+    print(f"OpenAI-compatible stub listening on {server.base_url}", file=sys.stderr)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
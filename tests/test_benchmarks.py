@@ -0,0 +1,146 @@
+import numpy as np
+
+from benchmarks import bench_search
+from benchmarks.bench_indexing import bench_scale, create_parser, PARAMETER_FIELDS, STAGES
+from benchmarks.harness import compare_to_baseline, percentile
+from benchmarks.stub_provider import StubEmbeddingProvider, hashed_embedding
+from benchmarks.synthetic import NoteGenerator, mutate_notes
+
+
+class TestNoteGenerator:
+    def test_notes_are_deterministic(self):
+        first = NoteGenerator(seed=1).notes(5)
+        second = NoteGenerator(seed=1).notes(5)
+
+        assert first == second
+        assert NoteGenerator(seed=2).notes(5) != first
+
+    def test_notes_match_extractor_schema(self):
+        (note,) = NoteGenerator(median_chars=500, size_distribution="fixed").notes(1)
+
+        assert {"title", "markdown", "size", "modificationDate", "creationDate"} <= set(note)
+        assert note["markdown"].startswith(f"# {note['title']}")
+        assert note["size"] == len(note["markdown"].encode("utf-8"))
+        assert len(note["markdown"]) >= 500
+
+    def test_mutate_notes_modifies_adds_and_deletes(self):
+        generator = NoteGenerator(median_chars=300)
+        notes = generator.notes(100)
+
+        updated = mutate_notes(generator, notes, modified_ratio=0.1, added_ratio=0.05, deleted_ratio=0.05)
+        original_titles = {note["title"] for note in notes}
+        unchanged = [note for note in updated if note in notes]
+
+        assert len(updated) == 100
+        assert len(unchanged) == 85
+        assert sum(note["title"] not in original_titles for note in updated) == 5
+
+
+class TestStubEmbeddingProvider:
+    def test_embeddings_are_deterministic_and_normalized(self):
+        provider = StubEmbeddingProvider(dimension=64)
+
+        vector = provider.generate_embedding("alpha beta gamma")
+
+        assert vector == provider.generate_embedding("alpha beta gamma")
+        assert len(vector) == 64
+        assert abs(np.linalg.norm(vector) - 1.0) < 1e-5
+
+    def test_shared_vocabulary_means_higher_similarity(self):
+        base = np.array(hashed_embedding("kalo mine rusa tivo zeda", 256))
+        related = np.array(hashed_embedding("kalo mine rusa other words", 256))
+        unrelated = np.array(hashed_embedding("completely different vocabulary here", 256))
+
+        assert base @ related > base @ unrelated
+
+    def test_batch_counts_requests_and_texts(self):
+        provider = StubEmbeddingProvider(dimension=8)
+
+        provider.generate_embeddings_batch(["one", "two", "three"])
+
+        assert provider.calls == 1
+        assert provider.embedded_texts == 3
+        assert provider.get_embedding_metadata()["embedding_dimension"] == 8
+
+
+class TestHarness:
+    def test_percentile_interpolates(self):
+        assert percentile([1, 2, 3, 4], 0.5) == 2.5
+        assert percentile([], 0.99) == 0.0
+
+    def test_compare_flags_throughput_and_memory_regressions(self):
+        baseline = [{"notes": 10, "stage": "chunk", "notes_per_sec": 100.0, "peak_rss_mb": 100.0}]
+        results = [{"notes": 10, "stage": "chunk", "notes_per_sec": 60.0, "peak_rss_mb": 110.0}]
+
+        regressions = compare_to_baseline(
+            results, baseline, ("notes", "stage"), {"notes_per_sec": True, "peak_rss_mb": False}, 0.25
+        )
+
+        assert len(regressions) == 1
+        assert "notes_per_sec" in regressions[0]
+
+
+class TestIndexingBenchmark:
+    def test_small_run_reports_every_stage(self, monkeypatch):
+        # Leave logger levels alone for the rest of the suite
+        monkeypatch.setattr("benchmarks.bench_indexing.quiet_minerva_logging", lambda: None)
+        args = create_parser().parse_args(["--notes", "20", "--median-chars", "600", "--dimension", "16"])
+        params = {field: getattr(args, field) for field in PARAMETER_FIELDS}
+
+        rows = bench_scale(20, params)
+
+        assert [row["stage"] for row in rows] == STAGES
+        assert all(row["notes_per_sec"] > 0 for row in rows)
+        assert rows[0]["chunks"] == rows[1]["chunks"] == rows[2]["chunks"]
+        assert rows[3]["chunks"] > 0
+
+
+class TestSearchBenchmark:
+    def test_query_mix_parsing_and_generation(self):
+        mix = bench_search.parse_query_mix("topic=0.5,title=0.5")
+        generator = NoteGenerator(median_chars=300)
+
+        queries = bench_search.build_queries(generator, 10, mix, 20, seed=3)
+
+        assert mix == {"topic": 0.5, "title": 0.5}
+        assert queries == bench_search.build_queries(generator, 10, mix, 20, seed=3)
+        assert any(query.startswith("Note ") for query in queries)
+
+    def test_stage_means_from_metrics_text(self):
+        before = bench_search.parse_stage_totals(
+            'minerva_search_stage_seconds_sum{stage="ann_query"} 1.0\n'
+            'minerva_search_stage_seconds_count{stage="ann_query"} 10\n'
+        )
+        after = bench_search.parse_stage_totals(
+            'minerva_search_stage_seconds_bucket{stage="ann_query",le="0.1"} 12\n'
+            'minerva_search_stage_seconds_sum{stage="ann_query"} 1.2\n'
+            'minerva_search_stage_seconds_count{stage="ann_query"} 12\n'
+        )
+
+        assert bench_search.stage_means_ms(before, after) == {"ann_query": 100.0}
+
+    def test_inprocess_run_reports_percentiles(self, temp_dir, monkeypatch):
+        monkeypatch.setattr("benchmarks.bench_search.quiet_minerva_logging", lambda: None)
+        args = bench_search.create_parser().parse_args([
+            "--notes", "20", "--median-chars", "600", "--dimension", "16", "--requests", "6",
+            "--warmup", "1", "--concurrency", "2", "--context-modes", "enhanced"
+        ])
+
+        (row,) = bench_search.run_benchmark(args, str(temp_dir / "chromadb"))
+
+        assert row["mode"] == "inprocess"
+        assert row["requests"] == 6 and row["errors"] == 0
+        assert row["p50_ms"] <= row["p95_ms"] <= row["p99_ms"]
+        assert "ann_query" in row["stages_ms"]
+
+    def test_inprocess_run_with_exact_engine(self, temp_dir, monkeypatch):
+        monkeypatch.setattr("benchmarks.bench_search.quiet_minerva_logging", lambda: None)
+        args = bench_search.create_parser().parse_args([
+            "--notes", "20", "--median-chars", "600", "--dimension", "16", "--requests", "4",
+            "--warmup", "1", "--concurrency", "2", "--context-modes", "chunk_only", "--search-engine", "exact"
+        ])
+
+        (row,) = bench_search.run_benchmark(args, str(temp_dir / "chromadb"))
+
+        assert row["errors"] == 0
+        assert "exact_query" in row["stages_ms"]
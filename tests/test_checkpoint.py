@@ -0,0 +1,152 @@
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from minerva.commands.index import embed_with_checkpoint, run_full_indexing
+from minerva.common.exceptions import IndexingError
+from minerva.common.models import Chunk, ChunkWithEmbedding
+from minerva.indexing.checkpoint import EmbeddingJournal, checkpoint_fingerprint, default_checkpoint_dir
+from tests.helpers.config_builders import make_index_config
+
+FINGERPRINT = {"version": 2, "collection": "notes", "chunk_size": 1200, "embedding_model": "m"}
+
+
+def _chunk(i, content=None):
+    return Chunk(id=f"c{i}", content=content or f"chunk {i}", noteId="n1", title="Note", modificationDate="2025-01-01",
+                 creationDate="2025-01-01", size=10, chunkIndex=i)
+
+
+def _embedded(i):
+    return ChunkWithEmbedding(chunk=_chunk(i), embedding=[float(i), 0.5, -1.0])
+
+
+def _journal(temp_dir: Path, fingerprint=FINGERPRINT, batch_size=2):
+    return EmbeddingJournal(temp_dir / "checkpoints", "notes", fingerprint, batch_size=batch_size)
+
+
+class TestEmbeddingJournal:
+    def test_resume_loads_every_durable_record(self, temp_dir: Path):
+        journal = _journal(temp_dir).open(resume=False)
+        for i in range(5):
+            journal.record(_embedded(i))
+        journal.close()
+
+        resumed = _journal(temp_dir).open(resume=True)
+
+        assert sorted(resumed.completed) == ['c0', 'c1', 'c2', 'c3', 'c4']
+        assert resumed.completed['c3'].tolist() == [3.0, 0.5, -1.0]
+
+    def test_only_full_batches_are_written_before_close(self, temp_dir: Path):
+        journal = _journal(temp_dir).open(resume=False)
+        for i in range(3):
+            journal.record(_embedded(i))
+
+        assert sorted(_journal(temp_dir).open(resume=True).completed) == ['c0', 'c1']
+
+    def test_torn_record_is_dropped_and_appending_continues(self, temp_dir: Path):
+        journal = _journal(temp_dir).open(resume=False)
+        for i in range(4):
+            journal.record(_embedded(i))
+        journal.close()
+        with open(journal.journal_path, "ab") as handle:
+            handle.write(b"MVJ2\x02\x00\x00")
+
+        resumed = _journal(temp_dir).open(resume=True)
+        resumed.record(_embedded(4))
+        resumed.record(_embedded(5))
+        resumed.close()
+
+        assert sorted(_journal(temp_dir).open(resume=True).completed) == ['c0', 'c1', 'c2', 'c3', 'c4', 'c5']
+
+    def test_different_configuration_is_refused(self, temp_dir: Path):
+        journal = _journal(temp_dir).open(resume=False)
+        journal.record(_embedded(0))
+        journal.close()
+
+        with pytest.raises(IndexingError):
+            _journal(temp_dir, fingerprint={**FINGERPRINT, "chunk_size": 800}).open(resume=True)
+
+    def test_fresh_run_discards_the_old_journal(self, temp_dir: Path):
+        journal = _journal(temp_dir).open(resume=False)
+        journal.record(_embedded(0))
+        journal.close()
+
+        _journal(temp_dir).open(resume=False).close()
+
+        assert _journal(temp_dir).open(resume=True).completed == {}
+
+    def test_missing_journal_starts_over(self, temp_dir: Path):
+        assert _journal(temp_dir).open(resume=True).completed == {}
+
+
+class TestEmbedWithCheckpoint:
+    def _generate(self, provider, chunks, embedded_callback=None):
+        results = [ChunkWithEmbedding(chunk=chunk, embedding=[float(chunk.chunkIndex), 0.5, -1.0]) for chunk in chunks]
+        for item in results:
+            embedded_callback(item)
+        return results
+
+    @patch('minerva.commands.index.generate_embeddings')
+    def test_only_missing_chunks_are_embedded(self, mock_generate, temp_dir: Path):
+        mock_generate.side_effect = self._generate
+        journal = _journal(temp_dir).open(resume=False)
+        for i in (0, 2):
+            journal.record(_embedded(i))
+        journal.close()
+
+        resumed = _journal(temp_dir).open(resume=True)
+        chunks = [_chunk(i) for i in range(4)]
+        embedded = embed_with_checkpoint(Mock(), chunks, resumed)
+        resumed.close()
+
+        assert [chunk.id for chunk in mock_generate.call_args.args[1]] == ['c1', 'c3']
+        assert [item.chunk.id for item in embedded] == ['c0', 'c1', 'c2', 'c3']
+        assert embedded[2].embedding == [2.0, 0.5, -1.0]
+        assert resumed.durable_count == 4
+
+    @patch('minerva.commands.index.generate_embeddings')
+    def test_chunk_with_changed_text_is_embedded_again(self, mock_generate, temp_dir: Path):
+        mock_generate.side_effect = self._generate
+        journal = _journal(temp_dir).open(resume=False)
+        for i in range(2):
+            journal.record(_embedded(i))
+        journal.close()
+
+        resumed = _journal(temp_dir).open(resume=True)
+        # Same chunk ID: the note was edited without a new modification date
+        chunks = [_chunk(0), _chunk(1, content="chunk 1, edited")]
+        embedded = embed_with_checkpoint(Mock(), chunks, resumed)
+        resumed.close()
+
+        assert [chunk.id for chunk in mock_generate.call_args.args[1]] == ['c1']
+        assert embedded[1].chunk.content == "chunk 1, edited"
+        assert _journal(temp_dir).open(resume=True).embedding_for(chunks[1]).tolist() == [1.0, 0.5, -1.0]
+
+
+class TestRunFullIndexing:
+    @patch('minerva.commands.index.create_chunks_from_notes')
+    @patch('minerva.commands.index.generate_embeddings')
+    def test_unexpected_error_still_flushes_the_journal(self, mock_generate, mock_chunks, temp_dir: Path):
+        config, _ = make_index_config(temp_dir)
+        provider = Mock()
+        provider.get_embedding_metadata.return_value = {'embedding_dimension': 3}
+        mock_chunks.return_value = [_chunk(i) for i in range(3)]
+
+        def fail_after_embedding(provider, chunks, embedded_callback=None):
+            for chunk in chunks:
+                embedded_callback(ChunkWithEmbedding(chunk=chunk, embedding=[1.0, 0.5, -1.0]))
+            raise ValueError("setting an array element with a sequence")
+
+        mock_generate.side_effect = fail_after_embedding
+
+        with pytest.raises(ValueError):
+            run_full_indexing(config, [], False, 0.0, provider)
+
+        journal = EmbeddingJournal(
+            default_checkpoint_dir(config.chromadb_path),
+            config.collection.name,
+            checkpoint_fingerprint(config, 3)
+        ).open(resume=True)
+        journal.close()
+        assert sorted(journal.completed) == ['c0', 'c1', 'c2']
@@ -0,0 +1,131 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from minerva.common.metrics import CACHE_REQUESTS
+from minerva.server.chunk_cache import CACHE_NAME, ChunkCache
+from minerva.server.context_retrieval import apply_context_mode
+
+
+def _collection(name="notes", last_updated="2025-01-01T00:00:00"):
+    store = {
+        f"c{i}": (f"Chunk {i} text.", {
+            'noteId': 'n1',
+            'chunkIndex': i,
+            'adjacent_chunk_ids': ':'.join(
+                f"c{j}" if 0 <= j < 5 else '' for j in (i - 2, i - 1, i + 1, i + 2)
+            )
+        })
+        for i in range(5)
+    }
+
+    def fake_get(ids=None, include=None, **kwargs):
+        found = [chunk_id for chunk_id in ids if chunk_id in store]
+        return {
+            'ids': found,
+            'documents': [store[chunk_id][0] for chunk_id in found],
+            'metadatas': [store[chunk_id][1] for chunk_id in found]
+        }
+
+    collection = MagicMock()
+    collection.name = name
+    collection.metadata = {'last_updated': last_updated}
+    collection.get.side_effect = fake_get
+    return collection
+
+
+def _fetched_ids(collection):
+    return [chunk_id for call in collection.get.call_args_list for chunk_id in call.kwargs['ids']]
+
+
+class TestChunkCache:
+    def test_second_lookup_is_served_from_memory(self):
+        cache = ChunkCache(100)
+        collection = _collection()
+
+        first = cache.get(collection, ['c1', 'c2'])
+        second = cache.get(collection, ['c2', 'c1', 'missing'])
+
+        assert collection.get.call_count == 2
+        assert _fetched_ids(collection) == ['c1', 'c2', 'missing']
+        assert first['ids'] == ['c1', 'c2']
+        assert second['ids'] == ['c2', 'c1']
+        assert second['documents'] == ['Chunk 2 text.', 'Chunk 1 text.']
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ChunkCache(2)
+        collection = _collection()
+
+        cache.get(collection, ['c0', 'c1'])
+        cache.get(collection, ['c0'])
+        cache.get(collection, ['c2'])
+        collection.get.reset_mock()
+        cache.get(collection, ['c0', 'c1', 'c2'])
+
+        assert len(cache) == 2
+        assert _fetched_ids(collection) == ['c1']
+
+    def test_changed_last_updated_drops_only_that_collection(self):
+        cache = ChunkCache(100)
+        notes = _collection("notes")
+        docs = _collection("docs")
+        cache.get(notes, ['c0'])
+        cache.get(docs, ['c0'])
+
+        notes.metadata = {'last_updated': '2025-02-01T00:00:00'}
+        notes.get.reset_mock()
+        docs.get.reset_mock()
+        cache.get(notes, ['c0'])
+        cache.get(docs, ['c0'])
+
+        assert notes.get.call_count == 1
+        assert docs.get.call_count == 0
+
+    def test_lookups_are_counted(self):
+        cache = ChunkCache(100)
+        collection = _collection()
+        hits = CACHE_REQUESTS.value(cache=CACHE_NAME, result="hit")
+        misses = CACHE_REQUESTS.value(cache=CACHE_NAME, result="miss")
+
+        cache.get(collection, ['c0', 'c1'])
+        cache.get(collection, ['c0', 'c1', 'c2'])
+
+        assert CACHE_REQUESTS.value(cache=CACHE_NAME, result="hit") == hits + 2
+        assert CACHE_REQUESTS.value(cache=CACHE_NAME, result="miss") == misses + 3
+
+    def test_rejects_empty_cache(self):
+        with pytest.raises(ValueError):
+            ChunkCache(0)
+
+
+class TestEnhancedContextWithCache:
+    def _results(self):
+        return [{
+            'chunkId': 'c2',
+            'noteTitle': 'Note',
+            'noteId': 'n1',
+            'chunkIndex': 2,
+            'collectionName': 'notes',
+            'similarityScore': 0.9,
+            'content': 'Chunk 2 text.',
+            'totalChunks': 1
+        }]
+
+    def test_repeated_search_skips_chromadb(self):
+        cache = ChunkCache(100)
+        collection = _collection()
+
+        first = apply_context_mode(collection, self._results(), "enhanced", chunk_cache=cache)
+        collection.get.reset_mock()
+        second = apply_context_mode(collection, self._results(), "enhanced", chunk_cache=cache)
+
+        assert collection.get.call_count == 0
+        assert second[0]['content'] == first[0]['content']
+        assert second[0]['totalChunks'] == 5
+
+    def test_matched_chunks_are_not_fetched_twice(self):
+        collection = _collection()
+
+        apply_context_mode(collection, self._results(), "enhanced")
+
+        assert sorted(_fetched_ids(collection)) == ['c0', 'c1', 'c2', 'c3', 'c4']
@@ -0,0 +1,70 @@
+from minerva.common.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=3, cooldown_seconds=30, clock=_Clock())
+
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert not breaker.allow_request()
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=2, clock=_Clock())
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CLOSED
+        assert breaker.consecutive_failures == 1
+
+    def test_single_trial_after_cooldown(self):
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=30, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 10
+        assert breaker.retry_after() == 20
+        assert not breaker.allow_request()
+
+        clock.now = 30
+        assert breaker.allow_request()
+        assert breaker.state == HALF_OPEN
+        assert not breaker.allow_request()
+
+    def test_failed_trial_reopens_for_full_cooldown(self):
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 30
+        breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == OPEN
+        assert breaker.retry_after() == 30
+
+    def test_successful_trial_closes(self):
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 30
+        breaker.allow_request()
+
+        breaker.record_success()
+
+        assert breaker.state == CLOSED
+        assert breaker.allow_request()
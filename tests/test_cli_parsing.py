@@ -247,6 +247,11 @@ class TestDefaultValues:
         args = parser.parse_args(['index', '--config', 'config.json'])
         assert args.dry_run is False
 
+    def test_index_resume_defaults_to_false(self):
+        parser = create_parser()
+        assert parser.parse_args(['index', '--config', 'config.json']).resume is False
+        assert parser.parse_args(['index', '--config', 'config.json', '--resume']).resume is True
+
     def test_validate_verbose_defaults_to_false(self):
         parser = create_parser()
         args = parser.parse_args(['validate', 'notes.json'])
@@ -0,0 +1,78 @@
+"""
+Import-time budget for the minerva CLI.
+
+Other tools (watcher, webhook orchestrator, minerva-kb, minerva-doc) shell out
+to `minerva` constantly, so every subcommand must only import what it needs.
+Each check runs `python -X importtime` in a fresh interpreter and dispatches
+the subcommand the same way `minerva.cli.main` does.
+"""
+
+import subprocess
+import sys
+from typing import Dict, Set, Tuple
+
+import pytest
+
+HEAVY_MODULES = {"litellm", "chromadb", "langchain_text_splitters", "tiktoken", "mcp"}
+
+# subcommand -> (top-level modules that must not be imported, budget in ms)
+# Budgets are deliberately generous: they catch regressions such as a heavy
+# top-level import sneaking back in, not small fluctuations between machines.
+STARTUP_BUDGETS: Dict[str, Tuple[Set[str], int]] = {
+    "validate": (HEAVY_MODULES | {"numpy"}, 1500),
+    "keychain": (HEAVY_MODULES | {"numpy"}, 1500),
+    "peek": ({"litellm", "langchain_text_splitters", "tiktoken", "mcp"}, 6000),
+    "remove": ({"litellm", "langchain_text_splitters", "tiktoken", "mcp"}, 6000),
+    "hnsw-eval": ({"litellm", "langchain_text_splitters", "tiktoken", "mcp"}, 6000),
+    "export-vectors": ({"litellm", "langchain_text_splitters", "tiktoken", "mcp"}, 6000),
+}
+
+
+def _import_profile(statement: str) -> Tuple[Set[str], float]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        timeout=120
+    )
+    assert completed.returncode == 0, completed.stderr
+
+    modules: Set[str] = set()
+    total_us = 0
+    for line in completed.stderr.splitlines():
+        # Format: "import time: <self us> | <cumulative us> | <indented module name>"
+        if not line.startswith("import time:"):
+            continue
+        self_us, _, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if not self_us.isdigit():
+            continue  # header line
+        total_us += int(self_us)
+        modules.add(name.split(".")[0])
+
+    return modules, total_us / 1000.0
+
+
+class TestCliStartup:
+    def test_cli_module_imports_no_heavy_dependencies(self):
+        modules, _ = _import_profile("import minerva.cli")
+
+        assert not modules & (HEAVY_MODULES | {"numpy"})
+
+    @pytest.mark.parametrize("command", sorted(STARTUP_BUDGETS))
+    def test_subcommand_startup_budget(self, command):
+        forbidden, budget_ms = STARTUP_BUDGETS[command]
+
+        modules, elapsed_ms = _import_profile(
+            f"import minerva.cli; minerva.cli.load_command_handler({command!r})"
+        )
+
+        assert not modules & forbidden, f"'{command}' imports {sorted(modules & forbidden)}"
+        assert elapsed_ms < budget_ms, f"'{command}' import time {elapsed_ms:.0f}ms exceeds {budget_ms}ms"
+
+    def test_every_subcommand_has_a_handler(self):
+        from minerva.cli import COMMAND_HANDLERS, create_parser
+
+        parser = create_parser()
+        subparsers = next(action for action in parser._actions if action.dest == "command")
+
+        assert set(subparsers.choices) == set(COMMAND_HANDLERS)
@@ -0,0 +1,167 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+from minerva.server import collection_discovery
+
+
+def _metadata(model: str = "embed") -> dict:
+    return {
+        'embedding_provider': 'ollama',
+        'embedding_model': model,
+        'llm_model': 'llm',
+        'embedding_base_url': 'http://localhost:11434',
+        'embedding_api_key_ref': None,
+        'description': 'desc'
+    }
+
+
+class _FakeCollection:
+    def __init__(self, name: str, metadata: dict):
+        self.name = name
+        self.metadata = metadata
+
+    def count(self) -> int:
+        return 3
+
+
+class _FakeClient:
+    def __init__(self, collections):
+        self._collections = collections
+
+    def list_collections(self):
+        return self._collections
+
+
+def _fake_provider_factory(created: list, available: bool = True, block: threading.Event = None):
+    def factory(config):
+        provider = MagicMock()
+        provider.embedding_model = config.embedding_model
+
+        def check():
+            if block is not None and config.embedding_model == "slow":
+                block.wait(5)
+            return {'available': available, 'error': None if available else 'down'}
+
+        provider.check_availability.side_effect = check
+        created.append(provider)
+        return provider
+    return factory
+
+
+class TestSharedProviders:
+    def test_collections_with_same_config_share_one_probed_provider(self, monkeypatch):
+        collections = [_FakeCollection(f"c{i}", _metadata()) for i in range(5)]
+        monkeypatch.setattr(collection_discovery, "initialize_chromadb_client", lambda _path: _FakeClient(collections))
+        created = []
+
+        with patch.object(collection_discovery, "AIProvider", side_effect=_fake_provider_factory(created)):
+            provider_map, details = collection_discovery.discover_collections_with_providers("/tmp/db")
+
+        assert len(created) == 1
+        assert created[0].check_availability.call_count == 1
+        assert len({id(provider) for provider in provider_map.values()}) == 1
+        assert all(detail['available'] for detail in details)
+
+    def test_distinct_configs_get_separate_providers(self, monkeypatch):
+        collections = [_FakeCollection("a", _metadata("one")), _FakeCollection("b", _metadata("two"))]
+        monkeypatch.setattr(collection_discovery, "initialize_chromadb_client", lambda _path: _FakeClient(collections))
+        created = []
+
+        with patch.object(collection_discovery, "AIProvider", side_effect=_fake_provider_factory(created)):
+            provider_map, _ = collection_discovery.discover_collections_with_providers("/tmp/db")
+
+        assert len(created) == 2
+        assert provider_map['a'] is not provider_map['b']
+
+    def test_hung_probe_times_out(self):
+        release = threading.Event()
+        created = []
+
+        try:
+            with patch.object(collection_discovery, "AIProvider", side_effect=_fake_provider_factory(created, block=release)):
+                resolved = collection_discovery.resolve_shared_providers(
+                    [_metadata("slow"), _metadata("fast")], probe_timeout=0.2
+                )
+        finally:
+            release.set()
+
+        slow = resolved[collection_discovery.provider_key_from_metadata(_metadata("slow"))]
+        fast = resolved[collection_discovery.provider_key_from_metadata(_metadata("fast"))]
+        assert slow[0] is None and "timed out" in slow[1]
+        assert fast[0] is not None
+
+    def test_failed_probe_names_the_provider(self):
+        provider = MagicMock(provider_type='ollama', embedding_model='embed', base_url='http://localhost:11434')
+        provider.check_availability.side_effect = RuntimeError("connection reset")
+
+        reason = collection_discovery.probe_provider(provider)
+
+        assert reason == (
+            "Availability check failed for provider 'ollama/embed' at http://localhost:11434: connection reset"
+        )
+
+    def test_missing_metadata_is_unavailable_without_probe(self):
+        resolved = collection_discovery.resolve_shared_providers([{}])
+
+        provider, reason = resolved[collection_discovery.provider_key_from_metadata({})]
+        assert provider is None
+        assert "Missing AI provider metadata" in reason
+
+
+class TestCollectionChanges:
+    def test_new_collection_reuses_known_provider_without_probe(self, monkeypatch):
+        collections = [_FakeCollection("old", _metadata()), _FakeCollection("new", _metadata())]
+        monkeypatch.setattr(collection_discovery, "initialize_chromadb_client", lambda _path: _FakeClient(collections))
+        existing = MagicMock()
+        created = []
+
+        with patch.object(collection_discovery, "AIProvider", side_effect=_fake_provider_factory(created)):
+            changes = collection_discovery.discover_collection_changes("/tmp/db", {"old"}, {"old": existing})
+
+        assert created == []
+        assert changes.providers == {"new": existing}
+        assert [detail['name'] for detail in changes.added] == ["new"]
+        assert changes.removed == []
+
+    def test_only_new_configurations_are_probed(self, monkeypatch):
+        collections = [_FakeCollection("old", _metadata("one")), _FakeCollection("new", _metadata("two"))]
+        monkeypatch.setattr(collection_discovery, "initialize_chromadb_client", lambda _path: _FakeClient(collections))
+        created = []
+
+        with patch.object(collection_discovery, "AIProvider", side_effect=_fake_provider_factory(created)):
+            changes = collection_discovery.discover_collection_changes("/tmp/db", {"old"}, {"old": MagicMock()})
+
+        assert [provider.embedding_model for provider in created] == ["two"]
+        assert changes.providers["new"] is created[0]
+
+    def test_deleted_collection_is_reported(self, monkeypatch):
+        collections = [_FakeCollection("kept", _metadata())]
+        monkeypatch.setattr(collection_discovery, "initialize_chromadb_client", lambda _path: _FakeClient(collections))
+
+        changes = collection_discovery.discover_collection_changes(
+            "/tmp/db", {"kept", "gone"}, {"kept": MagicMock(), "gone": MagicMock()}
+        )
+
+        assert changes.removed == ["gone"]
+        assert changes.added == []
+
+
+class TestLazyDiscovery:
+    def test_registry_mode_records_metadata_without_building_providers(self, monkeypatch):
+        from minerva.server.provider_registry import LazyProviderRegistry
+
+        collections = [_FakeCollection("ready", _metadata()), _FakeCollection("old", {'description': 'd'})]
+        monkeypatch.setattr(collection_discovery, "initialize_chromadb_client", lambda _path: _FakeClient(collections))
+        registry = LazyProviderRegistry()
+        created = []
+
+        with patch.object(collection_discovery, "AIProvider", side_effect=_fake_provider_factory(created)):
+            provider_map, details = collection_discovery.discover_collections_with_providers(
+                "/tmp/db", registry=registry
+            )
+
+        assert created == []
+        assert provider_map == {}
+        assert registry.names() == ["ready"]
+        assert [detail['available'] for detail in details] == [True, False]
+        assert "Missing AI provider metadata" in details[1]['unavailable_reason']
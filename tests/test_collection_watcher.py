@@ -0,0 +1,51 @@
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from minerva.server.collection_watcher import CollectionWatcher, chromadb_fingerprint
+
+
+def _touch(path: Path, content: str) -> None:
+    path.write_text(content)
+    # Make the change visible on filesystems with coarse timestamps
+    later = time.time() + 5
+    os.utime(path, (later, later))
+
+
+class TestCollectionWatcher:
+    def test_unchanged_directory_does_not_refresh(self, temp_dir):
+        (Path(temp_dir) / "chroma.sqlite3").write_text("db")
+        on_change = MagicMock()
+        watcher = CollectionWatcher(str(temp_dir), 60, on_change)
+
+        assert watcher.check() is False
+        on_change.assert_not_called()
+
+    def test_sysdb_write_triggers_refresh_once(self, temp_dir):
+        sysdb = Path(temp_dir) / "chroma.sqlite3"
+        sysdb.write_text("db")
+        on_change = MagicMock()
+        watcher = CollectionWatcher(str(temp_dir), 60, on_change)
+
+        _touch(sysdb, "db with a new collection")
+
+        assert watcher.check() is True
+        assert watcher.check() is False
+        on_change.assert_called_once()
+
+    def test_failed_refresh_is_retried(self, temp_dir):
+        on_change = MagicMock(side_effect=[RuntimeError("locked"), None])
+        watcher = CollectionWatcher(str(temp_dir), 60, on_change)
+        _touch(Path(temp_dir) / "chroma.sqlite3-wal", "wal")
+
+        try:
+            watcher.check()
+        except RuntimeError:
+            pass
+
+        assert watcher.check() is True
+        assert on_change.call_count == 2
+
+    def test_fingerprint_marks_missing_files(self, temp_dir):
+        assert chromadb_fingerprint(str(temp_dir)) == (None, None)
@@ -0,0 +1,209 @@
+from unittest.mock import MagicMock
+
+from minerva.indexing.chunking import chunk_markdown_content
+from minerva.server.context_retrieval import (
+    apply_context_mode,
+    find_chunk_overlap,
+    merge_note_windows,
+    stitch_chunks,
+)
+
+
+def _long_text(sentences: int = 120) -> str:
+    return " ".join(
+        f"Sentence number {i} explains detail {i % 7} of the subject." for i in range(sentences)
+    )
+
+
+def _indexed_chunks(text: str):
+    return [
+        {'index': i, 'content': chunk['content']}
+        for i, chunk in enumerate(chunk_markdown_content(text))
+    ]
+
+
+def _result(note_id: str, chunk_index: int, chunk_id: str, content: str = "match") -> dict:
+    return {
+        'chunkId': chunk_id,
+        'noteTitle': f"Note {note_id}",
+        'noteId': note_id,
+        'chunkIndex': chunk_index,
+        'modificationDate': '2025-01-01T00:00:00Z',
+        'collectionName': 'test_collection',
+        'similarityScore': 0.9,
+        'content': content,
+        'totalChunks': 1
+    }
+
+
+class TestFindChunkOverlap:
+    def test_detects_splitter_overlap(self):
+        chunks = _indexed_chunks(_long_text())
+        assert len(chunks) > 2
+
+        overlap = find_chunk_overlap(chunks[0]['content'], chunks[1]['content'])
+
+        assert overlap > 0
+        assert chunks[0]['content'].endswith(chunks[1]['content'][:overlap])
+
+    def test_returns_zero_without_overlap(self):
+        assert find_chunk_overlap("First paragraph about cats.", "Second paragraph about dogs.") == 0
+
+    def test_ignores_short_coincidental_overlap(self):
+        assert find_chunk_overlap("ends with the", "the start of something") == 0
+
+
+class TestStitchChunks:
+    def test_stitched_text_has_no_duplicated_overlap(self):
+        text = _long_text()
+        chunks = _indexed_chunks(text)
+
+        stitched = stitch_chunks(chunks, set(), style="window")
+
+        assert stitched == text
+
+    def test_matched_chunk_is_kept_whole(self):
+        chunks = _indexed_chunks(_long_text())[:3]
+
+        stitched = stitch_chunks(chunks, {1}, style="window")
+
+        assert f"[MATCH START]\n\n{chunks[1]['content']}\n\n[MATCH END]" in stitched
+        assert len(stitched) < sum(len(chunk['content']) for chunk in chunks) + 40
+
+    def test_non_overlapping_chunks_keep_paragraph_separator(self):
+        chunks = [
+            {'index': 0, 'content': "# Header A\n\nAlpha section."},
+            {'index': 1, 'content': "# Header B\n\nBeta section."},
+        ]
+
+        stitched = stitch_chunks(chunks, {1}, style="window")
+
+        assert stitched == "# Header A\n\nAlpha section.\n\n[MATCH START]\n\n# Header B\n\nBeta section.\n\n[MATCH END]"
+
+    def test_full_note_style_marks_matches(self):
+        chunks = [
+            {'index': 0, 'content': "Intro."},
+            {'index': 1, 'content': "Body."},
+        ]
+
+        stitched = stitch_chunks(chunks, {1}, style="full_note")
+
+        assert stitched == "Intro.\n\n[MATCH AT CHUNK 1]\n\nBody."
+
+
+class TestMergeNoteWindows:
+    def _window(self, note_id: str, matched: int, low: int, high: int) -> dict:
+        return {
+            'result': _result(note_id, matched, f"{note_id}-{matched}"),
+            'chunks': [{'index': i, 'content': f"{note_id} chunk {i}"} for i in range(low, high + 1)]
+        }
+
+    def test_overlapping_windows_from_same_note_are_merged(self):
+        windows = [self._window('a', 2, 0, 4), self._window('a', 4, 2, 6)]
+
+        merged = merge_note_windows(windows)
+
+        assert len(merged) == 1
+        assert [chunk['index'] for chunk in merged[0]['chunks']] == list(range(0, 7))
+        assert merged[0]['matched'] == {2, 4}
+        assert merged[0]['result']['chunkIndex'] == 2
+
+    def test_windows_from_different_notes_stay_separate(self):
+        windows = [self._window('a', 2, 0, 4), self._window('b', 2, 0, 4)]
+
+        merged = merge_note_windows(windows)
+
+        assert [entry['result']['noteId'] for entry in merged] == ['a', 'b']
+
+    def test_distant_windows_from_same_note_stay_separate(self):
+        windows = [self._window('a', 2, 0, 4), self._window('a', 20, 18, 22)]
+
+        assert len(merge_note_windows(windows)) == 2
+
+    def test_bridging_window_joins_earlier_windows(self):
+        windows = [
+            self._window('a', 2, 0, 4),
+            self._window('a', 10, 8, 12),
+            self._window('a', 6, 4, 8),
+        ]
+
+        merged = merge_note_windows(windows)
+
+        assert len(merged) == 1
+        assert merged[0]['matched'] == {2, 6, 10}
+        assert merged[0]['result']['chunkIndex'] == 2
+
+
+class TestApplyContextModeStitching:
+    def test_enhanced_mode_merges_hits_in_same_note(self):
+        chunks = _indexed_chunks(_long_text(200))[:6]
+        ids = [f"c{i}" for i in range(len(chunks))]
+
+        def adjacent(i):
+            def get(j):
+                return ids[j] if 0 <= j < len(ids) else ''
+            return ':'.join([get(i - 2), get(i - 1), get(i + 1), get(i + 2)])
+
+        store = {
+            ids[i]: (chunk['content'], {'noteId': 'n1', 'chunkIndex': i, 'adjacent_chunk_ids': adjacent(i)})
+            for i, chunk in enumerate(chunks)
+        }
+
+        def fake_get(ids=None, include=None, **kwargs):
+            found = [chunk_id for chunk_id in ids if chunk_id in store]
+            return {
+                'ids': found,
+                'documents': [store[chunk_id][0] for chunk_id in found],
+                'metadatas': [store[chunk_id][1] for chunk_id in found]
+            }
+
+        collection = MagicMock()
+        collection.get.side_effect = fake_get
+
+        results = [
+            _result('n1', 2, 'c2', chunks[2]['content']),
+            _result('n1', 3, 'c3', chunks[3]['content']),
+        ]
+
+        enhanced = apply_context_mode(collection, results, "enhanced")
+
+        assert len(enhanced) == 1
+        assert enhanced[0]['matchedChunkIndices'] == [2, 3]
+        assert enhanced[0]['totalChunks'] == 6
+        assert enhanced[0]['content'].count("[MATCH START]") == 2
+
+    def test_full_note_mode_returns_note_once(self):
+        collection = MagicMock()
+        collection.get.return_value = {
+            'ids': ['c0', 'c1', 'c2'],
+            'documents': ['Part zero.', 'Part one.', 'Part two.'],
+            'metadatas': [
+                {'noteId': 'n1', 'chunkIndex': 0},
+                {'noteId': 'n1', 'chunkIndex': 1},
+                {'noteId': 'n1', 'chunkIndex': 2},
+            ]
+        }
+
+        results = [_result('n1', 2, 'c2'), _result('n1', 0, 'c0')]
+
+        full = apply_context_mode(collection, results, "full_note")
+
+        assert len(full) == 1
+        assert collection.get.call_count == 1
+        assert full[0]['content'] == (
+            "[MATCH AT CHUNK 0]\n\nPart zero.\n\nPart one.\n\n[MATCH AT CHUNK 2]\n\nPart two."
+        )
+
+    def test_full_note_mode_accepts_chunks_without_chunk_index(self):
+        # Collections from older pipeline versions may lack chunkIndex metadata
+        collection = MagicMock()
+        collection.get.return_value = {
+            'ids': ['c0'],
+            'documents': ['Only part.'],
+            'metadatas': [{'noteId': 'n1'}]
+        }
+
+        full = apply_context_mode(collection, [_result('n1', 0, 'c0')], "full_note")
+
+        assert len(full) == 1
+        assert "Only part." in full[0]['content']
@@ -0,0 +1,132 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from minerva.indexing.storage import initialize_chromadb_client
+from minerva.server.diversification import (
+    cap_results_per_note,
+    diversity_candidate_count,
+    mmr_select,
+)
+from minerva.server.search_tools import SearchError, search_knowledge_base, search_knowledge_base_batch
+
+
+class TestMmrSelect:
+    def test_plain_relevance_without_vectors(self):
+        assert mmr_select([0.2, 0.9, 0.5], None, ["a", "b", "c"], k=2) == [1, 2]
+
+    def test_near_duplicates_are_skipped(self):
+        vectors = np.array([[1.0, 0.0], [0.99, 0.01], [0.0, 1.0]])
+
+        picks = mmr_select([0.95, 0.94, 0.80], vectors, ["a", "b", "c"], k=2, lambda_=0.5)
+
+        assert picks == [0, 2]
+
+    def test_lambda_one_is_plain_ranking(self):
+        vectors = np.array([[1.0, 0.0], [1.0, 0.0], [0.0, 1.0]])
+
+        assert mmr_select([0.9, 0.8, 0.7], vectors, ["a", "b", "c"], k=2, lambda_=1.0) == [0, 1]
+
+    def test_max_per_note(self):
+        picks = mmr_select([0.9, 0.8, 0.7, 0.6], None, ["a", "a", "a", "b"], k=3, max_per_note=2)
+
+        assert picks == [0, 1, 3]
+
+    def test_fewer_candidates_than_k(self):
+        assert mmr_select([0.9], None, ["a"], k=5) == [0]
+        assert mmr_select([], None, [], k=5) == []
+
+
+class TestCapResultsPerNote:
+    def test_caps_per_collection_and_note(self):
+        results = [
+            {"collectionName": "one", "noteId": "n1"},
+            {"collectionName": "one", "noteId": "n1"},
+            {"collectionName": "two", "noteId": "n1"},
+        ]
+
+        assert cap_results_per_note(results, 1) == [results[0], results[2]]
+        assert cap_results_per_note(results, None) == results
+
+
+def test_candidate_count_over_fetches():
+    assert diversity_candidate_count(2) == 15
+    assert diversity_candidate_count(10) == 30
+
+
+@pytest.fixture
+def long_note_collection(temp_dir: Path):
+    # Five adjacent, nearly identical chunks of one long note plus two other notes
+    chromadb_path = str(temp_dir / "chromadb")
+    client = initialize_chromadb_client(chromadb_path)
+    collection = client.create_collection(
+        name="notes",
+        metadata={"hnsw:space": "cosine", "embedding_dimension": 3, "embedding_model": "stub"}
+    )
+    embeddings = [[0.8, 0.6, 0.01 * index] for index in range(5)] + [[0.75, 0.0, 0.66], [0.7, -0.7, 0.1]]
+    note_ids = ["long"] * 5 + ["other-1", "other-2"]
+    collection.add(
+        ids=[f"chunk-{index}" for index in range(7)],
+        embeddings=embeddings,
+        documents=[f"text {index}" for index in range(7)],
+        metadatas=[
+            {"title": note_id, "noteId": note_id, "chunkIndex": index if note_id == "long" else 0}
+            for index, note_id in enumerate(note_ids)
+        ]
+    )
+    provider = MagicMock()
+    provider.generate_embedding.return_value = [1.0, 0.0, 0.0]
+    provider.generate_embeddings_batch.return_value = [[1.0, 0.0, 0.0], [0.7, 0.0, 0.7]]
+    return chromadb_path, provider
+
+
+class TestDiversifiedSearch:
+    def search(self, chromadb_path, provider, **kwargs):
+        return search_knowledge_base(
+            query="long note topic",
+            collection_name="notes",
+            chromadb_path=chromadb_path,
+            provider=provider,
+            context_mode="chunk_only",
+            max_results=3,
+            **kwargs
+        )
+
+    def test_default_search_returns_one_note(self, long_note_collection):
+        results = self.search(*long_note_collection)
+
+        assert {result["noteId"] for result in results} == {"long"}
+
+    def test_max_per_note_fills_with_other_notes(self, long_note_collection):
+        results = self.search(*long_note_collection, max_per_note=1)
+
+        assert [result["noteId"] for result in results] == ["long", "other-1", "other-2"]
+
+    def test_diversify_skips_near_duplicate_chunks(self, long_note_collection):
+        results = self.search(*long_note_collection, diversify=True)
+
+        # The two other notes beat the long note's near-duplicate chunks
+        assert results[0]["chunkId"] == "chunk-0"
+        assert sorted(result["noteId"] for result in results) == ["long", "other-1", "other-2"]
+
+    def test_invalid_max_per_note(self, long_note_collection):
+        with pytest.raises(SearchError, match="max_per_note"):
+            self.search(*long_note_collection, max_per_note=0)
+
+    def test_batch_caps_combined_results(self, long_note_collection):
+        chromadb_path, provider = long_note_collection
+
+        results = search_knowledge_base_batch(
+            queries=["long note topic", "second topic"],
+            collection_name="notes",
+            chromadb_path=chromadb_path,
+            provider=provider,
+            context_mode="chunk_only",
+            max_results=2,
+            max_per_note=1
+        )
+
+        note_ids = [result["noteId"] for result in results]
+        assert len(note_ids) == len(set(note_ids))
@@ -0,0 +1,227 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from minerva.common.exceptions import ConfigError
+from minerva.common.server_config import CollectionServerConfig
+from minerva.indexing.storage import initialize_chromadb_client
+from minerva.indexing.vector_export import load_vector_export, manifest_path
+from minerva.server.exact_search import ExactSearchEngine, build_index
+from minerva.server.mcp_server import initialize_exact_search
+from minerva.server.search_tools import search_knowledge_base
+from tests.helpers.config_builders import make_server_config
+
+
+def random_vectors(count: int, dimension: int = 8, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).standard_normal((count, dimension)).astype(np.float32)
+
+
+def create_collection(chromadb_path: str, name: str = "exact_notes", count: int = 50, seed: int = 0):
+    client = initialize_chromadb_client(chromadb_path)
+    collection = client.create_collection(
+        name=name,
+        metadata={"hnsw:space": "cosine", "last_updated": "2025-01-01T00:00:00", "embedding_dimension": 8}
+    )
+    vectors = random_vectors(count, seed=seed)
+    collection.add(
+        ids=[f"chunk-{index}" for index in range(count)],
+        embeddings=vectors,
+        documents=[f"Document {index}" for index in range(count)],
+        metadatas=[{"title": f"Note {index}", "noteId": f"note-{index}", "chunkIndex": 0} for index in range(count)]
+    )
+    return client, collection, vectors
+
+
+def brute_force_ids(vectors: np.ndarray, query: np.ndarray, k: int) -> list:
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = normalized @ (query / np.linalg.norm(query))
+    return [f"chunk-{index}" for index in np.argsort(-scores)[:k]]
+
+
+class TestExactIndex:
+    def test_top_k_orders_by_cosine_similarity(self):
+        matrix = np.array([[1.0, 0.0], [0.0, 1.0], [0.7071, 0.7071]], dtype=np.float32)
+        index = build_index("notes", ["a", "b", "c"], matrix, None)
+
+        ranked = index.top_k([2.0, 0.1], n_results=2)
+
+        assert ranked["ids"] == [["a", "c"]]
+        assert ranked["distances"][0][0] == pytest.approx(1 - 0.99875, abs=1e-3)
+
+    def test_top_k_on_empty_index(self):
+        index = build_index("notes", [], np.zeros((0, 4), dtype=np.float32), None)
+
+        assert index.top_k([1.0, 0.0, 0.0, 0.0], n_results=5) == {"ids": [[]], "distances": [[]]}
+
+    def test_n_results_larger_than_index(self):
+        matrix = np.eye(3, dtype=np.float32)
+        index = build_index("notes", ["a", "b", "c"], matrix, None)
+
+        assert sorted(index.top_k([1.0, 1.0, 0.0], n_results=10)["ids"][0]) == ["a", "b", "c"]
+
+
+class TestExactSearchEngine:
+    def test_matches_brute_force_with_documents(self, temp_dir: Path):
+        chromadb_path = str(temp_dir / "chromadb")
+        _, collection, vectors = create_collection(chromadb_path)
+        engine = ExactSearchEngine(chromadb_path, ["exact_notes"])
+        query = random_vectors(1, seed=9)[0]
+
+        results = engine.query(collection, query.tolist(), n_results=5)
+
+        assert results["ids"][0] == brute_force_ids(vectors, query, 5)
+        first = int(results["ids"][0][0].split("-")[1])
+        assert results["documents"][0][0] == f"Document {first}"
+        assert results["metadatas"][0][0]["title"] == f"Note {first}"
+        assert results["distances"][0] == sorted(results["distances"][0])
+
+    def test_index_is_reused_until_last_updated_changes(self, temp_dir: Path):
+        chromadb_path = str(temp_dir / "chromadb")
+        client, collection, _ = create_collection(chromadb_path)
+        engine = ExactSearchEngine(chromadb_path, ["exact_notes"])
+
+        first = engine.get_index(collection)
+        assert engine.get_index(client.get_collection("exact_notes")) is first
+
+        collection.add(ids=["chunk-new"], embeddings=[[1.0] * 8], documents=["New"], metadatas=[{"title": "New"}])
+        collection.modify(metadata={"last_updated": "2025-02-01T00:00:00", "embedding_dimension": 8})
+
+        refreshed = engine.get_index(client.get_collection("exact_notes"))
+        assert refreshed is not first
+        assert "chunk-new" in refreshed.ids
+        assert refreshed.last_updated == "2025-02-01T00:00:00"
+
+    def test_deleted_chunks_are_skipped_until_refresh(self, temp_dir: Path):
+        chromadb_path = str(temp_dir / "chromadb")
+        _, collection, vectors = create_collection(chromadb_path)
+        engine = ExactSearchEngine(chromadb_path, ["exact_notes"])
+        query = vectors[3]
+        engine.get_index(collection)
+
+        collection.delete(ids=["chunk-3"])
+        results = engine.query(collection, query.tolist(), n_results=5)
+
+        assert "chunk-3" not in results["ids"][0]
+        assert len(results["ids"][0]) == 4
+
+    def test_memory_mapped_index_is_served_from_vector_export(self, temp_dir: Path):
+        chromadb_path = str(temp_dir / "chromadb")
+        _, collection, vectors = create_collection(chromadb_path)
+        engine = ExactSearchEngine(chromadb_path, ["exact_notes"], memory_mapped=["exact_notes"])
+
+        index = engine.get_index(collection)
+
+        assert index.memory_mapped
+        assert isinstance(index.matrix, np.memmap)
+        assert manifest_path(engine.export_dir, "exact_notes").exists()
+
+        export = load_vector_export(engine.export_dir, "exact_notes")
+        assert export is not None
+        assert export.ids == index.ids
+        assert export.last_updated == "2025-01-01T00:00:00"
+
+        # Exported rows are the raw embeddings; scoring normalizes via inverse norms
+        np.testing.assert_allclose(np.asarray(export.matrix), vectors, rtol=1e-6)
+        query = vectors[0]
+        assert index.top_k(query.tolist(), 3)["ids"][0] == brute_force_ids(vectors, query, 3)
+
+    def test_unnormalized_rows_rank_by_cosine(self):
+        matrix = np.array([[10.0, 0.0], [0.0, 0.5]], dtype=np.float32)
+        index = build_index("notes", ["long", "short"], matrix, None)
+
+        ranked = index.top_k([0.1, 1.0], n_results=2)
+
+        assert ranked["ids"] == [["short", "long"]]
+        assert ranked["distances"][0][0] == pytest.approx(1 - 1 / np.sqrt(1.01), abs=1e-5)
+
+
+class TestSearchKnowledgeBaseWithExactEngine:
+    def test_exact_engine_replaces_ann_query(self):
+        collection = MagicMock()
+        collection.name = "exact_notes"
+        collection.metadata = {"embedding_dimension": 4}
+        client = MagicMock()
+        client.list_collections.return_value = [collection]
+        client.get_collection.return_value = collection
+
+        engine = MagicMock()
+        engine.handles.return_value = True
+        engine.query.return_value = {
+            "ids": [["chunk-1"]],
+            "distances": [[0.25]],
+            "documents": [["Content"]],
+            "metadatas": [[{"title": "Note", "noteId": "n1", "chunkIndex": 0}]],
+        }
+
+        results = search_knowledge_base(
+            query="question",
+            collection_name="exact_notes",
+            chromadb_path="/fake",
+            provider=MagicMock(),
+            context_mode="chunk_only",
+            query_embedding=[0.1, 0.2, 0.3, 0.4],
+            client=client,
+            exact_search=engine
+        )
+
+        collection.query.assert_not_called()
+        engine.query.assert_called_once_with(collection, [0.1, 0.2, 0.3, 0.4], 5)
+        assert results[0]["similarityScore"] == 0.75
+
+
+class TestServerConfigCollections:
+    def test_collection_settings_are_parsed(self, temp_dir: Path):
+        config, _ = make_server_config(
+            temp_dir,
+            overrides={"collections": {"docs": {"search_engine": "exact", "memory_map": True}}}
+        )
+
+        assert config.collection_settings("docs") == CollectionServerConfig(search_engine="exact", memory_map=True)
+        assert config.collection_settings("other").search_engine == "hnsw"
+
+    def test_unknown_search_engine_rejected(self, temp_dir: Path):
+        with pytest.raises(ConfigError):
+            make_server_config(temp_dir, overrides={"collections": {"docs": {"search_engine": "flat"}}})
+
+
+class TestInitializeExactSearch:
+    def test_loads_only_available_exact_collections(self, temp_dir: Path):
+        config, _ = make_server_config(
+            temp_dir,
+            overrides={"collections": {
+                "exact_notes": {"search_engine": "exact"},
+                "hnsw_notes": {"search_engine": "hnsw"},
+                "gone_notes": {"search_engine": "exact"},
+            }}
+        )
+        create_collection(config.chromadb_path)
+
+        engine = initialize_exact_search(config, [{"name": "exact_notes"}, {"name": "hnsw_notes"}])
+
+        assert engine.handles("exact_notes")
+        assert not engine.handles("hnsw_notes")
+        assert not engine.handles("gone_notes")
+        assert "exact_notes" in engine._indexes
+
+    def test_no_exact_collections(self, temp_dir: Path):
+        config, _ = make_server_config(temp_dir)
+
+        assert initialize_exact_search(config, [{"name": "docs"}]) is None
+
+
+class TestExactSearchBatch:
+    def test_query_batch_matches_single_queries(self, temp_dir: Path):
+        chromadb_path = str(temp_dir / "chromadb")
+        _, collection, vectors = create_collection(chromadb_path)
+        engine = ExactSearchEngine(chromadb_path, ["exact_notes"])
+        queries = random_vectors(3, seed=4)
+
+        batch = engine.query_batch(collection, queries.tolist(), n_results=4)
+
+        assert len(batch["ids"]) == 3
+        for row, query in enumerate(queries):
+            assert batch["ids"][row] == brute_force_ids(vectors, query, 4)
+            assert batch["ids"][row] == engine.query(collection, query.tolist(), 4)["ids"][0]
+            assert len(batch["documents"][row]) == 4
@@ -0,0 +1,134 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from minerva.server.federated_search import (
+    federated_search,
+    group_collections_by_provider,
+    merge_ranked_results,
+)
+from minerva.server.search_tools import SearchError
+
+
+def _provider(provider_type: str = "ollama", model: str = "embed", base_url=None, fail: bool = False):
+    provider = MagicMock()
+    provider.provider_type = provider_type
+    provider.embedding_model = model
+    provider.base_url = base_url
+    if fail:
+        provider.generate_embedding.side_effect = RuntimeError("provider down")
+    else:
+        provider.generate_embedding.return_value = [0.1, 0.2, 0.3]
+    return provider
+
+
+def _result(collection: str, score: float, chunk: str = "") -> dict:
+    return {
+        'chunkId': f"{collection}-{score}{chunk}",
+        'noteTitle': f"{collection} note",
+        'noteId': f"{collection}-note",
+        'chunkIndex': 0,
+        'modificationDate': '',
+        'collectionName': collection,
+        'similarityScore': score,
+        'content': 'content',
+        'totalChunks': 1
+    }
+
+
+class TestGrouping:
+    def test_collections_sharing_provider_and_model_are_grouped(self):
+        shared = _provider()
+        provider_map = {'a': shared, 'b': _provider(), 'c': _provider(model="other")}
+
+        groups = group_collections_by_provider(provider_map, ['a', 'b', 'c'])
+
+        assert sorted(groups.values()) == [['a', 'b'], ['c']]
+
+    def test_merge_fuses_collections_by_rank_not_raw_score(self):
+        # b's scores come from another embedding model (or RRF) and are not comparable to a's
+        merged = merge_ranked_results(
+            {'a': [_result('a', 0.9), _result('a', 0.85)], 'b': [_result('b', 0.03), _result('b', 0.02)]},
+            max_results=3
+        )
+
+        assert [(r['collectionName'], r['similarityScore']) for r in merged] == [('a', 0.9), ('b', 0.03), ('a', 0.85)]
+        assert merged[0]['federatedScore'] == merged[1]['federatedScore'] == 1.0
+        assert merged[2]['federatedScore'] < 1.0
+
+
+def _passthrough_context(**kwargs):
+    return kwargs['results']
+
+
+@patch('minerva.server.federated_search.initialize_chromadb_client')
+@patch('minerva.server.federated_search.retrieve_collection_context', side_effect=_passthrough_context)
+@patch('minerva.server.federated_search.search_knowledge_base')
+class TestFederatedSearch:
+    def test_embeds_once_per_provider_group(self, mock_search, mock_context, mock_client):
+        shared = _provider()
+        other = _provider(model="other")
+        provider_map = {'a': shared, 'b': shared, 'c': other}
+        mock_search.side_effect = lambda **kwargs: [_result(kwargs['collection_name'], 0.5)]
+
+        results, errors = federated_search("query", "/fake", provider_map, max_results=10)
+
+        assert shared.generate_embedding.call_count == 1
+        assert other.generate_embedding.call_count == 1
+        assert errors == {}
+        assert sorted(r['collectionName'] for r in results) == ['a', 'b', 'c']
+        for call in mock_search.call_args_list:
+            assert call.kwargs['query_embedding'] == [0.1, 0.2, 0.3]
+            assert call.kwargs['client'] is mock_client.return_value
+
+    def test_failing_collection_is_reported_not_raised(self, mock_search, mock_context, mock_client):
+        provider_map = {'a': _provider(), 'b': _provider(model="broken", fail=True)}
+        mock_search.side_effect = lambda **kwargs: [_result(kwargs['collection_name'], 0.8)]
+
+        results, errors = federated_search("query", "/fake", provider_map)
+
+        assert [r['collectionName'] for r in results] == ['a']
+        assert 'b' in errors
+
+    def test_all_collections_failing_raises(self, mock_search, mock_context, mock_client):
+        provider_map = {'a': _provider(fail=True)}
+
+        with pytest.raises(SearchError):
+            federated_search("query", "/fake", provider_map)
+
+    def test_unknown_collection_is_rejected(self, mock_search, mock_context, mock_client):
+        with pytest.raises(SearchError):
+            federated_search("query", "/fake", {'a': _provider()}, collection_names=['missing'])
+
+    def test_context_is_fetched_only_for_merged_top_results(self, mock_search, mock_context, mock_client):
+        provider_map = {'a': _provider(), 'b': _provider(), 'c': _provider()}
+        mock_search.side_effect = lambda **kwargs: [
+            _result(kwargs['collection_name'], 0.5, chunk=str(rank)) for rank in range(3)
+        ]
+
+        results, _ = federated_search(
+            "query", "/fake", provider_map, context_mode="full_note", max_results=4, token_budget=2000
+        )
+
+        assert {call.kwargs['context_mode'] for call in mock_search.call_args_list} == {"chunk_only"}
+        contexts = {call.kwargs['collection_name']: call.kwargs for call in mock_context.call_args_list}
+        assert {name: len(kwargs['results']) for name, kwargs in contexts.items()} == {'a': 2, 'b': 1, 'c': 1}
+        assert all(kwargs['context_mode'] == "full_note" and kwargs['token_budget'] == 2000
+                   for kwargs in contexts.values())
+        assert [r['chunkId'] for r in results] == ['a-0.50', 'b-0.50', 'c-0.50', 'a-0.51']
+
+    def test_failed_context_retrieval_is_reported(self, mock_search, mock_context, mock_client):
+        provider_map = {'a': _provider(), 'b': _provider()}
+        mock_search.side_effect = lambda **kwargs: [_result(kwargs['collection_name'], 0.5)]
+
+        def context(**kwargs):
+            if kwargs['collection_name'] == 'b':
+                raise SearchError("gone")
+            return kwargs['results']
+
+        mock_context.side_effect = context
+
+        results, errors = federated_search("query", "/fake", provider_map)
+
+        assert [r['collectionName'] for r in results] == ['a']
+        assert errors == {'b': "gone"}
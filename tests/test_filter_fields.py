@@ -0,0 +1,83 @@
+from minerva.indexing.filter_fields import (
+    MAX_PATH_PREFIX_DEPTH,
+    build_filter_fields,
+    date_to_epoch,
+    filter_fields_stale,
+    normalize_source_path,
+    path_prefix_fields,
+)
+
+
+class TestDateToEpoch:
+    def test_utc_offsets_and_naive_values(self):
+        assert date_to_epoch("2024-01-01T00:00:00Z") == 1704067200
+        assert date_to_epoch("2024-01-01T01:00:00+01:00") == 1704067200
+        assert date_to_epoch("2024-01-01T00:00:00") == 1704067200
+        assert date_to_epoch("2024-01-01") == 1704067200
+
+    def test_invalid_values(self):
+        assert date_to_epoch("yesterday") is None
+        assert date_to_epoch("") is None
+        assert date_to_epoch(None) is None
+
+
+class TestSourcePath:
+    def test_normalization(self):
+        assert normalize_source_path("./docs\\api//auth.md") == "docs/api/auth.md"
+        assert normalize_source_path("/docs/api/") == "docs/api"
+        assert normalize_source_path("./") == ""
+
+    def test_prefix_per_directory_depth(self):
+        assert path_prefix_fields("docs/api/auth.md") == {"pathPrefix1": "docs", "pathPrefix2": "docs/api"}
+        assert path_prefix_fields("README.md") == {}
+
+    def test_prefix_depth_is_capped(self):
+        deep = "/".join(f"d{level}" for level in range(MAX_PATH_PREFIX_DEPTH + 3)) + "/file.md"
+
+        assert len(path_prefix_fields(deep)) == MAX_PATH_PREFIX_DEPTH
+
+
+class TestBuildFilterFields:
+    def test_repository_doc_note(self):
+        fields = build_filter_fields({
+            "title": "Auth",
+            "markdown": "# Auth",
+            "modificationDate": "2024-01-01T00:00:00Z",
+            "creationDate": "2023-12-31T00:00:00Z",
+            "sourcePath": "docs/api/auth.md",
+        })
+
+        assert fields == {
+            "modifiedAt": 1704067200,
+            "createdAt": 1703980800,
+            "sourcePath": "docs/api/auth.md",
+            "pathPrefix1": "docs",
+            "pathPrefix2": "docs/api",
+        }
+
+    def test_book_note(self):
+        fields = build_filter_fields({
+            "title": "Dune",
+            "markdown": "# Dune",
+            "modificationDate": "1965-01-01T00:00:00Z",
+            "author": "  Frank   Herbert ",
+            "year": 1965,
+        })
+
+        assert fields["author"] == "Frank Herbert"
+        assert fields["authorKey"] == "frank herbert"
+        assert fields["year"] == 1965
+        assert "sourcePath" not in fields and "createdAt" not in fields
+
+    def test_unusable_values_are_left_out(self):
+        fields = build_filter_fields({"modificationDate": "not a date", "author": " ", "year": "1965"})
+
+        assert fields == {}
+
+
+def test_filter_fields_stale():
+    fields = {"modifiedAt": 1, "sourcePath": "a.md"}
+
+    assert filter_fields_stale({"title": "A"}, fields)
+    assert filter_fields_stale({"modifiedAt": 2, "sourcePath": "a.md"}, fields)
+    assert not filter_fields_stale({"title": "A", "modifiedAt": 1, "sourcePath": "a.md"}, fields)
@@ -0,0 +1,255 @@
+import json
+from argparse import Namespace
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from minerva.commands.hnsw_eval import run_hnsw_eval
+from minerva.common.exceptions import StorageError
+from minerva.indexing.hnsw_eval import (
+    EvalReport,
+    EvalResult,
+    evaluate_collection,
+    exact_neighbors,
+    format_report_text,
+    latency_percentile,
+    load_vectors,
+    normalize_rows,
+    recall_at_k,
+)
+from minerva.indexing.storage import (
+    build_collection_metadata,
+    get_hnsw_settings,
+    initialize_chromadb_client,
+    set_search_ef,
+)
+
+
+def clustered_vectors(count: int = 400, dimension: int = 16, seed: int = 1) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((8, dimension))
+    vectors = centers[rng.integers(0, 8, size=count)] + 0.3 * rng.standard_normal((count, dimension))
+    return normalize_rows(vectors.astype(np.float32))
+
+
+@pytest.fixture
+def chromadb_with_vectors(temp_dir: Path):
+    chromadb_path = str(temp_dir / "chromadb")
+    vectors = clustered_vectors()
+    client = initialize_chromadb_client(chromadb_path)
+    collection = client.create_collection(
+        name="eval_notes",
+        metadata={"hnsw:space": "cosine", "hnsw:M": 8, "hnsw:search_ef": 20}
+    )
+    collection.add(ids=[f"chunk-{index}" for index in range(len(vectors))], embeddings=vectors)
+    return chromadb_path, vectors
+
+
+class TestExactNeighbors:
+    def test_excludes_query_and_orders_by_similarity(self):
+        vectors = normalize_rows(np.array([
+            [1.0, 0.0],
+            [0.9, 0.1],
+            [0.0, 1.0],
+            [0.7, 0.7],
+        ], dtype=np.float32))
+
+        neighbors, latencies = exact_neighbors(vectors, [0], k=2)
+
+        assert neighbors == [[1, 3]]
+        assert len(latencies) == 1
+
+    def test_k_larger_than_collection(self):
+        vectors = normalize_rows(np.eye(3, dtype=np.float32))
+
+        neighbors, _ = exact_neighbors(vectors, [1], k=10)
+
+        assert sorted(neighbors[0]) == [0, 2]
+
+
+class TestMetrics:
+    def test_recall_at_k(self):
+        assert recall_at_k([["a", "b"], ["c", "x"]], [["a", "b"], ["c", "d"]]) == 0.75
+
+    def test_recall_with_no_expected_results(self):
+        assert recall_at_k([], []) == 1.0
+
+    def test_latency_percentile(self):
+        latencies = [float(value) for value in range(1, 101)]
+
+        assert latency_percentile(latencies, 50) == 50.0
+        assert latency_percentile(latencies, 95) == 95.0
+        assert latency_percentile([], 95) == 0.0
+
+
+class TestLoadVectors:
+    def test_pages_through_collection(self, monkeypatch):
+        monkeypatch.setattr("minerva.indexing.hnsw_eval.FETCH_PAGE_SIZE", 2)
+        collection = Mock()
+        collection.count.return_value = 3
+        collection.get.side_effect = [
+            {"ids": ["a", "b"], "embeddings": [[1.0, 0.0], [0.0, 1.0]]},
+            {"ids": ["c"], "embeddings": [[1.0, 1.0]]},
+        ]
+
+        ids, vectors = load_vectors(collection)
+
+        assert ids == ["a", "b", "c"]
+        assert vectors.shape == (3, 2)
+        assert collection.get.call_args_list[1].kwargs["offset"] == 2
+
+    def test_subsamples_to_max_vectors(self):
+        collection = Mock()
+        collection.count.return_value = 4
+        collection.get.return_value = {"ids": ["a", "b", "c", "d"], "embeddings": np.eye(4).tolist()}
+
+        ids, vectors = load_vectors(collection, max_vectors=2, seed=3)
+
+        assert len(ids) == 2
+        assert vectors.shape == (2, 4)
+
+    def test_empty_collection_raises(self):
+        collection = Mock()
+        collection.name = "empty"
+        collection.count.return_value = 0
+
+        with pytest.raises(StorageError):
+            load_vectors(collection)
+
+
+class TestHnswSettings:
+    EMBEDDING_METADATA = {"embedding_model": "stub", "embedding_provider": "openai"}
+
+    def test_collection_metadata_includes_hnsw_params(self):
+        metadata = build_collection_metadata(
+            "notes", self.EMBEDDING_METADATA, hnsw_params={"hnsw:M": 32, "hnsw:search_ef": 64}
+        )
+
+        assert metadata["hnsw:space"] == "cosine"
+        assert metadata["hnsw:M"] == 32
+        assert metadata["hnsw:search_ef"] == 64
+
+    @pytest.mark.parametrize("key", ["M", "hnsw:space"])
+    def test_collection_metadata_rejects_other_keys(self, key):
+        with pytest.raises(StorageError):
+            build_collection_metadata("notes", self.EMBEDDING_METADATA, hnsw_params={key: 16})
+
+    def test_get_and_set_search_ef(self, chromadb_with_vectors):
+        chromadb_path, _ = chromadb_with_vectors
+        collection = initialize_chromadb_client(chromadb_path).get_collection("eval_notes")
+
+        assert get_hnsw_settings(collection)["M"] == 8
+        assert get_hnsw_settings(collection)["search_ef"] == 20
+
+        set_search_ef(collection, 64)
+
+        reloaded = initialize_chromadb_client(chromadb_path).get_collection("eval_notes")
+        assert get_hnsw_settings(reloaded)["search_ef"] == 64
+        assert get_hnsw_settings(reloaded)["M"] == 8
+
+
+class TestEvaluateCollection:
+    def test_reports_exact_current_and_candidates(self, chromadb_with_vectors):
+        chromadb_path, _ = chromadb_with_vectors
+
+        report = evaluate_collection(
+            chromadb_path,
+            "eval_notes",
+            query_count=20,
+            k=5,
+            m_values=[8],
+            construction_ef_values=[50],
+            search_ef_values=[10, 100],
+        )
+
+        sources = [result.source for result in report.results]
+        assert sources == ["exact", "current", "candidate", "candidate"]
+        assert report.results[0].recall == 1.0
+        assert report.vector_count == 400
+        assert report.current_settings["M"] == 8
+
+        candidates = [result for result in report.results if result.source == "candidate"]
+        assert [result.search_ef for result in candidates] == [10, 100]
+        assert all(result.build_seconds is not None for result in candidates)
+        assert candidates[1].recall >= 0.9
+
+        payload = report.to_dict()
+        assert json.loads(json.dumps(payload))["k"] == 5
+
+    def test_subsample_skips_current_index(self, chromadb_with_vectors):
+        chromadb_path, _ = chromadb_with_vectors
+
+        report = evaluate_collection(
+            chromadb_path,
+            "eval_notes",
+            query_count=10,
+            k=5,
+            search_ef_values=[50],
+            max_vectors=200,
+        )
+
+        assert report.vector_count == 200
+        assert [result.source for result in report.results] == ["exact", "candidate"]
+        # Candidate graph settings default to the live index
+        assert report.results[1].M == 8
+
+
+class TestReport:
+    def make_report(self, recalls):
+        results = [EvalResult("exact", None, None, None, 1.0, 5.0, 6.0, 5.0)]
+        for search_ef, recall, p95 in recalls:
+            results.append(EvalResult("candidate", 16, 100, search_ef, recall, 1.0, p95, 1.0, 2.5))
+        return EvalReport("notes", 1000, 8, 50, 10, {"M": 16, "construction_ef": 100, "search_ef": 10}, results, 0.95)
+
+    def test_recommends_fastest_setting_above_target(self):
+        report = self.make_report([(10, 0.80, 0.5), (50, 0.96, 0.9), (100, 0.99, 1.4)])
+
+        assert report.recommended().search_ef == 50
+        assert "search_ef=50" in format_report_text(report)
+
+    def test_no_recommendation_below_target(self):
+        report = self.make_report([(10, 0.80, 0.5)])
+
+        assert report.recommended() is None
+        assert "No configuration reached" in format_report_text(report)
+
+
+class TestRunHnswEval:
+    def make_args(self, chromadb, collection_name="eval_notes", **overrides):
+        values = dict(
+            chromadb=Path(chromadb),
+            collection_name=collection_name,
+            queries=10,
+            k=5,
+            m=None,
+            construction_ef=None,
+            search_ef=[50],
+            max_vectors=None,
+            target_recall=0.9,
+            seed=0,
+            format="json",
+        )
+        values.update(overrides)
+        return Namespace(**values)
+
+    def test_json_output(self, chromadb_with_vectors):
+        chromadb_path, _ = chromadb_with_vectors
+
+        with patch('minerva.commands.hnsw_eval.logger') as mock_logger:
+            assert run_hnsw_eval(self.make_args(chromadb_path)) == 0
+
+        # JSON mode prints only the report
+        assert mock_logger.info.call_count == 1
+        payload = json.loads(mock_logger.info.call_args.args[0])
+        assert payload["collection"] == "eval_notes"
+        assert payload["results"][0]["source"] == "exact"
+
+    def test_missing_collection(self, chromadb_with_vectors):
+        chromadb_path, _ = chromadb_with_vectors
+
+        assert run_hnsw_eval(self.make_args(chromadb_path, collection_name="missing")) == 1
+
+    def test_missing_path(self, temp_dir: Path):
+        assert run_hnsw_eval(self.make_args(temp_dir / "nope")) == 1
@@ -14,8 +14,14 @@ from minerva.commands.index import (
     run_dry_run,
     run_full_indexing,
     initialize_and_validate_provider,
+    apply_hnsw_settings,
+    refresh_vector_export,
+    refresh_note_summaries,
 )
 from minerva.common.exceptions import ConfigError, JsonLoaderError, ProviderUnavailableError
+from minerva.common.index_config import HnswConfig
+from minerva.indexing.note_summaries import NoteSummarySyncStats
+from minerva.indexing.vector_export import ExportSyncStats
 from tests.helpers.config_builders import make_index_config
 
 
@@ -237,6 +243,7 @@ class TestRunDryRun:
 
 
 class TestRunFullIndexing:
+    @patch('minerva.commands.index.sync_lexical_index')
     @patch('minerva.commands.index.insert_chunks')
     @patch('minerva.commands.index.create_collection')
     @patch('minerva.commands.index.initialize_chromadb_client')
@@ -249,6 +256,7 @@ class TestRunFullIndexing:
         mock_init_chromadb,
         mock_create_collection,
         mock_insert_chunks,
+        mock_sync_lexical,
         valid_notes_list,
         temp_dir: Path,
     ):
@@ -284,7 +292,11 @@ class TestRunFullIndexing:
         mock_init_chromadb.assert_called_once_with(index_config.chromadb_path)
         mock_create_collection.assert_called_once()
         mock_insert_chunks.assert_called_once()
+        mock_sync_lexical.assert_called_once_with(
+            mock_client.get_collection.return_value, index_config.chromadb_path, rebuild=True
+        )
 
+    @patch('minerva.commands.index.sync_lexical_index')
     @patch('minerva.commands.index.insert_chunks')
     @patch('minerva.commands.index.recreate_collection')
     @patch('minerva.commands.index.initialize_chromadb_client')
@@ -297,6 +309,7 @@ class TestRunFullIndexing:
         mock_init_chromadb,
         mock_recreate_collection,
         mock_insert_chunks,
+        mock_sync_lexical,
         valid_notes_list,
         temp_dir: Path,
     ):
@@ -325,6 +338,160 @@ class TestRunFullIndexing:
 
         mock_recreate_collection.assert_called_once()
 
+    @patch('minerva.commands.index.insert_chunks')
+    @patch('minerva.commands.index.create_collection')
+    @patch('minerva.commands.index.initialize_chromadb_client')
+    @patch('minerva.commands.index.generate_embeddings')
+    @patch('minerva.commands.index.create_chunks_from_notes')
+    def test_full_indexing_passes_hnsw_params(
+        self,
+        mock_create_chunks,
+        mock_generate_embeddings,
+        mock_init_chromadb,
+        mock_create_collection,
+        mock_insert_chunks,
+        valid_notes_list,
+        temp_dir: Path,
+    ):
+        mock_provider = Mock()
+        mock_provider.get_embedding_metadata.return_value = {}
+        mock_create_chunks.return_value = [{"chunk_id": "1"}]
+        mock_generate_embeddings.return_value = [{"chunk_id": "1"}]
+        mock_insert_chunks.return_value = {"successful": 1, "failed": 0}
+
+        index_config, _ = make_index_config(
+            temp_dir,
+            collection_overrides={"hnsw": {"M": 32, "search_ef": 64}},
+        )
+
+        run_full_indexing(index_config, valid_notes_list, False, 0.0, mock_provider)
+
+        hnsw_params = mock_create_collection.call_args.kwargs['hnsw_params']
+        assert hnsw_params == {"hnsw:M": 32, "hnsw:search_ef": 64}
+
+
+class TestHnswConfig:
+    def test_hnsw_block_is_parsed(self, temp_dir: Path):
+        index_config, _ = make_index_config(
+            temp_dir,
+            collection_overrides={"hnsw": {"M": 24, "construction_ef": 200, "search_ef": 80}},
+        )
+
+        assert index_config.collection.hnsw == HnswConfig(M=24, construction_ef=200, search_ef=80)
+
+    def test_hnsw_block_is_optional(self, temp_dir: Path):
+        index_config, _ = make_index_config(temp_dir)
+
+        assert index_config.collection.hnsw is None
+
+    @pytest.mark.parametrize("hnsw_block", [{"M": 1}, {"search_ef": 0}, {"ef": 10}, {"M": "16"}])
+    def test_invalid_hnsw_block_rejected(self, temp_dir: Path, hnsw_block):
+        with pytest.raises(ConfigError):
+            make_index_config(temp_dir, collection_overrides={"hnsw": hnsw_block})
+
+    def test_to_metadata_skips_unset_values(self):
+        assert HnswConfig(construction_ef=150).to_metadata() == {"hnsw:construction_ef": 150}
+
+
+class TestApplyHnswSettings:
+    def make_collection(self, temp_dir: Path, hnsw: dict):
+        index_config, _ = make_index_config(temp_dir, collection_overrides={"hnsw": hnsw})
+        return index_config.collection
+
+    @patch('minerva.commands.index.set_search_ef')
+    @patch('minerva.commands.index.get_hnsw_settings')
+    def test_updates_changed_search_ef(self, mock_get_settings, mock_set_search_ef, temp_dir: Path):
+        mock_get_settings.return_value = {"M": 16, "construction_ef": 100, "search_ef": 100}
+        collection_obj = Mock()
+
+        apply_hnsw_settings(collection_obj, self.make_collection(temp_dir, {"search_ef": 40}))
+
+        mock_set_search_ef.assert_called_once_with(collection_obj, 40)
+
+    @patch('minerva.commands.index.set_search_ef')
+    @patch('minerva.commands.index.get_hnsw_settings')
+    def test_unchanged_search_ef_is_left_alone(self, mock_get_settings, mock_set_search_ef, temp_dir: Path):
+        mock_get_settings.return_value = {"M": 16, "construction_ef": 100, "search_ef": 40}
+
+        apply_hnsw_settings(Mock(), self.make_collection(temp_dir, {"search_ef": 40}))
+
+        mock_set_search_ef.assert_not_called()
+
+    @patch('minerva.commands.index.logger')
+    @patch('minerva.commands.index.set_search_ef')
+    @patch('minerva.commands.index.get_hnsw_settings')
+    def test_graph_changes_require_recreate(self, mock_get_settings, mock_set_search_ef, mock_logger, temp_dir: Path):
+        mock_get_settings.return_value = {"M": 16, "construction_ef": 100, "search_ef": 100}
+
+        apply_hnsw_settings(Mock(), self.make_collection(temp_dir, {"M": 32}))
+
+        mock_set_search_ef.assert_not_called()
+        warnings = " ".join(str(call.args[0]) for call in mock_logger.warning.call_args_list)
+        assert "M=32" in warnings
+        assert "force_recreate" in warnings
+
+
+class TestRefreshVectorExport:
+    @patch('minerva.commands.index.sync_vector_export')
+    def test_skips_collections_without_export(self, mock_sync, temp_dir: Path):
+        refresh_vector_export(Mock(), str(temp_dir), "notes")
+
+        mock_sync.assert_not_called()
+
+    @patch('minerva.commands.index.sync_vector_export')
+    def test_syncs_existing_export(self, mock_sync, temp_dir: Path):
+        export_dir = temp_dir / "minerva_vectors"
+        export_dir.mkdir()
+        (export_dir / "notes.json").write_text("{}")
+        mock_sync.return_value = (Mock(ids=["a", "b"]), ExportSyncStats(kept=1, added=1))
+        client = Mock()
+
+        refresh_vector_export(client, str(temp_dir), "notes")
+
+        mock_sync.assert_called_once_with(client.get_collection.return_value, export_dir)
+
+    @patch('minerva.commands.index.logger')
+    @patch('minerva.commands.index.sync_vector_export')
+    def test_sync_failure_only_warns(self, mock_sync, mock_logger, temp_dir: Path):
+        (temp_dir / "minerva_vectors").mkdir()
+        (temp_dir / "minerva_vectors" / "notes.json").write_text("{}")
+        mock_sync.side_effect = OSError("disk full")
+
+        refresh_vector_export(Mock(), str(temp_dir), "notes")
+
+        assert "disk full" in mock_logger.warning.call_args_list[0].args[0]
+
+
+class TestRefreshNoteSummaries:
+    @patch('minerva.commands.index.get_note_summary_collection', return_value=None)
+    @patch('minerva.commands.index.sync_note_summaries')
+    def test_skips_when_disabled_and_absent(self, mock_sync, mock_get, temp_dir: Path):
+        index_config, _ = make_index_config(temp_dir)
+
+        refresh_note_summaries(Mock(), index_config.collection)
+
+        mock_sync.assert_not_called()
+
+    @patch('minerva.commands.index.sync_note_summaries')
+    def test_syncs_when_enabled(self, mock_sync, temp_dir: Path):
+        index_config, _ = make_index_config(temp_dir, collection_overrides={"note_summaries": True})
+        mock_sync.return_value = NoteSummarySyncStats(added=3)
+        client = Mock()
+
+        refresh_note_summaries(client, index_config.collection, rebuild=True)
+
+        mock_sync.assert_called_once_with(client, client.get_collection.return_value, rebuild=True)
+
+    @patch('minerva.commands.index.get_note_summary_collection')
+    @patch('minerva.commands.index.sync_note_summaries')
+    def test_existing_summaries_stay_in_sync(self, mock_sync, mock_get, temp_dir: Path):
+        index_config, _ = make_index_config(temp_dir)
+        mock_sync.return_value = NoteSummarySyncStats(kept=3)
+
+        refresh_note_summaries(Mock(), index_config.collection)
+
+        mock_sync.assert_called_once()
+
 
 class TestInitializeAndValidateProvider:
     @patch('minerva.commands.index.initialize_provider')
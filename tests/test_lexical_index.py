@@ -0,0 +1,291 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from minerva.indexing.lexical_index import (
+    LexicalIndex,
+    lexical_index_exists,
+    lexical_index_path,
+    open_lexical_index,
+    remove_lexical_index,
+    sync_lexical_index,
+    tokenize,
+)
+from minerva.indexing.storage import initialize_chromadb_client
+from minerva.server.federated_search import federated_search
+from minerva.server.hybrid_search import reciprocal_rank_fusion
+from minerva.server.search_tools import SearchError, search_knowledge_base, search_knowledge_base_batch
+
+DOCUMENTS = {
+    "chunk-0": "Retry the request when the server returns ERR_CONN_RESET after a timeout.",
+    "chunk-1": "Connection handling: the client reconnects with exponential backoff.",
+    "chunk-2": "Use getUserById to load a user record from the accounts service.",
+    "chunk-3": "Notes about gardening, tomatoes and watering schedules.",
+    "chunk-4": "The accounts service caches user records for five minutes.",
+}
+
+
+class TestTokenize:
+    def test_identifiers_are_kept_whole_and_split(self):
+        tokens = tokenize("ERR_CONN_RESET in getUserById")
+
+        assert "err_conn_reset" in tokens
+        assert {"err", "conn", "reset"} <= set(tokens)
+        assert {"getuserbyid", "get", "user", "id"} <= set(tokens)
+
+    def test_dotted_and_dashed_names(self):
+        assert {"os.path.join", "os", "path", "join"} <= set(tokenize("call os.path.join here"))
+        assert {"e-1234", "e", "1234"} <= set(tokenize("error E-1234"))
+
+    def test_stopwords_and_case(self):
+        assert tokenize("The Server is DOWN") == ["server", "down"]
+
+
+@pytest.fixture
+def index(temp_dir: Path):
+    with LexicalIndex(temp_dir / "lexical.sqlite3") as lexical:
+        lexical.add_chunks(list(DOCUMENTS), list(DOCUMENTS.values()))
+        yield lexical
+
+
+class TestLexicalIndex:
+    def test_exact_identifier_ranks_first(self, index):
+        ranked = index.search("ERR_CONN_RESET", n_results=3)
+
+        assert ranked[0][0] == "chunk-0"
+        assert all(score > 0 for _, score in ranked)
+
+    def test_rare_terms_outweigh_common_ones(self, index):
+        ranked = [chunk_id for chunk_id, _ in index.search("accounts getUserById", n_results=5)]
+
+        assert ranked[0] == "chunk-2"
+        assert "chunk-4" in ranked
+        assert "chunk-3" not in ranked
+
+    def test_unknown_and_empty_queries(self, index):
+        assert index.search("kubernetes", n_results=5) == []
+        assert index.search("the and of", n_results=5) == []
+
+    def test_delete_and_replace_chunks(self, index):
+        index.delete_chunks(["chunk-0"])
+        assert index.search("ERR_CONN_RESET", n_results=3) == []
+
+        index.add_chunks(["chunk-3"], ["ERR_CONN_RESET now lives here"])
+        assert index.search("ERR_CONN_RESET", n_results=3)[0][0] == "chunk-3"
+        assert index.search("tomatoes", n_results=3) == []
+        assert index.count() == 4
+
+
+def create_collection(chromadb_path: str, name: str = "docs"):
+    client = initialize_chromadb_client(chromadb_path)
+    collection = client.create_collection(
+        name=name,
+        metadata={"hnsw:space": "cosine", "embedding_dimension": 4, "embedding_model": "stub"}
+    )
+    vectors = np.random.default_rng(0).standard_normal((len(DOCUMENTS), 4)).astype(np.float32)
+    collection.add(
+        ids=list(DOCUMENTS),
+        embeddings=vectors,
+        documents=list(DOCUMENTS.values()),
+        metadatas=[
+            {"title": f"Note {index}", "noteId": f"note-{index}", "chunkIndex": 0, "content_hash": "h"}
+            for index in range(len(DOCUMENTS))
+        ]
+    )
+    return client, collection, vectors
+
+
+class TestSyncLexicalIndex:
+    def test_builds_then_updates_incrementally(self, temp_dir: Path):
+        chromadb_path = str(temp_dir / "chromadb")
+        _, collection, _ = create_collection(chromadb_path)
+
+        stats = sync_lexical_index(collection, chromadb_path)
+        assert (stats.kept, stats.added, stats.removed) == (0, 5, 0)
+
+        collection.delete(ids=["chunk-3"])
+        collection.update(ids=["chunk-1"], embeddings=[[0.0, 1.0, 0.0, 0.0]],
+                          documents=["Sockets use keepalive probes"], metadatas=[{"content_hash": "h2"}])
+        collection.add(ids=["chunk-5"], embeddings=[[1.0, 0.0, 0.0, 0.0]], documents=["New identifier FOO_BAR"],
+                       metadatas=[{"content_hash": "h"}])
+
+        stats = sync_lexical_index(collection, chromadb_path)
+
+        assert (stats.kept, stats.added, stats.removed) == (3, 2, 1)
+        with open_lexical_index(chromadb_path, "docs") as index:
+            assert index.count() == 5
+            assert index.search("FOO_BAR", 1)[0][0] == "chunk-5"
+            assert index.search("keepalive", 1)[0][0] == "chunk-1"
+            assert index.search("tomatoes", 1) == []
+
+    def test_note_edited_in_place_reindexes_every_chunk(self, temp_dir: Path):
+        # Only chunk 0 carries the note hash; an edit that keeps the modification date keeps the chunk ids
+        chromadb_path = str(temp_dir / "chromadb")
+        client = initialize_chromadb_client(chromadb_path)
+        collection = client.create_collection(name="docs", metadata={"hnsw:space": "cosine"})
+        ids = ["note-a-0", "note-a-1"]
+        collection.add(
+            ids=ids,
+            embeddings=[[1.0, 0.0], [0.0, 1.0]],
+            documents=["Retry budget", "Backoff uses jitter"],
+            metadatas=[{"noteId": "a", "chunkIndex": 0, "content_hash": "h"}, {"noteId": "a", "chunkIndex": 1}]
+        )
+        sync_lexical_index(collection, chromadb_path)
+
+        collection.upsert(
+            ids=ids,
+            embeddings=[[1.0, 0.0], [0.0, 1.0]],
+            documents=["Retry budget", "Backoff uses exponential delays"],
+            metadatas=[{"noteId": "a", "chunkIndex": 0, "content_hash": "h2"}, {"noteId": "a", "chunkIndex": 1}]
+        )
+
+        stats = sync_lexical_index(collection, chromadb_path)
+
+        assert (stats.kept, stats.added, stats.removed) == (0, 2, 0)
+        with open_lexical_index(chromadb_path, "docs") as index:
+            assert index.search("exponential", 1)[0][0] == "note-a-1"
+            assert index.search("jitter", 1) == []
+
+    def test_rebuild_and_remove(self, temp_dir: Path):
+        chromadb_path = str(temp_dir / "chromadb")
+        _, collection, _ = create_collection(chromadb_path)
+        sync_lexical_index(collection, chromadb_path)
+
+        stats = sync_lexical_index(collection, chromadb_path, rebuild=True)
+        assert (stats.kept, stats.added) == (0, 5)
+
+        assert remove_lexical_index(chromadb_path, "docs")
+        assert not lexical_index_exists(chromadb_path, "docs")
+        assert open_lexical_index(chromadb_path, "docs") is None
+
+    def test_readonly_handle_cannot_write(self, temp_dir: Path):
+        chromadb_path = str(temp_dir / "chromadb")
+        _, collection, _ = create_collection(chromadb_path)
+        sync_lexical_index(collection, chromadb_path)
+
+        with LexicalIndex(lexical_index_path(chromadb_path, "docs"), readonly=True) as index:
+            with pytest.raises(Exception):
+                index.delete_chunks(["chunk-0"])
+
+
+class TestReciprocalRankFusion:
+    def test_items_in_both_lists_rise(self):
+        fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "d"]])
+
+        assert [chunk_id for chunk_id, _ in fused] == ["c", "a", "b", "d"]
+
+    def test_scores_are_normalized(self):
+        fused = dict(reciprocal_rank_fusion([["a", "b"], ["a"]]))
+
+        assert fused["a"] == pytest.approx(1.0)
+        assert 0 < fused["b"] < 0.5
+
+    def test_no_rankings(self):
+        assert reciprocal_rank_fusion([]) == []
+
+
+class TestSearchModes:
+    def search(self, chromadb_path, provider, query, mode, **kwargs):
+        return search_knowledge_base(
+            query=query,
+            collection_name="docs",
+            chromadb_path=chromadb_path,
+            provider=provider,
+            context_mode="chunk_only",
+            search_mode=mode,
+            **kwargs
+        )
+
+    @pytest.fixture
+    def indexed(self, temp_dir: Path):
+        chromadb_path = str(temp_dir / "chromadb")
+        _, collection, vectors = create_collection(chromadb_path)
+        sync_lexical_index(collection, chromadb_path)
+        return chromadb_path, vectors
+
+    def test_lexical_mode_skips_embedding(self, indexed):
+        chromadb_path, _ = indexed
+        provider = MagicMock()
+
+        results = self.search(chromadb_path, provider, "ERR_CONN_RESET", "lexical", max_results=2)
+
+        provider.generate_embedding.assert_not_called()
+        assert results[0]["chunkId"] == "chunk-0"
+        assert results[0]["noteTitle"] == "Note 0"
+        assert results[0]["similarityScore"] == pytest.approx(1.0)
+        assert "lexicalScore" in results[0] and "vectorScore" not in results[0]
+
+    def test_hybrid_mode_fuses_both_rankings(self, indexed):
+        chromadb_path, vectors = indexed
+        provider = MagicMock()
+        # The query vector points at the gardening note; the keywords point at chunk-2
+        provider.generate_embedding.return_value = vectors[3].tolist()
+
+        results = self.search(chromadb_path, provider, "getUserById", "hybrid", max_results=3)
+
+        # Top of the vector ranking and top of the keyword ranking both make the cut
+        assert {"chunk-2", "chunk-3"} <= {result["chunkId"] for result in results}
+        by_id = {result["chunkId"]: result for result in results}
+        assert by_id["chunk-3"]["vectorScore"] == pytest.approx(1.0, abs=1e-5)
+        assert "lexicalScore" in by_id["chunk-2"]
+        assert results == sorted(results, key=lambda result: result["similarityScore"], reverse=True)
+
+    def test_hybrid_falls_back_without_lexical_index(self, temp_dir: Path):
+        chromadb_path = str(temp_dir / "chromadb")
+        _, _, vectors = create_collection(chromadb_path)
+        provider = MagicMock()
+        provider.generate_embedding.return_value = vectors[1].tolist()
+
+        results = self.search(chromadb_path, provider, "anything", "hybrid", max_results=2)
+
+        assert results[0]["chunkId"] == "chunk-1"
+        assert "vectorScore" not in results[0]
+
+    def test_lexical_mode_requires_index(self, temp_dir: Path):
+        chromadb_path = str(temp_dir / "chromadb")
+        create_collection(chromadb_path)
+
+        with pytest.raises(SearchError, match="no lexical index"):
+            self.search(chromadb_path, MagicMock(), "anything", "lexical")
+
+    def test_invalid_mode(self, indexed):
+        chromadb_path, _ = indexed
+
+        with pytest.raises(SearchError, match="Invalid search_mode"):
+            self.search(chromadb_path, MagicMock(), "anything", "fuzzy")
+
+    def test_federated_lexical_search_skips_embedding(self, indexed):
+        chromadb_path, _ = indexed
+        provider = MagicMock()
+
+        with patch("minerva.server.federated_search.embed_query") as mock_embed:
+            results, errors = federated_search(
+                query="ERR_CONN_RESET",
+                chromadb_path=chromadb_path,
+                provider_map={"docs": provider},
+                context_mode="chunk_only",
+                max_results=2,
+                search_mode="lexical"
+            )
+
+        mock_embed.assert_not_called()
+        assert errors == {}
+        assert results[0]["chunkId"] == "chunk-0"
+
+    def test_batch_lexical_search_unions_queries(self, indexed):
+        chromadb_path, _ = indexed
+
+        results = search_knowledge_base_batch(
+            queries=["ERR_CONN_RESET", "getUserById"],
+            collection_name="docs",
+            chromadb_path=chromadb_path,
+            provider=MagicMock(),
+            context_mode="chunk_only",
+            max_results=1,
+            search_mode="lexical"
+        )
+
+        assert {result["chunkId"] for result in results} == {"chunk-0", "chunk-2"}
+        assert all(len(result["matchedQueries"]) == 1 for result in results)
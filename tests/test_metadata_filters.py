@@ -0,0 +1,127 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from minerva.indexing.filter_fields import build_filter_fields
+from minerva.indexing.lexical_index import sync_lexical_index
+from minerva.indexing.storage import initialize_chromadb_client
+from minerva.server.exact_search import ExactSearchEngine
+from minerva.server.metadata_filters import build_where_clause
+from minerva.server.search_tools import SearchError, search_knowledge_base
+
+
+class TestBuildWhereClause:
+    def test_no_filters(self):
+        assert build_where_clause(None) is None
+        assert build_where_clause({"author": None}) is None
+
+    def test_single_filter_is_not_wrapped(self):
+        assert build_where_clause({"year": 1965}) == {"year": 1965}
+
+    def test_source_path_prefix_matches_whole_segments(self):
+        assert build_where_clause({"source_path_prefix": "./docs/api/"}) == {
+            "$or": [{"sourcePath": "docs/api"}, {"pathPrefix2": "docs/api"}]
+        }
+
+    def test_filters_are_combined(self):
+        where = build_where_clause({
+            "modified_after": "2024-01-01",
+            "modified_before": "2024-02-01T00:00:00Z",
+            "author": "Frank HERBERT",
+        })
+
+        assert where == {"$and": [
+            {"modifiedAt": {"$gte": 1704067200}},
+            {"modifiedAt": {"$lt": 1706745600}},
+            {"authorKey": "frank herbert"},
+        ]}
+
+    @pytest.mark.parametrize("filters", [
+        {"modified_after": "last week"},
+        {"year": "1965"},
+        {"author": "  "},
+        {"source_path_prefix": "/"},
+        {"source_path_prefix": "/".join(["d"] * 20)},
+        {"title": "Dune"},
+    ])
+    def test_invalid_filters(self, filters):
+        with pytest.raises(ValueError):
+            build_where_clause(filters)
+
+
+NOTES = [
+    ("chunk-0", "Token refresh flow for the API", {"sourcePath": "docs/api/auth.md", "modificationDate": "2024-03-01T00:00:00Z"}),
+    ("chunk-1", "Token refresh in the API v2 draft", {"sourcePath": "docs/api-v2/auth.md", "modificationDate": "2024-05-01T00:00:00Z"}),
+    ("chunk-2", "Release checklist and token rotation", {"sourcePath": "ops/release.md", "modificationDate": "2023-06-01T00:00:00Z"}),
+    ("chunk-3", "A novel about tokens", {"author": "Frank Herbert", "year": 1965, "modificationDate": "1965-01-01T00:00:00Z"}),
+]
+
+
+@pytest.fixture
+def filtered_collection(temp_dir: Path):
+    chromadb_path = str(temp_dir / "chromadb")
+    client = initialize_chromadb_client(chromadb_path)
+    collection = client.create_collection(
+        name="docs",
+        metadata={"hnsw:space": "cosine", "embedding_dimension": 4, "embedding_model": "stub"}
+    )
+    vectors = np.random.default_rng(1).standard_normal((len(NOTES), 4)).astype(np.float32)
+    collection.add(
+        ids=[chunk_id for chunk_id, _, _ in NOTES],
+        embeddings=vectors,
+        documents=[document for _, document, _ in NOTES],
+        metadatas=[
+            {"title": f"Note {index}", "noteId": f"note-{index}", "chunkIndex": 0, **build_filter_fields(note)}
+            for index, (_, _, note) in enumerate(NOTES)
+        ]
+    )
+    sync_lexical_index(collection, chromadb_path)
+    return chromadb_path, vectors
+
+
+class TestFilteredSearch:
+    def search(self, chromadb_path, vectors, filters, **kwargs):
+        provider = MagicMock()
+        provider.generate_embedding.return_value = vectors[0].tolist()
+        results = search_knowledge_base(
+            query="token",
+            collection_name="docs",
+            chromadb_path=chromadb_path,
+            provider=provider,
+            context_mode="chunk_only",
+            max_results=5,
+            filters=filters,
+            **kwargs
+        )
+        return sorted(result["chunkId"] for result in results)
+
+    @pytest.mark.parametrize("search_mode", ["semantic", "hybrid", "lexical"])
+    def test_source_path_prefix(self, filtered_collection, search_mode):
+        chromadb_path, vectors = filtered_collection
+
+        found = self.search(chromadb_path, vectors, {"source_path_prefix": "docs/api"}, search_mode=search_mode)
+
+        assert found == ["chunk-0"]
+
+    def test_date_range_author_and_year(self, filtered_collection):
+        chromadb_path, vectors = filtered_collection
+
+        assert self.search(chromadb_path, vectors, {"modified_after": "2024-01-01"}) == ["chunk-0", "chunk-1"]
+        assert self.search(chromadb_path, vectors, {"modified_before": "2024-01-01"}) == ["chunk-2", "chunk-3"]
+        assert self.search(chromadb_path, vectors, {"author": "frank herbert", "year": 1965}) == ["chunk-3"]
+
+    def test_exact_search_engine(self, filtered_collection):
+        chromadb_path, vectors = filtered_collection
+        engine = ExactSearchEngine(chromadb_path, ["docs"])
+
+        found = self.search(chromadb_path, vectors, {"source_path_prefix": "docs"}, exact_search=engine)
+
+        assert found == ["chunk-0", "chunk-1"]
+
+    def test_invalid_filter(self, filtered_collection):
+        chromadb_path, vectors = filtered_collection
+
+        with pytest.raises(SearchError, match="Invalid filter"):
+            self.search(chromadb_path, vectors, {"year": "sometime"})
@@ -0,0 +1,121 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from minerva.common.metrics import (
+    MetricsRegistry,
+    PROVIDER_RETRIES,
+    SEARCH_REQUESTS,
+    SEARCH_STAGE_SECONDS,
+)
+from minerva.server.search_tools import search_knowledge_base
+
+
+class TestMetricsRegistry:
+    def test_counter_renders_labels_and_type(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("test_requests_total", "Requests", ["collection"])
+
+        counter.inc(collection="notes")
+        counter.inc(2, collection="notes")
+
+        text = registry.render()
+        assert "# TYPE test_requests_total counter" in text
+        assert 'test_requests_total{collection="notes"} 3' in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("test_seconds", "Latency", ["stage"], buckets=(0.1, 1.0))
+
+        histogram.observe(0.05, stage="a")
+        histogram.observe(0.5, stage="a")
+        histogram.observe(5.0, stage="a")
+
+        text = registry.render()
+        assert 'test_seconds_bucket{stage="a",le="0.1"} 1' in text
+        assert 'test_seconds_bucket{stage="a",le="1"} 2' in text
+        assert 'test_seconds_bucket{stage="a",le="+Inf"} 3' in text
+        assert 'test_seconds_count{stage="a"} 3' in text
+        assert 'test_seconds_sum{stage="a"} 5.55' in text
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.counter("test_total", "Test", ["name"]).inc(name='a"b')
+
+        assert 'test_total{name="a\\"b"} 1' in registry.render()
+
+    def test_wrong_labels_are_rejected(self):
+        counter = MetricsRegistry().counter("test_total", "Test", ["collection"])
+
+        with pytest.raises(ValueError):
+            counter.inc(mode="x")
+
+    def test_re_registering_returns_same_metric(self):
+        registry = MetricsRegistry()
+
+        first = registry.counter("test_total", "Test")
+        second = registry.counter("test_total", "Test")
+
+        assert first is second
+
+
+class TestSearchInstrumentation:
+    @patch('minerva.server.search_tools.initialize_chromadb_client')
+    def test_search_records_stage_latencies_and_request_count(self, mock_client_factory):
+        collection = MagicMock()
+        collection.metadata = {'embedding_dimension': 3}
+        collection.query.return_value = {
+            'ids': [['c1']],
+            'distances': [[0.1]],
+            'documents': [['Content']],
+            'metadatas': [[{'title': 'T', 'noteId': 'n1', 'chunkIndex': 0}]]
+        }
+        collection_ref = MagicMock()
+        collection_ref.name = 'metrics_test'
+        client = MagicMock()
+        client.list_collections.return_value = [collection_ref]
+        client.get_collection.return_value = collection
+        mock_client_factory.return_value = client
+
+        provider = MagicMock()
+        provider.generate_embedding.return_value = [0.1, 0.2, 0.3]
+
+        before_ann = SEARCH_STAGE_SECONDS.count(stage="ann_query")
+        before_requests = SEARCH_REQUESTS.value(collection="metrics_test", context_mode="chunk_only", status="ok")
+
+        search_knowledge_base("query", "metrics_test", "/fake", provider, context_mode="chunk_only")
+
+        assert SEARCH_STAGE_SECONDS.count(stage="ann_query") == before_ann + 1
+        assert SEARCH_REQUESTS.value(collection="metrics_test", context_mode="chunk_only", status="ok") == before_requests + 1
+
+
+class TestProviderRetryMetrics:
+    def test_retries_are_counted(self):
+        from minerva.indexing.embeddings import generate_embedding
+
+        provider = MagicMock()
+        provider.provider_type = "retry_test"
+        provider.generate_embedding.side_effect = [RuntimeError("boom"), [0.1, 0.2]]
+
+        before = PROVIDER_RETRIES.value(provider="retry_test", operation="embedding")
+
+        generate_embedding(provider, "text", max_retries=1, retry_delay=0)
+
+        assert PROVIDER_RETRIES.value(provider="retry_test", operation="embedding") == before + 1
+
+
+class TestMetricsEndpoint:
+    def test_metrics_route_serves_prometheus_text(self):
+        from starlette.testclient import TestClient
+        from mcp.server.fastmcp import FastMCP
+        from minerva.server.mcp_server import _register_http_routes
+
+        mcp = FastMCP("test")
+        _register_http_routes(mcp)
+
+        with TestClient(mcp.streamable_http_app()) as client:
+            response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE minerva_search_stage_seconds histogram" in response.text
@@ -0,0 +1,126 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from minerva.indexing.note_summaries import (
+    get_note_summary_collection,
+    is_note_summary_collection,
+    note_summary_collection_name,
+    remove_note_summaries,
+    sync_note_summaries,
+)
+from minerva.indexing.storage import initialize_chromadb_client
+from minerva.server.collection_discovery import list_searchable_collections
+from minerva.server.search_tools import search_knowledge_base
+from minerva.server.two_stage_search import TwoStageSearchEngine
+
+# Three notes of two chunks each; note-2's chunks point the other way from the rest
+VECTORS = {
+    "a0": ("note-0", [1.0, 0.0, 0.0]), "a1": ("note-0", [0.9, 0.1, 0.0]),
+    "b0": ("note-1", [0.7, 0.7, 0.0]), "b1": ("note-1", [0.6, 0.8, 0.0]),
+    "c0": ("note-2", [0.0, 0.0, 1.0]), "c1": ("note-2", [0.0, 0.1, 0.9]),
+}
+
+
+def create_collection(chromadb_path: str):
+    client = initialize_chromadb_client(chromadb_path)
+    collection = client.create_collection(
+        name="docs",
+        metadata={"hnsw:space": "cosine", "embedding_dimension": 3, "embedding_model": "stub"}
+    )
+    collection.add(
+        ids=list(VECTORS),
+        embeddings=[vector for _, vector in VECTORS.values()],
+        documents=[f"Chunk {chunk_id}" for chunk_id in VECTORS],
+        metadatas=[
+            {"noteId": note_id, "title": note_id, "chunkIndex": int(chunk_id[1]), "content_hash": f"h-{note_id}"}
+            for chunk_id, (note_id, _) in VECTORS.items()
+        ]
+    )
+    return client, collection
+
+
+class TestSyncNoteSummaries:
+    def test_builds_one_mean_vector_per_note(self, temp_dir: Path):
+        client, collection = create_collection(str(temp_dir / "chromadb"))
+
+        stats = sync_note_summaries(client, collection)
+
+        assert (stats.kept, stats.added, stats.removed) == (0, 3, 0)
+        summaries = get_note_summary_collection(client, "docs")
+        assert summaries.name == note_summary_collection_name("docs")
+        assert is_note_summary_collection(summaries)
+        stored = summaries.get(ids=["note-2"], include=["embeddings", "metadatas"])
+        assert stored["metadatas"][0]["chunkCount"] == 2
+        expected = np.mean([[0.0, 0.0, 1.0], np.array([0.0, 0.1, 0.9]) / np.linalg.norm([0.0, 0.1, 0.9])], axis=0)
+        np.testing.assert_allclose(stored["embeddings"][0], expected, rtol=1e-5)
+
+    def test_only_changed_notes_are_recomputed(self, temp_dir: Path):
+        client, collection = create_collection(str(temp_dir / "chromadb"))
+        sync_note_summaries(client, collection)
+
+        collection.delete(ids=["c0", "c1"])
+        collection.update(ids=["b0"], metadatas=[{"noteId": "note-1", "title": "note-1", "chunkIndex": 0,
+                                                  "content_hash": "h2"}])
+
+        stats = sync_note_summaries(client, collection)
+
+        assert (stats.kept, stats.added, stats.removed) == (1, 1, 1)
+        assert get_note_summary_collection(client, "docs").count() == 2
+
+    def test_summaries_are_hidden_and_removable(self, temp_dir: Path):
+        client, collection = create_collection(str(temp_dir / "chromadb"))
+        sync_note_summaries(client, collection)
+
+        assert [c.name for c in list_searchable_collections(client)] == ["docs"]
+        assert remove_note_summaries(client, "docs")
+        assert get_note_summary_collection(client, "docs") is None
+        assert not remove_note_summaries(client, "docs")
+
+
+class TestTwoStageSearch:
+    @pytest.fixture
+    def indexed(self, temp_dir: Path):
+        chromadb_path = str(temp_dir / "chromadb")
+        client, collection = create_collection(chromadb_path)
+        sync_note_summaries(client, collection)
+        return chromadb_path
+
+    def search(self, chromadb_path, engine, embedding, max_results=3):
+        provider = MagicMock()
+        provider.generate_embedding.return_value = embedding
+        return search_knowledge_base(
+            query="question",
+            collection_name="docs",
+            chromadb_path=chromadb_path,
+            provider=provider,
+            context_mode="chunk_only",
+            max_results=max_results,
+            two_stage=engine
+        )
+
+    def test_ranks_chunks_of_top_notes_only(self, indexed):
+        engine = TwoStageSearchEngine(indexed, {"docs": 1})
+
+        results = self.search(indexed, engine, [1.0, 0.05, 0.0])
+
+        assert [result["chunkId"] for result in results] == ["a0", "a1"]
+        assert results[0]["similarityScore"] == pytest.approx(0.9988, abs=1e-3)
+
+    def test_more_notes_widen_the_candidates(self, indexed):
+        engine = TwoStageSearchEngine(indexed, {"docs": 2})
+
+        results = self.search(indexed, engine, [0.7, 0.7, 0.0], max_results=4)
+
+        assert {result["noteId"] for result in results} == {"note-0", "note-1"}
+
+    def test_missing_summaries_fall_back_to_chunk_search(self, temp_dir: Path):
+        chromadb_path = str(temp_dir / "chromadb")
+        create_collection(chromadb_path)
+        engine = TwoStageSearchEngine(chromadb_path, {"docs": 1})
+
+        results = self.search(chromadb_path, engine, [0.0, 0.0, 1.0], max_results=6)
+
+        assert len(results) == 6
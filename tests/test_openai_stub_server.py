@@ -0,0 +1,113 @@
+import httpx
+import numpy as np
+import pytest
+
+from benchmarks.stub_provider import hashed_embedding
+from minerva.common.ai_config import AIProviderConfig
+from minerva.common.ai_provider import AIProvider, AIProviderError, LMStudioClient
+from minerva.common.exceptions import EmbeddingError
+from minerva.indexing.embeddings import generate_embedding
+from tests.helpers.openai_stub_server import OpenAIStubServer
+
+
+@pytest.fixture
+def stub():
+    with OpenAIStubServer() as server:
+        yield server
+
+
+def _lmstudio_provider(stub):
+    return AIProvider(AIProviderConfig(
+        provider_type="lmstudio",
+        embedding_model="stub-embedding",
+        llm_model="stub-chat",
+        base_url=stub.base_url
+    ))
+
+
+class TestStubEndpoints:
+    def test_embeddings_are_deterministic(self, stub):
+        provider = _lmstudio_provider(stub)
+
+        vector = provider.generate_embedding("alpha beta")
+
+        assert np.allclose(vector, hashed_embedding("alpha beta", 384), atol=1e-6)
+        assert vector == provider.generate_embedding("alpha beta")
+
+    def test_batch_embeddings_and_batch_size_limit(self, stub):
+        provider = _lmstudio_provider(stub)
+        stub.configure(max_batch_size=2)
+
+        assert len(provider.generate_embeddings_batch(["one", "two"])) == 2
+        with pytest.raises(AIProviderError):
+            provider.generate_embeddings_batch(["one", "two", "three"])
+
+        stats = stub.stats()
+        assert stats["batch_sizes"] == [2]
+        assert stats["statuses"]["400"] == 1
+
+    def test_chat_completion_returns_canned_text(self, stub):
+        stub.configure(completion_text="hello from stub")
+
+        response = _lmstudio_provider(stub).chat_completion(messages=[{"role": "user", "content": "hi"}])
+
+        assert response["content"] == "hello from stub"
+
+    def test_streaming_chat_completion(self, stub):
+        client = LMStudioClient(stub.base_url)
+
+        result = client.chat_completion("stub-chat", [{"role": "user", "content": "hi"}], 0.0, None, None, True)
+        chunks = list(result["stream"])
+
+        text = "".join(chunk["choices"][0]["delta"].get("content", "") for chunk in chunks)
+        assert text == "This is a canned response from the stub server."
+        assert chunks[-1]["choices"][0]["finish_reason"] == "stop"
+
+    def test_runtime_config_and_stats_over_http(self, stub):
+        response = httpx.post(f"{stub.url}/_stub/config", json={"latency_ms": 1})
+        stats = httpx.get(f"{stub.url}/_stub/stats").json()
+
+        assert response.status_code == 200
+        assert stub.state.latency_ms == 1
+        assert "connections" in stats
+
+        assert httpx.post(f"{stub.url}/_stub/config", json={"bogus": 1}).status_code == 400
+
+
+class TestFaultInjection:
+    def test_rate_limited_response_carries_retry_after(self, stub):
+        stub.configure(rate_limit_rate=1.0, retry_after_seconds=3)
+
+        response = httpx.post(f"{stub.base_url}/embeddings", json={"model": "m", "input": "x"})
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "3"
+        assert response.json()["error"]["code"] == "rate_limit_exceeded"
+
+    def test_requests_per_minute_window(self, stub):
+        stub.configure(requests_per_minute=2)
+
+        statuses = [
+            httpx.post(f"{stub.base_url}/embeddings", json={"model": "m", "input": "x"}).status_code
+            for _ in range(3)
+        ]
+
+        assert statuses == [200, 200, 429]
+
+    def test_retry_recovers_from_transient_failures(self, stub):
+        provider = _lmstudio_provider(stub)
+        stub.configure(fail_next=[2, 429])
+
+        vector = generate_embedding(provider, "retry me", max_retries=3, retry_delay=0)
+
+        assert len(vector) == 384
+        assert stub.stats()["statuses"] == {"429": 2, "200": 1}
+
+    def test_retry_gives_up_when_errors_persist(self, stub):
+        provider = _lmstudio_provider(stub)
+        stub.configure(error_rate=1.0)
+
+        with pytest.raises(EmbeddingError):
+            generate_embedding(provider, "never works", max_retries=1, retry_delay=0)
+
+        assert stub.stats()["statuses"]["500"] == 2
@@ -0,0 +1,117 @@
+import json
+import pstats
+
+import pytest
+
+from minerva.cli import create_parser
+from minerva.common import profiling
+
+
+def _allocate(size):
+    return bytearray(size)
+
+
+class TestMemoryProfiler:
+    def test_stage_records_peak_per_stage(self):
+        profiler = profiling.MemoryProfiler()
+        profiler.start()
+        try:
+            with profiler.stage("small"):
+                _allocate(10_000)
+            with profiler.stage("large"):
+                _allocate(2_000_000)
+        finally:
+            report = profiler.stop()
+
+        stages = {stage["name"]: stage for stage in report["stages"]}
+        assert stages["large"]["peak_bytes"] - stages["small"]["peak_bytes"] > 1_000_000
+        assert report["overall_peak_bytes"] >= stages["large"]["peak_bytes"]
+
+    def test_repeated_stages_accumulate_calls(self):
+        profiler = profiling.MemoryProfiler()
+        profiler.start()
+        try:
+            for _ in range(3):
+                with profiler.stage("embed"):
+                    _allocate(1000)
+        finally:
+            report = profiler.stop()
+
+        (stage,) = report["stages"]
+        assert stage["calls"] == 3
+
+    def test_nested_stage_peak_counts_toward_outer(self):
+        profiler = profiling.MemoryProfiler()
+        profiler.start()
+        try:
+            with profiler.stage("outer"):
+                with profiler.stage("inner"):
+                    _allocate(2_000_000)
+        finally:
+            report = profiler.stop()
+
+        stages = {stage["name"]: stage for stage in report["stages"]}
+        assert stages["outer"]["peak_bytes"] >= stages["inner"]["peak_bytes"]
+
+    def test_pipeline_stage_is_noop_without_profiler(self):
+        with profiling.pipeline_stage("load"):
+            pass
+
+
+class TestRunProfiled:
+    def test_cprofile_writes_pstats_and_summary(self, temp_dir):
+        result = profiling.run_profiled(lambda: sum(range(1000)), "validate", profile_dir=temp_dir)
+
+        assert result == sum(range(1000))
+        (pstats_path,) = temp_dir.glob("validate-*.pstats")
+        (summary_path,) = temp_dir.glob("validate-*.txt")
+        assert pstats.Stats(str(pstats_path)).total_calls > 0
+        assert "cumulative" in summary_path.read_text()
+
+    def test_memory_profile_reports_pipeline_stages(self, temp_dir):
+        def command():
+            with profiling.pipeline_stage("chunk"):
+                _allocate(100_000)
+            return 0
+
+        profiling.run_profiled(command, "index", profile_dir=temp_dir, cpu=False, memory=True)
+
+        (json_path,) = temp_dir.glob("index-*-memory.json")
+        report = json.loads(json_path.read_text())
+        assert [stage["name"] for stage in report["stages"]] == ["chunk"]
+        assert list(temp_dir.glob("index-*-memory.txt"))
+        assert profiling._memory_profiler is None
+
+    def test_sampling_falls_back_to_cprofile_when_unavailable(self, temp_dir, monkeypatch):
+        monkeypatch.setitem(__import__("sys").modules, "pyinstrument", None)
+
+        profiling.run_profiled(lambda: None, "query", profile_dir=temp_dir, profiler="sampling")
+
+        assert list(temp_dir.glob("query-*.pstats"))
+
+    def test_profile_is_written_when_command_fails(self, temp_dir):
+        def command():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            profiling.run_profiled(command, "index", profile_dir=temp_dir, memory=True)
+
+        assert list(temp_dir.glob("index-*.pstats"))
+        assert list(temp_dir.glob("index-*-memory.json"))
+
+
+class TestProfileCliOptions:
+    def test_global_profile_flags(self):
+        args = create_parser().parse_args(
+            ["--profile", "--profiler", "sampling", "--memory-profile", "--profile-dir", "/tmp/p", "validate", "notes.json"]
+        )
+
+        assert args.profile and args.memory_profile
+        assert args.profiler == "sampling"
+        assert str(args.profile_dir) == "/tmp/p"
+        assert args.command == "validate"
+
+    def test_profiling_off_by_default(self):
+        args = create_parser().parse_args(["validate", "notes.json"])
+
+        assert not args.profile and not args.memory_profile
@@ -0,0 +1,128 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from minerva.common.ai_config import AIProviderConfig
+from minerva.common.ai_provider import AIProvider
+from minerva.common.exceptions import ProviderCircuitOpenError, ProviderUnavailableError
+from minerva.common.models import Chunk
+from minerva.indexing.embeddings import generate_embeddings
+from tests.helpers.config_builders import make_index_config
+
+URLS = ('http://gpu-1:1234', 'http://gpu-2:1234', 'http://gpu-3:1234')
+
+
+class FakeEndpointClient:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.down = False
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def embeddings(self, model, texts):
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            if self.down:
+                raise ProviderUnavailableError("Connection refused")
+            time.sleep(self.delay)
+            return {'data': [{'embedding': [float(len(text)), 1.0]} for text in texts]}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def build_provider(delay=0.0):
+    provider = AIProvider(AIProviderConfig(
+        provider_type='lmstudio',
+        embedding_model='lm-embed',
+        base_urls=URLS
+    ))
+    clients = [FakeEndpointClient(delay) for _ in URLS]
+    for endpoint, client in zip(provider.endpoints, clients):
+        endpoint.client = client
+    return provider, clients
+
+
+def _chunks(count):
+    return [
+        Chunk(id=f"c{i}", content="x" * (i + 1), noteId="n1", title="Note", modificationDate="2025-01-01",
+              creationDate="2025-01-01", size=10, chunkIndex=i)
+        for i in range(count)
+    ]
+
+
+class TestEndpointConfig:
+    def test_list_of_base_urls_is_loaded(self, temp_dir: Path):
+        config, _ = make_index_config(temp_dir, provider_overrides={"base_url": list(URLS)})
+
+        assert config.provider.base_urls == URLS
+        assert config.provider.base_url == URLS[0]
+        assert config.provider.endpoints == URLS
+
+    def test_single_base_url_keeps_one_endpoint(self, temp_dir: Path):
+        config, _ = make_index_config(temp_dir, provider_overrides={"base_url": URLS[0]})
+
+        assert config.provider.base_urls == ()
+        assert config.provider.endpoints == (URLS[0],)
+
+    def test_provider_has_one_endpoint_per_url(self):
+        assert build_provider()[0].endpoint_count == 3
+        single = AIProviderConfig(provider_type='lmstudio', embedding_model='lm-embed', base_url=URLS[0])
+        assert AIProvider(single).endpoint_count == 1
+
+    def test_base_url_must_lead_base_urls(self):
+        with pytest.raises(ValueError):
+            AIProviderConfig(provider_type='ollama', embedding_model='m', base_url=URLS[1], base_urls=URLS)
+
+
+class TestEndpointDispatch:
+    def test_idle_endpoints_take_turns(self):
+        provider, clients = build_provider()
+
+        for _ in range(6):
+            provider.generate_embedding('text')
+
+        assert [client.calls for client in clients] == [2, 2, 2]
+
+    def test_unreachable_endpoint_fails_over_and_is_skipped(self):
+        provider, clients = build_provider()
+        clients[0].down = True
+
+        for _ in range(9):
+            provider.generate_embedding('text')
+
+        assert clients[0].calls == 3
+        assert provider.endpoints[0].health.snapshot()['state'] == "open"
+        assert clients[1].calls + clients[2].calls == 9
+
+    def test_all_endpoints_down_fails_fast(self):
+        provider, clients = build_provider()
+        for client in clients:
+            client.down = True
+
+        for _ in range(3):
+            with pytest.raises(ProviderUnavailableError):
+                provider.generate_embedding('text')
+
+        with pytest.raises(ProviderCircuitOpenError, match="All 3 lmstudio endpoints"):
+            provider.generate_embedding('text')
+
+
+class TestParallelIndexing:
+    def test_one_request_in_flight_per_endpoint(self):
+        provider, clients = build_provider(delay=0.02)
+        chunks = _chunks(30)
+
+        embedded = generate_embeddings(provider, chunks, max_retries=0, retry_delay=0)
+
+        assert [item.chunk.id for item in embedded] == [chunk.id for chunk in chunks]
+        assert sum(client.calls for client in clients) == 31
+        assert all(client.peak == 1 for client in clients)
+        assert all(client.calls >= 5 for client in clients)
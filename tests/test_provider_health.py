@@ -0,0 +1,153 @@
+import time
+
+import pytest
+
+from minerva.common.ai_config import AIProviderConfig
+from minerva.common.ai_provider import (
+    AIProvider,
+    ProviderHealthMonitor,
+    provider_health_snapshot,
+)
+from minerva.common.exceptions import EmbeddingError, ProviderCircuitOpenError, ProviderUnavailableError
+from minerva.common.models import Chunk
+from minerva.indexing.embeddings import generate_embedding, generate_embeddings
+
+
+class FlakyLMStudioClient:
+    def __init__(self):
+        self.down = False
+        self.calls = 0
+
+    def embeddings(self, model, texts):
+        self.calls += 1
+        if self.down:
+            raise ProviderUnavailableError("Connection refused")
+        return {'data': [{'embedding': [3.0, 4.0]} for _ in texts]}
+
+
+def build_provider(base_url='http://localhost:1234'):
+    provider = AIProvider(AIProviderConfig(
+        provider_type='lmstudio',
+        embedding_model='lm-embed',
+        llm_model='lm-chat',
+        base_url=base_url
+    ))
+    provider.lmstudio_client = FlakyLMStudioClient()
+    return provider
+
+
+def _fail(provider, times):
+    for _ in range(times):
+        with pytest.raises(ProviderUnavailableError):
+            provider.generate_embedding('text')
+
+
+class TestProviderCircuit:
+    def test_calls_fail_fast_after_consecutive_connection_errors(self):
+        provider = build_provider()
+        provider.lmstudio_client.down = True
+
+        _fail(provider, 3)
+        with pytest.raises(ProviderCircuitOpenError):
+            provider.generate_embedding('text')
+
+        assert provider.lmstudio_client.calls == 3
+
+    def test_other_errors_do_not_open_the_circuit(self):
+        monitor = ProviderHealthMonitor("test", failure_threshold=2)
+
+        for _ in range(5):
+            monitor.record_failure(ValueError("invalid response shape"))
+
+        monitor.before_call()
+        assert monitor.snapshot()['state'] == "closed"
+
+    def test_providers_on_the_same_endpoint_share_health(self):
+        first = build_provider()
+        second = build_provider()
+        other = build_provider('http://localhost:5678')
+        first.lmstudio_client.down = True
+
+        _fail(first, 3)
+
+        with pytest.raises(ProviderCircuitOpenError):
+            second.generate_embedding('text')
+        assert other.generate_embedding('text') == pytest.approx([0.6, 0.8])
+
+    def test_background_probe_closes_the_circuit_on_recovery(self):
+        monitor = ProviderHealthMonitor("test", failure_threshold=1, probe_interval=0.05)
+        endpoint = {'down': True}
+
+        def probe():
+            if endpoint['down']:
+                raise ProviderUnavailableError("Connection refused")
+
+        monitor.set_probe(probe)
+        monitor.record_failure(ProviderUnavailableError("Connection refused"))
+        with pytest.raises(ProviderCircuitOpenError):
+            monitor.before_call()
+
+        endpoint['down'] = False
+        deadline = time.monotonic() + 2
+        while monitor.snapshot()['state'] != "closed" and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        monitor.before_call()
+        assert monitor.snapshot()['consecutive_failures'] == 0
+
+    def test_snapshot_reports_open_endpoints(self):
+        provider = build_provider()
+        provider.lmstudio_client.down = True
+
+        _fail(provider, 3)
+
+        [entry] = provider_health_snapshot()
+        assert entry['provider'] == 'lmstudio@http://localhost:1234'
+        assert entry['state'] == "open"
+        assert entry['last_error'] == "Connection refused"
+
+
+class TestAvailabilityCache:
+    def test_availability_is_reused_within_ttl(self):
+        provider = build_provider()
+
+        assert provider.check_availability()['available'] is True
+        assert provider.check_availability()['available'] is True
+
+        assert provider.lmstudio_client.calls == 1
+
+    def test_open_circuit_bypasses_cached_availability(self):
+        provider = build_provider()
+        provider.check_availability()
+        provider.lmstudio_client.down = True
+
+        _fail(provider, 3)
+
+        assert provider.check_availability()['available'] is False
+
+
+class TestIndexingFailsFast:
+    def test_retries_stop_once_the_circuit_opens(self):
+        provider = build_provider()
+        provider.lmstudio_client.down = True
+
+        with pytest.raises(ProviderCircuitOpenError):
+            generate_embedding(provider, 'text', max_retries=5, retry_delay=0)
+
+        assert provider.lmstudio_client.calls == 3
+
+    def test_generate_embeddings_aborts_instead_of_failing_every_chunk(self):
+        provider = build_provider()
+        provider.check_availability()
+        provider.lmstudio_client = FlakyLMStudioClient()
+        provider.lmstudio_client.down = True
+        chunks = [
+            Chunk(id=f"c{i}", content=f"chunk {i}", noteId="n1", title="Note", modificationDate="2025-01-01",
+                  creationDate="2025-01-01", size=10, chunkIndex=i)
+            for i in range(10)
+        ]
+
+        with pytest.raises(EmbeddingError, match="Provider unavailable"):
+            generate_embeddings(provider, chunks, max_retries=1, retry_delay=0)
+
+        assert provider.lmstudio_client.calls == 3
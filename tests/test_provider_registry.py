@@ -0,0 +1,107 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from minerva.common.exceptions import ProviderUnavailableError
+from minerva.server import mcp_server
+from minerva.server.provider_registry import LazyProviderRegistry
+from tests.helpers.config_builders import make_server_config
+
+
+def _metadata(model: str = "embed") -> dict:
+    return {
+        'embedding_provider': 'ollama',
+        'embedding_model': model,
+        'llm_model': 'llm',
+        'embedding_base_url': 'http://localhost:11434',
+        'embedding_api_key_ref': None
+    }
+
+
+class TestLazyProviderRegistry:
+    def test_provider_is_built_on_first_use_and_shared(self):
+        registry = LazyProviderRegistry()
+        registry.register("a", _metadata())
+        registry.register("b", _metadata())
+        provider = MagicMock()
+
+        with patch(
+            'minerva.server.provider_registry.reconstruct_provider_from_metadata',
+            return_value=(provider, None)
+        ) as reconstruct:
+            assert registry.cached("a") is None
+            assert registry.get("a") is provider
+            assert registry.get("b") is provider
+
+        assert reconstruct.call_count == 1
+        assert registry.cached("b") is provider
+
+    def test_repeated_failures_open_the_circuit(self):
+        registry = LazyProviderRegistry(failure_threshold=2, cooldown_seconds=60)
+        registry.register("a", _metadata())
+
+        with patch(
+            'minerva.server.provider_registry.reconstruct_provider_from_metadata',
+            return_value=(None, "connection refused")
+        ) as reconstruct:
+            for _ in range(2):
+                with pytest.raises(ProviderUnavailableError):
+                    registry.get("a")
+            with pytest.raises(ProviderUnavailableError) as exc_info:
+                registry.get("a")
+
+        assert reconstruct.call_count == 2
+        assert "retrying in" in str(exc_info.value)
+        assert "connection refused" in str(exc_info.value)
+
+    def test_failing_provider_does_not_affect_other_configurations(self):
+        registry = LazyProviderRegistry(failure_threshold=1)
+        registry.register("down", _metadata("down"))
+        registry.register("up", _metadata("up"))
+        provider = MagicMock()
+
+        def reconstruct(metadata):
+            return (None, "down") if metadata['embedding_model'] == "down" else (provider, None)
+
+        with patch('minerva.server.provider_registry.reconstruct_provider_from_metadata', side_effect=reconstruct):
+            with pytest.raises(ProviderUnavailableError):
+                registry.get("down")
+            assert registry.get("up") is provider
+
+    def test_unknown_collection_raises_key_error(self):
+        with pytest.raises(KeyError):
+            LazyProviderRegistry().get("missing")
+
+
+class TestFederatedSearchWithLazyProviders:
+    def test_named_collection_with_failing_provider_is_skipped(self, temp_dir, monkeypatch):
+        server_config, _ = make_server_config(temp_dir)
+        registry = LazyProviderRegistry(failure_threshold=1)
+        registry.register("a", _metadata("up"))
+        registry.register("b", _metadata("down"))
+        provider = MagicMock()
+        monkeypatch.setattr(mcp_server, "SERVER_CONFIG", server_config)
+        monkeypatch.setattr(mcp_server, "PROVIDER_REGISTRY", registry)
+
+        def reconstruct(metadata):
+            return (None, "connection refused") if metadata['embedding_model'] == "down" else (provider, None)
+
+        def search(**kwargs):
+            return [{
+                'collectionName': kwargs['collection_name'],
+                'chunkId': 'chunk-0',
+                'noteTitle': 'Note',
+                'similarityScore': 0.9,
+                'content': 'text'
+            }]
+
+        with patch('minerva.server.provider_registry.reconstruct_provider_from_metadata', side_effect=reconstruct), \
+                patch('minerva.server.federated_search.initialize_chromadb_client'), \
+                patch('minerva.server.federated_search.embed_query', return_value=[0.1]), \
+                patch('minerva.server.federated_search.search_knowledge_base', side_effect=search) as search_mock, \
+                patch('minerva.server.federated_search.retrieve_collection_context',
+                      side_effect=lambda **kwargs: kwargs['results']):
+            results = mcp_server.search_all_knowledge_bases("query", collection_names=["a", "b"])
+
+        assert [result['collectionName'] for result in results] == ["a"]
+        assert [call.kwargs['collection_name'] for call in search_mock.call_args_list] == ["a"]
@@ -0,0 +1,144 @@
+from unittest.mock import MagicMock
+
+from minerva.common.models import Chunk, ChunkWithEmbedding
+from minerva.common.tokens import approximate_token_count, count_tokens
+from minerva.indexing.storage import prepare_chunk_batch_data
+from minerva.server.context_retrieval import apply_context_mode
+from minerva.server.response_packer import (
+    RESULT_OVERHEAD_TOKENS,
+    chunk_token_count,
+    pack_windows,
+)
+
+
+def _result(note_id: str, chunk_index: int) -> dict:
+    return {
+        'chunkId': f"{note_id}-{chunk_index}",
+        'noteTitle': f"Note {note_id}",
+        'noteId': note_id,
+        'chunkIndex': chunk_index,
+        'modificationDate': '2025-01-01T00:00:00Z',
+        'collectionName': 'test_collection',
+        'similarityScore': 0.9,
+        'content': f"{note_id} match {chunk_index}",
+        'totalChunks': 1
+    }
+
+
+def _window(note_id: str, matched: int, low: int, high: int, tokens: int = 100) -> dict:
+    return {
+        'result': _result(note_id, matched),
+        'chunks': [
+            {'index': i, 'content': f"{note_id} chunk {i}", 'tokenCount': tokens}
+            for i in range(low, high + 1)
+        ]
+    }
+
+
+def _overhead(note_id: str) -> int:
+    return RESULT_OVERHEAD_TOKENS + approximate_token_count(f"Note {note_id}")
+
+
+class TestTokenCounting:
+    def test_approximate_count_is_quarter_of_characters(self):
+        assert approximate_token_count("") == 0
+        assert approximate_token_count("abc") == 1
+        assert approximate_token_count("a" * 400) == 100
+
+    def test_count_tokens_is_positive_for_text(self):
+        assert count_tokens("Some markdown text about indexing.") > 0
+
+    def test_chunk_token_count_prefers_stored_value(self):
+        assert chunk_token_count({'content': "x" * 400, 'tokenCount': 7}) == 7
+        assert chunk_token_count({'content': "x" * 400}) == 100
+
+    def test_token_count_is_stored_in_chunk_metadata(self):
+        chunk = Chunk(
+            id="c1", content="Body", noteId="n1", title="Title",
+            modificationDate="2025-01-01", creationDate="2025-01-01",
+            size=4, chunkIndex=0, token_count=3
+        )
+
+        _, _, _, metadatas = prepare_chunk_batch_data([ChunkWithEmbedding(chunk=chunk, embedding=[0.1, 0.2])])
+
+        assert metadatas[0]['tokenCount'] == 3
+
+
+class TestPackWindows:
+    def test_everything_fits_under_large_budget(self):
+        windows = [_window('a', 2, 0, 4), _window('b', 2, 0, 4)]
+
+        packed, used = pack_windows(windows, 100000)
+
+        assert [len(window['chunks']) for window in packed] == [5, 5]
+        assert used == _overhead('a') + _overhead('b') + 1000
+
+    def test_matched_chunks_are_admitted_before_context(self):
+        windows = [_window('a', 2, 0, 4), _window('b', 2, 0, 4), _window('c', 2, 0, 4)]
+        budget = _overhead('a') + _overhead('b') + _overhead('c') + 300
+
+        packed, used = pack_windows(windows, budget)
+
+        assert [window['result']['noteId'] for window in packed] == ['a', 'b', 'c']
+        assert all([chunk['index'] for chunk in window['chunks']] == [2] for window in packed)
+        assert used <= budget
+
+    def test_context_grows_ring_by_ring_in_rank_order(self):
+        windows = [_window('a', 2, 0, 4), _window('b', 2, 0, 4)]
+        budget = _overhead('a') + _overhead('b') + 200 + 300
+
+        packed, _ = pack_windows(windows, budget)
+
+        assert [chunk['index'] for chunk in packed[0]['chunks']] == [1, 2, 3]
+        assert [chunk['index'] for chunk in packed[1]['chunks']] == [1, 2]
+
+    def test_lower_ranked_results_are_dropped(self):
+        windows = [_window('a', 2, 0, 4), _window('b', 2, 0, 4)]
+
+        packed, _ = pack_windows(windows, _overhead('a') + 150)
+
+        assert [window['result']['noteId'] for window in packed] == ['a']
+
+    def test_top_result_is_kept_even_over_budget(self):
+        packed, _ = pack_windows([_window('a', 2, 0, 4, tokens=5000)], 1000)
+
+        assert len(packed) == 1
+        assert [chunk['index'] for chunk in packed[0]['chunks']] == [2]
+
+    def test_shared_chunks_are_charged_once(self):
+        windows = [_window('a', 2, 0, 4), _window('a', 3, 1, 5)]
+
+        _, used = pack_windows(windows, 100000)
+
+        assert used == 2 * _overhead('a') + 600
+
+
+class TestApplyContextModeBudget:
+    def test_full_note_is_trimmed_around_match(self):
+        collection = MagicMock()
+        collection.get.return_value = {
+            'ids': [f"c{i}" for i in range(10)],
+            'documents': [f"Part {i}." for i in range(10)],
+            'metadatas': [{'noteId': 'n1', 'chunkIndex': i, 'tokenCount': 100} for i in range(10)]
+        }
+
+        results = apply_context_mode(
+            collection, [_result('n1', 5)], "full_note", token_budget=_overhead('n1') + 300
+        )
+
+        assert results[0]['totalChunks'] == 3
+        assert "Part 4." in results[0]['content']
+        assert "Part 6." in results[0]['content']
+        assert "Part 3." not in results[0]['content']
+
+    def test_chunk_only_drops_results_past_budget(self):
+        results = [_result('a', 0), _result('b', 0), _result('c', 0)]
+
+        packed = apply_context_mode(MagicMock(), results, "chunk_only", token_budget=_overhead('a') + 20)
+
+        assert [result['noteId'] for result in packed] == ['a']
+
+    def test_no_budget_keeps_all_results(self):
+        results = [_result('a', 0), _result('b', 0)]
+
+        assert len(apply_context_mode(MagicMock(), results, "chunk_only")) == 2
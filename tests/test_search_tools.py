@@ -7,7 +7,12 @@ so that AI assistants can cite sources when presenting information to users.
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from minerva.server.search_tools import search_knowledge_base
+from minerva.server.search_tools import (
+    MAX_BATCH_QUERIES,
+    SearchError,
+    search_knowledge_base,
+    search_knowledge_base_batch,
+)
 
 
 class TestCitationRequirement:
@@ -271,3 +276,83 @@ class TestResultStructure:
         assert result['noteId'] == 'note123'
         assert result['chunkIndex'] == 5
         assert result['collectionName'] == 'test_collection'
+
+
+class TestSearchKnowledgeBaseBatch:
+    """Several queries share one embedding request, one ChromaDB query and one result list."""
+
+    def make_collection(self):
+        metadata = {
+            'a': {'title': 'Note A', 'noteId': 'na', 'chunkIndex': 0},
+            'b': {'title': 'Note B', 'noteId': 'nb', 'chunkIndex': 0},
+            'c': {'title': 'Note C', 'noteId': 'nc', 'chunkIndex': 0},
+        }
+        collection = MagicMock()
+        collection.name = 'docs'
+        collection.metadata = {'embedding_dimension': 2}
+        collection.query.return_value = {
+            'ids': [['a', 'b'], ['b', 'c']],
+            'distances': [[0.1, 0.4], [0.2, 0.5]],
+            'documents': [['A', 'B'], ['B', 'C']],
+            'metadatas': [[metadata['a'], metadata['b']], [metadata['b'], metadata['c']]],
+        }
+        client = MagicMock()
+        client.list_collections.return_value = [collection]
+        client.get_collection.return_value = collection
+        return client, collection
+
+    def test_one_embedding_request_and_one_query(self):
+        client, collection = self.make_collection()
+        provider = MagicMock()
+        provider.generate_embeddings_batch.return_value = [[1.0, 0.0], [0.0, 1.0]]
+
+        results = search_knowledge_base_batch(
+            queries=["first question", "second question"],
+            collection_name='docs',
+            chromadb_path='/fake/path',
+            provider=provider,
+            context_mode='chunk_only',
+            max_results=2,
+            client=client
+        )
+
+        provider.generate_embeddings_batch.assert_called_once_with(["first question", "second question"])
+        provider.generate_embedding.assert_not_called()
+        collection.query.assert_called_once()
+        assert collection.query.call_args.kwargs['query_embeddings'] == [[1.0, 0.0], [0.0, 1.0]]
+
+        # 'b' was found by both queries and appears once, with its best score
+        assert [result['chunkId'] for result in results] == ['a', 'b', 'c']
+        by_id = {result['chunkId']: result for result in results}
+        assert by_id['b']['matchedQueries'] == ["first question", "second question"]
+        assert by_id['b']['similarityScore'] == pytest.approx(0.8)
+        assert by_id['c']['matchedQueries'] == ["second question"]
+
+    def test_duplicate_and_blank_queries_are_dropped(self):
+        client, collection = self.make_collection()
+        provider = MagicMock()
+        provider.generate_embedding.return_value = [1.0, 0.0]
+        collection.query.return_value = {
+            key: value[:1] for key, value in collection.query.return_value.items()
+        }
+
+        search_knowledge_base_batch(
+            queries=["same", " same ", ""],
+            collection_name='docs',
+            chromadb_path='/fake/path',
+            provider=provider,
+            context_mode='chunk_only',
+            client=client
+        )
+
+        provider.generate_embedding.assert_called_once_with("same")
+
+    @pytest.mark.parametrize("queries", [[], ["  "], [f"q{index}" for index in range(MAX_BATCH_QUERIES + 1)]])
+    def test_rejects_empty_or_oversized_batches(self, queries):
+        with pytest.raises(SearchError):
+            search_knowledge_base_batch(
+                queries=queries,
+                collection_name='docs',
+                chromadb_path='/fake/path',
+                provider=MagicMock()
+            )
@@ -0,0 +1,124 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from minerva.cli import create_parser
+from minerva.common import tracing
+from minerva.common.exceptions import ConfigError
+from minerva.indexing.storage import insert_batch_to_collection, note_hashes_by_chunk
+
+
+@pytest.fixture(autouse=True)
+def reset_tracing():
+    tracing.shutdown_tracing()
+    yield
+    tracing.shutdown_tracing()
+
+
+def _read_jsonl(path):
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+class TestDisabledTracing:
+    def test_span_is_noop_when_disabled(self):
+        assert not tracing.is_tracing_enabled()
+
+        with tracing.span("anything", size=3) as attributes:
+            attributes["ignored"] = True
+
+    def test_traced_function_runs_normally_when_disabled(self):
+        @tracing.traced("test.func")
+        def add(a, b):
+            return a + b
+
+        assert add(1, 2) == 3
+
+
+class TestJsonLinesExport:
+    def test_nested_spans_record_parent(self, temp_dir):
+        path = temp_dir / "trace.jsonl"
+        tracing.configure_tracing(path)
+
+        with tracing.span("outer", collection="notes"):
+            with tracing.span("inner") as attributes:
+                attributes["results"] = 4
+
+        events = _read_jsonl(path)
+        inner, outer = events
+
+        assert outer["name"] == "outer" and outer["parent_id"] is None
+        assert inner["parent_id"] == outer["span_id"]
+        assert inner["attributes"] == {"results": 4}
+        assert outer["attributes"] == {"collection": "notes"}
+        assert outer["duration_us"] >= inner["duration_us"]
+
+    def test_traced_records_errors(self, temp_dir):
+        path = temp_dir / "trace.jsonl"
+        tracing.configure_tracing(path)
+
+        @tracing.traced("test.failing")
+        def fail():
+            raise ValueError("nope")
+
+        with pytest.raises(ValueError):
+            fail()
+
+        (event,) = _read_jsonl(path)
+        assert event["name"] == "test.failing"
+        assert event["attributes"]["error"] == "ValueError: nope"
+
+
+class TestInstrumentedFunctions:
+    def test_insert_batch_span_comes_from_insert_batch_to_collection(self, temp_dir):
+        path = temp_dir / "trace.jsonl"
+        tracing.configure_tracing(path)
+
+        note_hashes_by_chunk([("c0", {"noteId": "n1", "content_hash": "h"})])
+        assert not path.exists() or _read_jsonl(path) == []
+
+        insert_batch_to_collection(Mock(), [], 1, {"successful": 0, "batches": 0})
+        assert [event["name"] for event in _read_jsonl(path)] == ["index.insert_batch"]
+
+
+class TestChromeExport:
+    def test_chrome_trace_written_on_shutdown(self, temp_dir):
+        path = temp_dir / "trace.json"
+        tracer = tracing.configure_tracing(path)
+        assert tracer.trace_format == "chrome"
+
+        with tracing.span("index.embed", batch=1):
+            pass
+        tracing.shutdown_tracing()
+
+        payload = json.loads(path.read_text())
+        (event,) = payload["traceEvents"]
+        assert event["ph"] == "X"
+        assert event["name"] == "index.embed"
+        assert event["cat"] == "index"
+        assert event["args"]["batch"] == 1
+
+    def test_unknown_format_is_rejected(self, temp_dir):
+        with pytest.raises(ConfigError):
+            tracing.configure_tracing(temp_dir / "trace.out", "xml")
+
+
+class TestTracingConfiguration:
+    def test_environment_variable_enables_tracing(self, temp_dir, monkeypatch):
+        monkeypatch.setenv(tracing.TRACE_ENV_VAR, str(temp_dir / "env.jsonl"))
+
+        tracer = tracing.configure_tracing_from_env()
+
+        assert tracer is not None
+        assert tracing.is_tracing_enabled()
+
+    def test_environment_variable_unset_leaves_tracing_disabled(self, monkeypatch):
+        monkeypatch.delenv(tracing.TRACE_ENV_VAR, raising=False)
+
+        assert tracing.configure_tracing_from_env() is None
+
+    def test_cli_accepts_global_trace_flag(self):
+        args = create_parser().parse_args(["--trace", "/tmp/t.json", "validate", "notes.json"])
+
+        assert str(args.trace) == "/tmp/t.json"
+        assert args.command == "validate"
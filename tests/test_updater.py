@@ -17,6 +17,8 @@ from minerva.indexing.updater import (
     delete_note_chunks,
     update_collection_timestamp,
     update_collection_description,
+    FETCH_PAGE_SIZE,
+    DELETE_BATCH_SIZE,
 )
 
 
@@ -364,6 +366,21 @@ class TestFetchExistingState:
         assert len(result.noteId_to_chunks) == 0
         assert len(result.noteId_to_hash) == 0
 
+    def test_fetches_large_collections_in_pages(self):
+        collection = Mock()
+        collection.count.return_value = FETCH_PAGE_SIZE + 1
+
+        def get_page(include, limit, offset):
+            ids = [f'chunk{i}' for i in range(offset, min(offset + limit, FETCH_PAGE_SIZE + 1))]
+            return {'ids': ids, 'metadatas': [{'noteId': chunk_id, 'chunkIndex': 0} for chunk_id in ids]}
+
+        collection.get.side_effect = get_page
+
+        result = fetch_existing_state(collection)
+
+        assert collection.get.call_count == 2
+        assert len(result.noteId_to_chunks) == FETCH_PAGE_SIZE + 1
+
 
 class TestDetectChanges:
     def test_detects_added_notes(self):
@@ -519,6 +536,16 @@ class TestDeleteNoteChunks:
 
         assert result == 0
 
+    def test_deletes_in_batches(self):
+        collection = Mock()
+        chunks = [{'id': f'chunk{i}'} for i in range(DELETE_BATCH_SIZE + 1)]
+        existing_state = ExistingState(noteId_to_chunks={'note1': chunks}, noteId_to_hash={})
+
+        result = delete_note_chunks(collection, ['note1'], existing_state)
+
+        assert result == DELETE_BATCH_SIZE + 1
+        assert collection.delete.call_count == 2
+
 
 class TestUpdateCollectionTimestamp:
     def test_updates_last_updated_field(self):
@@ -551,6 +578,22 @@ class TestUpdateCollectionTimestamp:
 
         collection.modify.assert_called_once()
 
+    def test_drops_hnsw_creation_keys(self):
+        collection = Mock()
+        collection.metadata = {
+            'description': 'test',
+            'hnsw:space': 'cosine',
+            'hnsw:M': 32,
+            'hnsw:construction_ef': 200,
+            'hnsw:search_ef': 50,
+        }
+
+        update_collection_timestamp(collection)
+
+        metadata = collection.modify.call_args.kwargs['metadata']
+        assert not [key for key in metadata if key.startswith('hnsw:')]
+        assert metadata['description'] == 'test'
+
 
 class TestUpdateCollectionDescription:
     def test_updates_description_and_timestamp(self):
@@ -0,0 +1,220 @@
+from argparse import Namespace
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from minerva.commands.export_vectors import run_export_vectors
+from minerva.common.exceptions import StorageError
+from minerva.indexing.storage import initialize_chromadb_client
+from minerva.indexing.updater import strip_hnsw_metadata
+from minerva.indexing.vector_export import (
+    default_export_dir,
+    export_exists,
+    fetch_embeddings,
+    load_vector_export,
+    matrix_path,
+    read_manifest,
+    remove_vector_export,
+    sync_vector_export,
+)
+
+
+def random_vectors(count: int, dimension: int = 8, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).standard_normal((count, dimension)).astype(np.float32)
+
+
+def add_chunks(collection, start: int, count: int, content_hash: str = "h", seed: int = 0) -> np.ndarray:
+    vectors = random_vectors(count, seed=seed)
+    collection.add(
+        ids=[f"chunk-{index}" for index in range(start, start + count)],
+        embeddings=vectors,
+        metadatas=[{"noteId": f"note-{index}", "content_hash": content_hash} for index in range(start, start + count)]
+    )
+    return vectors
+
+
+def touch(collection, **changes) -> None:
+    collection.modify(metadata={**strip_hnsw_metadata(collection.metadata), **changes})
+
+
+@pytest.fixture
+def collection(temp_dir: Path):
+    client = initialize_chromadb_client(str(temp_dir / "chromadb"))
+    collection = client.create_collection(
+        name="notes",
+        metadata={"hnsw:space": "cosine", "last_updated": "2025-01-01T00:00:00",
+                  "embedding_dimension": 8, "embedding_model": "stub"}
+    )
+    return collection
+
+
+@pytest.fixture
+def export_dir(temp_dir: Path) -> Path:
+    return default_export_dir(str(temp_dir / "chromadb"))
+
+
+def vectors_by_id(export) -> dict:
+    return {chunk_id: np.asarray(export.matrix[row]) for row, chunk_id in enumerate(export.ids)}
+
+
+class TestSyncVectorExport:
+    def test_full_export_round_trips(self, collection, export_dir):
+        vectors = add_chunks(collection, 0, 20)
+
+        export, stats = sync_vector_export(collection, export_dir)
+
+        assert stats.added == 20 and stats.kept == 0
+        assert isinstance(export.matrix, np.memmap)
+        assert export.matrix_path == matrix_path(export_dir, "notes", "npy")
+        np.testing.assert_allclose(np.load(export.matrix_path), vectors, rtol=1e-6)
+        assert export.ids == [f"chunk-{index}" for index in range(20)]
+        assert read_manifest(export_dir, "notes")["dimension"] == 8
+
+    def test_unchanged_collection_is_up_to_date(self, collection, export_dir):
+        add_chunks(collection, 0, 5)
+        first, _ = sync_vector_export(collection, export_dir)
+
+        export, stats = sync_vector_export(collection, export_dir)
+
+        assert stats.up_to_date
+        assert export.ids == first.ids
+
+    def test_incremental_sync_reads_only_changed_chunks(self, collection, export_dir):
+        original = add_chunks(collection, 0, 10)
+        sync_vector_export(collection, export_dir)
+
+        collection.delete(ids=["chunk-2"])
+        replaced = random_vectors(1, seed=5)
+        collection.update(ids=["chunk-4"], embeddings=replaced, metadatas=[{"content_hash": "h2"}])
+        added = add_chunks(collection, 10, 3, seed=7)
+        touch(collection, last_updated="2025-02-01T00:00:00")
+
+        with patch("minerva.indexing.vector_export.fetch_embeddings", wraps=fetch_embeddings) as fetch:
+            export, stats = sync_vector_export(collection, export_dir)
+
+        assert (stats.kept, stats.added, stats.removed) == (8, 4, 2)
+        assert sorted(fetch.call_args.args[1]) == ["chunk-10", "chunk-11", "chunk-12", "chunk-4"]
+        assert export.last_updated == "2025-02-01T00:00:00"
+
+        rows = vectors_by_id(export)
+        assert "chunk-2" not in rows
+        np.testing.assert_allclose(rows["chunk-0"], original[0], rtol=1e-6)
+        np.testing.assert_allclose(rows["chunk-4"], replaced[0], rtol=1e-6)
+        np.testing.assert_allclose(rows["chunk-12"], added[2], rtol=1e-6)
+
+    def test_note_edited_in_place_reexports_every_chunk(self, collection, export_dir):
+        # Only chunk 0 carries the note hash; an edit that keeps the modification date keeps the chunk ids
+        ids = ["note-a-0", "note-a-1", "note-a-2"]
+        collection.add(
+            ids=ids,
+            embeddings=random_vectors(3),
+            metadatas=[{"noteId": "a", "chunkIndex": 0, "content_hash": "h"}, {"noteId": "a", "chunkIndex": 1},
+                       {"noteId": "a", "chunkIndex": 2}]
+        )
+        sync_vector_export(collection, export_dir)
+
+        edited = random_vectors(3, seed=3)
+        collection.upsert(
+            ids=ids,
+            embeddings=edited,
+            metadatas=[{"noteId": "a", "chunkIndex": 0, "content_hash": "h2"}, {"noteId": "a", "chunkIndex": 1},
+                       {"noteId": "a", "chunkIndex": 2}]
+        )
+        touch(collection, last_updated="2025-02-01T00:00:00")
+
+        export, stats = sync_vector_export(collection, export_dir)
+
+        assert (stats.kept, stats.added) == (0, 3)
+        rows = vectors_by_id(export)
+        for index, chunk_id in enumerate(ids):
+            np.testing.assert_allclose(rows[chunk_id], edited[index], rtol=1e-6)
+
+    def test_embedding_model_change_rewrites_everything(self, collection, export_dir):
+        add_chunks(collection, 0, 4)
+        sync_vector_export(collection, export_dir)
+
+        touch(collection, embedding_model="other", last_updated="2025-02-01T00:00:00")
+        _, stats = sync_vector_export(collection, export_dir)
+
+        assert (stats.kept, stats.added) == (0, 4)
+
+    def test_raw_format_and_switching_back(self, collection, export_dir):
+        vectors = add_chunks(collection, 0, 6)
+
+        export, _ = sync_vector_export(collection, export_dir, export_format="raw")
+
+        raw_path = matrix_path(export_dir, "notes", "raw")
+        assert export.matrix_path == raw_path
+        np.testing.assert_allclose(np.fromfile(raw_path, dtype=np.float32).reshape(6, 8), vectors, rtol=1e-6)
+
+        # An up-to-date export is still rewritten when the format changes
+        export, stats = sync_vector_export(collection, export_dir, export_format="npy")
+        assert stats.kept == 6 and not stats.up_to_date
+        assert not raw_path.exists()
+        assert load_vector_export(export_dir, "notes").format == "npy"
+
+    def test_empty_collection(self, collection, export_dir):
+        export, stats = sync_vector_export(collection, export_dir)
+
+        assert export.ids == []
+        assert export.matrix.shape == (0, 8)
+        assert stats.added == 0
+
+    def test_unknown_format_rejected(self, collection, export_dir):
+        with pytest.raises(StorageError):
+            sync_vector_export(collection, export_dir, export_format="parquet")
+
+    def test_mismatched_manifest_is_ignored(self, collection, export_dir):
+        add_chunks(collection, 0, 3)
+        export, _ = sync_vector_export(collection, export_dir)
+        np.save(export.matrix_path, random_vectors(2))
+
+        assert load_vector_export(export_dir, "notes") is None
+
+    def test_remove_vector_export(self, collection, export_dir):
+        add_chunks(collection, 0, 3)
+        sync_vector_export(collection, export_dir)
+
+        assert remove_vector_export(export_dir, "notes")
+        assert not export_exists(export_dir, "notes")
+        assert not remove_vector_export(export_dir, "notes")
+
+
+class TestRunExportVectors:
+    def make_args(self, chromadb, collection_names=None, **overrides):
+        values = dict(chromadb=Path(chromadb), collection_names=collection_names or [],
+                      format=None, output_dir=None, full=False)
+        values.update(overrides)
+        return Namespace(**values)
+
+    def test_exports_all_collections(self, collection, temp_dir: Path):
+        add_chunks(collection, 0, 5)
+
+        with patch("minerva.commands.export_vectors.logger"):
+            assert run_export_vectors(self.make_args(temp_dir / "chromadb")) == 0
+
+        assert export_exists(default_export_dir(str(temp_dir / "chromadb")), "notes")
+
+    def test_custom_output_dir_and_format(self, collection, temp_dir: Path):
+        add_chunks(collection, 0, 5)
+        output_dir = temp_dir / "exports"
+
+        with patch("minerva.commands.export_vectors.logger"):
+            result = run_export_vectors(self.make_args(
+                temp_dir / "chromadb", ["notes"], format="raw", output_dir=output_dir
+            ))
+
+        assert result == 0
+        assert matrix_path(output_dir, "notes", "raw").exists()
+
+    def test_missing_collection(self, collection, temp_dir: Path):
+        with patch("minerva.commands.export_vectors.logger") as mock_logger:
+            assert run_export_vectors(self.make_args(temp_dir / "chromadb", ["missing"])) == 1
+
+        assert "Collection 'missing' not found" in mock_logger.error.call_args_list[0].args[0]
+
+    def test_missing_path(self, temp_dir: Path):
+        with patch("minerva.commands.export_vectors.logger"):
+            assert run_export_vectors(self.make_args(temp_dir / "nope")) == 1